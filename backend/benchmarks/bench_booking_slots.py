@@ -0,0 +1,218 @@
+# backend/benchmarks/bench_booking_slots.py
+
+import sys
+import os
+import time
+import random
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from dotenv import load_dotenv
+
+# 'backend' 폴더를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# 다른 모든 임포트 *전에* .env 파일 로드
+load_dotenv()
+
+import httpx
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+
+from database import SQLALCHEMY_DATABASE_URL, get_db
+from models import Booking, Content, ContentSlot, User
+from routers.auth import create_access_token
+from services.booking_slot_service import set_slot_capacity, slot_start
+from services.content_stats_service import EXCLUDED_BOOKING_STATUSES, refresh_content_stats
+
+
+def make_client_factory(base_url, session_factory):
+    """
+    스레드마다 하나의 HTTP 클라이언트를 만듭니다.
+    base_url 이 없으면 앱을 프로세스 안에서 띄우고(TestClient), 요청마다 스레드 수만큼 큰 풀의 세션을 씁니다.
+    """
+    if base_url is None:
+        import main
+
+        def override_get_db():
+            db = session_factory()
+            try:
+                yield db
+            finally:
+                db.close()
+        # 기본 풀(5 + overflow 10)에서 연결을 기다리면 동시성이 사라지므로 전용 풀로 교체
+        main.app.dependency_overrides[get_db] = override_get_db
+
+    local = threading.local()
+
+    def client():
+        if not hasattr(local, "client"):
+            local.client = TestClient(main.app) if base_url is None else httpx.Client(base_url=base_url, timeout=60)
+        return local.client
+    return client
+
+
+def run_parallel(tasks, threads: int):
+    """모든 요청을 스레드 풀에 올린 뒤 한꺼번에 출발시켜 ([(결과, 지연 ms)], 전체 소요 초) 를 반환합니다."""
+    gate = threading.Event()
+
+    def run(task):
+        gate.wait()
+        started = time.perf_counter()
+        try:
+            outcome = task()
+        except Exception as e:
+            outcome = ("error", f"{type(e).__name__}: {str(e).splitlines()[0] if str(e) else ''}")
+        return outcome, (time.perf_counter() - started) * 1000
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        futures = [pool.submit(run, task) for task in tasks]
+        time.sleep(0.2)
+        started = time.perf_counter()
+        gate.set()
+        results = [future.result() for future in futures]
+        return results, time.perf_counter() - started
+
+
+def report(label: str, results: list, elapsed: float):
+    latencies = sorted(ms for _, ms in results)
+    counts = {}
+    for outcome, _ in results:
+        counts[outcome[0]] = counts.get(outcome[0], 0) + 1
+    p50, p99 = latencies[len(latencies) // 2], latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    summary = ", ".join(f"{name} {count}" for name, count in sorted(counts.items()))
+    print(f"   {label:<8} {summary} | p50 {p50:7.1f} ms | p99 {p99:7.1f} ms | {len(results) / elapsed:7.1f} req/s")
+
+
+def report_errors(results: list) -> bool:
+    """error 결과(409 가 아닌 실패 응답, 예외)를 출력하고, 하나라도 있으면 True"""
+    errors = [outcome[1] for outcome, _ in results if outcome[0] == "error"]
+    for error in sorted(set(errors))[:5]:
+        print(f"   ❌ {error}")
+    return bool(errors)
+
+
+def main():
+    """
+    POST /bookings/ 로 한 슬롯에 수백 건의 예약을 동시에 보내 정원을 넘기지 않는지(booked <= capacity,
+    booked == 201 응답 인원 합계, 409 는 정말 자리가 없을 때만)를 확인하고,
+    성공한 예약을 DELETE /bookings/{id} 로 동시에 취소해 인원이 모두 반납되는지 확인합니다.
+    201/409 외의 응답(500 등)이 하나라도 있으면 실패로 끝납니다.
+    DATABASE_URL 의 DB 에 임시 슬롯/예약을 만들고, 끝나면 지웁니다. (--keep 이면 남김)
+    """
+    parser = argparse.ArgumentParser(description="Stress test atomic booking slot reservations through the API")
+    parser.add_argument("--requests", type=int, default=500, help="동시에 보낼 예약 요청 수")
+    parser.add_argument("--threads", type=int, default=200, help="동시 실행 스레드(= DB 연결) 수")
+    parser.add_argument("--capacity", type=int, default=60, help="테스트 슬롯 정원")
+    parser.add_argument("--max-personnel", type=int, default=3, help="요청당 인원 (1 ~ 이 값 무작위)")
+    parser.add_argument("--content-id", type=int, default=None, help="예약할 콘텐츠 (기본: 첫 Active 콘텐츠)")
+    parser.add_argument("--base-url", default=None,
+                        help="실행 중인 API 서버 주소 (예: http://localhost:8000, 기본: 앱을 프로세스 안에서 실행)")
+    parser.add_argument("--lazy", action="store_true",
+                        help="슬롯을 미리 만들지 않고 첫 예약들이 동시에 만들게 함 (정원은 DEFAULT_SLOT_CAPACITY)")
+    parser.add_argument("--keep", action="store_true", help="테스트 예약/슬롯을 지우지 않음")
+    args = parser.parse_args()
+
+    # 스레드마다 실제 연결을 갖도록 전용 풀 사용 (기본 풀 크기 5 에서 대기하면 동시성이 사라짐)
+    engine = create_engine(SQLALCHEMY_DATABASE_URL, pool_size=args.threads, max_overflow=0, pool_recycle=3600)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    client = make_client_factory(args.base_url, Session)
+
+    db = Session()
+    content_id = args.content_id or db.query(Content.id).filter(Content.status == "Active")\
+                                      .order_by(Content.id).limit(1).scalar()
+    traveler_id = db.query(User.id).order_by(User.id).limit(1).scalar()
+    if content_id is None or traveler_id is None:
+        print("❗️ No active content or user to book with. Run db_init.py first.")
+        return
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(traveler_id)})}"}
+    # 실제 일정과 겹치지 않는 먼 미래의 분 단위 일시
+    start_at = slot_start(datetime.now() + timedelta(days=3650, minutes=random.randint(0, 525600)))
+    if not args.lazy:
+        set_slot_capacity(db, content_id, start_at, args.capacity)
+        db.commit()
+    db.close()
+
+    rng = random.Random(42)
+    personnel = [rng.randint(1, args.max_personnel) for _ in range(args.requests)]
+    print(f"--- content {content_id} @ {start_at:%Y-%m-%d %H:%M} | {args.requests} requests "
+          f"({sum(personnel)} personnel) on {args.threads} threads ---")
+
+    def book(count):
+        def task():
+            response = client().post("/bookings/", headers=headers, json={
+                "content_id": content_id, "booking_date": start_at.isoformat(), "personnel": count,
+            })
+            if response.status_code == 201:
+                return ("ok", response.json()["booking_id"], count)
+            if response.status_code == 409:
+                return ("full",)
+            return ("error", f"POST {response.status_code}: {response.text[:200]}")
+        return task
+
+    results, elapsed = run_parallel([book(count) for count in personnel], args.threads)
+    report("reserve", results, elapsed)
+
+    db = Session()
+    failed = report_errors(results)
+    try:
+        slot = db.query(ContentSlot).filter(ContentSlot.content_id == content_id, ContentSlot.start_at == start_at).first()
+        if slot is None:
+            print("   ❌ slot was not created")
+            sys.exit(1)
+        booked_rows = db.query(func.coalesce(func.sum(Booking.personnel), 0))\
+                        .filter(Booking.content_id == content_id, Booking.booking_date == start_at,
+                                Booking.status.notin_(EXCLUDED_BOOKING_STATUSES)).scalar()
+        accepted = [outcome for outcome, _ in results if outcome[0] == "ok"]
+        rejected = [count for (outcome, _), count in zip(results, personnel) if outcome[0] == "full"]
+        accepted_personnel = sum(outcome[2] for outcome in accepted)
+        checks = [
+            ("booked <= capacity", slot.booked <= slot.capacity, f"{slot.booked} / {slot.capacity}"),
+            ("booked == accepted personnel", slot.booked == accepted_personnel, f"{slot.booked} vs {accepted_personnel}"),
+            ("booked == bookings table", slot.booked == int(booked_rows), f"{slot.booked} vs {booked_rows}"),
+            # 취소 없이 남은 자리는 줄기만 하므로, 거절된 요청은 끝까지 자리가 부족했어야 함
+            ("rejections were really full", not rejected or slot.capacity - slot.booked < min(rejected),
+             f"remaining {slot.capacity - slot.booked}, smallest rejected {min(rejected) if rejected else '-'}"),
+        ]
+        for name, passed, detail in checks:
+            failed |= not passed
+            print(f"   {'✅' if passed else '❌'} {name:<30} ({detail})")
+
+        def cancel(booking_id):
+            def task():
+                response = client().delete(f"/bookings/{booking_id}", headers=headers)
+                if response.status_code == 200:
+                    return ("ok",)
+                return ("error", f"DELETE {response.status_code}: {response.text[:200]}")
+            return task
+
+        cancel_results, elapsed = run_parallel([cancel(booking_id) for _, booking_id, _ in accepted], args.threads)
+        if cancel_results:
+            report("cancel", cancel_results, elapsed)
+            failed |= report_errors(cancel_results)
+        db.expire_all()
+        booked_after = db.query(ContentSlot.booked).filter(ContentSlot.id == slot.id).scalar()
+        passed = booked_after == 0
+        failed |= not passed
+        print(f"   {'✅' if passed else '❌'} {'all personnel released':<30} (booked {booked_after})")
+
+        if not args.keep:
+            db.query(Booking).filter(Booking.content_id == content_id, Booking.booking_date == start_at)\
+              .delete(synchronize_session=False)
+            db.query(ContentSlot).filter(ContentSlot.id == slot.id).delete(synchronize_session=False)
+            refresh_content_stats(db, [content_id])
+            db.commit()
+            print("--- Test bookings and slot removed ---")
+    finally:
+        db.close()
+        engine.dispose()
+
+    print("\n❗️ Oversubscription check FAILED" if failed else "\n🎉 No oversubscription")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+# backend/benchmarks/bench_cache_backends.py
+
+import sys
+import os
+import time
+import pickle
+import argparse
+from datetime import date, datetime
+from decimal import Decimal
+from dotenv import load_dotenv
+
+# 'backend' 폴더를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# 다른 모든 임포트 *전에* .env 파일 로드
+load_dotenv()
+
+import cache
+from cache import MISSING, LocalLRUCache, RedisCache
+from services.response_cache_service import CachedResponse
+
+
+# 실제 캐시에 들어가는 값과 같은 모양의 표본 (content_detail / list_count / responses / response_versions)
+SAMPLES = {
+    "detail": {
+        "id": 1, "title": "부산 야경 투어", "price": 35000, "created_at": datetime(2025, 3, 1, 18, 30, 5, 120),
+        "rating": 4.5, "guide_avg_rating": None, "tags": [{"id": 3, "name": "야경"}],
+        "related": [{"id": 2, "title": "해운대", "price": "20,000", "rating": 0.0, "time": None, "imageUrl": None}],
+    },
+    "related": ([{"id": 2, "title": "해운대", "price": "문의"}], 42),
+    "count": (1234, True),
+    "response": CachedResponse('"abc"', 200, [(b"content-type", b"application/json"), (b"etag", b'"abc"')],
+                               b'{"items":[]}\x00\xff', (("contents", 3), ("reviews", 0)), 1700000000.25),
+    "none": None,
+    "scalars": [0, -1, 1.5, "", "한글", True, False],
+    "odd_keys": {1: "int key", ("a", 1): "tuple key", "__type__": "looks like a tag"},
+    "other_types": [date(2025, 1, 2), Decimal("12.50"), b""],
+}
+
+
+def _check(name: str, passed: bool, detail: str = "") -> bool:
+    print(f"   {'✅' if passed else '❌'} {name:<40} {detail}")
+    return passed
+
+
+def _same(a, b) -> bool:
+    # 값과 타입(tuple/list, bytes/str 등)이 모두 같아야 함
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(_same(a[k], b[k]) for k in a)
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    if isinstance(a, CachedResponse):
+        return all(_same(getattr(a, f), getattr(b, f)) for f in a.__dataclass_fields__)
+    return a == b
+
+
+def check_parity(local: LocalLRUCache, shared: RedisCache) -> bool:
+    """같은 연산을 두 백엔드에 실행해 결과가 같은지 확인합니다."""
+    ok = True
+    for backend in (local, shared):
+        backend.clear()
+        for key, value in SAMPLES.items():
+            backend.set(key, value)
+
+    for key, value in SAMPLES.items():
+        from_local, from_shared = local.get(key), shared.get(key)
+        ok &= _check(f"round trip: {key}", _same(from_local, value) and _same(from_shared, value),
+                     "" if _same(from_shared, value) else f"redis -> {from_shared!r}")
+
+    keys = list(SAMPLES) + ["absent"]
+    ok &= _check("get_many", all(_same(a, b) for a, b in zip(local.get_many(keys), shared.get_many(keys))))
+    ok &= _check("missing key", local.get("absent") is MISSING and shared.get("absent") is MISSING)
+    ok &= _check("missing key default", local.get("absent", 7) == 7 and shared.get("absent", 7) == 7)
+
+    for backend in (local, shared):
+        backend.delete("detail")
+    ok &= _check("delete", local.get("detail") is MISSING and shared.get("detail") is MISSING)
+
+    counters = [[backend.incr("v"), backend.incr("v", 5), backend.get_counters(["v", "w"])]
+                for backend in (local, shared)]
+    ok &= _check("incr / get_counters", counters[0] == counters[1] == [1, 6, [6, 0]], str(counters[1]))
+
+    for backend in (local, shared):
+        backend.set("short", "x", ttl=0.2)
+    time.sleep(0.3)
+    ok &= _check("ttl expiry", local.get("short") is MISSING and shared.get("short") is MISSING)
+
+    # 직렬화할 수 없는 값은 저장되지 않음 (Redis 는 errors 로 집계)
+    errors = shared.stats.errors
+    shared.set("object", object())
+    ok &= _check("unsupported value is not stored", shared.get("object") is MISSING and shared.stats.errors > errors)
+
+    # 누군가 Redis 에 pickle 을 써 넣어도 실행되지 않고 미스로 처리
+    shared.client.set(shared._key("planted"), pickle.dumps({"payload": 1}))
+    ok &= _check("foreign payload is a miss", shared.get("planted") is MISSING)
+
+    for backend in (local, shared):
+        backend.clear()
+    ok &= _check("clear", len(local) == 0 and len(shared) == 0)
+    return ok
+
+
+class FlakyClient:
+    """down 이면 모든 호출이 delay 초 뒤 ConnectionError (Redis 장애 + socket_timeout 흉내)"""
+
+    def __init__(self, client, delay: float):
+        self.client = client
+        self.delay = delay
+        self.down = False
+        self.calls_while_down = 0
+
+    def __getattr__(self, name):
+        method = getattr(self.client, name)
+
+        def call(*args, **kwargs):
+            if self.down:
+                self.calls_while_down += 1
+                time.sleep(self.delay)
+                raise ConnectionError("redis is down")
+            return method(*args, **kwargs)
+        return call
+
+
+def check_outage(client, name: str, delay: float) -> bool:
+    """Redis 장애 동안 회로가 열려 바로 로컬 캐시로 처리하고, 복구 시 그동안의 무효화를 반영하는지 확인합니다."""
+    cache.CACHE_REDIS_RETRY_SECONDS = 0.5
+    flaky = FlakyClient(client, delay)
+    shared = RedisCache(name + "_outage", client=flaky)
+    other_worker = RedisCache(name + "_outage", client=client)
+    shared.clear()
+    shared.set("detail", SAMPLES["detail"])
+    shared.incr("version")
+
+    flaky.down = True
+    started = time.perf_counter()
+    for i in range(200):
+        shared.get("detail")
+        shared.set(f"k{i}", i)
+    per_call_ms = (time.perf_counter() - started) * 1000 / 400
+    ok = _check("circuit opens after the failure threshold",
+                flaky.calls_while_down == cache.CACHE_REDIS_FAILURE_THRESHOLD,
+                f"({flaky.calls_while_down} calls reached Redis, {per_call_ms:.3f} ms/op)")
+    ok &= _check("local fallback serves while open", shared.get("k199") == 199)
+    shared.delete("detail")
+    shared.incr("version", 2)
+    ok &= _check("other workers still see the old values", other_worker.get("detail") is not MISSING
+                 and other_worker.get_counters(["version"]) == [1])
+
+    flaky.down = False
+    time.sleep(cache.CACHE_REDIS_RETRY_SECONDS + 0.1)
+    shared.get("detail")
+    ok &= _check("circuit closes after the retry interval", shared.status()["circuit"] == "closed")
+    ok &= _check("invalidations replayed to Redis", other_worker.get("detail") is MISSING
+                 and other_worker.get_counters(["version"]) == [3],
+                 f"(version {other_worker.get_counters(['version'])[0]})")
+    ok &= _check("fallback emptied on recovery", len(shared.fallback) == 0)
+    shared.clear()
+    return ok
+
+
+def measure(backend, rounds: int) -> str:
+    started = time.perf_counter()
+    for i in range(rounds):
+        backend.set(f"k{i % 100}", SAMPLES["detail"])
+        backend.get(f"k{(i * 7) % 100}")
+    elapsed = time.perf_counter() - started
+    backend.clear()
+    return f"{rounds * 2 / elapsed:10.0f} ops/s"
+
+
+def main():
+    """
+    LocalLRUCache 와 RedisCache 에 같은 연산을 실행해 결과가 같은지(직렬화 왕복, TTL, 카운터, 삭제) 확인하고,
+    Redis 장애 중에는 회로가 열려 로컬 캐시로 바로 처리하고 복구 시 무효화가 반영되는지 확인한 뒤,
+    상세 dict 하나를 저장/조회하는 속도를 비교합니다. 하나라도 다르면 실패로 끝납니다.
+    기본은 fakeredis (설치 필요), --redis-url 을 주면 실제 Redis 서버의 임시 이름 공간을 사용합니다.
+    """
+    parser = argparse.ArgumentParser(description="Check LocalLRUCache / RedisCache parity")
+    parser.add_argument("--redis-url", default=None, help="실제 Redis 주소 (예: redis://localhost:6379/0, 기본: fakeredis)")
+    parser.add_argument("--rounds", type=int, default=5000, help="속도 측정 반복 횟수")
+    parser.add_argument("--outage-delay", type=float, default=0.5,
+                        help="장애 흉내에서 실패한 호출 하나가 걸리는 시간(초, 기본 socket_timeout 과 같은 0.5)")
+    args = parser.parse_args()
+
+    if args.redis_url:
+        import redis
+        client = redis.Redis.from_url(args.redis_url)
+    else:
+        import fakeredis
+        client = fakeredis.FakeRedis()
+
+    name = f"parity_check_{os.getpid()}"
+    local = LocalLRUCache(name, max_entries=1000)
+    shared = RedisCache(name, client=client)
+    print(f"--- Cache backend parity ({'redis ' + args.redis_url if args.redis_url else 'fakeredis'}) ---")
+
+    ok = check_parity(local, shared)
+    print("--- Redis outage ---")
+    ok &= check_outage(client, name, args.outage_delay)
+    print(f"   LocalLRUCache {measure(local, args.rounds)}")
+    print(f"   RedisCache    {measure(shared, args.rounds)}")
+
+    print("\n🎉 Backends behave the same" if ok else "\n❗️ Backend parity check FAILED")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
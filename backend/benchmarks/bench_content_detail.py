@@ -0,0 +1,71 @@
+# backend/benchmarks/bench_content_detail.py
+
+import sys
+import os
+import time
+import random
+import argparse
+from dotenv import load_dotenv
+
+# 'backend' 폴더를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# 다른 모든 임포트 *전에* .env 파일 로드
+load_dotenv()
+
+from sqlalchemy import event
+
+import cache
+from database import SessionLocal, engine
+from models import Content
+from routers.content import get_content_detail
+from services import content_detail_service
+
+
+def main():
+    """상세 조회 1회당 SQL 문 수와 지연 시간을 캐시 미스(cold) / 적중(warm)으로 나눠 측정합니다."""
+    parser = argparse.ArgumentParser(description="Benchmark the content detail endpoint (cold vs cached)")
+    parser.add_argument("--contents", type=int, default=200, help="조회할 콘텐츠 수 (최신 Active 순)")
+    parser.add_argument("--rounds", type=int, default=5, help="캐시 적중 측정 반복 횟수")
+    args = parser.parse_args()
+
+    statements = [0]
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count(*_):
+        statements[0] += 1
+
+    db = SessionLocal()
+    try:
+        content_ids = [cid for (cid,) in db.query(Content.id).filter(Content.status == "Active")
+                       .order_by(Content.created_at.desc()).limit(args.contents)]
+        print(f"--- Content detail benchmark ({len(content_ids)} contents) ---")
+        if not content_ids:
+            print("⚠️ No active contents.")
+            return
+
+        def run(ids):
+            timings, counts = [], []
+            for cid in ids:
+                statements[0] = 0
+                t0 = time.perf_counter()
+                get_content_detail(cid, 1, 5, 1, 4, db)
+                timings.append((time.perf_counter() - t0) * 1000)
+                counts.append(statements[0])
+            timings.sort()
+            return timings[len(timings) // 2], timings[int(len(timings) * 0.99)], sum(counts) / len(counts)
+
+        content_detail_service.invalidate(content_ids)
+        p50, p99, queries = run(content_ids)
+        print(f"✅ cold  : p50 {p50:.2f} ms | p99 {p99:.2f} ms | {queries:.1f} queries/request")
+
+        random.seed(7)
+        warm_ids = [random.choice(content_ids) for _ in range(len(content_ids) * args.rounds)]
+        p50, p99, queries = run(warm_ids)
+        print(f"✅ cached: p50 {p50:.2f} ms | p99 {p99:.2f} ms | {queries:.1f} queries/request")
+        print(f"   cache: {cache.all_stats().get('content_detail')}")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
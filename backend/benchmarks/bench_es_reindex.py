@@ -0,0 +1,250 @@
+# backend/benchmarks/bench_es_reindex.py
+
+import sys
+import os
+import json
+import time
+import argparse
+from dotenv import load_dotenv
+
+# 'backend' 폴더를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# 다른 모든 임포트 *전에* .env 파일 로드
+load_dotenv()
+
+from elastic_transport import SerializerCollection
+from elasticsearch._otel import OpenTelemetry
+
+from services.search_index_service import CONTENTS_ALIAS, ReindexAbortedError, reindex_all
+
+
+class FakeApiError(Exception):
+    """가짜 ES 가 실제 서버라면 4xx 로 거절했을 요청"""
+    pass
+
+
+class _BulkResponse:
+    def __init__(self, body: dict):
+        self.body = body
+
+
+class FakeIndices:
+    """reindex_all 이 쓰는 indices API 만 메모리로 구현합니다. (alias 교체는 실제 ES 처럼 한 요청 단위로 원자적)"""
+
+    def __init__(self):
+        self.indices = {}  # 이름 -> {"settings": dict, "docs": dict}
+        self.aliases = {}  # alias -> 가리키는 인덱스 이름 set
+
+    def create(self, index, settings=None, mappings=None):
+        if index in self.indices or index in self.aliases:
+            raise FakeApiError(f"resource_already_exists_exception [{index}]")
+        self.indices[index] = {"settings": dict(settings or {}), "mappings": mappings, "docs": {}}
+
+    def put_settings(self, index, settings):
+        self._index(index)["settings"].update(settings)
+
+    def refresh(self, index):
+        self._index(index)
+
+    def exists(self, index):
+        return index in self.indices or index in self.aliases
+
+    def exists_alias(self, name):
+        return bool(self.aliases.get(name))
+
+    def get_alias(self, name):
+        if not self.aliases.get(name):
+            raise FakeApiError(f"alias [{name}] missing")
+        return {index: {"aliases": {name: {}}} for index in sorted(self.aliases[name])}
+
+    def update_aliases(self, actions):
+        indices = dict(self.indices)
+        aliases = {name: set(targets) for name, targets in self.aliases.items()}
+        for action in actions:
+            (kind, spec), = action.items()
+            if kind == "remove":
+                if spec["index"] not in aliases.get(spec["alias"], set()):
+                    raise FakeApiError(f"aliases_not_found_exception [{spec['alias']}]")
+                aliases[spec["alias"]].discard(spec["index"])
+            elif kind == "remove_index":
+                if indices.pop(spec["index"], None) is None:
+                    raise FakeApiError(f"index_not_found_exception [{spec['index']}]")
+            elif kind == "add":
+                if spec["index"] not in indices:
+                    raise FakeApiError(f"index_not_found_exception [{spec['index']}]")
+                if spec["alias"] in indices:
+                    raise FakeApiError(f"invalid_alias_name_exception: an index exists with the same name [{spec['alias']}]")
+                aliases.setdefault(spec["alias"], set()).add(spec["index"])
+            else:
+                raise FakeApiError(f"unknown alias action [{kind}]")
+        self.indices = indices
+        self.aliases = {name: targets for name, targets in aliases.items() if targets}
+
+    def delete(self, index, ignore_unavailable=False):
+        if index not in self.indices:
+            if ignore_unavailable:
+                return
+            raise FakeApiError(f"index_not_found_exception [{index}]")
+        del self.indices[index]
+        for targets in self.aliases.values():
+            targets.discard(index)
+        self.aliases = {name: targets for name, targets in self.aliases.items() if targets}
+
+    def _index(self, index):
+        if index not in self.indices:
+            raise FakeApiError(f"index_not_found_exception [{index}]")
+        return self.indices[index]
+
+
+class FakeElasticsearch:
+    """
+    reindex_all 에 넘길 수 있는 메모리 ES 클라이언트.
+    bulk 는 elasticsearch.helpers.streaming_bulk 가 보내는 NDJSON 줄(bytes) 목록을 그대로 받아 처리하고,
+    fail_ids 에 있는 문서는 400(mapper_parsing_exception)으로 실패시킵니다.
+    (streaming_bulk 가 내부에서 쓰는 options() / transport.serializers / _otel 도 최소한으로 갖춤)
+    """
+
+    def __init__(self, fail_ids=()):
+        self.indices = FakeIndices()
+        self.fail_ids = set(fail_ids)
+        self.transport = type("FakeTransport", (), {"serializers": SerializerCollection()})()
+        self._otel = OpenTelemetry(enabled=False)
+        self.bulk_requests = 0
+
+    def options(self, **kwargs):
+        return self
+
+    def bulk(self, operations, **kwargs):
+        self.bulk_requests += 1
+        lines = [json.loads(line) for line in operations]
+        items = []
+        while lines:
+            (op_type, meta), = lines.pop(0).items()
+            source = lines.pop(0) if op_type in ("index", "create", "update") else None
+            index = self.indices.indices.get(meta["_index"])
+            result = {"_index": meta["_index"], "_id": str(meta["_id"])}
+            if index is None:
+                result.update(status=404, error={"type": "index_not_found_exception"})
+            elif str(meta["_id"]) in {str(i) for i in self.fail_ids}:
+                result.update(status=400, error={"type": "mapper_parsing_exception", "reason": "fake failure"})
+            else:
+                index["docs"][str(meta["_id"])] = source
+                result.update(status=201, result="created")
+            items.append({op_type: result})
+        return _BulkResponse({"errors": any(item[op]["status"] >= 300 for item in items for op in item),
+                              "items": items})
+
+    def count(self, index):
+        """alias 또는 인덱스 이름으로 문서 수 (검증용)"""
+        targets = self.indices.aliases.get(index) or ({index} if index in self.indices.indices else set())
+        return sum(len(self.indices.indices[name]["docs"]) for name in targets)
+
+
+def _documents(count: int):
+    for i in range(1, count + 1):
+        yield {"id": i, "title": f"콘텐츠 {i}", "description": "", "all_tags": [], "all_reviews_text": "",
+               "location": "부산", "style": None, "price": 10000, "status": "Active", "guide_id": 1,
+               "created_at": None}
+
+
+def _check(name: str, passed: bool, detail: str = "") -> bool:
+    print(f"   {'✅' if passed else '❌'} {name:<52} {detail}")
+    return passed
+
+
+def _quiet_reindex(es, **kwargs):
+    # 실패 문서마다 출력하는 경고는 검증 결과를 가리므로 숨김
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        return reindex_all(es, None, None, **kwargs)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+
+def check_swap(docs: int, batch_size: int) -> bool:
+    print("--- 1. Alias swap (v1 -> v2) ---")
+    es = FakeElasticsearch()
+    first = _quiet_reindex(es, index_name="contents_v1", documents=_documents(docs), batch_size=batch_size)
+    ok = _check("first build points the alias at v1", es.indices.aliases.get(CONTENTS_ALIAS) == {"contents_v1"})
+    ok &= _check("all documents indexed", first["indexed"] == docs and es.count(CONTENTS_ALIAS) == docs,
+                 f"({first['indexed']} / {docs})")
+    ok &= _check("refresh / replicas restored",
+                 es.indices.indices["contents_v1"]["settings"].get("refresh_interval") == "1s")
+
+    started = time.perf_counter()
+    second = _quiet_reindex(es, index_name="contents_v2", documents=_documents(docs + 5), batch_size=batch_size)
+    elapsed = time.perf_counter() - started
+    ok &= _check("alias moved to v2", es.indices.aliases.get(CONTENTS_ALIAS) == {"contents_v2"})
+    ok &= _check("previous index reported and deleted",
+                 second["previous"] == ["contents_v1"] and "contents_v1" not in es.indices.indices)
+    ok &= _check("searches see the new documents", es.count(CONTENTS_ALIAS) == docs + 5,
+                 f"({docs + 5} docs, {es.bulk_requests} bulk requests, {elapsed * 1000:.0f} ms)")
+
+    _quiet_reindex(es, index_name="contents_v3", documents=_documents(docs), batch_size=batch_size, keep_old=True)
+    ok &= _check("--keep-old leaves the previous index", "contents_v2" in es.indices.indices
+                 and es.indices.aliases.get(CONTENTS_ALIAS) == {"contents_v3"})
+    return ok
+
+
+def check_abort(docs: int, batch_size: int) -> bool:
+    print("--- 2. Failed documents (max_failed) ---")
+    es = FakeElasticsearch()
+    _quiet_reindex(es, index_name="contents_v1", documents=_documents(docs), batch_size=batch_size)
+
+    es.fail_ids = {3, 7}
+    try:
+        _quiet_reindex(es, index_name="contents_v2", documents=_documents(docs), batch_size=batch_size, max_failed=0)
+        ok = _check("2 failures over max_failed=0 abort", False, "(no ReindexAbortedError)")
+    except ReindexAbortedError as e:
+        ok = _check("2 failures over max_failed=0 abort", e.failed == 2 and e.indexed == docs - 2,
+                    f"({e.failed} failed, {e.indexed} indexed)")
+    ok &= _check("alias stays on the old index", es.indices.aliases.get(CONTENTS_ALIAS) == {"contents_v1"})
+    ok &= _check("old index keeps every document", es.count(CONTENTS_ALIAS) == docs)
+    ok &= _check("incomplete new index deleted", "contents_v2" not in es.indices.indices)
+
+    result = _quiet_reindex(es, index_name="contents_v3", documents=_documents(docs), batch_size=batch_size,
+                            max_failed=2)
+    ok &= _check("2 failures within max_failed=2 swap",
+                 result["failed"] == 2 and es.indices.aliases.get(CONTENTS_ALIAS) == {"contents_v3"},
+                 f"({result['indexed']} indexed)")
+    return ok
+
+
+def check_legacy(docs: int, batch_size: int) -> bool:
+    print("--- 3. Legacy concrete 'contents' index ---")
+    es = FakeElasticsearch()
+    es.indices.create(index=CONTENTS_ALIAS)
+    es.indices.indices[CONTENTS_ALIAS]["docs"] = {"1": {"id": 1}}
+    result = _quiet_reindex(es, index_name="contents_v1", documents=_documents(docs), batch_size=batch_size)
+    ok = _check("concrete index replaced by the alias",
+                CONTENTS_ALIAS not in es.indices.indices and es.indices.aliases.get(CONTENTS_ALIAS) == {"contents_v1"})
+    ok &= _check("no alias targets reported as previous", result["previous"] == [])
+    ok &= _check("searches see the new documents", es.count(CONTENTS_ALIAS) == docs)
+    return ok
+
+
+def main():
+    """
+    가짜(메모리) ES 클라이언트로 reindex_all 의 세 경로를 검증합니다. (ES 서버/DB 불필요)
+    1) alias 교체와 이전 인덱스 정리, 2) 실패 문서가 max_failed 를 넘으면 alias 유지 + 새 인덱스 삭제,
+    3) alias 이름과 같은 예전 '실제 인덱스' 교체. 하나라도 어긋나면 실패로 끝납니다.
+    """
+    parser = argparse.ArgumentParser(description="Verify reindex_all against an in-memory Elasticsearch client")
+    parser.add_argument("--docs", type=int, default=2500, help="재색인할 가짜 문서 수")
+    parser.add_argument("--batch-size", type=int, default=500, help="bulk 요청당 문서 수")
+    args = parser.parse_args()
+
+    ok = check_swap(args.docs, args.batch_size)
+    ok &= check_abort(args.docs, args.batch_size)
+    ok &= check_legacy(args.docs, args.batch_size)
+
+    print("\n🎉 Reindex paths behave as expected" if ok else "\n❗️ Reindex check FAILED")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# backend/benchmarks/bench_fuzzy_lookup.py
+
+import sys
+import os
+import time
+import random
+import argparse
+from dotenv import load_dotenv
+
+# 'backend' 폴더를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# 다른 모든 임포트 *전에* .env 파일 로드
+load_dotenv()
+
+from services.fuzzy_service import SymSpellDictionary, build_fuzzy_dictionary, to_jamo
+
+# 합성 데이터용 음절: 자주 쓰는 초성 14 x 중성 10 x 종성(없음/ㄴ/ㄹ/ㅇ) 4 = 560개
+_CHO = [0, 2, 3, 5, 6, 7, 9, 11, 12, 14, 15, 16, 17, 18]
+_JUNG = [0, 1, 4, 5, 6, 8, 12, 13, 18, 20]
+_JONG = [0, 4, 8, 21]
+_SYLLABLES = [chr(0xAC00 + (c * 21 + j) * 28 + t) for c in _CHO for j in _JUNG for t in _JONG]
+
+
+def synthetic_dictionary(n_contents: int) -> SymSpellDictionary:
+    random.seed(42)
+    dictionary = SymSpellDictionary()
+    for cid in range(1, n_contents + 1):
+        words = ["".join(random.choice(_SYLLABLES) for _ in range(random.randint(2, 4))) for _ in range(5)]
+        dictionary.set_content(cid, [" ".join(words)])
+    return dictionary
+
+
+def make_typo(word: str) -> str:
+    """한 음절의 모음을 다른 모음으로 바꿉니다. (예: 해 -> 헤, 자모 편집 거리 1)"""
+    positions = [i for i, char in enumerate(word) if 0xAC00 <= ord(char) <= 0xD7A3]
+    if not positions:
+        return word
+    i = random.choice(positions)
+    offset = ord(word[i]) - 0xAC00
+    cho, jung, jong = offset // 588, (offset % 588) // 28, offset % 28
+    new_jung = random.choice([j for j in _JUNG if j != jung])
+    return word[:i] + chr(0xAC00 + (cho * 21 + new_jung) * 28 + jong) + word[i + 1:]
+
+
+def main():
+    """SymSpell(자모) 사전의 빌드 시간과 오타 교정 조회 지연 시간을 측정합니다."""
+    parser = argparse.ArgumentParser(description="Benchmark jamo SymSpell dictionary build and lookup")
+    parser.add_argument("--synthetic", type=int, default=0, help="DB 대신 N개의 합성 콘텐츠로 사전 생성")
+    parser.add_argument("--lookups", type=int, default=5000, help="조회 횟수")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.synthetic:
+        dictionary = synthetic_dictionary(args.synthetic)
+        source = f"{args.synthetic} synthetic contents"
+    else:
+        from database import SessionLocal
+        db = SessionLocal()
+        try:
+            dictionary = build_fuzzy_dictionary(db)
+        finally:
+            db.close()
+        source = "database"
+    build_seconds = time.perf_counter() - started
+
+    print(f"--- Fuzzy dictionary benchmark ({source}) ---")
+    print(f"✅ build: {build_seconds:.2f}s | words: {len(dictionary)} | delete variants: {len(dictionary.deletes)}")
+
+    known_words = [max(originals, key=originals.get) for originals in dictionary.words.values()]
+    if not known_words:
+        print("⚠️ Dictionary is empty.")
+        return
+    random.seed(7)
+    queries = [make_typo(random.choice(known_words)) for _ in range(args.lookups)]
+
+    timings = []
+    corrected = 0
+    for query in queries:
+        t0 = time.perf_counter()
+        result = dictionary.lookup(query)
+        timings.append((time.perf_counter() - t0) * 1_000_000)
+        if result is not None:
+            corrected += 1
+    timings.sort()
+    p50 = timings[len(timings) // 2]
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    print(f"✅ lookup: p50 {p50:.0f} µs | p99 {p99:.0f} µs | max {timings[-1]:.0f} µs")
+    print(f"   corrected {corrected}/{len(queries)} typo queries")
+    sample = queries[0]
+    print(f"   e.g. '{sample}' ({to_jamo(sample)}) -> {dictionary.lookup(sample)}")
+
+if __name__ == "__main__":
+    main()
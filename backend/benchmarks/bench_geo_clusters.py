@@ -0,0 +1,93 @@
+# backend/benchmarks/bench_geo_clusters.py
+
+import sys
+import os
+import json
+import time
+import random
+import argparse
+from dotenv import load_dotenv
+
+# 'backend' 폴더를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# 다른 모든 임포트 *전에* .env 파일 로드
+load_dotenv()
+
+from services.geo_index_service import GeoGridIndex, GeoPoint, build_geo_index
+
+# 합성 데이터 범위 (대한민국 본토 + 제주)
+KOREA_BBOX = (33.1, 124.6, 38.6, 131.0)
+# 측정할 화면: (이름, 줌, 화면 크기(도)) - 약 1000x800px 화면 기준
+VIEWPORTS = [
+    ("country", 7, (5.5, 6.4)),
+    ("region", 10, (0.7, 0.8)),
+    ("city", 13, (0.09, 0.1)),
+    ("street", 16, (0.011, 0.013)),
+]
+
+
+def synthetic_index(n_points: int) -> GeoGridIndex:
+    """도시 주변에 몰린 분포를 흉내 내기 위해 20개 중심점 주변에 정규분포로 배치합니다."""
+    random.seed(42)
+    centers = [(random.uniform(34.5, 37.8), random.uniform(126.3, 129.4)) for _ in range(20)]
+    index = GeoGridIndex()
+    for cid in range(1, n_points + 1):
+        lat0, lng0 = random.choice(centers)
+        index.set_content(GeoPoint(
+            content_id=cid,
+            latitude=min(max(random.gauss(lat0, 0.15), KOREA_BBOX[0]), KOREA_BBOX[2]),
+            longitude=min(max(random.gauss(lng0, 0.15), KOREA_BBOX[1]), KOREA_BBOX[3]),
+            title=f"투어 {cid}", location="SEO", price=10000, rating=4.0,
+            main_image_url=None, booking_count=random.randint(0, 50),
+        ))
+    return index
+
+
+def main():
+    """격자 클러스터 인덱스의 화면별 조회 지연 시간과 응답 크기를 측정합니다."""
+    parser = argparse.ArgumentParser(description="Benchmark bbox + zoom map clustering")
+    parser.add_argument("--synthetic", type=int, default=0, help="DB 대신 N개의 합성 좌표로 인덱스 생성")
+    parser.add_argument("--queries", type=int, default=500, help="화면 종류별 조회 횟수")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.synthetic:
+        index = synthetic_index(args.synthetic)
+        source = f"{args.synthetic} synthetic points"
+    else:
+        from database import SessionLocal
+        db = SessionLocal()
+        try:
+            index = build_geo_index(db)
+        finally:
+            db.close()
+        source = "database"
+    print(f"--- Geo cluster benchmark ({source}) ---")
+    print(f"✅ build: {time.perf_counter() - started:.2f}s | points: {len(index)}")
+    if not len(index):
+        print("⚠️ Index is empty.")
+        return
+
+    points = list(index.points.values())
+    random.seed(7)
+    for name, zoom, (height, width) in VIEWPORTS:
+        timings, sizes = [], []
+        for _ in range(args.queries):
+            center = random.choice(points)
+            bbox = (center.latitude - height / 2, center.longitude - width / 2,
+                    center.latitude + height / 2, center.longitude + width / 2)
+            t0 = time.perf_counter()
+            result = index.query(*bbox, zoom)
+            timings.append((time.perf_counter() - t0) * 1000)
+            payload = {
+                "clusters": [[c.latitude, c.longitude, c.count, c.top.content_id, c.top.title] for c in result.clusters],
+                "markers": [[m.content_id, m.latitude, m.longitude, m.title, m.price] for m in result.markers],
+            }
+            sizes.append(len(json.dumps(payload, ensure_ascii=False).encode("utf-8")))
+        timings.sort()
+        print(f"✅ {name:<8} zoom {zoom:>2}: p50 {timings[len(timings) // 2]:.2f} ms | "
+              f"p99 {timings[int(len(timings) * 0.99)]:.2f} ms | avg payload {sum(sizes) / len(sizes) / 1024:.1f} KB")
+
+if __name__ == "__main__":
+    main()
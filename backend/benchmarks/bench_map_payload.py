@@ -0,0 +1,113 @@
+# backend/benchmarks/bench_map_payload.py
+
+import sys
+import os
+import gzip
+import json
+import time
+import random
+import argparse
+from types import SimpleNamespace
+from dotenv import load_dotenv
+
+# 'backend' 폴더를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# 다른 모든 임포트 *전에* .env 파일 로드
+load_dotenv()
+
+from fastapi.encoders import jsonable_encoder
+
+from schemas import MapContentSchema
+from services.map_payload_service import decode_map_columns, encode_map_columns
+
+LOCATIONS = ["SEO", "BUS", "JEJ", "GAN", "GYE", "JEO", "DAE", "INC"]
+
+
+def synthetic_rows(n_rows: int):
+    """실제 지도 응답과 비슷한 행 (설명 300~800자, 지역 코드 8종, 이미지 URL 절반)"""
+    random.seed(42)
+    sentence = "바다와 야경을 함께 즐기는 현지 가이드 투어입니다. "
+    return [
+        SimpleNamespace(
+            id=cid, title=f"투어 상품 {cid} - 야경과 먹방", location=random.choice(LOCATIONS),
+            latitude=random.uniform(33.1, 38.6), longitude=random.uniform(124.6, 131.0),
+            price=random.randint(1, 20) * 10000, rating=random.choice([None, round(random.uniform(1, 5), 2)]),
+            main_image_url=f"/images/content_{cid}.jpg" if cid % 2 else None,
+            description=sentence * random.randint(12, 30),
+        )
+        for cid in range(1, n_rows + 1)
+    ]
+
+
+def database_rows():
+    from database import SessionLocal
+    from models import Content, ContentStats
+    from services.content_stats_service import main_image_column
+    db = SessionLocal()
+    try:
+        return db.query(
+            Content.id, Content.title, Content.location, Content.latitude, Content.longitude, Content.price,
+            main_image_column().label("main_image_url"), ContentStats.avg_rating.label("rating"), Content.description
+        ).outerjoin(ContentStats, ContentStats.content_id == Content.id)\
+         .filter(Content.status == "Active", Content.latitude.isnot(None), Content.longitude.isnot(None))\
+         .all()
+    finally:
+        db.close()
+
+
+def encode_json(rows) -> bytes:
+    """라우터의 JSON 경로와 같은 순서: 스키마 생성 -> jsonable_encoder -> json 직렬화"""
+    schemas = [
+        MapContentSchema(
+            id=row.id, title=row.title, location=row.location, latitude=row.latitude, longitude=row.longitude,
+            main_image_url=row.main_image_url, description=row.description, price=row.price,
+            rating=float(row.rating) if row.rating is not None else 0.0
+        )
+        for row in rows
+    ]
+    return json.dumps(jsonable_encoder(schemas), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def measure(fn, rows, repeat: int):
+    timings, payload = [], b""
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        payload = fn(rows)
+        timings.append((time.perf_counter() - t0) * 1000)
+    timings.sort()
+    return payload, timings[len(timings) // 2]
+
+
+def main():
+    """지도 마커 응답의 JSON / 열 단위 바이너리 크기와 인코딩 시간을 비교합니다."""
+    parser = argparse.ArgumentParser(description="Benchmark JSON vs columnar binary map payloads")
+    parser.add_argument("--synthetic", type=int, default=0, help="DB 대신 N개의 합성 마커 사용")
+    parser.add_argument("--repeat", type=int, default=20, help="형식별 인코딩 반복 횟수")
+    args = parser.parse_args()
+
+    rows = synthetic_rows(args.synthetic) if args.synthetic else database_rows()
+    source = f"{args.synthetic} synthetic markers" if args.synthetic else "database"
+    print(f"--- Map payload benchmark ({source}, {len(rows)} markers) ---")
+    if not rows:
+        print("⚠️ No markers.")
+        return
+
+    json_payload, json_ms = measure(encode_json, rows, args.repeat)
+    binary_payload, binary_ms = measure(encode_map_columns, rows, args.repeat)
+    for name, payload, elapsed in (("json", json_payload, json_ms), ("columns", binary_payload, binary_ms)):
+        print(f"✅ {name:<8}: {len(payload) / 1024:8.1f} KB | gzip {len(gzip.compress(payload)) / 1024:7.1f} KB "
+              f"| encode p50 {elapsed:.1f} ms")
+    print(f"   size ratio (gzip): {len(gzip.compress(binary_payload)) / len(gzip.compress(json_payload)):.1%} of JSON")
+
+    decoded = decode_map_columns(binary_payload)
+    mismatches = sum(
+        1 for i, row in enumerate(rows)
+        if decoded["id"][i] != row.id or decoded["title"][i] != row.title
+        or abs(decoded["latitude"][i] - float(row.latitude)) > 1e-6
+        or abs(decoded["longitude"][i] - float(row.longitude)) > 1e-6
+    )
+    print(f"   round trip: {len(rows) - mismatches}/{len(rows)} markers identical")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# backend/benchmarks/bench_nearby.py
+
+import sys
+import os
+import time
+import random
+import argparse
+from dotenv import load_dotenv
+
+# 'backend' 폴더를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# 다른 모든 임포트 *전에* .env 파일 로드
+load_dotenv()
+
+import numpy as np
+
+from services.geo_index_service import GeoPoint
+from services.nearby_service import NearbyIndex, build_nearby_index
+
+
+def synthetic_index(n_points: int) -> NearbyIndex:
+    """20개 도시 중심점 주변에 몰린 합성 좌표 (대한민국 범위)"""
+    random.seed(42)
+    centers = [(random.uniform(34.5, 37.8), random.uniform(126.3, 129.4)) for _ in range(20)]
+    index = NearbyIndex()
+    for cid in range(1, n_points + 1):
+        lat0, lng0 = random.choice(centers)
+        index.set_content(GeoPoint(
+            content_id=cid, latitude=random.gauss(lat0, 0.15), longitude=random.gauss(lng0, 0.15),
+            title=f"투어 {cid}", location="SEO", price=random.randint(1, 20) * 10000, rating=None,
+            main_image_url=None, booking_count=0,
+        ))
+    return index
+
+
+def brute_force_ids(index: NearbyIndex, lat: float, lng: float, k: int, max_price=None):
+    """전체 배열 하버사인 (검증용)"""
+    snap = index.snapshot()
+    rows = np.arange(len(snap.ids))
+    if max_price is not None:
+        rows = rows[snap.price <= max_price]
+    distances = index._haversine_km(snap, rows, np.radians(lat), np.radians(lng))
+    order = np.argsort(distances, kind="stable")[:k]
+    return [int(snap.ids[rows[i]]) for i in order]
+
+
+def measure(index: NearbyIndex, queries, **kwargs):
+    timings = []
+    for lat, lng in queries:
+        t0 = time.perf_counter()
+        index.nearest(lat, lng, **kwargs)
+        timings.append((time.perf_counter() - t0) * 1_000_000)
+    timings.sort()
+    return timings[len(timings) // 2], timings[int(len(timings) * 0.99)]
+
+
+def main():
+    """k 최근접 조회의 지연 시간을 측정하고, 전체 탐색 결과와 일치하는지 확인합니다."""
+    parser = argparse.ArgumentParser(description="Benchmark k-nearest contents lookup")
+    parser.add_argument("--synthetic", type=int, default=0, help="DB 대신 N개의 합성 좌표로 인덱스 생성")
+    parser.add_argument("--queries", type=int, default=2000, help="조회 횟수")
+    parser.add_argument("--k", type=int, default=10, help="최근접 개수")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.synthetic:
+        index = synthetic_index(args.synthetic)
+        index.snapshot()
+        source = f"{args.synthetic} synthetic points"
+    else:
+        from database import SessionLocal
+        db = SessionLocal()
+        try:
+            index = build_nearby_index(db)
+        finally:
+            db.close()
+        source = "database"
+    print(f"--- Nearby (kNN) benchmark ({source}) ---")
+    print(f"✅ build: {time.perf_counter() - started:.2f}s | points: {len(index)}")
+    if not len(index):
+        print("⚠️ Index is empty.")
+        return
+
+    random.seed(7)
+    points = list(index.points.values())
+    # 실제 콘텐츠 위치 근처(상세 페이지의 '주변 투어') + 무작위 위치(내 위치)를 섞어서 조회
+    queries = [
+        (p.latitude + random.uniform(-0.01, 0.01), p.longitude + random.uniform(-0.01, 0.01))
+        for p in random.sample(points, min(len(points), args.queries // 2))
+    ] + [(random.uniform(33.2, 38.5), random.uniform(126.0, 129.5)) for _ in range(args.queries // 2)]
+
+    p50, p99 = measure(index, queries, k=args.k)
+    print(f"✅ nearest k={args.k}: p50 {p50:.0f} µs | p99 {p99:.0f} µs")
+    p50, p99 = measure(index, queries, k=args.k, max_price=50000)
+    print(f"✅ nearest k={args.k} (max_price): p50 {p50:.0f} µs | p99 {p99:.0f} µs")
+
+    mismatches = 0
+    for lat, lng in queries[:200]:
+        found = [r.point.content_id for r in index.nearest(lat, lng, k=args.k)]
+        if found != brute_force_ids(index, lat, lng, args.k):
+            mismatches += 1
+    print(f"   matches brute force: {200 - mismatches}/200")
+
+if __name__ == "__main__":
+    main()
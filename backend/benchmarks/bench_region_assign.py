@@ -0,0 +1,84 @@
+# backend/benchmarks/bench_region_assign.py
+
+import sys
+import os
+import math
+import time
+import random
+import argparse
+from dotenv import load_dotenv
+
+# 'backend' 폴더를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# 다른 모든 임포트 *전에* .env 파일 로드
+load_dotenv()
+
+from services.region_service import REGION_GEOJSON_PATH, Region, RegionLocator, _to_polygon, load_regions
+
+
+def synthetic_regions(rows: int = 16, cols: int = 16, vertices: int = 200):
+    """대한민국 범위를 rows x cols 로 나눈 '울퉁불퉁한' 다각형들 (시군구 약 250개, 경계점 수도 실제와 비슷하게)"""
+    random.seed(42)
+    regions = []
+    lat0, lng0, height, width = 33.1, 124.6, 5.5 / rows, 6.4 / cols
+    for row in range(rows):
+        for col in range(cols):
+            c_lat, c_lng = lat0 + (row + 0.5) * height, lng0 + (col + 0.5) * width
+            ring = []
+            for i in range(vertices):
+                angle = 2 * math.pi * i / vertices
+                scale = random.uniform(0.85, 1.0) / 2
+                ring.append((c_lng + math.cos(angle) * width * scale, c_lat + math.sin(angle) * height * scale))
+            ring.append(ring[0])
+            regions.append(Region(name=f"시도{row} 시군구{col}", sido=f"시도{row}", sigungu=f"시군구{col}",
+                                  polygons=[_to_polygon([ring])]))
+    return regions
+
+
+def locate_without_index(regions, lat: float, lng: float):
+    """사전 필터 없이 모든 폴리곤을 검사 (비교용)"""
+    for region in regions:
+        for polygon in region.polygons:
+            if polygon.contains(lat, lng):
+                return region
+    return None
+
+
+def main():
+    """좌표 -> 시군구 판정 처리량을 측정하고, 격자 사전 필터 결과가 전체 검사와 같은지 확인합니다."""
+    parser = argparse.ArgumentParser(description="Benchmark point-in-polygon region assignment")
+    parser.add_argument("--synthetic", action="store_true", help="경계 파일 대신 합성 다각형 사용")
+    parser.add_argument("--points", type=int, default=20000, help="판정할 좌표 수")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    regions = synthetic_regions() if args.synthetic else load_regions(REGION_GEOJSON_PATH)
+    locator = RegionLocator(regions)
+    vertices = sum(len(polygon.outer) for region in regions for polygon in region.polygons)
+    print(f"--- Region assignment benchmark ({'synthetic' if args.synthetic else REGION_GEOJSON_PATH}) ---")
+    print(f"✅ load + index: {time.perf_counter() - started:.2f}s | regions: {len(regions)} | vertices: {vertices} "
+          f"| grid cells: {len(locator.grid)}")
+
+    random.seed(7)
+    points = [(random.uniform(33.1, 38.6), random.uniform(124.6, 131.0)) for _ in range(args.points)]
+
+    t0 = time.perf_counter()
+    indexed = [locator.locate(lat, lng) for lat, lng in points]
+    indexed_elapsed = time.perf_counter() - t0
+    print(f"✅ grid prefilter: {args.points / indexed_elapsed:,.0f} points/s "
+          f"({indexed_elapsed * 1_000_000 / args.points:.1f} µs/point)")
+
+    sample = points[:min(len(points), 2000)]
+    t0 = time.perf_counter()
+    scanned = [locate_without_index(regions, lat, lng) for lat, lng in sample]
+    scan_elapsed = time.perf_counter() - t0
+    print(f"✅ full scan:      {len(sample) / scan_elapsed:,.0f} points/s "
+          f"({scan_elapsed * 1_000_000 / len(sample):.1f} µs/point)")
+
+    mismatches = sum(1 for a, b in zip(indexed, scanned) if a is not b)
+    print(f"   assigned: {sum(1 for r in indexed if r is not None)}/{len(points)} | "
+          f"matches full scan: {len(sample) - mismatches}/{len(sample)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# backend/benchmarks/bench_related.py
+
+import sys
+import os
+import time
+import random
+import argparse
+from dotenv import load_dotenv
+
+# 'backend' 폴더를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# 다른 모든 임포트 *전에* .env 파일 로드
+load_dotenv()
+
+import numpy as np
+
+from services.related_service import (
+    FEATURE_WEIGHTS, RELATED_TOP_K, RelatedFeatures, _hstack, _normalize_rows, _tfidf_block, compute_neighbours,
+)
+
+
+def synthetic_features(n_contents: int, n_tags: int = 300, n_review_tags: int = 40) -> RelatedFeatures:
+    """태그 3~8개(인기 태그 쏠림), 리뷰 태그, 17개 지역, 5개 가이드 캐릭터를 가진 합성 콘텐츠"""
+    random.seed(42)
+    tag_weights = [1 / (rank + 1) for rank in range(n_tags)]
+    tags, review_tags, locations, styles = [], [], [], []
+    for _ in range(n_contents):
+        tags.append({tag: 1.0 for tag in random.choices(range(n_tags), weights=tag_weights, k=random.randint(3, 8))})
+        review_tags.append({tag: float(random.randint(1, 20)) for tag in random.sample(range(n_review_tags), random.randint(0, 4))})
+        locations.append({random.randrange(17): 1.0})
+        styles.append({random.randrange(5): 1.0})
+    matrix = _normalize_rows(_hstack([
+        (_tfidf_block(tags, n_tags), FEATURE_WEIGHTS["tag"]),
+        (_tfidf_block(review_tags, n_review_tags), FEATURE_WEIGHTS["review_tag"]),
+        (_tfidf_block(locations, 17), FEATURE_WEIGHTS["location"]),
+        (_tfidf_block(styles, 5), FEATURE_WEIGHTS["style"]),
+    ]))
+    return RelatedFeatures(
+        content_ids=np.arange(1, n_contents + 1, dtype=np.int64),
+        popularity=np.array([random.randint(0, 500) for _ in range(n_contents)], dtype=np.int64),
+        matrix=matrix,
+    )
+
+
+def dense_scores(features: RelatedFeatures) -> np.ndarray:
+    """밀집 행렬 곱으로 구한 전체 코사인 유사도 (검증용, 작은 N 에서만)"""
+    matrix = features.matrix
+    dense = np.zeros((len(features.content_ids), matrix.n_cols))
+    rows = np.repeat(np.arange(len(features.content_ids)), np.diff(matrix.indptr))
+    dense[rows, matrix.indices] = matrix.data
+    scores = dense @ dense.T
+    np.fill_diagonal(scores, 0.0)
+    return scores
+
+
+def main():
+    """관련 콘텐츠 top-K 계산 시간을 측정하고, 밀집 행렬 곱 결과와 점수가 일치하는지 확인합니다."""
+    parser = argparse.ArgumentParser(description="Benchmark related contents precomputation")
+    parser.add_argument("--contents", type=int, default=20000, help="합성 콘텐츠 수")
+    parser.add_argument("--k", type=int, default=RELATED_TOP_K, help="콘텐츠당 이웃 수")
+    parser.add_argument("--verify", type=int, default=2000, help="밀집 행렬 곱과 비교할 콘텐츠 수 (0 이면 생략)")
+    args = parser.parse_args()
+
+    print(f"--- Related contents benchmark ({args.contents} synthetic contents) ---")
+    started = time.perf_counter()
+    features = synthetic_features(args.contents)
+    print(f"✅ features: {time.perf_counter() - started:.2f}s | {features.matrix.n_cols} columns, "
+          f"{len(features.matrix.data)} non-zeros")
+
+    started = time.perf_counter()
+    neighbours = compute_neighbours(features, args.k)
+    elapsed = time.perf_counter() - started
+    print(f"✅ top-{args.k}: {elapsed:.2f}s ({elapsed / args.contents * 1_000_000:.0f} µs per content)")
+
+    if args.verify:
+        small = synthetic_features(args.verify)
+        scores = dense_scores(small)
+        mismatches = 0
+        for i, items in compute_neighbours(small, args.k).items():
+            expected = np.sort(scores[i - 1][scores[i - 1] > 1e-9])[::-1][:args.k]
+            if not np.allclose([score for _, score in items], expected):
+                mismatches += 1
+        print(f"   matches dense product: {args.verify - mismatches}/{args.verify}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# backend/benchmarks/bench_review_feed.py
+
+import sys
+import os
+import time
+import argparse
+from dotenv import load_dotenv
+
+# 'backend' 폴더를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# 다른 모든 임포트 *전에* .env 파일 로드
+load_dotenv()
+
+from sqlalchemy import func
+
+from database import SessionLocal
+from models import GuideReview, Review
+from services import review_feed_service
+
+
+def walk(fetch, per_page: int, use_cursor: bool):
+    """피드를 끝까지 넘기며 페이지별 지연 시간(ms)을 기록합니다."""
+    timings, cursor, page = [], None, 1
+    while True:
+        started = time.perf_counter()
+        result = fetch(per_page=per_page, page=page, cursor=cursor if use_cursor else None)
+        timings.append((time.perf_counter() - started) * 1000)
+        if not result.items or (use_cursor and not result.next_cursor):
+            return timings
+        cursor, page = result.next_cursor, page + 1
+
+
+def report(label: str, timings: list):
+    tail = timings[-max(1, len(timings) // 10):]
+    print(f"   {label:<7} pages: {len(timings):>5} | first {timings[0]:6.2f} ms | "
+          f"last 10% avg {sum(tail) / len(tail):6.2f} ms | total {sum(timings):8.1f} ms")
+
+
+def main():
+    """리뷰가 가장 많은 콘텐츠/가이드의 피드를 OFFSET(page) 과 커서로 끝까지 넘기며 페이지 지연 시간을 비교합니다."""
+    parser = argparse.ArgumentParser(description="Benchmark review feed paging (offset vs keyset)")
+    parser.add_argument("--per-page", type=int, default=10, help="페이지당 리뷰 개수")
+    parser.add_argument("--sort", default="latest", choices=review_feed_service.REVIEW_SORTS, help="정렬")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        content_id = db.query(Review.content_id).group_by(Review.content_id)\
+                       .order_by(func.count(Review.id).desc()).limit(1).scalar()
+        guide_id = db.query(GuideReview.guide_id).group_by(GuideReview.guide_id)\
+                     .order_by(func.count(GuideReview.id).desc()).limit(1).scalar()
+        feeds = [
+            (f"content {content_id}", lambda **kw: review_feed_service.content_review_page(db, content_id, args.sort, **kw)),
+            (f"guide {guide_id}", lambda **kw: review_feed_service.guide_review_page(db, guide_id, args.sort, **kw)),
+        ]
+        for label, fetch in feeds:
+            if label.endswith("None"):
+                continue
+            total = fetch(per_page=1, page=1, cursor=None).total
+            print(f"--- Review feed: {label} ({total} reviews, sort={args.sort}) ---")
+            report("offset", walk(fetch, args.per_page, use_cursor=False))
+            report("cursor", walk(fetch, args.per_page, use_cursor=True))
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
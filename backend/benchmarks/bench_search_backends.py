@@ -0,0 +1,77 @@
+# backend/benchmarks/bench_search_backends.py
+
+import sys
+import os
+import time
+import argparse
+import statistics
+from dotenv import load_dotenv
+
+# 'backend' 폴더를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# 다른 모든 임포트 *전에* .env 파일 로드
+load_dotenv()
+
+from database import SessionLocal
+from models import Content
+from services import fulltext_search_service
+
+DEFAULT_QUERIES = ["해운대", "제주", "야경 투어", "한옥", "서핑 체험"]
+
+
+def ilike_search(db, terms, per_page):
+    """기존 ILIKE 경로와 같은 조건 (검색어마다 title/description ILIKE, 최신순)"""
+    query = db.query(Content.id).filter(Content.status == "Active")
+    for term in terms:
+        pattern = f"%{term}%"
+        query = query.filter(Content.title.ilike(pattern) | Content.description.ilike(pattern))
+    total = query.count()
+    ids = [row.id for row in query.order_by(Content.created_at.desc()).limit(per_page).all()]
+    return total, ids
+
+
+def fulltext_search(db, terms, per_page):
+    page = fulltext_search_service.search_page(db, terms, per_page)
+    return (page.total_count, page.ids) if page else (0, [])
+
+
+def run(name, fn, db, queries, per_page, repeat):
+    timings = []
+    totals = {}
+    for _ in range(repeat):
+        for q in queries:
+            terms = q.split()
+            started = time.perf_counter()
+            total, _ = fn(db, terms, per_page)
+            timings.append((time.perf_counter() - started) * 1000)
+            totals[q] = total
+    timings.sort()
+    p95 = timings[int(len(timings) * 0.95) - 1] if len(timings) >= 20 else timings[-1]
+    print(f"[{name}] p50 {statistics.median(timings):.2f} ms | p95 {p95:.2f} ms | max {timings[-1]:.2f} ms")
+    for q, total in totals.items():
+        print(f"    '{q}': {total} hits")
+
+
+def main():
+    """ILIKE 경로와 MySQL FULLTEXT(ngram) 경로의 검색 지연 시간을 비교합니다. (실제 DB 대상)"""
+    parser = argparse.ArgumentParser(description="Benchmark ILIKE vs FULLTEXT ngram search")
+    parser.add_argument("--repeat", type=int, default=20, help="검색어 목록 반복 횟수")
+    parser.add_argument("--per-page", type=int, default=9)
+    parser.add_argument("queries", nargs="*", default=DEFAULT_QUERIES, help="검색어 (공백으로 여러 단어)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        active = db.query(Content.id).filter(Content.status == "Active").count()
+        print(f"--- Search backend benchmark ({active} active contents, {args.repeat} rounds) ---")
+        run("ILIKE", ilike_search, db, args.queries, args.per_page, args.repeat)
+        try:
+            run("FULLTEXT", fulltext_search, db, args.queries, args.per_page, args.repeat)
+        except Exception as e:
+            print(f"[FULLTEXT] failed - is migrations/001_contents_fulltext_ngram.sql applied? ({e})")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,549 @@
+# app/cache.py
+
+import base64
+import dataclasses
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+# .env 파일에서 환경 변수를 로드합니다.
+load_dotenv()
+
+# 캐시 백엔드 선택
+# - "local": 프로세스 메모리 LRU (기본값, 워커마다 따로 가짐)
+# - "redis": 여러 uvicorn 워커가 같은 값/무효화를 공유 (REDIS_URL 필요)
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "local").lower()
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+# Redis 키 접두어 (같은 Redis 를 다른 서비스와 함께 쓸 때 충돌 방지)
+CACHE_KEY_PREFIX = os.getenv("CACHE_KEY_PREFIX", "travia")
+# Redis 가 연속 이 횟수만큼 실패하면 회로를 열고 워커 메모리 캐시로 전환합니다.
+CACHE_REDIS_FAILURE_THRESHOLD = int(os.getenv("CACHE_REDIS_FAILURE_THRESHOLD", "2"))
+# 회로가 열린 동안 Redis 를 다시 시도하는 간격(초)
+CACHE_REDIS_RETRY_SECONDS = float(os.getenv("CACHE_REDIS_RETRY_SECONDS", "5"))
+# 회로가 열린 동안 모아 둘 개별 삭제 수 (넘으면 복구 시 해당 캐시 전체를 비움)
+CACHE_REDIS_MAX_PENDING_DELETES = int(os.getenv("CACHE_REDIS_MAX_PENDING_DELETES", "1000"))
+
+# get() 이 '값 없음'을 None 과 구분하기 위한 표식 (None 도 캐시할 수 있음)
+MISSING = object()
+
+
+class CacheStats:
+    """캐시 적중/미스/축출 카운터 (/health 로 노출)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.sets = 0
+        self.errors = 0
+
+    def record(self, field: str, amount: int = 1):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + amount)
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "sets": self.sets,
+                "errors": self.errors,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+class CacheBackend:
+    """
+    모든 캐시 백엔드의 공통 인터페이스
+    - 키는 문자열, 값은 JSON 타입(dict/list/str/숫자/None) + tuple, bytes, datetime, date, Decimal
+      그리고 register_cache_type 으로 등록한 dataclass (RedisCache 가 직렬화할 수 있는 범위)
+    - ttl(초)이 None 이면 default_ttl, default_ttl 도 None 이면 만료 없음
+    """
+
+    def __init__(self, name: str, default_ttl: Optional[float] = None):
+        self.name = name
+        self.default_ttl = default_ttl
+        self.stats = CacheStats()
+
+    def get(self, key: str, default: Any = MISSING) -> Any:
+        raise NotImplementedError
+
+    def get_many(self, keys: List[str]) -> List[Any]:
+        """여러 키를 한 번에 조회합니다. 없는 키는 MISSING."""
+        return [self.get(key) for key in keys]
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def incr(self, key: str, amount: int = 1) -> int:
+        """정수 카운터를 원자적으로 증가시킵니다. (데이터 버전 등, 만료 없음)"""
+        raise NotImplementedError
+
+    def get_counters(self, keys: List[str]) -> List[int]:
+        """incr 로 관리하는 카운터 여러 개를 한 번에 읽습니다. (없으면 0, 적중/미스 통계에 넣지 않음)"""
+        raise NotImplementedError
+
+    def clear(self):
+        """이 캐시(이름 공간)의 모든 항목을 지웁니다."""
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def status(self) -> dict:
+        return {"backend": type(self).__name__, "entries": len(self), **self.stats.as_dict()}
+
+
+# ==================================================
+# 1. 프로세스 메모리 LRU + TTL
+# ==================================================
+
+class LocalLRUCache(CacheBackend):
+    """크기 제한이 있는 LRU. 가득 차면 가장 오래 사용하지 않은 항목부터 축출합니다."""
+
+    def __init__(self, name: str, max_entries: int = 1024, default_ttl: Optional[float] = None):
+        super().__init__(name, default_ttl)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # key -> (만료 시각 또는 None, 값)
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def _expires_at(self, ttl: Optional[float]) -> Optional[float]:
+        ttl = self.default_ttl if ttl is None else ttl
+        return time.monotonic() + ttl if ttl is not None else None
+
+    def get(self, key: str, default: Any = MISSING) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.stats.record("hits")
+                    return value
+                del self._data[key]
+        self.stats.record("misses")
+        return default
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        with self._lock:
+            self._data[key] = (self._expires_at(ttl), value)
+            self._data.move_to_end(key)
+            evicted = 0
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                evicted += 1
+        self.stats.record("sets")
+        if evicted:
+            self.stats.record("evictions", evicted)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def incr(self, key: str, amount: int = 1) -> int:
+        with self._lock:
+            _, value = self._data.get(key, (None, 0))
+            value += amount
+            self._data[key] = (None, value)
+            self._data.move_to_end(key)
+            return value
+
+    def get_counters(self, keys: List[str]) -> List[int]:
+        with self._lock:
+            return [self._data[key][1] if key in self._data else 0 for key in keys]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# ==================================================
+# 2. Redis 값 직렬화 (JSON)
+# ==================================================
+
+# pickle 은 역직렬화가 곧 코드 실행이라, Redis 에 쓸 수 있는 누구든 모든 워커에서 코드를 실행할 수 있게 됩니다.
+# 그래서 JSON 으로 저장하고, JSON 에 없는 타입은 {"__type__": 이름, "value": ...} 로 표시합니다.
+# dataclass 는 이름으로 등록된 클래스만 복원하므로 Redis 의 값이 임의의 클래스를 만들 수 없습니다.
+_TYPE_TAG = "__type__"
+_cache_types: Dict[str, type] = {}
+
+
+def register_cache_type(cls):
+    """RedisCache 에 저장할 수 있는 dataclass 로 등록합니다. (클래스 데코레이터)"""
+    if not dataclasses.is_dataclass(cls):
+        raise TypeError(f"{cls.__name__} is not a dataclass")
+    _cache_types[cls.__name__] = cls
+    return cls
+
+
+def _tagged(name: str, value: Any) -> dict:
+    return {_TYPE_TAG: name, "value": value}
+
+
+def _encode(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        if _TYPE_TAG not in value and all(isinstance(key, str) for key in value):
+            return {key: _encode(item) for key, item in value.items()}
+        # 문자열이 아닌 키 (또는 표시용 키와 겹치는 dict) 는 (키, 값) 목록으로
+        return _tagged("dict", [[_encode(key), _encode(item)] for key, item in value.items()])
+    if isinstance(value, tuple):
+        return _tagged("tuple", [_encode(item) for item in value])
+    if isinstance(value, bytes):
+        return _tagged("bytes", base64.b64encode(value).decode("ascii"))
+    if isinstance(value, datetime):
+        return _tagged("datetime", value.isoformat())
+    if isinstance(value, date):
+        return _tagged("date", value.isoformat())
+    if isinstance(value, Decimal):
+        return _tagged("decimal", str(value))
+    name = type(value).__name__
+    if _cache_types.get(name) is type(value):
+        return _tagged(name, {field.name: _encode(getattr(value, field.name))
+                              for field in dataclasses.fields(value)})
+    raise TypeError(f"cannot cache value of type {name}")
+
+
+def _decode_object(obj: dict) -> Any:
+    # json.loads 의 object_hook: 안쪽 값부터 복원되므로 "value" 는 이미 복원된 상태
+    if _TYPE_TAG not in obj:
+        return obj
+    name, value = obj[_TYPE_TAG], obj["value"]
+    if name == "dict":
+        return {key: item for key, item in value}
+    if name == "tuple":
+        return tuple(value)
+    if name == "bytes":
+        return base64.b64decode(value)
+    if name == "datetime":
+        return datetime.fromisoformat(value)
+    if name == "date":
+        return date.fromisoformat(value)
+    if name == "decimal":
+        return Decimal(value)
+    if name in _cache_types:
+        return _cache_types[name](**value)
+    raise ValueError(f"unknown cached type {name!r}")
+
+
+def dumps(value: Any) -> bytes:
+    return json.dumps(_encode(value), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(raw: bytes) -> Any:
+    return json.loads(raw, object_hook=_decode_object)
+
+
+# ==================================================
+# 3. Redis (여러 워커 공유)
+# ==================================================
+
+class RedisCache(CacheBackend):
+    """
+    Redis 에 '접두어:캐시이름:키' 로 저장합니다. 값은 JSON 으로 직렬화합니다. (dumps / loads)
+    client 를 넘기면 그 클라이언트를 사용합니다. (예: 로컬 검증용 fakeredis.FakeRedis())
+    LRU 축출은 Redis 서버의 maxmemory-policy(allkeys-lru 권장)가 담당합니다.
+    복원할 수 없는 값(다른 형식으로 쓰인 값 등)은 미스로 처리합니다.
+
+    Redis 장애 시 (캐시 때문에 API 가 느려지거나 실패하지 않도록)
+    - 연속 CACHE_REDIS_FAILURE_THRESHOLD 회 실패하면 회로를 열고, 그동안은 Redis 를 호출하지 않고
+      워커 메모리의 LocalLRUCache(fallback)를 씁니다. (요청마다 socket_timeout 을 기다리지 않음)
+    - CACHE_REDIS_RETRY_SECONDS 마다 요청 하나만 Redis 를 다시 시도하고, 성공하면 회로를 닫습니다.
+    - 회로가 열린 동안의 무효화(delete / incr / clear)는 모아 두었다가 복구 시 Redis 에 반영합니다.
+      (다른 워커가 장애 전의 값/버전을 계속 쓰지 않도록)
+    """
+
+    def __init__(self, name: str, default_ttl: Optional[float] = None, client=None, url: str = REDIS_URL,
+                 max_entries: int = 1024):
+        super().__init__(name, default_ttl)
+        if client is None:
+            import redis # 공유 모드에서만 필요한 의존성
+            client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+        self.client = client
+        self.namespace = f"{CACHE_KEY_PREFIX}:{name}:"
+        self.fallback = LocalLRUCache(name, max_entries=max_entries, default_ttl=default_ttl)
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        # 회로가 열린 동안 Redis 에 반영하지 못한 무효화
+        self._pending_deletes: set = set()
+        self._pending_incr: Dict[str, int] = {}
+        self._pending_clear = False
+
+    def _key(self, key: str) -> str:
+        return self.namespace + key
+
+    # --- 회로 (장애 시 fallback) ---
+
+    def _available(self) -> bool:
+        """Redis 를 호출해도 되는지. 회로가 열려 있으면 재시도 시각이 된 요청 하나만 통과시킵니다."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing or time.monotonic() - self._opened_at < CACHE_REDIS_RETRY_SECONDS:
+                return False
+            self._probing = True
+            return True
+
+    def _succeeded(self):
+        with self._lock:
+            self._consecutive_failures = 0
+            if self._opened_at is None:
+                return
+        # 복구: 모아 둔 무효화를 먼저 반영한 뒤 회로를 닫음 (반영에 실패하면 열린 상태 유지)
+        if not self._replay_pending():
+            return
+        self.fallback.clear()
+        with self._lock:
+            self._opened_at = None
+            self._probing = False
+        print(f"Cache '{self.name}' Redis recovered; circuit closed")
+
+    def _failed(self, operation: str, error: Exception):
+        self.stats.record("errors")
+        with self._lock:
+            self._consecutive_failures += 1
+            self._probing = False
+            was_open = self._opened_at is not None
+            if was_open or self._consecutive_failures >= CACHE_REDIS_FAILURE_THRESHOLD:
+                self._opened_at = time.monotonic()
+        if not was_open:
+            print(f"Cache '{self.name}' {operation} failed: {error}")
+            if self._opened_at is not None:
+                print(f"Cache '{self.name}' Redis circuit open; using local fallback for "
+                      f"{CACHE_REDIS_RETRY_SECONDS:g}s")
+
+    def _remember(self, delete: Optional[str] = None, incr: Optional[tuple] = None, clear: bool = False):
+        with self._lock:
+            if clear:
+                self._pending_clear = True
+                self._pending_deletes.clear()
+            elif delete is not None and not self._pending_clear:
+                self._pending_deletes.add(delete)
+                if len(self._pending_deletes) > CACHE_REDIS_MAX_PENDING_DELETES:
+                    # 너무 많으면 개별 삭제 대신 이 캐시 전체를 비움
+                    self._pending_clear = True
+                    self._pending_deletes.clear()
+            elif incr is not None:
+                key, amount = incr
+                self._pending_incr[key] = self._pending_incr.get(key, 0) + amount
+
+    def _replay_pending(self) -> bool:
+        with self._lock:
+            deletes, increments, clear = self._pending_deletes, self._pending_incr, self._pending_clear
+            self._pending_deletes, self._pending_incr, self._pending_clear = set(), {}, False
+        try:
+            if clear:
+                self._clear_namespace()
+            if deletes:
+                self.client.delete(*[self._key(key) for key in deletes])
+            for key, amount in increments.items():
+                self.client.incrby(self._key(key), amount)
+        except Exception as e:
+            # 반영하지 못한 무효화는 다음 복구 때 다시 시도 (일부가 반영됐어도 delete/clear 는 다시 해도 안전)
+            # incr 는 중복 반영될 수 있지만 버전 카운터는 '바뀌었는지'만 의미가 있으므로 문제없음
+            self._remember(clear=clear)
+            for key in deletes:
+                self._remember(delete=key)
+            for key, amount in increments.items():
+                self._remember(incr=(key, amount))
+            self._failed("replay", e)
+            return False
+        return True
+
+    # --- 값 ---
+
+    def _load(self, raw) -> Any:
+        if raw is None:
+            self.stats.record("misses")
+            return MISSING
+        try:
+            value = loads(raw)
+        except (ValueError, TypeError, KeyError) as e:
+            # 형식 문제이지 Redis 장애가 아니므로 회로에는 반영하지 않음
+            self.stats.record("errors")
+            print(f"Cache '{self.name}' decode failed: {e}")
+            self.stats.record("misses")
+            return MISSING
+        self.stats.record("hits")
+        return value
+
+    def get(self, key: str, default: Any = MISSING) -> Any:
+        if not self._available():
+            return self.fallback.get(key, default)
+        try:
+            raw = self.client.get(self._key(key))
+        except Exception as e:
+            self._failed("get", e)
+            return self.fallback.get(key, default)
+        self._succeeded()
+        value = self._load(raw)
+        return default if value is MISSING else value
+
+    def get_many(self, keys: List[str]) -> List[Any]:
+        if not keys:
+            return []
+        if not self._available():
+            return self.fallback.get_many(keys)
+        try:
+            raws = self.client.mget([self._key(k) for k in keys])
+        except Exception as e:
+            self._failed("get_many", e)
+            return self.fallback.get_many(keys)
+        self._succeeded()
+        return [self._load(raw) for raw in raws]
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        ttl = self.default_ttl if ttl is None else ttl
+        try:
+            payload = dumps(value)
+        except (TypeError, ValueError) as e:
+            self.stats.record("errors")
+            print(f"Cache '{self.name}' set failed: {e}")
+            return
+        if not self._available():
+            self.fallback.set(key, value, ttl=ttl)
+            return
+        px = int(ttl * 1000) if ttl is not None else None
+        try:
+            self.client.set(self._key(key), payload, px=px)
+        except Exception as e:
+            self._failed("set", e)
+            self.fallback.set(key, value, ttl=ttl)
+            return
+        self._succeeded()
+        self.stats.record("sets")
+
+    def delete(self, key: str):
+        if self._available():
+            try:
+                self.client.delete(self._key(key))
+                self._succeeded()
+                return
+            except Exception as e:
+                self._failed("delete", e)
+        self.fallback.delete(key)
+        self._remember(delete=key)
+
+    def incr(self, key: str, amount: int = 1) -> int:
+        # 카운터는 JSON 이 아닌 Redis 정수로 저장 (INCRBY 가 원자적으로 처리)
+        if self._available():
+            try:
+                value = int(self.client.incrby(self._key(key), amount))
+                self._succeeded()
+                return value
+            except Exception as e:
+                self._failed("incr", e)
+        self._remember(incr=(key, amount))
+        return self.fallback.incr(key, amount)
+
+    def get_counters(self, keys: List[str]) -> List[int]:
+        if not keys:
+            return []
+        if not self._available():
+            return self.fallback.get_counters(keys)
+        try:
+            raws = self.client.mget([self._key(k) for k in keys])
+        except Exception as e:
+            self._failed("get_counters", e)
+            return self.fallback.get_counters(keys)
+        self._succeeded()
+        return [int(raw) if raw is not None else 0 for raw in raws]
+
+    def _clear_namespace(self):
+        batch = []
+        for key in self.client.scan_iter(match=self.namespace + "*", count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                self.client.delete(*batch)
+                batch = []
+        if batch:
+            self.client.delete(*batch)
+
+    def clear(self):
+        self.fallback.clear()
+        if self._available():
+            try:
+                self._clear_namespace()
+                self._succeeded()
+                return
+            except Exception as e:
+                self._failed("clear", e)
+        self._remember(clear=True)
+
+    def __len__(self) -> int:
+        if not self._available():
+            return len(self.fallback)
+        return sum(1 for _ in self.client.scan_iter(match=self.namespace + "*", count=500))
+
+    def status(self) -> dict:
+        # 항목 수 집계는 SCAN 이 필요하므로 상태 조회에서는 생략
+        with self._lock:
+            circuit = "open" if self._opened_at is not None else "closed"
+            pending = len(self._pending_deletes) + len(self._pending_incr) + int(self._pending_clear)
+        return {"backend": type(self).__name__, "circuit": circuit, "pending_invalidations": pending,
+                **self.stats.as_dict()}
+
+
+# ==================================================
+# 4. 캐시 레지스트리
+# ==================================================
+
+_caches: Dict[str, CacheBackend] = {}
+_registry_lock = threading.Lock()
+
+
+def get_cache(
+    name: str,
+    max_entries: int = 1024,
+    default_ttl: Optional[float] = None,
+    shared: bool = True,
+) -> CacheBackend:
+    """
+    이름별 캐시를 반환합니다. (같은 이름이면 같은 객체)
+    shared=False 이면 CACHE_BACKEND 와 관계없이 항상 프로세스 메모리를 사용합니다.
+    (예: 응답 객체처럼 워커 간에 공유할 필요가 없고 직렬화 비용이 아까운 값)
+    """
+    with _registry_lock:
+        cache = _caches.get(name)
+        if cache is None:
+            if shared and CACHE_BACKEND == "redis":
+                cache = RedisCache(name, default_ttl=default_ttl, max_entries=max_entries)
+            else:
+                cache = LocalLRUCache(name, max_entries=max_entries, default_ttl=default_ttl)
+            _caches[name] = cache
+        return cache
+
+
+def all_stats() -> dict:
+    """등록된 모든 캐시의 상태 (/health 용)"""
+    with _registry_lock:
+        caches = list(_caches.values())
+    result = {}
+    for cache in caches:
+        try:
+            result[cache.name] = cache.status()
+        except Exception as e:
+            result[cache.name] = {"backend": type(cache).__name__, "error": str(e)}
+    return result
@@ -49,6 +49,8 @@ location VARCHAR(10) NOT NULL, -- 지역 코드 (예: SEO, BAR, ROM)
 status VARCHAR(10) NOT NULL, -- 'Draft', 'Active', 'Archived'
 created_at DATETIME NOT NULL,
 PRIMARY KEY (id),
+KEY ix_contents_status_created_id (status, created_at, id), -- 목록 커서 페이징용
+FULLTEXT KEY ft_contents_title_description (title, description) WITH PARSER ngram, -- SEARCH_BACKEND=fulltext 용
 FOREIGN KEY (guide_id) REFERENCES travel_project.guide_profiles (users_id)
 ON DELETE RESTRICT -- 가이드가 삭제되려면 모든 콘텐츠가 먼저 삭제되어야 함
 ON UPDATE CASCADE
@@ -101,14 +103,20 @@ ON UPDATE CASCADE
 CREATE TABLE travel_project.reviews (
 id INT NOT NULL AUTO_INCREMENT,
 booking_id INT NOT NULL UNIQUE, -- 예약 당 하나의 상품 리뷰만 허용
+content_id INT NOT NULL, -- bookings.content_id 사본 (리뷰 피드 인덱스용)
 reviewer_id INT NOT NULL,
 rating INT NOT NULL, -- 상품 품질 평점 (1-5)
 text TEXT NOT NULL,
 created_at DATETIME NOT NULL,
 PRIMARY KEY (id),
+KEY ix_reviews_content_created_id (content_id, created_at, id), -- 리뷰 피드 커서 페이징용
+KEY ix_reviews_content_rating_created_id (content_id, rating, created_at, id),
 FOREIGN KEY (booking_id) REFERENCES travel_project.bookings (id)
 ON DELETE RESTRICT
 ON UPDATE CASCADE,
+FOREIGN KEY (content_id) REFERENCES travel_project.contents (id)
+ON DELETE RESTRICT
+ON UPDATE CASCADE,
 FOREIGN KEY (reviewer_id) REFERENCES travel_project.users (id)
 ON DELETE RESTRICT
 ON UPDATE CASCADE
@@ -164,6 +172,8 @@ rating INT NOT NULL, -- 가이드 매너/서비스 평점 (1-5)
 text TEXT NOT NULL,
 created_at DATETIME NOT NULL,
 PRIMARY KEY (id),
+KEY ix_guide_reviews_guide_created_id (guide_id, created_at, id), -- 리뷰 피드 커서 페이징용
+KEY ix_guide_reviews_guide_rating_created_id (guide_id, rating, created_at, id),
 FOREIGN KEY (booking_id) REFERENCES travel_project.bookings (id)
 ON DELETE RESTRICT
 ON UPDATE CASCADE,
@@ -195,3 +205,123 @@ FOREIGN KEY (traveler_id) REFERENCES travel_project.users (id)
 ON DELETE RESTRICT
 ON UPDATE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- search_outbox 테이블 (검색 인덱스 동기화 이벤트 - 쓰기 트랜잭션과 함께 기록)
+CREATE TABLE travel_project.search_outbox (
+id INT NOT NULL AUTO_INCREMENT,
+content_id INT NOT NULL,
+reason VARCHAR(20) NOT NULL, -- 'content', 'review', 'tags', 'guide'
+created_at DATETIME NOT NULL,
+processed_at DATETIME, -- NULL 이면 미처리
+PRIMARY KEY (id),
+KEY ix_search_outbox_pending (processed_at, id),
+KEY ix_search_outbox_content_id (content_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- content_stats 테이블 (콘텐츠별 평점/리뷰/예약 집계 - 리뷰/예약 쓰기 시 증분 갱신)
+CREATE TABLE travel_project.content_stats (
+content_id INT NOT NULL,
+review_count INT NOT NULL DEFAULT 0,
+rating_sum INT NOT NULL DEFAULT 0,
+avg_rating FLOAT, -- 리뷰가 없으면 NULL
+rating_1 INT NOT NULL DEFAULT 0,
+rating_2 INT NOT NULL DEFAULT 0,
+rating_3 INT NOT NULL DEFAULT 0,
+rating_4 INT NOT NULL DEFAULT 0,
+rating_5 INT NOT NULL DEFAULT 0,
+booking_count INT NOT NULL DEFAULT 0, -- 취소/거절 제외
+main_image_url VARCHAR(255),
+updated_at DATETIME NOT NULL,
+PRIMARY KEY (content_id),
+FOREIGN KEY (content_id) REFERENCES travel_project.contents (id)
+ON DELETE CASCADE
+ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+
+-- content_regions 테이블 (콘텐츠 좌표 -> 시도/시군구 경계 배정 - run_assign_regions.py / change feed)
+CREATE TABLE travel_project.content_regions (
+content_id INT NOT NULL,
+region_name VARCHAR(100) NOT NULL, -- '부산광역시 해운대구'
+sido_name VARCHAR(50) NOT NULL,
+sigungu_name VARCHAR(50), -- 시군구가 없는 지역(세종시 등)은 NULL
+updated_at DATETIME NOT NULL,
+PRIMARY KEY (content_id),
+KEY ix_content_regions_region_name (region_name),
+KEY ix_content_regions_sido_sigungu (sido_name, sigungu_name),
+FOREIGN KEY (content_id) REFERENCES travel_project.contents (id)
+ON DELETE CASCADE
+ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- content_related 테이블 (콘텐츠별 상위 K 관련 콘텐츠 - run_build_related.py 가 재계산)
+CREATE TABLE travel_project.content_related (
+content_id INT NOT NULL,
+sort_order INT NOT NULL, -- 1 부터 (유사도 높은 순)
+related_content_id INT NOT NULL,
+score FLOAT NOT NULL, -- 코사인 유사도 (0 ~ 1)
+updated_at DATETIME NOT NULL,
+PRIMARY KEY (content_id, sort_order),
+KEY ix_content_related_related_content_id (related_content_id),
+FOREIGN KEY (content_id) REFERENCES travel_project.contents (id)
+ON DELETE CASCADE
+ON UPDATE CASCADE,
+FOREIGN KEY (related_content_id) REFERENCES travel_project.contents (id)
+ON DELETE CASCADE
+ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- guide_summary 테이블 (가이드 프로필용 집계 - 리뷰/태깅 시 증분 갱신, run_reconcile_guide_summary.py 가 재계산)
+CREATE TABLE travel_project.guide_summary (
+guide_id INT NOT NULL,
+review_count INT NOT NULL DEFAULT 0,
+rating_sum INT NOT NULL DEFAULT 0,
+avg_rating FLOAT, -- 리뷰가 없으면 NULL
+content_count INT NOT NULL DEFAULT 0, -- Active 콘텐츠 수
+updated_at DATETIME NOT NULL,
+PRIMARY KEY (guide_id),
+FOREIGN KEY (guide_id) REFERENCES travel_project.guide_profiles (users_id)
+ON DELETE CASCADE
+ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- guide_summary_characters 테이블 (가이드 리뷰의 AI 캐릭터별 리뷰 수)
+CREATE TABLE travel_project.guide_summary_characters (
+guide_id INT NOT NULL,
+ai_character_id INT NOT NULL,
+review_count INT NOT NULL DEFAULT 0,
+PRIMARY KEY (guide_id, ai_character_id), -- ai_characters 는 models.py 로 생성되므로 FK 는 모델에만 둠
+FOREIGN KEY (guide_id) REFERENCES travel_project.guide_profiles (users_id)
+ON DELETE CASCADE
+ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- guide_summary_tags 테이블 (가이드 리뷰에서 추출된 태그별 횟수)
+CREATE TABLE travel_project.guide_summary_tags (
+guide_id INT NOT NULL,
+tag_id INT NOT NULL,
+tag_count INT NOT NULL DEFAULT 0,
+PRIMARY KEY (guide_id, tag_id),
+KEY ix_guide_summary_tags_guide_count (guide_id, tag_count), -- 상위 태그 조회용
+FOREIGN KEY (guide_id) REFERENCES travel_project.guide_profiles (users_id)
+ON DELETE CASCADE
+ON UPDATE CASCADE,
+FOREIGN KEY (tag_id) REFERENCES travel_project.tags (id)
+ON DELETE CASCADE
+ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- content_slots 테이블 (콘텐츠 일정별 예약 정원 - booked + 인원 <= capacity 조건부 UPDATE 로 예약)
+CREATE TABLE travel_project.content_slots (
+id INT NOT NULL AUTO_INCREMENT,
+content_id INT NOT NULL,
+start_at DATETIME NOT NULL, -- 예약 일시 (bookings.booking_date 와 같은 값)
+capacity INT NOT NULL,
+booked INT NOT NULL DEFAULT 0, -- 취소/거절되지 않은 예약 인원 합계
+updated_at DATETIME NOT NULL,
+PRIMARY KEY (id),
+UNIQUE KEY uq_content_slots_content_start (content_id, start_at),
+FOREIGN KEY (content_id) REFERENCES travel_project.contents (id)
+ON DELETE CASCADE
+ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
\ No newline at end of file
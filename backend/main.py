@@ -1,13 +1,50 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+import cache
 # routers 패키지에서 각 모듈 임포트
-from routers import content, auth, booking, review, character
+from routers import content, auth, booking, review, character, guide
+from services import (
+    elasticsearch_service, change_feed_service, text_index_service, tag_index_service, suggest_service,
+    fuzzy_service, response_cache_service, geo_index_service, nearby_service, region_service,
+    content_detail_service, guide_summary_service, memory_index_service
+)
+from services.count_cache_service import on_content_change as invalidate_count_cache_on_change
+
+
+# 0. 앱 수명주기 (Lifespan)
+# 외부 의존성(ES)과 메모리 인덱스 빌드는 기동을 막지 않도록 백그라운드에서 진행합니다.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await elasticsearch_service.start()
+    # outbox 를 변경 로그로 구독 (배치 스크립트 등 다른 프로세스의 변경도 반영)
+    await change_feed_service.start()
+    # 지역 배정은 응답 캐시 무효화보다 먼저 (무효화 직후 요청이 이전 지역 집계를 다시 캐시하지 않도록)
+    change_feed_service.register_listener(region_service.on_content_change)
+    change_feed_service.register_listener(invalidate_count_cache_on_change)
+    change_feed_service.register_listener(content_detail_service.on_content_change)
+    change_feed_service.register_listener(guide_summary_service.on_content_change)
+    change_feed_service.register_listener(response_cache_service.on_content_change)
+    await text_index_service.text_index.start()
+    await tag_index_service.tag_index.start()
+    await suggest_service.suggest_index.start()
+    await fuzzy_service.fuzzy_dictionary.start()
+    await geo_index_service.geo_index.start()
+    await nearby_service.nearby_index.start()
+    yield
+    # 텍스트/태그/제안/오타/지도/근처 인덱스를 포함해 start() 된 모든 메모리 인덱스의 빌드를 정리
+    await memory_index_service.stop_all()
+    await change_feed_service.stop()
+    await elasticsearch_service.stop()
+
 
 # 1. FastAPI 애플리케이션 인스턴스 생성
 app = FastAPI(
     title="Travia Project API",
     description="여행 가이드 및 콘텐츠 예약 플랫폼 API",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # 2. CORS 설정
@@ -19,6 +56,10 @@ origins = [
     "http://127.0.0.1:5173",    # 로컬 호스트 IP 접속 대비
 ]
 
+# 2-0. 응답 캐시 (ETag / 304)
+# CORS 보다 먼저 등록해야 CORS 가 바깥쪽에서 캐시/304 응답에도 헤더를 붙입니다.
+app.add_middleware(response_cache_service.ResponseCacheMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -63,7 +104,32 @@ app.include_router(
     tags=["Characters"]
 )
 
+# 3-6. 가이드 라우터 (가이드 프로필 페이지용 조회)
+app.include_router(
+    guide.router,
+    prefix="/guides",
+    tags=["Guides"]
+)
+
 # 4. 루트 경로 테스트
 @app.get("/")
 def read_root():
-    return {"message": "Travia API server is running successfully."}
\ No newline at end of file
+    return {"message": "Travia API server is running successfully."}
+
+# 5. 헬스 체크 (의존 서비스 상태)
+@app.get("/health")
+def health_check():
+    return {
+        "status": "ok",
+        "elasticsearch": elasticsearch_service.health(),
+        "response_cache": response_cache_service.status(),
+        "caches": cache.all_stats(),
+        "memory_indexes": {
+            text_index_service.text_index.name: text_index_service.text_index.status(),
+            tag_index_service.tag_index.name: tag_index_service.tag_index.status(),
+            suggest_service.suggest_index.name: suggest_service.suggest_index.status(),
+            fuzzy_service.fuzzy_dictionary.name: fuzzy_service.fuzzy_dictionary.status(),
+            geo_index_service.geo_index.name: geo_index_service.geo_index.status(),
+            nearby_service.nearby_index.name: nearby_service.nearby_index.status(),
+        },
+    }
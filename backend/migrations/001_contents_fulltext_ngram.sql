@@ -0,0 +1,17 @@
+-- ==================================================
+-- Migration 001: contents FULLTEXT (ngram) 인덱스 추가
+-- SEARCH_BACKEND=fulltext 설정 시 get_content_list 가 사용하는
+-- MATCH(title, description) AGAINST (... IN BOOLEAN MODE) 검색용 인덱스입니다.
+-- * ngram_token_size 는 기본값(2)을 사용합니다. (한국어 글자 바이그램)
+--   토큰이 두 글자 단위라 한 글자 검색어("섬", "산")는 어떤 토큰과도 일치하지 않아 결과가 0건입니다.
+--   (메모리 인덱스/ES 경로는 한 글자 검색어도 찾음. ngram_token_size=1 은 인덱스가 크게 늘고 두 글자 검색이 느려짐)
+-- * 대용량 테이블에서는 인덱스 생성 중 쓰기가 지연될 수 있으므로 트래픽이 적은 시간에 실행하세요.
+-- ==================================================
+
+USE travel_project;
+
+ALTER TABLE travel_project.contents
+    ADD FULLTEXT INDEX ft_contents_title_description (title, description) WITH PARSER ngram;
+
+-- 롤백:
+-- ALTER TABLE travel_project.contents DROP INDEX ft_contents_title_description;
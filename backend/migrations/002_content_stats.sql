@@ -0,0 +1,31 @@
+-- ==================================================
+-- Migration 002: content_stats 집계 테이블 추가
+-- 콘텐츠별 평균 평점 / 리뷰 수 / 평점 분포 / 예약 수 / 메인 이미지를 한 행에 보관합니다.
+-- * 리뷰 작성, 예약 생성/상태 변경 시 같은 트랜잭션에서 증분 갱신됩니다.
+-- * 테이블 생성 직후 `python run_reconcile_stats.py` 로 기존 데이터를 채우세요.
+--   (채우기 전에는 지도/관련 상품의 평점이 0 으로 보입니다. 상세 조회는 원본에서 집계)
+-- ==================================================
+
+USE travel_project;
+
+CREATE TABLE travel_project.content_stats (
+content_id INT NOT NULL,
+review_count INT NOT NULL DEFAULT 0,
+rating_sum INT NOT NULL DEFAULT 0,
+avg_rating FLOAT, -- 리뷰가 없으면 NULL
+rating_1 INT NOT NULL DEFAULT 0,
+rating_2 INT NOT NULL DEFAULT 0,
+rating_3 INT NOT NULL DEFAULT 0,
+rating_4 INT NOT NULL DEFAULT 0,
+rating_5 INT NOT NULL DEFAULT 0,
+booking_count INT NOT NULL DEFAULT 0, -- 취소/거절 제외
+main_image_url VARCHAR(255),
+updated_at DATETIME NOT NULL,
+PRIMARY KEY (content_id),
+FOREIGN KEY (content_id) REFERENCES travel_project.contents (id)
+ON DELETE CASCADE
+ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 롤백:
+-- DROP TABLE travel_project.content_stats;
@@ -0,0 +1,26 @@
+-- ==================================================
+-- Migration 003: content_regions 지역 배정 테이블 추가
+-- 콘텐츠 좌표가 속한 시도/시군구(프론트엔드 지도와 같은 GeoJSON 경계)를 한 행에 보관합니다.
+-- * 새로 등록되었거나 좌표가 바뀐 콘텐츠는 API 의 change feed 가 다시 배정합니다.
+-- * 테이블 생성 직후 `python run_assign_regions.py` 로 기존 콘텐츠를 배정하세요.
+--   (배정 전에는 지역별 콘텐츠 수가 비어 있고, 지도 지역 필터는 location 코드로만 동작합니다)
+-- ==================================================
+
+USE travel_project;
+
+CREATE TABLE travel_project.content_regions (
+content_id INT NOT NULL,
+region_name VARCHAR(100) NOT NULL, -- '부산광역시 해운대구'
+sido_name VARCHAR(50) NOT NULL,
+sigungu_name VARCHAR(50), -- 시군구가 없는 지역(세종시 등)은 NULL
+updated_at DATETIME NOT NULL,
+PRIMARY KEY (content_id),
+KEY ix_content_regions_region_name (region_name),
+KEY ix_content_regions_sido_sigungu (sido_name, sigungu_name),
+FOREIGN KEY (content_id) REFERENCES travel_project.contents (id)
+ON DELETE CASCADE
+ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 롤백:
+-- DROP TABLE travel_project.content_regions;
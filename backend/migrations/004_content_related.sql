@@ -0,0 +1,28 @@
+-- ==================================================
+-- Migration 004: content_related 관련 콘텐츠 테이블 추가
+-- 상품 태그 / 리뷰 태그 / 지역 / 가이드 캐릭터의 TF-IDF 코사인 유사도로 계산한
+-- 콘텐츠별 상위 K 개 이웃을 보관합니다.
+-- * 테이블 생성 후 `python run_build_related.py` 로 채우고, 주기적으로(예: 매일) 다시 실행하세요.
+--   (이웃이 없는 콘텐츠의 상세 페이지는 기존처럼 최신 콘텐츠를 관련 콘텐츠로 보여줍니다)
+-- ==================================================
+
+USE travel_project;
+
+CREATE TABLE travel_project.content_related (
+content_id INT NOT NULL,
+sort_order INT NOT NULL, -- 1 부터 (유사도 높은 순)
+related_content_id INT NOT NULL,
+score FLOAT NOT NULL, -- 코사인 유사도 (0 ~ 1)
+updated_at DATETIME NOT NULL,
+PRIMARY KEY (content_id, sort_order),
+KEY ix_content_related_related_content_id (related_content_id),
+FOREIGN KEY (content_id) REFERENCES travel_project.contents (id)
+ON DELETE CASCADE
+ON UPDATE CASCADE,
+FOREIGN KEY (related_content_id) REFERENCES travel_project.contents (id)
+ON DELETE CASCADE
+ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 롤백:
+-- DROP TABLE travel_project.content_related;
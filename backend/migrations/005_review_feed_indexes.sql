@@ -0,0 +1,34 @@
+-- ==================================================
+-- Migration 005: 리뷰 피드 커서 페이징용 컬럼/인덱스 추가
+-- GET /content/{id}/reviews, GET /guides/{id}/reviews 가 (created_at, id) / (rating, created_at, id)
+-- 순서로 인덱스를 따라 seek 하도록 합니다.
+-- * reviews.content_id 는 bookings.content_id 의 사본입니다. (리뷰 작성 시 함께 저장)
+-- * 대용량 테이블에서는 인덱스 생성 중 쓰기가 지연될 수 있으므로 트래픽이 적은 시간에 실행하세요.
+-- ==================================================
+
+USE travel_project;
+
+ALTER TABLE travel_project.reviews ADD COLUMN content_id INT NULL AFTER booking_id;
+
+UPDATE travel_project.reviews r
+JOIN travel_project.bookings b ON b.id = r.booking_id
+SET r.content_id = b.content_id;
+
+ALTER TABLE travel_project.reviews
+    MODIFY content_id INT NOT NULL,
+    ADD INDEX ix_reviews_content_created_id (content_id, created_at, id),
+    ADD INDEX ix_reviews_content_rating_created_id (content_id, rating, created_at, id),
+    ADD CONSTRAINT fk_reviews_content_id FOREIGN KEY (content_id) REFERENCES travel_project.contents (id)
+        ON DELETE RESTRICT
+        ON UPDATE CASCADE;
+
+ALTER TABLE travel_project.guide_reviews
+    ADD INDEX ix_guide_reviews_guide_created_id (guide_id, created_at, id),
+    ADD INDEX ix_guide_reviews_guide_rating_created_id (guide_id, rating, created_at, id);
+
+-- 롤백:
+-- ALTER TABLE travel_project.guide_reviews
+--     DROP INDEX ix_guide_reviews_guide_created_id, DROP INDEX ix_guide_reviews_guide_rating_created_id;
+-- ALTER TABLE travel_project.reviews DROP FOREIGN KEY fk_reviews_content_id;
+-- ALTER TABLE travel_project.reviews
+--     DROP INDEX ix_reviews_content_created_id, DROP INDEX ix_reviews_content_rating_created_id, DROP COLUMN content_id;
@@ -0,0 +1,53 @@
+-- ==================================================
+-- Migration 006: guide_summary 가이드 요약 테이블 추가
+-- 가이드 프로필 API(GET /guides/{id})가 읽는 평균 평점 / 리뷰 수 / 콘텐츠 수 / 캐릭터 분포 / 상위 태그입니다.
+-- * 가이드 리뷰 작성, AI 캐릭터 분류 시 같은 트랜잭션에서 증분 갱신됩니다.
+-- * 테이블 생성 직후 `python run_reconcile_guide_summary.py` 로 기존 데이터를 채우세요.
+--   (채우기 전에는 프로필 조회 시 원본에서 집계합니다)
+-- ==================================================
+
+USE travel_project;
+
+CREATE TABLE travel_project.guide_summary (
+guide_id INT NOT NULL,
+review_count INT NOT NULL DEFAULT 0,
+rating_sum INT NOT NULL DEFAULT 0,
+avg_rating FLOAT, -- 리뷰가 없으면 NULL
+content_count INT NOT NULL DEFAULT 0, -- Active 콘텐츠 수
+updated_at DATETIME NOT NULL,
+PRIMARY KEY (guide_id),
+FOREIGN KEY (guide_id) REFERENCES travel_project.guide_profiles (users_id)
+ON DELETE CASCADE
+ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- guide_summary_characters 테이블 (가이드 리뷰의 AI 캐릭터별 리뷰 수)
+CREATE TABLE travel_project.guide_summary_characters (
+guide_id INT NOT NULL,
+ai_character_id INT NOT NULL,
+review_count INT NOT NULL DEFAULT 0,
+PRIMARY KEY (guide_id, ai_character_id), -- ai_characters 는 models.py 로 생성되므로 FK 는 모델에만 둠
+FOREIGN KEY (guide_id) REFERENCES travel_project.guide_profiles (users_id)
+ON DELETE CASCADE
+ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- guide_summary_tags 테이블 (가이드 리뷰에서 추출된 태그별 횟수)
+CREATE TABLE travel_project.guide_summary_tags (
+guide_id INT NOT NULL,
+tag_id INT NOT NULL,
+tag_count INT NOT NULL DEFAULT 0,
+PRIMARY KEY (guide_id, tag_id),
+KEY ix_guide_summary_tags_guide_count (guide_id, tag_count), -- 상위 태그 조회용
+FOREIGN KEY (guide_id) REFERENCES travel_project.guide_profiles (users_id)
+ON DELETE CASCADE
+ON UPDATE CASCADE,
+FOREIGN KEY (tag_id) REFERENCES travel_project.tags (id)
+ON DELETE CASCADE
+ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 롤백:
+-- DROP TABLE travel_project.guide_summary_tags;
+-- DROP TABLE travel_project.guide_summary_characters;
+-- DROP TABLE travel_project.guide_summary;
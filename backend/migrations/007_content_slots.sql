@@ -0,0 +1,41 @@
+-- ==================================================
+-- Migration 007: content_slots 예약 정원 테이블 추가
+-- 콘텐츠의 일정(예약 일시)별 정원(capacity)과 예약된 인원(booked)입니다.
+-- * 예약 생성은 `booked = booked + 인원 WHERE booked + 인원 <= capacity` 조건부 UPDATE 로 자리를 잡고,
+--   취소/거절 시 같은 트랜잭션에서 인원을 돌려놓습니다. (services/booking_slot_service.py)
+-- * 슬롯이 없는 일시의 첫 예약은 DEFAULT_SLOT_CAPACITY(기본 10명) 정원으로 슬롯을 만듭니다.
+--   가이드는 PUT /bookings/slots/{content_id} 로 일정별 정원을 바꿀 수 있습니다.
+-- * 아래 INSERT 가 기존 예약으로 슬롯을 채웁니다. 이후 점검은 `python run_reconcile_booking_slots.py`
+-- ==================================================
+
+USE travel_project;
+
+CREATE TABLE travel_project.content_slots (
+id INT NOT NULL AUTO_INCREMENT,
+content_id INT NOT NULL,
+start_at DATETIME NOT NULL, -- 예약 일시 (bookings.booking_date 와 같은 값)
+capacity INT NOT NULL,
+booked INT NOT NULL DEFAULT 0, -- 취소/거절되지 않은 예약 인원 합계
+updated_at DATETIME NOT NULL,
+PRIMARY KEY (id),
+UNIQUE KEY uq_content_slots_content_start (content_id, start_at),
+FOREIGN KEY (content_id) REFERENCES travel_project.contents (id)
+ON DELETE CASCADE
+ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 기존 예약 일시를 분 단위로 맞춤 (슬롯 조회/반납은 분 단위로 자른 일시로 하므로,
+-- 초가 남은 예약은 취소해도 자리가 돌아오지 않고 같은 분의 새 예약이 별도 슬롯을 만들게 됨)
+UPDATE travel_project.bookings
+SET booking_date = DATE_FORMAT(booking_date, '%Y-%m-%d %H:%i:00')
+WHERE SECOND(booking_date) <> 0 OR MICROSECOND(booking_date) <> 0;
+
+-- 기존 예약으로 슬롯 채우기 (이미 정원을 넘긴 일정은 예약된 인원을 정원으로 둠)
+INSERT INTO travel_project.content_slots (content_id, start_at, capacity, booked, updated_at)
+SELECT content_id, booking_date, GREATEST(10, SUM(personnel)), SUM(personnel), NOW()
+FROM travel_project.bookings
+WHERE status NOT IN ('Canceled', 'Rejected')
+GROUP BY content_id, booking_date;
+
+-- 롤백:
+-- DROP TABLE travel_project.content_slots;
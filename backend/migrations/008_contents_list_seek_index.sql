@@ -0,0 +1,16 @@
+-- ==================================================
+-- Migration 008: contents 목록 커서 페이징용 인덱스 추가
+-- GET /content/list 의 기본 정렬(최신순)이 status 필터 + (created_at, id) 내림차순으로
+-- 인덱스를 따라 seek 하도록 합니다. (페이지 깊이와 관계없이 일정한 지연 시간)
+-- * db_init.sql / models.py 로 새로 만든 DB 에는 이미 있습니다. 기존 DB 에만 적용하세요.
+--   (create_all 은 이미 있는 테이블에 인덱스를 추가하지 않음)
+-- * InnoDB 보조 인덱스는 온라인으로 생성되지만, 대용량 테이블에서는 트래픽이 적은 시간에 실행하세요.
+-- ==================================================
+
+USE travel_project;
+
+ALTER TABLE travel_project.contents
+    ADD INDEX ix_contents_status_created_id (status, created_at, id), ALGORITHM=INPLACE, LOCK=NONE;
+
+-- 롤백:
+-- ALTER TABLE travel_project.contents DROP INDEX ix_contents_status_created_id;
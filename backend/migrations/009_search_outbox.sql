@@ -0,0 +1,24 @@
+-- ==================================================
+-- Migration 009: search_outbox 테이블 추가
+-- 콘텐츠/리뷰/태그 쓰기 트랜잭션이 함께 기록하는 검색 인덱스 동기화 이벤트입니다.
+-- (services/search_outbox_service.py 가 기록, change feed 가 읽어 ES/메모리 색인에 반영)
+-- * 이 테이블이 없으면 리뷰/콘텐츠 쓰기가 실패하므로 새 버전 배포 전에 적용하세요.
+-- * db_init.sql / models.py 로 새로 만든 DB 에는 이미 있습니다. 기존 DB 에만 적용하세요.
+-- * 적용 전의 변경은 기록되지 않았으므로, 적용 후 `python run_es_reindex.py` 로 한 번 전체 재색인하세요.
+-- ==================================================
+
+USE travel_project;
+
+CREATE TABLE travel_project.search_outbox (
+id INT NOT NULL AUTO_INCREMENT,
+content_id INT NOT NULL, -- 콘텐츠가 삭제되어도 '삭제' 이벤트를 전달해야 하므로 FK 없음
+reason VARCHAR(20) NOT NULL, -- 'content', 'review', 'tags', 'guide'
+created_at DATETIME NOT NULL,
+processed_at DATETIME, -- NULL 이면 미처리
+PRIMARY KEY (id),
+KEY ix_search_outbox_pending (processed_at, id),
+KEY ix_search_outbox_content_id (content_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 롤백:
+-- DROP TABLE travel_project.search_outbox;
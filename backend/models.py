@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base # database.py에서 정의한 Base 임포트
@@ -70,7 +70,14 @@ class GuideProfile(Base):
 
 class Content(Base):
     __tablename__ = "contents"
-    __table_args__ = {'schema': SCHEMA_NAME}
+    __table_args__ = (
+        # 목록 조회의 커서 페이징 (status 필터 + created_at, id 내림차순 seek) 용 인덱스
+        Index('ix_contents_status_created_id', 'status', 'created_at', 'id'),
+        # SEARCH_BACKEND=fulltext 용 한국어 검색 인덱스 (MySQL ngram 파서, 기본 토큰 크기 2 = 바이그램)
+        Index('ft_contents_title_description', 'title', 'description',
+              mysql_prefix='FULLTEXT', mysql_with_parser='ngram'),
+        {'schema': SCHEMA_NAME}
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     guide_id = Column(Integer, ForeignKey(f'{SCHEMA_NAME}.guide_profiles.users_id', ondelete="RESTRICT", onupdate="CASCADE"), nullable=False)
@@ -141,10 +148,17 @@ class Booking(Base):
 
 class Review(Base):
     __tablename__ = "reviews"
-    __table_args__ = {'schema': SCHEMA_NAME}
+    __table_args__ = (
+        # 콘텐츠별 리뷰 피드의 커서 페이징 (최신순 / 평점순 seek) 용 인덱스
+        Index('ix_reviews_content_created_id', 'content_id', 'created_at', 'id'),
+        Index('ix_reviews_content_rating_created_id', 'content_id', 'rating', 'created_at', 'id'),
+        {'schema': SCHEMA_NAME}
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     booking_id = Column(Integer, ForeignKey(f'{SCHEMA_NAME}.bookings.id', ondelete="RESTRICT", onupdate="CASCADE"), nullable=False, unique=True)
+    # bookings.content_id 의 사본 -> 예약 JOIN 없이 콘텐츠별 리뷰를 인덱스 순서대로 읽기 위함 (작성 시 함께 저장)
+    content_id = Column(Integer, ForeignKey(f'{SCHEMA_NAME}.contents.id', ondelete="RESTRICT", onupdate="CASCADE"), nullable=False)
     reviewer_id = Column(Integer, ForeignKey(f'{SCHEMA_NAME}.users.id', ondelete="RESTRICT", onupdate="CASCADE"), nullable=False)
     rating = Column(Integer, nullable=False) # 상품 품질 평점 (1-5)
     text = Column(Text, nullable=False)
@@ -158,7 +172,12 @@ class Review(Base):
 
 class GuideReview(Base):
     __tablename__ = "guide_reviews"
-    __table_args__ = {'schema': SCHEMA_NAME}
+    __table_args__ = (
+        # 가이드별 리뷰 피드의 커서 페이징 (최신순 / 평점순 seek) 용 인덱스
+        Index('ix_guide_reviews_guide_created_id', 'guide_id', 'created_at', 'id'),
+        Index('ix_guide_reviews_guide_rating_created_id', 'guide_id', 'rating', 'created_at', 'id'),
+        {'schema': SCHEMA_NAME}
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     booking_id = Column(Integer, ForeignKey(f'{SCHEMA_NAME}.bookings.id', ondelete="RESTRICT", onupdate="CASCADE"), nullable=False, unique=True)
@@ -332,4 +351,148 @@ class TravelerReviewTag(Base):
     
     # 관계 정의
     traveler_review = relationship("TravelerReview", back_populates="traveler_review_tags")
-    tag = relationship("Tag", back_populates="traveler_review_tags")
\ No newline at end of file
+    tag = relationship("Tag", back_populates="traveler_review_tags")
+
+# ==================================================
+# 6. Search Sync (검색 인덱스 동기화)
+# ==================================================
+
+# --- ▼ [신규] 검색 인덱스 변경 이벤트 Outbox 테이블 ▼ ---
+# 리뷰/태그/콘텐츠를 변경하는 트랜잭션 안에서 함께 INSERT 되며,
+# run_es_outbox_worker.py 가 주기적으로 읽어 ES 'contents' 문서를 부분 갱신합니다.
+class SearchOutbox(Base):
+    __tablename__ = "search_outbox"
+    __table_args__ = (
+        Index('ix_search_outbox_pending', 'processed_at', 'id'),
+        {'schema': SCHEMA_NAME}
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    # 콘텐츠가 삭제되어도 '삭제' 이벤트를 전달해야 하므로 FK 를 두지 않습니다.
+    content_id = Column(Integer, nullable=False, index=True)
+    reason = Column(String(20), nullable=False) # 'content', 'review', 'tags', 'guide'
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    processed_at = Column(DateTime, nullable=True) # NULL 이면 아직 처리되지 않은 이벤트
+
+
+# ==================================================
+# 7. Read Model (조회용 집계)
+# ==================================================
+
+# --- ▼ [신규] 콘텐츠 통계 테이블 ▼ ---
+# 리뷰/예약 쓰기 트랜잭션 안에서 증분 갱신되며 (services/content_stats_service.py),
+# run_reconcile_stats.py 가 원본 테이블에서 다시 집계해 어긋난 행을 바로잡습니다.
+# 목록/지도/상세 조회는 리뷰를 매번 집계하지 않고 이 한 행을 JOIN 합니다.
+class ContentStats(Base):
+    __tablename__ = "content_stats"
+    __table_args__ = {'schema': SCHEMA_NAME}
+
+    content_id = Column(Integer, ForeignKey(f'{SCHEMA_NAME}.contents.id', ondelete="CASCADE", onupdate="CASCADE"), primary_key=True)
+    review_count = Column(Integer, nullable=False, default=0)
+    rating_sum = Column(Integer, nullable=False, default=0)
+    avg_rating = Column(Float, nullable=True) # 리뷰가 없으면 NULL
+    # 평점 분포 (1-5점별 리뷰 수)
+    rating_1 = Column(Integer, nullable=False, default=0)
+    rating_2 = Column(Integer, nullable=False, default=0)
+    rating_3 = Column(Integer, nullable=False, default=0)
+    rating_4 = Column(Integer, nullable=False, default=0)
+    rating_5 = Column(Integer, nullable=False, default=0)
+    booking_count = Column(Integer, nullable=False, default=0) # 취소/거절을 제외한 예약 수
+    main_image_url = Column(String(255), nullable=True)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+# --- ▲ [신규] ▲ ---
+
+
+# --- ▼ [신규] 콘텐츠 지역(시도/시군구) 배정 테이블 ▼ ---
+# 콘텐츠 좌표를 시군구 경계 폴리곤에 대입해 채웁니다. (services/region_service.py)
+# run_assign_regions.py 가 전체를 배정하고, 이후 변경분은 change feed 로 다시 배정합니다.
+# 지도 화면의 지역별 콘텐츠 수/지역 필터는 이 테이블을 GROUP BY / JOIN 합니다.
+class ContentRegion(Base):
+    __tablename__ = "content_regions"
+    __table_args__ = (
+        Index('ix_content_regions_sido_sigungu', 'sido_name', 'sigungu_name'),
+        {'schema': SCHEMA_NAME}
+    )
+
+    content_id = Column(Integer, ForeignKey(f'{SCHEMA_NAME}.contents.id', ondelete="CASCADE", onupdate="CASCADE"), primary_key=True)
+    region_name = Column(String(100), nullable=False, index=True) # '부산광역시 해운대구' (GeoJSON sidonm_sggnm)
+    sido_name = Column(String(50), nullable=False) # '부산광역시'
+    sigungu_name = Column(String(50), nullable=True) # '해운대구' (세종시처럼 시군구가 없으면 NULL)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+# --- ▲ [신규] ▲ ---
+
+
+# --- ▼ [신규] 관련 콘텐츠 (미리 계산한 이웃) 테이블 ▼ ---
+# run_build_related.py 가 상품 태그/리뷰 태그/지역/가이드 캐릭터의 TF-IDF 코사인 유사도로
+# 콘텐츠별 상위 K 개 이웃을 계산해 통째로 교체합니다. (services/related_service.py)
+# 상세 페이지는 (content_id, sort_order) PK 범위 조회 한 번으로 관련 콘텐츠를 읽습니다.
+class ContentRelated(Base):
+    __tablename__ = "content_related"
+    __table_args__ = {'schema': SCHEMA_NAME}
+
+    content_id = Column(Integer, ForeignKey(f'{SCHEMA_NAME}.contents.id', ondelete="CASCADE", onupdate="CASCADE"), primary_key=True)
+    sort_order = Column(Integer, primary_key=True, autoincrement=False) # 1 부터 (유사도 높은 순)
+    related_content_id = Column(Integer, ForeignKey(f'{SCHEMA_NAME}.contents.id', ondelete="CASCADE", onupdate="CASCADE"), nullable=False)
+    score = Column(Float, nullable=False) # 코사인 유사도 (0 ~ 1)
+    updated_at = Column(DateTime, default=func.now(), nullable=False)
+# --- ▲ [신규] ▲ ---
+
+
+# --- ▼ [신규] 가이드 요약(프로필 페이지용 집계) 테이블 ▼ ---
+# 가이드 리뷰 작성 / AI 캐릭터 분류(태깅) 트랜잭션 안에서 증분 갱신되고,
+# 콘텐츠 수는 change feed 로 다시 셉니다. (services/guide_summary_service.py)
+# run_reconcile_guide_summary.py 가 원본 테이블에서 다시 집계해 어긋난 행을 바로잡습니다.
+class GuideSummary(Base):
+    __tablename__ = "guide_summary"
+    __table_args__ = {'schema': SCHEMA_NAME}
+
+    guide_id = Column(Integer, ForeignKey(f'{SCHEMA_NAME}.guide_profiles.users_id', ondelete="CASCADE", onupdate="CASCADE"), primary_key=True)
+    review_count = Column(Integer, nullable=False, default=0) # 가이드 리뷰 수
+    rating_sum = Column(Integer, nullable=False, default=0)
+    avg_rating = Column(Float, nullable=True) # 리뷰가 없으면 NULL
+    content_count = Column(Integer, nullable=False, default=0) # Active 콘텐츠 수
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+
+
+# 가이드 리뷰의 AI 캐릭터 분포 (캐릭터별 리뷰 수)
+class GuideSummaryCharacter(Base):
+    __tablename__ = "guide_summary_characters"
+    __table_args__ = {'schema': SCHEMA_NAME}
+
+    guide_id = Column(Integer, ForeignKey(f'{SCHEMA_NAME}.guide_profiles.users_id', ondelete="CASCADE", onupdate="CASCADE"), primary_key=True)
+    ai_character_id = Column(Integer, ForeignKey(f'{SCHEMA_NAME}.ai_characters.id', ondelete="CASCADE", onupdate="CASCADE"), primary_key=True)
+    review_count = Column(Integer, nullable=False, default=0)
+
+
+# 가이드 리뷰에서 추출된 태그별 횟수 (상위 태그 표시용)
+class GuideSummaryTag(Base):
+    __tablename__ = "guide_summary_tags"
+    __table_args__ = (
+        Index('ix_guide_summary_tags_guide_count', 'guide_id', 'tag_count'),
+        {'schema': SCHEMA_NAME}
+    )
+
+    guide_id = Column(Integer, ForeignKey(f'{SCHEMA_NAME}.guide_profiles.users_id', ondelete="CASCADE", onupdate="CASCADE"), primary_key=True)
+    tag_id = Column(Integer, ForeignKey(f'{SCHEMA_NAME}.tags.id', ondelete="CASCADE", onupdate="CASCADE"), primary_key=True)
+    tag_count = Column(Integer, nullable=False, default=0)
+# --- ▲ [신규] ▲ ---
+
+
+# --- ▼ [신규] 콘텐츠 일정 슬롯 (예약 정원) 테이블 ▼ ---
+# 예약은 booked + 인원 <= capacity 조건부 UPDATE 한 번으로 자리를 잡습니다. (services/booking_slot_service.py)
+# 행 단위 잠금만 쓰므로 같은 슬롯끼리만 순서대로 처리되고, 다른 슬롯/콘텐츠의 예약은 서로 막지 않습니다.
+# run_reconcile_booking_slots.py 가 예약 원본에서 booked 를 다시 집계해 어긋난 슬롯을 바로잡습니다.
+class ContentSlot(Base):
+    __tablename__ = "content_slots"
+    __table_args__ = (
+        UniqueConstraint('content_id', 'start_at', name='uq_content_slots_content_start'),
+        {'schema': SCHEMA_NAME}
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    content_id = Column(Integer, ForeignKey(f'{SCHEMA_NAME}.contents.id', ondelete="CASCADE", onupdate="CASCADE"), nullable=False)
+    start_at = Column(DateTime, nullable=False) # 예약 일시 (분 단위, Booking.booking_date 와 같은 값)
+    capacity = Column(Integer, nullable=False) # 최대 인원
+    booked = Column(Integer, nullable=False, default=0) # 취소/거절되지 않은 예약 인원 합계
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+# --- ▲ [신규] ▲ ---
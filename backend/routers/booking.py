@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session, joinedload
-from datetime import datetime
-from typing import List
+from datetime import datetime, timedelta
+from typing import List, Optional
 
 from database import get_db
 # --- ▼ [수정] Review, GuideReview 모델 임포트 추가 ▼ ---
@@ -14,9 +14,16 @@ from schemas import (
     BookingCreateResponse, 
     MyBookingSchema,
     GuideBookingSchema,  # 가이드용 스키마
-    UserInfoSchema     # 고객 정보 스키마
+    UserInfoSchema,     # 고객 정보 스키마
+    ContentSlotSchema,
+    SlotCapacityRequest
 )
 from routers.auth import get_current_user 
+from services import response_cache_service
+from services.content_stats_service import record_booking_status
+from services.booking_slot_service import (
+    SlotCapacityError, list_slots, record_slot_status, reserve_slot, set_slot_capacity, slot_start,
+)
 
 # 1. APIRouter 인스턴스 생성
 router = APIRouter(
@@ -77,15 +84,25 @@ def create_booking(
     new_booking = Booking(
         traveler_id=current_user.id,
         content_id=request.content_id,
-        booking_date=request.booking_date,
+        booking_date=slot_start(request.booking_date), # [수정] 슬롯과 같은 분 단위 일시로 저장
         personnel=request.personnel, 
         status="Pending",
         created_at=datetime.now()
     )
     try:
+        # [신규] 일정 슬롯의 자리를 조건부 UPDATE 로 먼저 잡음 (정원 초과면 409, 예약 행은 만들지 않음)
+        reserve_slot(db, new_booking.content_id, new_booking.booking_date, new_booking.personnel)
         db.add(new_booking)
+        record_booking_status(db, new_booking.content_id, None, new_booking.status)
         db.commit()
         db.refresh(new_booking)
+        response_cache_service.invalidate(response_cache_service.DOMAIN_BOOKINGS)
+    except SlotCapacityError as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"선택한 일정의 남은 자리가 부족합니다. (남은 자리: {e.remaining}명)"
+        )
     except Exception as e:
         db.rollback()
         print(f"Booking creation failed: {e}")
@@ -231,6 +248,7 @@ def approve_booking(
     try:
         db.commit()
         db.refresh(booking)
+        response_cache_service.invalidate(response_cache_service.DOMAIN_BOOKINGS)
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -282,8 +300,11 @@ def reject_booking(
     # 4. 상태 변경 및 저장
     booking.status = "Rejected"
     try:
+        record_booking_status(db, booking.content_id, "Pending", booking.status)
+        record_slot_status(db, booking.content_id, booking.booking_date, booking.personnel, "Pending", booking.status)
         db.commit()
         db.refresh(booking)
+        response_cache_service.invalidate(response_cache_service.DOMAIN_BOOKINGS)
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -339,6 +360,7 @@ def complete_booking(
     try:
         db.commit()
         db.refresh(booking)
+        response_cache_service.invalidate(response_cache_service.DOMAIN_BOOKINGS)
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -373,10 +395,14 @@ def cancel_booking(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="이 예약을 취소할 권한이 없습니다.")
     if booking.status == "Canceled":
          raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="이미 취소된 예약입니다.")
+    previous_status = booking.status
     booking.status = "Canceled"
     try:
+        record_booking_status(db, booking.content_id, previous_status, booking.status)
+        record_slot_status(db, booking.content_id, booking.booking_date, booking.personnel, previous_status, booking.status)
         db.commit() 
         db.refresh(booking) 
+        response_cache_service.invalidate(response_cache_service.DOMAIN_BOOKINGS)
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="예약 취소 중 서버 오류가 발생했습니다.")
@@ -407,3 +433,60 @@ def cancel_booking(
     )
 
 
+# --- ▼ 9. [신규] 콘텐츠 일정별 남은 자리 조회 ▼ ---
+@router.get("/slots/{content_id}", response_model=List[ContentSlotSchema])
+def get_content_slots(
+    content_id: int,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    콘텐츠의 일정 슬롯(정원/예약 인원/남은 자리)을 조회합니다. (기본: 지금부터 30일)
+    슬롯이 없는 일시는 첫 예약 시 기본 정원으로 만들어집니다.
+    """
+    date_from = date_from or datetime.now()
+    date_to = date_to or date_from + timedelta(days=30)
+    return [
+        ContentSlotSchema(start_at=slot.start_at, capacity=slot.capacity, booked=slot.booked,
+                          remaining=max(slot.capacity - slot.booked, 0))
+        for slot in list_slots(db, content_id, date_from, date_to)
+    ]
+
+
+# --- ▼ 10. [신규] 가이드가 일정별 정원 설정 ▼ ---
+@router.put("/slots/{content_id}", response_model=ContentSlotSchema)
+def update_content_slot(
+    content_id: int,
+    request: SlotCapacityRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    가이드가 자신의 콘텐츠 일정 정원을 설정합니다. (슬롯이 없으면 생성)
+    이미 예약된 인원보다 적게 줄일 수는 없습니다.
+    """
+    content = db.query(Content.id).filter(Content.id == content_id, Content.guide_id == current_user.id).first()
+    if not content:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="콘텐츠를 찾을 수 없거나 정원을 변경할 권한이 없습니다."
+        )
+    try:
+        slot = set_slot_capacity(db, content_id, request.start_at, request.capacity)
+        db.commit()
+    except SlotCapacityError as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"이미 예약된 인원({e.booked}명)보다 적게 정원을 줄일 수 없습니다."
+        )
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"정원 변경 중 오류 발생: {e}"
+        )
+    return ContentSlotSchema(start_at=slot.start_at, capacity=slot.capacity, booked=slot.booked,
+                             remaining=max(slot.capacity - slot.booked, 0))
+# --- ▲ [신규 API 추가 완료] ▲ ---
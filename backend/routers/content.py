@@ -1,29 +1,40 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, distinct
-from typing import List, Optional
-
-# Elasticsearch 설정
-from elasticsearch import Elasticsearch
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.orm import Session
+from sqlalchemy import func, distinct, or_
+from typing import List, Literal, Optional
 
 from database import get_db
 from models import (
-    Content, GuideProfile, User, ContentImage, Booking, Review, Tag, ContentTag,
-    AiCharacter, AiCharacterDefinitionTag, GuideReview
+    Content, GuideProfile, User, Tag, ContentTag, AiCharacter, ContentStats, ContentRegion
 )
 from schemas import (
     ContentListSchema, ContentDetailSchema, ReviewSchema, RelatedContentSchema,
-    ContentListResponse, MapContentSchema
+    ContentListResponse, MapContentSchema, ContentFacetsResponse, SuggestionSchema,
+    MapMarkerSchema, MapClusterSchema, MapClustersResponse, NearbyContentSchema,
+    RegionCountSchema, RegionCountsResponse, ContentDescriptionSchema, TagSchema, ReviewPageResponse
 )
-
-# Elasticsearch 연결 시도
-try:
-    es = Elasticsearch("http://localhost:9200")
-    es.info()
-    print("Elasticsearch 클라이언트 연결 성공")
-except Exception as e:
-    print(f"Elasticsearch 연결 실패 (DB 검색만 사용됩니다): {e}")
-    es = None
+from services.count_cache_service import (
+    filter_signature, get_cached_count, set_cached_count, count_query
+)
+from services.pagination_service import (
+    InvalidCursorError, cursor_kind, decode_created_at_cursor, keyset_before, next_cursor_from_rows
+)
+from services.es_search_service import ES_CURSOR_KIND, search_content_page
+# Elasticsearch 클라이언트는 첫 검색 시 생성되며, 서킷 브레이커가 장애 시 호출을 차단합니다.
+from services import elasticsearch_service
+from services import text_index_service
+from services import fulltext_search_service
+from services import facet_service
+from services import suggest_service
+from services import fuzzy_service
+from services import geo_index_service
+from services import nearby_service
+from services import region_service
+from services import map_payload_service
+from services import content_detail_service
+from services import review_feed_service
+from services.tag_index_service import TagFilter, content_id_condition
+from services.content_stats_service import main_image_column
 
 router = APIRouter(tags=["content"])
 
@@ -42,18 +53,13 @@ def get_locations(db: Session = Depends(get_db)):
 
 
 # 2. [콘텐츠 목록 조회] - (수정됨: GuideProfile.users_id 적용)
-@router.get("/list", response_model=ContentListResponse)
-def get_content_list(
-    db: Session = Depends(get_db),
-    page: int = Query(1, ge=1, description="페이지 번호"),
-    per_page: int = Query(9, ge=1, le=50, description="페이지당 콘텐츠 개수"),
-    search_terms: Optional[List[str]] = Query(None, alias="q", description="텍스트 검색어"),
-    location: Optional[str] = Query(None, description="지역 필터"),
-    tags: Optional[str] = Query(None, description="태그 필터"),
-    style: Optional[str] = Query(None, description="캐릭터 스타일 (예: 모험가)")
-):
-    # 1. 기본 쿼리 생성
-    results_query = db.query(
+
+def _list_base_query(db: Session):
+    """
+    목록 카드에 필요한 컬럼(콘텐츠 + 가이드 닉네임 + 메인 이미지)을 조회하는 기본 쿼리 (콘텐츠당 1행)
+    메인 이미지는 content_stats 한 행에서 읽습니다. (1:1 JOIN 이라 행이 늘지 않음)
+    """
+    return db.query(
         Content.id,
         Content.title,
         Content.description,
@@ -62,52 +68,152 @@ def get_content_list(
         Content.created_at,
         Content.guide_id,
         User.nickname.label("guide_nickname"),
-        ContentImage.image_url.label("main_image_url")
+        main_image_column().label("main_image_url")
     ).select_from(Content)\
+    .outerjoin(ContentStats, ContentStats.content_id == Content.id)\
     .outerjoin(GuideProfile, Content.guide_id == GuideProfile.users_id)\
     .outerjoin(User, GuideProfile.users_id == User.id)\
-    .outerjoin(ContentImage, (Content.id == ContentImage.contents_id) & (ContentImage.is_main == True))\
     .filter(Content.status == 'Active')
-    # ▲ 위 두 줄에서 user_id -> users_id 로 수정했습니다.
 
-    # 2. Elasticsearch 검색
-    if search_terms and es:
-        try:
-            query_string = " ".join(search_terms)
-            es_query = {
-                "query": {
-                    "bool": {
-                        "should": [
-                            { "match": { "title": { "query": query_string, "boost": 3 } } },
-                            { "terms": { "all_tags": search_terms, "boost": 2 } },
-                            { "match": { "all_reviews_text": { "query": query_string, "boost": 1.5 } } },
-                            { "match": { "description": { "query": query_string, "boost": 1 } } }
-                        ],
-                        "minimum_should_match": 1
-                    }
-                },
-                "_source": ["id"],
-                "size": 1000 
-            }
-            
-            response = es.search(index="contents", body=es_query)
-            searched_ids = [hit['_source']['id'] for hit in response['hits']['hits']]
-            
-            if searched_ids:
-                results_query = results_query.filter(Content.id.in_(searched_ids))
-            else:
-                results_query = results_query.filter(Content.id == -1)
 
+def _to_list_schema(row) -> ContentListSchema:
+    return ContentListSchema(
+        id=row.id,
+        title=row.title,
+        description=row.description if row.description else "설명 없음",
+        price=row.price if row.price is not None else 0,
+        location=row.location if row.location else "미정",
+        guide_nickname=row.guide_nickname if row.guide_nickname else "정보 없음",
+        main_image_url=row.main_image_url,
+        guide_id=row.guide_id
+    )
+
+
+def _hydrate_ranked_ids(db: Session, ranked_ids: List[int]) -> List[ContentListSchema]:
+    """검색 엔진이 정한 순서의 ID 목록을 한 번의 IN 쿼리로 채우고, 원래 순서를 유지해 반환합니다."""
+    if not ranked_ids:
+        return []
+    rows_by_id = {row.id: row for row in _list_base_query(db).filter(Content.id.in_(ranked_ids)).all()}
+    return [_to_list_schema(rows_by_id[cid]) for cid in ranked_ids if cid in rows_by_id]
+
+
+@router.get("/list", response_model=ContentListResponse)
+def get_content_list(
+    db: Session = Depends(get_db),
+    page: int = Query(1, ge=1, description="페이지 번호"),
+    per_page: int = Query(9, ge=1, le=50, description="페이지당 콘텐츠 개수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 page 대신 커서 기반 페이징)"),
+    search_terms: Optional[List[str]] = Query(None, alias="q", description="텍스트 검색어"),
+    location: Optional[str] = Query(None, description="지역 필터"),
+    tags: Optional[str] = Query(None, description="태그 필터 (쉼표 구분, 하나라도 가진 콘텐츠)"),
+    tags_all: Optional[str] = Query(None, description="태그 필터 (쉼표 구분, 모두 가진 콘텐츠)"),
+    tags_not: Optional[str] = Query(None, description="제외할 태그 (쉼표 구분)"),
+    style: Optional[str] = Query(None, description="캐릭터 스타일 (예: 모험가)")
+):
+    tag_filter = TagFilter.from_params(tags, tags_all, tags_not)
+    response = _search_content_list(db, search_terms, page, per_page, cursor, location, tag_filter, style)
+
+    # 오타 교정: 원래 검색어의 결과가 0건일 때만 사전에서 자모 편집 거리가 가장 가까운 단어로 바꿔 다시 검색
+    # (예: "헤운대" -> "해운대"). 사전에 없는 단어도 올바른 검색어일 수 있으므로 원래 검색어를 항상 먼저 사용
+    if search_terms and response.total_count == 0:
+        corrected_terms = fuzzy_service.rewrite_terms(search_terms)
+        if corrected_terms:
+            response = _search_content_list(db, corrected_terms, page, per_page, cursor, location, tag_filter, style)
+            response.corrected_terms = corrected_terms
+    return response
+
+
+# 목록 검색 경로별 커서 종류 (ES -> FULLTEXT -> 메모리 인덱스 -> DB)
+_DB_CURSOR_KIND = "created_at"
+_LIST_CURSOR_KINDS = {
+    ES_CURSOR_KIND, fulltext_search_service.FULLTEXT_CURSOR_KIND, text_index_service.MEMORY_CURSOR_KIND, _DB_CURSOR_KIND
+}
+
+
+def _own_cursor(cursor: Optional[str], page: int, kind: str):
+    """
+    페이지를 넘기는 도중 서킷 브레이커 등으로 검색 경로가 바뀌면 클라이언트는 다른 경로가 만든 커서를 보냅니다.
+    그런 커서는 400 으로 거절하지 않고 버린 뒤 이 경로의 첫 페이지부터 응답합니다. (손상된 커서는 그대로 400)
+    반환: (cursor, page)
+    """
+    kind_of_cursor = cursor_kind(cursor) if cursor else None
+    if kind_of_cursor in _LIST_CURSOR_KINDS and kind_of_cursor != kind:
+        return None, 1
+    return cursor, page
+
+
+def _search_content_list(
+    db: Session,
+    search_terms: Optional[List[str]],
+    page: int,
+    per_page: int,
+    cursor: Optional[str],
+    location: Optional[str],
+    tag_filter: TagFilter,
+    style: Optional[str]
+) -> ContentListResponse:
+    """ES -> FULLTEXT -> 메모리 인덱스 -> DB 순으로 목록 한 페이지를 조회합니다."""
+    # 1. Elasticsearch 검색 (텍스트 검색어가 있을 때)
+    #    ES 가 관련도 점수/필터/페이징을 모두 담당하고, DB 는 해당 페이지의 ID 만 채웁니다.
+    search_page = None
+    use_fulltext = fulltext_search_service.SEARCH_BACKEND == "fulltext"
+    es = elasticsearch_service.get_search_client() if search_terms and not use_fulltext else None
+    if es:
+        es_cursor, es_page = _own_cursor(cursor, page, ES_CURSOR_KIND)
+        try:
+            search_page = search_content_page(
+                es, search_terms, per_page,
+                page=es_page, cursor=es_cursor,
+                location=location, tag_filter=tag_filter, style=style,
+                request_timeout=elasticsearch_service.ES_REQUEST_TIMEOUT_SECONDS
+            )
+            elasticsearch_service.breaker.record_success()
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}")
         except Exception as e:
             print(f"ES 검색 중 오류 발생 (DB 검색으로 전환): {e}")
-            for term in search_terms:
-                pattern = f"%{term}%"
-                results_query = results_query.filter(
-                    (Content.title.ilike(pattern)) | 
-                    (Content.description.ilike(pattern))
-                )
-    
-    elif search_terms:
+            elasticsearch_service.breaker.record_failure(e)
+
+    # 1-0. (ES 없는 배포) MySQL FULLTEXT ngram 인덱스로 관련도순 검색
+    if use_fulltext and search_terms:
+        ft_cursor, ft_page = _own_cursor(cursor, page, fulltext_search_service.FULLTEXT_CURSOR_KIND)
+        try:
+            search_page = fulltext_search_service.search_page(
+                db, search_terms, per_page,
+                page=ft_page, cursor=ft_cursor,
+                location=location, tag_filter=tag_filter, style=style
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}")
+        except Exception as e:
+            print(f"FULLTEXT 검색 중 오류 발생 (메모리 인덱스로 전환): {e}")
+            db.rollback()
+
+    # 1-1. ES 를 쓸 수 없으면 메모리 바이그램 인덱스(BM25)로 검색 (테이블 스캔 없음)
+    if search_page is None and search_terms:
+        memory_cursor, memory_page = _own_cursor(cursor, page, text_index_service.MEMORY_CURSOR_KIND)
+        try:
+            search_page = text_index_service.search_page(
+                search_terms, per_page,
+                page=memory_page, cursor=memory_cursor,
+                location=location, tag_filter=tag_filter, style=style
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}")
+
+    if search_page is not None:
+        return ContentListResponse(
+            contents=_hydrate_ranked_ids(db, search_page.ids),
+            total_count=search_page.total_count,
+            is_estimated_count=search_page.is_estimated_count,
+            next_cursor=search_page.next_cursor
+        )
+
+    # 2. DB 검색 (ES 와 메모리 인덱스 모두 사용할 수 없을 때의 최후 수단)
+    cursor, page = _own_cursor(cursor, page, _DB_CURSOR_KIND)
+    results_query = _list_base_query(db)
+
+    if search_terms:
         for term in search_terms:
             pattern = f"%{term}%"
             results_query = results_query.filter(
@@ -127,67 +233,81 @@ def get_content_list(
             AiCharacter.name == style
         )
 
-    # 5. [태그 필터]
-    if tags:
-        tag_list = tags.split(',')
-        results_query = results_query.join(ContentTag).join(Tag).filter(
-            Tag.name.in_([t.strip() for t in tag_list])
-        )
+    # 5. [태그 필터] - 메모리 태그 비트맵으로 AND/OR/NOT 을 계산해 ID 조건으로 전달
+    #    (JOIN 이 없어 행이 늘지 않으므로 DISTINCT 가 필요 없음)
+    tag_condition = content_id_condition(tag_filter)
+    if tag_condition is not None:
+        results_query = results_query.filter(tag_condition)
 
     # 6. 결과 조회 및 페이징
-    results_query = results_query.distinct()
-    total_count = results_query.count()
-    
-    results = results_query.order_by(Content.created_at.desc())\
-                           .offset((page - 1) * per_page)\
-                           .limit(per_page)\
-                           .all()
+    # 6-0. 전체 개수는 필터 조합별로 캐시 (캐시 적중 시 목록 조회 1회로 끝남)
+    count_signature = filter_signature(search_terms, location, tag_filter.signature(), style)
+    cached = get_cached_count(count_signature)
+    if cached is None:
+        total_count, is_estimated_count = count_query(results_query)
+        set_cached_count(count_signature, total_count, is_estimated_count)
+    else:
+        total_count, is_estimated_count = cached
+
+    # 6-1. 커서 모드: OFFSET 대신 (created_at, id) 기준 seek 으로 다음 페이지를 조회
+    #      (깊은 페이지에서도 앞쪽 행을 건너뛰며 읽지 않으므로 지연 시간이 일정함)
+    page_query = results_query.order_by(Content.created_at.desc(), Content.id.desc())
+    if cursor:
+        try:
+            last_created_at, last_id = decode_created_at_cursor(cursor, _DB_CURSOR_KIND)
+        except InvalidCursorError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        page_query = page_query.filter(
+            keyset_before(Content.created_at, Content.id, last_created_at, last_id)
+        )
+    else:
+        page_query = page_query.offset((page - 1) * per_page)
+
+    # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+    results = page_query.limit(per_page + 1).all()
+    next_cursor = next_cursor_from_rows(results, per_page, _DB_CURSOR_KIND)
 
     # 7. 변환
-    content_list = []
-    for row in results:
-        content_list.append(ContentListSchema(
-            id=row.id,
-            title=row.title,
-            description=row.description if row.description else "설명 없음",
-            price=row.price if row.price is not None else 0,
-            location=row.location if row.location else "미정",
-            guide_nickname=row.guide_nickname if row.guide_nickname else "정보 없음",
-            main_image_url=row.main_image_url,
-            guide_id=row.guide_id
-        ))
+    content_list = [_to_list_schema(row) for row in results[:per_page]]
 
     return ContentListResponse(
         contents=content_list,
-        total_count=total_count
+        total_count=total_count,
+        is_estimated_count=is_estimated_count,
+        next_cursor=next_cursor
     )
 
 
 # 3. [지도 데이터 조회]
-@router.get("/map-data", response_model=List[MapContentSchema])
+# Accept: application/vnd.travia.map-columns 이면 열 단위 바이너리 (설명 제외 -> /{content_id}/description),
+# 그 외에는 기존 JSON 목록
+@router.get(
+    "/map-data",
+    response_model=List[MapContentSchema],
+    responses={200: {"content": {map_payload_service.MAP_COLUMNS_MEDIA_TYPE: {}}}}
+)
 def get_map_content_by_area(
+    request: Request,
+    response: Response,
     area: Optional[str] = Query(None),
     db: Session = Depends(get_db)
 ):
-    avg_rating_subquery = db.query(
-        Booking.content_id,
-        func.avg(Review.rating).label("avg_rating")
-    ).join(Review, Booking.id == Review.booking_id).group_by(Booking.content_id).subquery()
-
-    query = db.query(
+    payload_format = map_payload_service.negotiate_format(request.headers.get("accept"))
+    columns = [
         Content.id,
         Content.title,
         Content.location,
         Content.latitude,
         Content.longitude,
-        Content.description,
         Content.price,
-        ContentImage.image_url.label("main_image_url"),
-        avg_rating_subquery.c.avg_rating.label("rating")
-    ).outerjoin(
-        ContentImage, (Content.id == ContentImage.contents_id) & (ContentImage.is_main == True)
-    ).outerjoin(
-        avg_rating_subquery, Content.id == avg_rating_subquery.c.content_id
+        # 평점/메인 이미지는 content_stats 한 행을 JOIN (요청마다 리뷰를 집계하지 않음)
+        main_image_column().label("main_image_url"),
+        ContentStats.avg_rating.label("rating")
+    ]
+    if payload_format == map_payload_service.FORMAT_JSON:
+        columns.append(Content.description)
+    query = db.query(*columns).outerjoin(
+        ContentStats, ContentStats.content_id == Content.id
     ).filter(
         Content.status == "Active",
         Content.latitude.isnot(None),
@@ -195,9 +315,21 @@ def get_map_content_by_area(
     )
     
     if area:
-        query = query.filter(Content.location == area)
+        # 지역 코드(location) 또는 지도 폴리곤 이름(시도 / '시도 시군구' - content_regions 배정 결과)
+        query = query.outerjoin(ContentRegion, ContentRegion.content_id == Content.id).filter(or_(
+            Content.location == area, ContentRegion.region_name == area, ContentRegion.sido_name == area
+        ))
     
     results = query.all()
+
+    # 같은 URL 이 Accept 에 따라 다른 본문을 반환하므로 (브라우저/프록시 캐시용)
+    if payload_format == map_payload_service.FORMAT_COLUMNS:
+        return Response(
+            content=map_payload_service.encode_map_columns(results),
+            media_type=map_payload_service.MAP_COLUMNS_MEDIA_TYPE,
+            headers={"Vary": "Accept"}
+        )
+    response.headers["Vary"] = "Accept"
     
     map_contents = []
     for row in results:
@@ -216,6 +348,54 @@ def get_map_content_by_area(
     return map_contents
 
 
+# 3-1. [지도 클러스터 조회] - 화면(bbox) + 줌 기준 (낮은 줌: 클러스터, 높은 줌: 개별 마커)
+def _to_marker_schema(point) -> MapMarkerSchema:
+    return MapMarkerSchema(
+        id=point.content_id, title=point.title, location=point.location,
+        latitude=point.latitude, longitude=point.longitude,
+        main_image_url=point.main_image_url, price=point.price, rating=point.rating
+    )
+
+
+@router.get("/map-clusters", response_model=MapClustersResponse)
+def get_map_clusters(
+    min_lat: float = Query(..., ge=-90, le=90, description="화면 남쪽 위도"),
+    min_lng: float = Query(..., ge=-180, le=180, description="화면 서쪽 경도"),
+    max_lat: float = Query(..., ge=-90, le=90, description="화면 북쪽 위도"),
+    max_lng: float = Query(..., ge=-180, le=180, description="화면 동쪽 경도"),
+    zoom: int = Query(..., ge=0, le=21, description="웹 메르카토르 줌 (카카오맵 level ≈ 20 - zoom)")
+):
+    if min_lat > max_lat or min_lng > max_lng:
+        raise HTTPException(status_code=400, detail="min_lat/min_lng must not exceed max_lat/max_lng")
+
+    result = geo_index_service.query_map(min_lat, min_lng, max_lat, max_lng, zoom)
+    if result is None:
+        raise HTTPException(status_code=503, detail="Map index is warming up")
+    return MapClustersResponse(
+        zoom=result.zoom,
+        total_count=result.total_count,
+        clusters=[
+            MapClusterSchema(latitude=c.latitude, longitude=c.longitude, count=c.count, top=_to_marker_schema(c.top))
+            for c in result.clusters
+        ],
+        markers=[_to_marker_schema(point) for point in result.markers],
+        truncated=result.truncated
+    )
+
+
+# 3-2. [지역별 콘텐츠 수] - 지도 폴리곤 색칠용 (시도별, 또는 sido 를 주면 그 시도의 시군구별)
+@router.get("/region-counts", response_model=RegionCountsResponse)
+def get_region_counts(
+    sido: Optional[str] = Query(None, description="시도 이름 (예: 부산광역시). 주면 시군구별로 집계"),
+    db: Session = Depends(get_db)
+):
+    regions = region_service.region_counts(db, sido=sido)
+    return RegionCountsResponse(
+        level="sido" if sido is None else "sigungu",
+        regions=[RegionCountSchema(**region) for region in regions]
+    )
+
+
 # 4. [인기 태그 조회]
 @router.get("/tags", response_model=List[str])
 def get_popular_tags(db: Session = Depends(get_db)):
@@ -225,6 +405,119 @@ def get_popular_tags(db: Session = Depends(get_db)):
     return [row[0] for row in results]
 
 
+# 4-1. [검색 패싯 개수 조회] - 현재 검색 조건 기준 지역/태그/스타일별 개수 ("제주 (42)")
+@router.get("/facets", response_model=ContentFacetsResponse)
+def get_content_facets(
+    db: Session = Depends(get_db),
+    search_terms: Optional[List[str]] = Query(None, alias="q", description="텍스트 검색어"),
+    location: Optional[str] = Query(None, description="지역 필터"),
+    tags: Optional[str] = Query(None, description="태그 필터 (쉼표 구분, 하나라도 가진 콘텐츠)"),
+    tags_all: Optional[str] = Query(None, description="태그 필터 (쉼표 구분, 모두 가진 콘텐츠)"),
+    tags_not: Optional[str] = Query(None, description="제외할 태그 (쉼표 구분)"),
+    style: Optional[str] = Query(None, description="캐릭터 스타일 (예: 모험가)"),
+    size: int = Query(20, ge=1, le=100, description="패싯별 최대 항목 수")
+):
+    tag_filter = TagFilter.from_params(tags, tags_all, tags_not)
+    total_count, counts, source = _facet_counts(db, search_terms, location, tag_filter, style, size)
+    # 목록 검색과 같은 기준(원래 검색어가 0건일 때만)으로 오타 교정을 적용해 개수와 목록이 어긋나지 않게 함
+    if search_terms and total_count == 0:
+        corrected_terms = fuzzy_service.rewrite_terms(search_terms)
+        if corrected_terms:
+            total_count, counts, source = _facet_counts(db, corrected_terms, location, tag_filter, style, size)
+    return ContentFacetsResponse(
+        total_count=total_count,
+        locations=facet_service.top_values(counts["location"], size),
+        tags=facet_service.top_values(counts["tag"], size),
+        styles=facet_service.top_values(counts["style"], size),
+        source=source
+    )
+
+
+def _facet_counts(db: Session, search_terms: Optional[List[str]], location: Optional[str],
+                  tag_filter: TagFilter, style: Optional[str], size: int):
+    """(전체 개수, 패싯별 개수, 출처) - ES 집계 -> 메모리 인덱스 한 번 순회 -> DB GROUP BY 순으로 시도"""
+    result, source = None, None
+    es = elasticsearch_service.get_search_client()
+    if es:
+        try:
+            result = facet_service.facet_counts_es(
+                es, search_terms, location, tag_filter, style, size,
+                request_timeout=elasticsearch_service.ES_REQUEST_TIMEOUT_SECONDS
+            )
+            source = "elasticsearch"
+            elasticsearch_service.breaker.record_success()
+        except Exception as e:
+            print(f"ES 패싯 집계 중 오류 발생 (메모리 인덱스로 전환): {e}")
+            elasticsearch_service.breaker.record_failure(e)
+
+    if result is None:
+        result = facet_service.facet_counts_memory(search_terms, location, tag_filter, style)
+        source = "memory"
+
+    if result is None:
+        result = facet_service.facet_counts_db(db, search_terms, location, tag_filter, style)
+        source = "database"
+
+    total_count, counts = result
+    return total_count, counts, source
+
+
+# 4-2. [검색어 자동완성] - 메모리 접두어 인덱스만 사용 (키 입력마다 호출되어도 DB 를 조회하지 않음)
+@router.get("/suggest", response_model=List[SuggestionSchema])
+def get_suggestions(
+    prefix: str = Query(..., min_length=1, max_length=50, description="입력 중인 검색어"),
+    limit: int = Query(10, ge=1, le=30, description="최대 후보 개수"),
+    types: Optional[str] = Query(None, description="항목 종류 필터 (쉼표 구분: content,tag,location,style)")
+):
+    kinds = [t.strip() for t in types.split(',') if t.strip()] if types else None
+    if kinds and not set(kinds) <= set(suggest_service.SUGGEST_KINDS):
+        raise HTTPException(status_code=400, detail=f"types must be among {', '.join(suggest_service.SUGGEST_KINDS)}")
+
+    suggestions = suggest_service.suggest(prefix, limit, kinds)
+    if suggestions is None:
+        raise HTTPException(status_code=503, detail="Suggestion index is warming up")
+    return [
+        SuggestionSchema(text=s.text, type=s.kind, weight=s.weight, content_id=s.content_id)
+        for s in suggestions
+    ]
+
+
+# 4-3. [주변 콘텐츠 조회] - 위치 기준 k 최근접 (하버사인 거리)
+def _nearby_response(results) -> List[NearbyContentSchema]:
+    return [
+        NearbyContentSchema(**_to_marker_schema(r.point).model_dump(), distance_km=round(r.distance_km, 3))
+        for r in results
+    ]
+
+
+def _find_nearby_or_raise(find, *args, **kwargs):
+    try:
+        results = find(*args, **kwargs)
+    except nearby_service.TagIndexNotReadyError:
+        raise HTTPException(status_code=503, detail="Tag index is warming up")
+    if results is None:
+        raise HTTPException(status_code=503, detail="Nearby index is warming up")
+    return _nearby_response(results)
+
+
+@router.get("/nearby", response_model=List[NearbyContentSchema])
+def get_nearby_contents(
+    lat: float = Query(..., ge=-90, le=90, description="기준 위도"),
+    lng: float = Query(..., ge=-180, le=180, description="기준 경도"),
+    limit: int = Query(10, ge=1, le=100, description="최대 개수"),
+    max_km: Optional[float] = Query(None, gt=0, description="최대 거리 (km)"),
+    min_price: Optional[int] = Query(None, ge=0, description="최소 가격"),
+    max_price: Optional[int] = Query(None, ge=0, description="최대 가격"),
+    tags: Optional[str] = Query(None, description="태그 필터 (쉼표 구분, 하나라도 가진 콘텐츠)"),
+    tags_all: Optional[str] = Query(None, description="태그 필터 (쉼표 구분, 모두 가진 콘텐츠)"),
+    tags_not: Optional[str] = Query(None, description="제외할 태그 (쉼표 구분)")
+):
+    return _find_nearby_or_raise(
+        nearby_service.find_nearby, lat, lng, limit, max_km, min_price, max_price,
+        TagFilter.from_params(tags, tags_all, tags_not)
+    )
+
+
 # 5. [상세 조회]
 @router.get("/{content_id}", response_model=ContentDetailSchema)
 def get_content_detail(
@@ -235,78 +528,87 @@ def get_content_detail(
     related_per_page: int = Query(4, ge=1),
     db: Session = Depends(get_db)
 ):
-    content = db.query(Content).options(
-        joinedload(Content.guide).joinedload(GuideProfile.user)
-    ).filter(
-        Content.id == content_id,
-        Content.status == "Active"
-    ).first()
+    # 리뷰를 제외한 부분(콘텐츠/가이드/통계/메인 이미지/태그)은 콘텐츠별 캐시에서 읽음
+    # (리뷰/태그/콘텐츠 변경 시 무효화 - services/content_detail_service.py)
+    detail = content_detail_service.get_content_detail(db, content_id)
+    if detail is None:
+        raise HTTPException(status_code=404, detail="Content not found")
+
+    # 리뷰 페이지만 매번 조회 (이후 페이지는 GET /content/{id}/reviews 로 상세 없이 조회)
+    review_page = review_feed_service.content_review_page(
+        db, content_id, per_page=reviews_per_page, page=reviews_page, total=detail["review_count"]
+    )
+    reviews_data = [ReviewSchema(**item) for item in review_page.items]
+
+    # 관련 콘텐츠는 캐시된 상세에 함께 실린 '미리 계산된 이웃' (없으면 최신 콘텐츠)에서 자름
+    related_items, total_related_count = content_detail_service.get_related_page(
+        db, detail, related_page, related_per_page
+    )
+
+    return ContentDetailSchema(
+        id=detail["id"], title=detail["title"], description=detail["description"],
+        price=detail["price"] if detail["price"] else 0, location=detail["location"] if detail["location"] else "미정",
+        created_at=detail["created_at"], status=detail["status"],
+        main_image_url=detail["main_image_url"], guide_name=detail["guide_name"],
+        guide_nickname=detail["guide_nickname"], guide_avg_rating=detail["guide_avg_rating"],
+        guide_id=detail["guide_id"], reviews=reviews_data,
+        related_contents=[RelatedContentSchema(**item) for item in related_items],
+        tags=[TagSchema(**tag) for tag in detail["tags"]],
+        rating=detail["rating"], review_count=detail["review_count"], total_related_count=total_related_count
+    )
 
-    if not content:
+
+# 5-1. [콘텐츠 리뷰 피드]
+# 상세 페이지의 '리뷰 더 보기'용. 상세 전체를 다시 만들지 않고 리뷰만 (content_id, created_at, id) 인덱스로 seek
+@router.get("/{content_id}/reviews", response_model=ReviewPageResponse)
+def get_content_reviews(
+    content_id: int,
+    sort: Literal["latest", "rating_desc", "rating_asc"] = Query("latest", description="정렬 (최신순 / 평점 높은순 / 평점 낮은순)"),
+    page: int = Query(1, ge=1, description="페이지 번호"),
+    per_page: int = Query(10, ge=1, le=50, description="페이지당 리뷰 개수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 page 대신 커서 기반 페이징)"),
+    db: Session = Depends(get_db)
+):
+    try:
+        review_page = review_feed_service.content_review_page(db, content_id, sort, per_page, page=page, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}")
+    if review_page is None:
         raise HTTPException(status_code=404, detail="Content not found")
+    return ReviewPageResponse(
+        items=[ReviewSchema(**item) for item in review_page.items], total=review_page.total,
+        page=None if cursor else page, per_page=per_page, next_cursor=review_page.next_cursor
+    )
 
-    guide_name = "공식 가이드"
-    guide_nickname = "정보 없음"
-    guide_avg_rating = None
-    if content.guide and content.guide.user:
-        guide_name = content.guide.user.nickname
-        guide_nickname = content.guide.user.nickname
-        guide_avg_rating = content.guide.avg_rating
-
-    main_image_url = db.query(ContentImage.image_url).filter(
-        ContentImage.contents_id == content_id,
-        ContentImage.is_main == True
-    ).scalar()
-
-    content_rating_stats = db.query(
-        func.avg(Review.rating).label("avg_rating"),
-        func.count(Review.id).label("total_reviews_count")
-    ).join(Booking, Review.booking_id == Booking.id).filter(Booking.content_id == content_id).first()
-
-    total_reviews_count = content_rating_stats.total_reviews_count if content_rating_stats else 0
-    avg_content_rating = round(float(content_rating_stats.avg_rating), 1) if content_rating_stats and content_rating_stats.avg_rating else 0.0
-
-    review_results = db.query(Review).options(joinedload(Review.reviewer))\
-        .join(Booking, Review.booking_id == Booking.id)\
-        .filter(Booking.content_id == content_id)\
-        .order_by(Review.created_at.desc())\
-        .offset((reviews_page - 1) * reviews_per_page).limit(reviews_per_page).all()
-
-    reviews_data = []
-    for review in review_results:
-        reviews_data.append(ReviewSchema(
-            id=review.id,
-            user=review.reviewer.nickname if review.reviewer else "알 수 없음",
-            rating=float(review.rating),
-            text=review.text,
-            created_at=review.created_at
-        ))
 
-    total_related_count = db.query(func.count(Content.id)).filter(
-        Content.id != content_id, Content.status == "Active"
-    ).scalar() or 0
-
-    related_results = db.query(Content.id, Content.title, Content.price, ContentImage.image_url.label("imageUrl"))\
-        .outerjoin(ContentImage, (Content.id == ContentImage.contents_id) & (ContentImage.is_main == True))\
-        .filter(Content.id != content_id, Content.status == "Active")\
-        .order_by(Content.created_at.desc())\
-        .offset((related_page - 1) * related_per_page).limit(related_per_page).all()
-
-    related_contents_data = []
-    for r in related_results:
-        related_contents_data.append(RelatedContentSchema(
-            id=r.id, title=r.title, price=f"{r.price:,}" if r.price else "문의",
-            rating=0.0, time="2시간 소요", imageUrl=r.imageUrl
-        ))
+# 5-2. [이 콘텐츠 주변의 콘텐츠]
+@router.get("/{content_id}/nearby", response_model=List[NearbyContentSchema])
+def get_contents_near_content(
+    content_id: int,
+    limit: int = Query(10, ge=1, le=100, description="최대 개수"),
+    max_km: Optional[float] = Query(None, gt=0, description="최대 거리 (km)"),
+    min_price: Optional[int] = Query(None, ge=0, description="최소 가격"),
+    max_price: Optional[int] = Query(None, ge=0, description="최대 가격"),
+    tags: Optional[str] = Query(None, description="태그 필터 (쉼표 구분, 하나라도 가진 콘텐츠)"),
+    tags_all: Optional[str] = Query(None, description="태그 필터 (쉼표 구분, 모두 가진 콘텐츠)"),
+    tags_not: Optional[str] = Query(None, description="제외할 태그 (쉼표 구분)")
+):
+    try:
+        return _find_nearby_or_raise(
+            nearby_service.find_nearby_content, content_id,
+            k=limit, max_km=max_km, min_price=min_price, max_price=max_price,
+            tag_filter=TagFilter.from_params(tags, tags_all, tags_not)
+        )
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Content not found or has no coordinates")
 
-    tags_data = db.query(Tag).join(ContentTag, Tag.id == ContentTag.tag_id).filter(ContentTag.contents_id == content_id).all()
 
-    return ContentDetailSchema(
-        id=content.id, title=content.title, description=content.description,
-        price=content.price if content.price else 0, location=content.location if content.location else "미정",
-        created_at=content.created_at, status=content.status,
-        main_image_url=main_image_url, guide_name=guide_name, guide_nickname=guide_nickname,
-        guide_avg_rating=guide_avg_rating, guide_id=content.guide_id,
-        reviews=reviews_data, related_contents=related_contents_data, tags=tags_data,
-        rating=avg_content_rating, review_count=total_reviews_count, total_related_count=total_related_count
-    )
\ No newline at end of file
+# 5-3. [콘텐츠 설명] - 바이너리 지도 응답에서 뺀 설명을 마커 선택 시 불러올 때 사용
+@router.get("/{content_id}/description", response_model=ContentDescriptionSchema)
+def get_content_description(content_id: int, db: Session = Depends(get_db)):
+    row = db.query(Content.id, Content.description)\
+            .filter(Content.id == content_id, Content.status == "Active")\
+            .first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Content not found")
+    return ContentDescriptionSchema(id=row.id, description=row.description)
\ No newline at end of file
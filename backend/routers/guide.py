@@ -0,0 +1,104 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Literal, Optional
+
+from database import get_db
+from schemas import (
+    ContentListSchema, GuideContentsResponse, GuideProfileResponse, ReviewPageResponse, ReviewSchema
+)
+from services import guide_summary_service
+from services import review_feed_service
+from services.pagination_service import InvalidCursorError
+
+# 가이드 프로필 페이지용 조회 API
+router = APIRouter(
+    # (prefix는 main.py에서 app.include_router를 통해 관리합니다)
+    tags=["Guides"]
+)
+
+
+def _to_contents_response(rows, total: int, page: int, per_page: int) -> GuideContentsResponse:
+    return GuideContentsResponse(
+        items=[
+            ContentListSchema(
+                id=row.id, title=row.title,
+                description=row.description if row.description else "설명 없음",
+                price=row.price if row.price is not None else 0,
+                location=row.location if row.location else "미정",
+                guide_nickname=row.guide_nickname if row.guide_nickname else "정보 없음",
+                main_image_url=row.main_image_url, guide_id=row.guide_id
+            )
+            for row in rows
+        ],
+        total=total, page=page, per_page=per_page
+    )
+
+
+def _to_review_response(review_page, page: Optional[int], per_page: int) -> ReviewPageResponse:
+    return ReviewPageResponse(
+        items=[ReviewSchema(**item) for item in review_page.items], total=review_page.total,
+        page=page, per_page=per_page, next_cursor=review_page.next_cursor
+    )
+
+
+# 1. [가이드 프로필] - 프로필 페이지를 한 번의 호출로 채움
+# 평점/리뷰 수/콘텐츠 수/캐릭터 분포/상위 태그는 guide_summary 에서 읽고 (리뷰를 매번 집계하지 않음),
+# 콘텐츠와 최신 리뷰의 첫 페이지를 함께 싣습니다. 다음 페이지는 아래의 하위 API 로 조회합니다.
+@router.get("/{guide_id}", response_model=GuideProfileResponse)
+def get_guide_profile(
+    guide_id: int,
+    contents_per_page: int = Query(9, ge=1, le=50, description="함께 실을 콘텐츠 개수"),
+    reviews_per_page: int = Query(6, ge=1, le=50, description="함께 실을 최신 리뷰 개수"),
+    db: Session = Depends(get_db)
+):
+    profile = guide_summary_service.get_guide_profile(db, guide_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Guide not found")
+
+    content_rows, content_total = guide_summary_service.guide_contents_page(
+        db, guide_id, per_page=contents_per_page, total=profile["content_count"]
+    )
+    review_page = review_feed_service.guide_review_page(
+        db, guide_id, per_page=reviews_per_page, total=profile["review_count"]
+    )
+    return GuideProfileResponse(
+        **profile,
+        contents=_to_contents_response(content_rows, content_total, 1, contents_per_page),
+        reviews=_to_review_response(review_page, 1, reviews_per_page)
+    )
+
+
+# 2. [가이드 콘텐츠 목록]
+@router.get("/{guide_id}/contents", response_model=GuideContentsResponse)
+def get_guide_contents(
+    guide_id: int,
+    page: int = Query(1, ge=1, description="페이지 번호"),
+    per_page: int = Query(9, ge=1, le=50, description="페이지당 콘텐츠 개수"),
+    db: Session = Depends(get_db)
+):
+    result = guide_summary_service.guide_contents_page(db, guide_id, page, per_page)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Guide not found")
+    rows, total = result
+    return _to_contents_response(rows, total, page, per_page)
+
+
+# 3. [가이드 리뷰 피드] - 여행자가 가이드에게 남긴 리뷰 (GuideReview)
+# (guide_id, created_at, id) / (guide_id, rating, created_at, id) 인덱스로 seek 하므로
+# 커서로 이어서 읽으면 리뷰가 수천 개여도 페이지마다 비용이 일정합니다.
+@router.get("/{guide_id}/reviews", response_model=ReviewPageResponse)
+def get_guide_reviews(
+    guide_id: int,
+    sort: Literal["latest", "rating_desc", "rating_asc"] = Query("latest", description="정렬 (최신순 / 평점 높은순 / 평점 낮은순)"),
+    page: int = Query(1, ge=1, description="페이지 번호"),
+    per_page: int = Query(10, ge=1, le=50, description="페이지당 리뷰 개수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 page 대신 커서 기반 페이징)"),
+    db: Session = Depends(get_db)
+):
+    try:
+        review_page = review_feed_service.guide_review_page(db, guide_id, sort, per_page, page=page, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}")
+    if review_page is None:
+        raise HTTPException(status_code=404, detail="Guide not found")
+    return _to_review_response(review_page, None if cursor else page, per_page)
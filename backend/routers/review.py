@@ -1,8 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session, joinedload
-# --- ▼ [신규 추가] 평균 계산을 위한 func 임포트 ▼ ---
-from sqlalchemy import func
-# --- ▲ [신규 추가 완료] ▲ ---
 from typing import List
 
 # [수정] auth.py와 동일한 절대 경로 방식으로 변경
@@ -11,6 +8,11 @@ import models
 import schemas     
 # [수정] auth.py는 review.py와 같은 routers 폴더에 있으므로 상대 경로(.)로 import
 from .auth import get_current_user 
+from services.search_outbox_service import enqueue_content_sync
+from services.content_stats_service import record_review
+from services import response_cache_service
+from services import content_detail_service
+from services.guide_summary_service import record_guide_review
 
 
 # 라우터 설정
@@ -76,7 +78,8 @@ def create_content_review(
 
     # 6. 검증 통과 -> 리뷰 생성
     new_review = models.Review(
-        # 'content_id' 제거 (models.Review에 없음)
+        # 리뷰 피드 인덱스용 content_id 사본 (원본은 booking.content_id)
+        content_id=booking.content_id,
         reviewer_id=current_user.id, 
         booking_id=review_data.booking_id,
         rating=int(review_data.rating), 
@@ -86,12 +89,15 @@ def create_content_review(
     # 7. DB에 저장
     try:
         db.add(new_review)
+        # 검색 인덱스 동기화 이벤트를 리뷰와 같은 트랜잭션에 기록
+        enqueue_content_sync(db, [booking.content_id], "review")
+        # 콘텐츠 통계(평균 평점/리뷰 수/평점 분포)도 같은 트랜잭션에서 증분 갱신
+        record_review(db, booking.content_id, new_review.rating)
         db.commit()
         db.refresh(new_review)
-        
-        # --- ▼ [신규 추가] 상품(Content) 평점 업데이트 로직 ▼ ---
-        # (Content 평점은 ContentDetail에서 계산하므로 여기서는 생략, 필요시 추가)
-        # --- ▲ [신규 추가 완료] ▲ ---
+        response_cache_service.invalidate(response_cache_service.DOMAIN_REVIEWS)
+        # 상세 캐시의 평점/리뷰 수 (다른 워커는 change feed 로 무효화)
+        content_detail_service.invalidate([booking.content_id])
         
         return new_review
     except Exception as e:
@@ -183,18 +189,20 @@ def create_guide_review(
     # 8. DB에 저장
     try:
         db.add(new_guide_review)
+        # 가이드 리뷰 본문도 all_reviews_text 에 포함되므로 동기화 이벤트 기록
+        enqueue_content_sync(db, [booking.content_id], "review")
+        # 가이드 요약(리뷰 수/평점 합계/평균)도 같은 트랜잭션에서 증분 갱신
+        record_guide_review(db, target_guide_id, new_guide_review.rating)
         db.commit()
         db.refresh(new_guide_review)
+        response_cache_service.invalidate(response_cache_service.DOMAIN_REVIEWS)
         
         # --- ▼ [신규 추가] 가이드 평균 평점 업데이트 로직 ▼ ---
         
-        # 8-1. 해당 가이드의 모든 리뷰 평점 평균 계산
-        #      func.avg는 결과가 Decimal일 수 있으므로 float으로 변환
-        avg_rating_result = db.query(
-            func.avg(models.GuideReview.rating).label("avg_rating")
-        ).filter(
-            models.GuideReview.guide_id == target_guide_id
-        ).scalar() # 단일 값(평균)만 가져옴
+        # 8-1. 방금 갱신된 가이드 요약의 평균 평점 (리뷰 전체를 다시 집계하지 않음)
+        avg_rating_result = db.query(models.GuideSummary.avg_rating).filter(
+            models.GuideSummary.guide_id == target_guide_id
+        ).scalar()
         
         new_avg_rating = float(avg_rating_result) if avg_rating_result is not None else 0.0
 
@@ -207,6 +215,9 @@ def create_guide_review(
         if guide_profile:
             guide_profile.avg_rating = new_avg_rating
             db.commit() # 가이드 프로필 변경사항 저장
+            # 이 가이드의 모든 상품 상세에 가이드 평점이 실려 있으므로 함께 무효화
+            guide_content_ids = [cid for (cid,) in db.query(models.Content.id).filter(models.Content.guide_id == target_guide_id)]
+            content_detail_service.invalidate(guide_content_ids)
         else:
             # 혹시 모를 에러 상황 로깅 (리뷰는 있는데 프로필이 없는 경우)
             print(f"Warning: GuideProfile not found for guide_id {target_guide_id} while updating avg_rating.")
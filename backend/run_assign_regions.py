@@ -0,0 +1,58 @@
+# backend/run_assign_regions.py
+
+import sys
+import os
+import time
+import argparse
+from dotenv import load_dotenv
+
+# 'backend' 폴더를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+# 다른 모든 임포트 *전에* .env 파일 로드
+load_dotenv()
+
+from database import SessionLocal
+from services.region_service import REGION_GEOJSON_PATH, RegionLocator, assign_regions, load_regions
+
+
+def main():
+    """
+    콘텐츠 지역 배정 스크립트.
+    시군구 경계 GeoJSON 을 읽어 모든 콘텐츠의 좌표가 속한 시도/시군구를 판정하고
+    content_regions 테이블에서 달라진 행만 추가/수정/삭제합니다.
+    (최초 적재, 경계 파일 교체 후 재배정용 - 여러 번 실행해도 안전합니다)
+    """
+    parser = argparse.ArgumentParser(description="Assign every content to its province/district polygon")
+    parser.add_argument("--geojson", default=REGION_GEOJSON_PATH, help="시군구 경계 GeoJSON 경로")
+    parser.add_argument("--batch-size", type=int, default=1000, help="한 번에 판정/commit 할 콘텐츠 수 (기본 1000)")
+    parser.add_argument("--dry-run", action="store_true", help="바뀔 행 수만 보고하고 저장하지 않음")
+    args = parser.parse_args()
+
+    print("--- 1. Loading region boundaries ---")
+    started = time.monotonic()
+    locator = RegionLocator(load_regions(args.geojson))
+    print(f"   ✅ {len(locator)} regions loaded from {args.geojson} ({time.monotonic() - started:.1f}s)")
+
+    print("--- 2. Assigning contents to regions ---")
+    db = SessionLocal()
+    started = time.monotonic()
+
+    try:
+        result = assign_regions(db, batch_size=args.batch_size, locator=locator, dry_run=args.dry_run)
+        elapsed = time.monotonic() - started
+        print(f"   ✅ Checked {result['checked']} contents: "
+              f"{result['assigned']} inside a region, {result['unassigned']} outside / without coordinates.")
+        action = "would be" if args.dry_run else "were"
+        print(f"--- 3. {result['changed']} rows {action} written.")
+        print(f"\n🎉 Region assignment completed in {elapsed:.1f}s")
+
+    except Exception as e:
+        db.rollback()
+        print(f"\n❗️ An error occurred: {e}")
+    finally:
+        db.close()
+        print("--- Database session closed ---")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# backend/run_build_related.py
+
+import sys
+import os
+import time
+import argparse
+from dotenv import load_dotenv
+
+# 'backend' 폴더를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+# 다른 모든 임포트 *전에* .env 파일 로드
+load_dotenv()
+
+from database import SessionLocal
+from services.related_service import RELATED_TOP_K, rebuild_related
+
+
+def main():
+    """
+    관련 콘텐츠(content_related) 재계산 스크립트.
+    콘텐츠 태그/리뷰 태그/지역/가이드 스타일로 만든 TF-IDF 벡터의 코사인 유사도로
+    콘텐츠마다 상위 k 개 이웃을 미리 계산해 저장합니다.
+    (주기적으로 실행 - 여러 번 실행해도 안전하며, 상세 캐시가 만료되는 대로 화면에 반영됩니다)
+    """
+    parser = argparse.ArgumentParser(description="Precompute related contents by tag similarity")
+    parser.add_argument("--k", type=int, default=RELATED_TOP_K, help=f"콘텐츠당 저장할 이웃 수 (기본 {RELATED_TOP_K})")
+    parser.add_argument("--batch-size", type=int, default=500, help="한 번에 교체/commit 할 콘텐츠 수 (기본 500)")
+    parser.add_argument("--dry-run", action="store_true", help="계산만 하고 저장하지 않음")
+    args = parser.parse_args()
+
+    print("--- 1. Related Contents Build Start ---")
+    db = SessionLocal()
+    started = time.monotonic()
+
+    try:
+        result = rebuild_related(db, k=args.k, batch_size=args.batch_size, dry_run=args.dry_run)
+        elapsed = time.monotonic() - started
+        print(f"   ✅ Computed neighbours for {result['contents']} contents ({result['features']} features).")
+        if result["without_neighbours"]:
+            print(f"   ⚠️ {result['without_neighbours']} contents share no features (latest contents will be shown).")
+        action = "would be" if args.dry_run else "were"
+        print(f"--- 2. {result['rows']} rows {action} written.")
+        print(f"\n🎉 Build completed in {elapsed:.1f}s")
+
+    except Exception as e:
+        db.rollback()
+        print(f"\n❗️ An error occurred: {e}")
+    finally:
+        db.close()
+        print("--- Database session closed ---")
+
+if __name__ == "__main__":
+    main()
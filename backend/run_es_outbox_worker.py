@@ -0,0 +1,83 @@
+# backend/run_es_outbox_worker.py
+
+import sys
+import os
+import time
+import argparse
+from datetime import timedelta
+from dotenv import load_dotenv
+
+# 'backend' 폴더를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+# 다른 모든 임포트 *전에* .env 파일 로드
+load_dotenv()
+
+from elasticsearch import Elasticsearch
+
+from database import SessionLocal
+from services.search_index_service import ES_URL
+from services.search_outbox_service import sync_pending_batch, purge_processed_events
+
+# 처리 완료된 outbox 이벤트 보관 기간
+OUTBOX_RETENTION = timedelta(hours=24)
+# 이 간격(초)마다 오래된 처리 완료 이벤트를 정리
+PURGE_INTERVAL_SECONDS = 600
+# ES 오류 시 최대 대기 시간(초) - 실패가 이어지면 대기 시간을 2배씩 늘림
+MAX_BACKOFF_SECONDS = 60
+
+
+def main():
+    """
+    search_outbox 이벤트를 읽어 ES 'contents' 문서를 부분 갱신하는 워커.
+    전체 재색인(run_es_reindex.py) 없이 리뷰/태그/콘텐츠 변경을 수 초 안에 검색에 반영합니다.
+    """
+    parser = argparse.ArgumentParser(description="Drain search_outbox into Elasticsearch")
+    parser.add_argument("--batch-size", type=int, default=500, help="한 번에 처리할 이벤트 수")
+    parser.add_argument("--interval", type=float, default=1.0, help="처리할 이벤트가 없을 때 대기 시간(초)")
+    parser.add_argument("--once", action="store_true", help="밀린 이벤트를 모두 처리한 뒤 종료")
+    args = parser.parse_args()
+
+    print("--- 1. Search Outbox Worker Start ---")
+    es = Elasticsearch(ES_URL, request_timeout=30)
+    backoff = args.interval
+    last_purge = 0.0
+
+    while True:
+        db = SessionLocal()
+        try:
+            processed = sync_pending_batch(es, db, batch_size=args.batch_size)
+            if processed:
+                print(f"   ✅ Synced {processed} outbox events.")
+            backoff = args.interval
+
+            if time.monotonic() - last_purge > PURGE_INTERVAL_SECONDS:
+                purged = purge_processed_events(db, OUTBOX_RETENTION)
+                db.commit()
+                last_purge = time.monotonic()
+                if purged:
+                    print(f"   🧹 Purged {purged} processed events.")
+
+        except KeyboardInterrupt:
+            db.rollback()
+            print("\n--- Interrupted ---")
+            break
+        except Exception as e:
+            db.rollback()
+            processed = 0
+            backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
+            print(f"❗️ Sync failed, retrying in {backoff:.0f}s: {e}")
+            time.sleep(backoff)
+            continue
+        finally:
+            db.close()
+
+        if processed < args.batch_size:
+            if args.once:
+                break
+            time.sleep(args.interval)
+
+    print("--- Search Outbox Worker stopped ---")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# backend/run_es_reindex.py
+
+import sys
+import os
+import time
+import argparse
+from dotenv import load_dotenv
+
+# 'backend' 폴더를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+# 다른 모든 임포트 *전에* .env 파일 로드
+load_dotenv()
+
+from elasticsearch import Elasticsearch
+
+from database import SessionLocal
+from services.search_index_service import ES_URL, CONTENTS_ALIAS, ReindexAbortedError, reindex_all
+
+
+def main():
+    """
+    'contents' 검색 인덱스 전체 재색인 스크립트.
+    새 버전 인덱스(contents_vYYYYmmddHHMMSS)에 bulk 로 적재한 뒤
+    'contents' alias 를 원자적으로 교체하므로 검색 중단 없이 실행할 수 있습니다.
+    """
+    parser = argparse.ArgumentParser(description="Rebuild the 'contents' Elasticsearch index")
+    parser.add_argument("--batch-size", type=int, default=1000, help="DB 스트리밍/ES bulk 단위 (기본 1000)")
+    parser.add_argument("--replicas", type=int, default=1, help="적재 완료 후 설정할 replica 수")
+    parser.add_argument("--keep-old", action="store_true", help="이전 버전 인덱스를 삭제하지 않고 남김 (롤백용)")
+    parser.add_argument("--max-failed", type=int, default=None,
+                        help="적재 실패를 허용할 최대 문서 수 (넘으면 alias 를 교체하지 않음, 기본 ES_REINDEX_MAX_FAILED=0)")
+    args = parser.parse_args()
+
+    print("--- 1. Elasticsearch Full Reindex Start ---")
+    es = Elasticsearch(ES_URL, request_timeout=60)
+
+    # 스트리밍용 세션과 태그/리뷰 조회용 세션을 분리
+    stream_db = SessionLocal()
+    lookup_db = SessionLocal()
+    started = time.monotonic()
+
+    try:
+        print(f"--- 2. Streaming contents into a new index (batch size {args.batch_size})...")
+        result = reindex_all(
+            es, stream_db, lookup_db,
+            batch_size=args.batch_size,
+            replicas=args.replicas,
+            keep_old=args.keep_old,
+            max_failed=args.max_failed,
+        )
+        elapsed = time.monotonic() - started
+        print(f"   ✅ Indexed {result['indexed']} documents into '{result['index']}' ({result['failed']} failed).")
+        print(f"--- 3. Alias '{CONTENTS_ALIAS}' now points to '{result['index']}'.")
+        if result["previous"]:
+            action = "kept" if args.keep_old else "deleted"
+            print(f"   ℹ️ Previous indices {action}: {', '.join(result['previous'])}")
+        print(f"\n🎉 Reindex completed in {elapsed:.1f}s")
+
+    except ReindexAbortedError as e:
+        print(f"\n❗️ Reindex aborted: {e}")
+        print(f"--- New index '{e.index_name}' was deleted ---")
+        print("--- Alias was not changed; search keeps using the previous index ---")
+    except Exception as e:
+        print(f"\n❗️ An error occurred: {e}")
+        print("--- Alias was not changed; search keeps using the previous index ---")
+    finally:
+        stream_db.close()
+        lookup_db.close()
+        print("--- Database sessions closed ---")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# backend/run_fetch_region_geojson.py
+
+import sys
+import os
+import shutil
+import argparse
+import tempfile
+from dotenv import load_dotenv
+
+# 'backend' 폴더를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+# 다른 모든 임포트 *전에* .env 파일 로드
+load_dotenv()
+
+import httpx
+
+from services.region_service import REGION_GEOJSON_PATH, RegionDataNotFoundError, load_regions
+
+
+def _download(source: str, target: str):
+    with httpx.stream("GET", source, follow_redirects=True, timeout=120) as response:
+        response.raise_for_status()
+        with open(target, "wb") as f:
+            for chunk in response.iter_bytes():
+                f.write(chunk)
+
+
+def main():
+    """
+    시군구 경계 GeoJSON 준비 스크립트.
+    용량 때문에 저장소에 포함하지 않는 경계 파일(프론트엔드 지도와 백엔드 지역 배정이 함께 사용)을
+    URL 또는 로컬 경로에서 가져와, 읽을 수 있는지(sidonm / sggnm / sidonm_sggnm 속성의 폴리곤) 확인한 뒤
+    REGION_GEOJSON_PATH(기본: frontend/public/korea_ver3.geojson)에 저장합니다.
+    확인에 실패하면 기존 파일을 건드리지 않습니다.
+    """
+    parser = argparse.ArgumentParser(description="Download and validate the province/district boundary GeoJSON")
+    parser.add_argument("--source", default=os.getenv("REGION_GEOJSON_SOURCE"),
+                        help="경계 GeoJSON 의 URL 또는 로컬 경로 (기본: 환경 변수 REGION_GEOJSON_SOURCE)")
+    parser.add_argument("--output", default=REGION_GEOJSON_PATH, help="저장할 경로 (기본 REGION_GEOJSON_PATH)")
+    parser.add_argument("--force", action="store_true", help="이미 파일이 있어도 다시 받음")
+    args = parser.parse_args()
+
+    if os.path.exists(args.output) and not args.force:
+        print(f"✅ {args.output} already exists. (--force to replace)")
+        return
+    if not args.source:
+        print("❗️ No source given. Pass --source <URL or path> or set REGION_GEOJSON_SOURCE.")
+        print("   The file must be a FeatureCollection of 시군구 polygons with "
+              "'sidonm' / 'sggnm' (or 'sidonm_sggnm') properties in WGS84 (경도, 위도).")
+        sys.exit(1)
+
+    print(f"--- 1. Fetching {args.source} ---")
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(suffix=".geojson", dir=os.path.dirname(os.path.abspath(args.output)))
+    os.close(fd)
+    try:
+        if os.path.exists(args.source):
+            shutil.copyfile(args.source, temp_path)
+        else:
+            _download(args.source, temp_path)
+        print(f"   ✅ {os.path.getsize(temp_path) / 1024 / 1024:.1f} MB")
+
+        print("--- 2. Validating boundaries ---")
+        regions = load_regions(temp_path)
+        if not regions:
+            raise RegionDataNotFoundError("No polygon features with sidonm / sggnm / sidonm_sggnm properties")
+        sido_count = len({region.sido for region in regions})
+        print(f"   ✅ {len(regions)} regions in {sido_count} provinces (e.g. {', '.join(r.name for r in regions[:3])})")
+
+        os.replace(temp_path, args.output)
+        print(f"\n🎉 Saved to {args.output}")
+        print("   Next: python run_assign_regions.py")
+
+    except (OSError, httpx.HTTPError, RegionDataNotFoundError) as e:
+        print(f"\n❗️ An error occurred: {e}")
+        sys.exit(1)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,7 @@ load_dotenv()
 # 2. DB 모델 및 세션 임포트
 from database import SessionLocal
 from models import ReviewTag, Tag, ContentTag, Review, Booking, Content
+from services.search_outbox_service import enqueue_content_sync
 
 # 3. 각 상품(Content)별로 승격시킬 상위 태그 개수
 TOP_N_TAGS = 5 
@@ -40,9 +41,14 @@ def main():
     try:
         # 2. 기존에 '승격'되었던 AI 태그를 모두 삭제
         print(f"--- 2. Clearing old AI-promoted tags from 'content_tags'...")
+        # 태그가 사라지는 콘텐츠도 검색 인덱스에 반영되도록 삭제 전에 ID 수집
+        cleared_content_ids = [row[0] for row in db.query(ContentTag.contents_id).filter(
+            ContentTag.is_ai_extracted == True
+        ).distinct().all()]
         deleted_count = db.query(ContentTag).filter(
             ContentTag.is_ai_extracted == True
         ).delete(synchronize_session=False)
+        enqueue_content_sync(db, cleared_content_ids, "tags")
         db.commit()
         print(f"   ✅ Cleared {deleted_count} old AI tags.")
 
@@ -116,6 +122,7 @@ def main():
         # 5. 승격된 태그들을 DB에 일괄 저장
         if new_content_tags_list:
             db.add_all(new_content_tags_list)
+            enqueue_content_sync(db, [t.contents_id for t in new_content_tags_list], "tags")
             db.commit()
             print(f"\n🎉 Successfully promoted {len(new_content_tags_list)} tags to 'content_tags' table!")
         else:
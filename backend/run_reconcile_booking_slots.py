@@ -0,0 +1,52 @@
+# backend/run_reconcile_booking_slots.py
+
+import sys
+import os
+import time
+import argparse
+from dotenv import load_dotenv
+
+# 'backend' 폴더를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+# 다른 모든 임포트 *전에* .env 파일 로드
+load_dotenv()
+
+from database import SessionLocal
+from services.booking_slot_service import reconcile_all
+
+
+def main():
+    """
+    content_slots 재계산 스크립트.
+    예약 원본에서 일정(콘텐츠, 예약 일시)별 인원을 다시 집계해 어긋난 booked 를 고치고,
+    슬롯이 없는 예약 일시는 슬롯을 만듭니다. (최초 적재 및 주기적인 점검용 - 여러 번 실행해도 안전합니다)
+    """
+    parser = argparse.ArgumentParser(description="Rebuild content_slots.booked from bookings")
+    parser.add_argument("--batch-size", type=int, default=500, help="한 번에 잠그고 집계/commit 할 콘텐츠 수 (기본 500)")
+    parser.add_argument("--dry-run", action="store_true", help="고칠 슬롯 수만 보고하고 저장하지 않음")
+    args = parser.parse_args()
+
+    print("--- 1. Booking Slot Reconcile Start ---")
+    db = SessionLocal()
+    started = time.monotonic()
+
+    try:
+        result = reconcile_all(db, batch_size=args.batch_size, dry_run=args.dry_run)
+        elapsed = time.monotonic() - started
+        print(f"   ✅ Checked {result['checked']} slots.")
+        action = "would be" if args.dry_run else "were"
+        print(f"--- 2. {result['inserted']} slots {action} inserted, {result['updated']} slots {action} corrected.")
+        if result["over_capacity"]:
+            print(f"   ⚠️ {result['over_capacity']} slots have more booked personnel than capacity.")
+        print(f"\n🎉 Reconcile completed in {elapsed:.1f}s")
+
+    except Exception as e:
+        db.rollback()
+        print(f"\n❗️ An error occurred: {e}")
+    finally:
+        db.close()
+        print("--- Database session closed ---")
+
+if __name__ == "__main__":
+    main()
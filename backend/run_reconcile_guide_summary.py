@@ -0,0 +1,51 @@
+# backend/run_reconcile_guide_summary.py
+
+import sys
+import os
+import time
+import argparse
+from dotenv import load_dotenv
+
+# 'backend' 폴더를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+# 다른 모든 임포트 *전에* .env 파일 로드
+load_dotenv()
+
+from database import SessionLocal
+from services.guide_summary_service import reconcile_all
+
+
+def main():
+    """
+    guide_summary 재계산 스크립트.
+    가이드 리뷰/콘텐츠/리뷰 태그 원본 테이블에서 가이드별 요약(평점, 리뷰 수, 콘텐츠 수,
+    캐릭터 분포, 태그 횟수)을 다시 집계해 증분 갱신과 어긋난 가이드를 고치고, 없는 행은 추가합니다.
+    (최초 적재 및 주기적인 점검용 - 여러 번 실행해도 안전합니다)
+    """
+    parser = argparse.ArgumentParser(description="Rebuild the guide_summary tables from guide reviews/contents")
+    parser.add_argument("--batch-size", type=int, default=500, help="한 번에 집계/commit 할 가이드 수 (기본 500)")
+    parser.add_argument("--dry-run", action="store_true", help="고칠 가이드 수만 보고하고 저장하지 않음")
+    args = parser.parse_args()
+
+    print("--- 1. Guide Summary Reconcile Start ---")
+    db = SessionLocal()
+    started = time.monotonic()
+
+    try:
+        result = reconcile_all(db, batch_size=args.batch_size, dry_run=args.dry_run)
+        elapsed = time.monotonic() - started
+        print(f"   ✅ Checked {result['checked']} guides.")
+        action = "would be" if args.dry_run else "were"
+        print(f"--- 2. {result['inserted']} summaries {action} inserted, {result['updated']} summaries {action} corrected.")
+        print(f"\n🎉 Reconcile completed in {elapsed:.1f}s")
+
+    except Exception as e:
+        db.rollback()
+        print(f"\n❗️ An error occurred: {e}")
+    finally:
+        db.close()
+        print("--- Database session closed ---")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# backend/run_reconcile_stats.py
+
+import sys
+import os
+import time
+import argparse
+from dotenv import load_dotenv
+
+# 'backend' 폴더를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+# 다른 모든 임포트 *전에* .env 파일 로드
+load_dotenv()
+
+from database import SessionLocal
+from services.content_stats_service import reconcile_all
+
+
+def main():
+    """
+    content_stats 재계산 스크립트.
+    리뷰/예약/이미지 원본 테이블에서 콘텐츠별 통계를 다시 집계해
+    증분 갱신과 어긋난 행을 고치고, 아직 행이 없는 콘텐츠는 추가합니다.
+    (최초 적재 및 주기적인 점검용 - 여러 번 실행해도 안전합니다)
+    """
+    parser = argparse.ArgumentParser(description="Rebuild the content_stats table from reviews/bookings")
+    parser.add_argument("--batch-size", type=int, default=1000, help="한 번에 집계/commit 할 콘텐츠 수 (기본 1000)")
+    parser.add_argument("--dry-run", action="store_true", help="고칠 행 수만 보고하고 저장하지 않음")
+    args = parser.parse_args()
+
+    print("--- 1. Content Stats Reconcile Start ---")
+    db = SessionLocal()
+    started = time.monotonic()
+
+    try:
+        result = reconcile_all(db, batch_size=args.batch_size, dry_run=args.dry_run)
+        elapsed = time.monotonic() - started
+        print(f"   ✅ Checked {result['checked']} contents.")
+        action = "would be" if args.dry_run else "were"
+        print(f"--- 2. {result['inserted']} rows {action} inserted, {result['updated']} rows {action} corrected.")
+        print(f"\n🎉 Reconcile completed in {elapsed:.1f}s")
+
+    except Exception as e:
+        db.rollback()
+        print(f"\n❗️ An error occurred: {e}")
+    finally:
+        db.close()
+        print("--- Database session closed ---")
+
+if __name__ == "__main__":
+    main()
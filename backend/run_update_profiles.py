@@ -8,6 +8,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from sqlalchemy import func
 from database import SessionLocal
 from models import GuideProfile, GuideReview, AiCharacter
+from services.search_outbox_service import enqueue_guide_contents_sync
 
 def update_guide_representative_character():
     """
@@ -24,6 +25,7 @@ def update_guide_representative_character():
         guides = db.query(GuideProfile).all()
         
         updated_count = 0
+        updated_guide_ids = []
         
         for guide in guides:
             # 2. 해당 가이드의 리뷰 중 ai_character_id 별 개수 세기 (내림차순 정렬)
@@ -48,8 +50,11 @@ def update_guide_representative_character():
                 if guide.ai_character_id_as_guide != char_id:
                     guide.ai_character_id_as_guide = char_id
                     updated_count += 1
+                    updated_guide_ids.append(guide.users_id)
                     print(f" - 가이드(ID: {guide.users_id}) 업데이트 -> 캐릭터 ID: {char_id}")
 
+        # 대표 캐릭터(style)가 바뀐 가이드의 콘텐츠를 검색 인덱스 동기화 대상으로 기록
+        enqueue_guide_contents_sync(db, updated_guide_ids, "guide")
         db.commit()
         print(f"✅ 업데이트 완료! (총 {updated_count}명의 가이드 정보 갱신)")
         
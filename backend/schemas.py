@@ -40,10 +40,37 @@ class ContentListSchema(BaseModel):
 class ContentListResponse(BaseModel):
     contents: List[ContentListSchema] = Field(..., description="현재 페이지의 콘텐츠 목록")
     total_count: int = Field(..., description="조건에 맞는 전체 콘텐츠 개수")
+    is_estimated_count: bool = Field(False, description="True 이면 total_count 는 '이 개수 이상'을 뜻하는 추정치")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 조회용 커서 (마지막 페이지면 null)")
+    corrected_terms: Optional[List[str]] = Field(None, description="오타 교정으로 실제 검색에 사용된 검색어 (교정이 없으면 null)")
 
     model_config = ConfigDict(from_attributes=True)
 
 
+# --- ▼ [신규] 검색 패싯(facet) 개수 ▼ ---
+class FacetCountSchema(BaseModel):
+    value: str = Field(..., description="패싯 값 (예: 지역 코드, 태그 이름, 캐릭터 이름)")
+    count: int = Field(..., description="현재 조건에서 이 값을 가진 콘텐츠 개수")
+
+
+class ContentFacetsResponse(BaseModel):
+    total_count: int = Field(..., description="현재 조건에 맞는 전체 콘텐츠 개수")
+    locations: List[FacetCountSchema] = Field(..., description="지역별 개수 (많은 순)")
+    tags: List[FacetCountSchema] = Field(..., description="태그별 개수 (많은 순)")
+    styles: List[FacetCountSchema] = Field(..., description="가이드 캐릭터 스타일별 개수 (많은 순)")
+    source: str = Field(..., description="개수를 계산한 곳 (elasticsearch | memory | database)")
+# --- ▲ [신규] ▲ ---
+
+
+# --- ▼ [신규] 검색어 자동완성 ▼ ---
+class SuggestionSchema(BaseModel):
+    text: str = Field(..., description="자동완성 문구 (콘텐츠 제목, 태그, 지역 코드, 캐릭터 이름)")
+    type: str = Field(..., description="항목 종류 (content | tag | location | style)")
+    weight: int = Field(..., description="인기도 (예약 수 기반)")
+    content_id: Optional[int] = Field(None, description="type 이 content 일 때 콘텐츠 ID")
+# --- ▲ [신규] ▲ ---
+
+
 # --- Tag 스키마 (Detail Page용) ---
 class TagSchema(BaseModel):
     """
@@ -66,6 +93,56 @@ class ReviewSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True, populate_by_name=True) # V2 스타일 alias 설정
 
 
+# --- ▼ [신규] 리뷰 피드 (콘텐츠/가이드 리뷰 무한 스크롤, 페이지 이동) ▼ ---
+class ReviewPageResponse(BaseModel):
+    items: List[ReviewSchema] = Field(..., description="현재 페이지의 리뷰 목록")
+    total: int = Field(..., description="전체 리뷰 개수")
+    page: Optional[int] = Field(None, description="page 기준 조회일 때의 페이지 번호 (커서 조회면 null)")
+    per_page: int = Field(..., description="페이지당 리뷰 개수")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 조회용 커서 (마지막 페이지면 null)")
+# --- ▲ [신규] ▲ ---
+
+
+# --- ▼ [신규] 가이드 프로필 페이지 ▼ ---
+class GuideCharacterShareSchema(BaseModel):
+    id: int
+    name: Optional[str] = Field(None, description="AI 캐릭터 이름")
+    review_count: int = Field(..., description="이 캐릭터로 분류된 가이드 리뷰 수")
+    ratio: float = Field(..., description="분류된 리뷰 중 비율 (0 ~ 1)")
+
+
+class GuideTagCountSchema(BaseModel):
+    id: int
+    name: Optional[str] = Field(None, description="태그 이름")
+    count: int = Field(..., description="가이드 리뷰에서 추출된 횟수")
+
+
+class GuideContentsResponse(BaseModel):
+    items: List[ContentListSchema] = Field(..., description="현재 페이지의 콘텐츠 목록 (최신순)")
+    total: int = Field(..., description="가이드의 Active 콘텐츠 수")
+    page: int
+    per_page: int
+
+
+class GuideProfileResponse(BaseModel):
+    id: int = Field(..., description="가이드 User ID")
+    name: str = Field(..., description="가이드 닉네임")
+    avatar_url: Optional[str] = Field(None, description="프로필 이미지 URL")
+    bio: Optional[str] = Field(None, description="가이드 소개")
+    license_status: str = Field(..., description="'Pending' 또는 'Licensed'")
+    verified: bool = Field(..., description="자격 인증 여부 (license_status == 'Licensed')")
+    manner_score: int
+    character_name: Optional[str] = Field(None, description="대표 AI 캐릭터 이름")
+    avg_rating: float = Field(..., description="가이드 리뷰 평균 평점 (리뷰가 없으면 0)")
+    review_count: int = Field(..., description="가이드 리뷰 수")
+    content_count: int = Field(..., description="Active 콘텐츠 수")
+    character_distribution: List[GuideCharacterShareSchema] = Field(..., description="리뷰 캐릭터 분포 (많은 순)")
+    top_tags: List[GuideTagCountSchema] = Field(..., description="리뷰에서 많이 나온 태그")
+    contents: GuideContentsResponse = Field(..., description="콘텐츠 첫 페이지 (다음 페이지는 /guides/{id}/contents)")
+    reviews: ReviewPageResponse = Field(..., description="최신 리뷰 첫 페이지 (다음 페이지는 /guides/{id}/reviews)")
+# --- ▲ [신규] ▲ ---
+
+
 # DetailPage의 'RelatedContentList' 컴포넌트용 스키마
 class RelatedContentSchema(BaseModel):
     id: int
@@ -114,6 +191,62 @@ class MapContentSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+# --- ▼ [신규] 콘텐츠 설명 (바이너리 지도 응답에서는 빠지므로 마커별로 조회) ▼ ---
+class ContentDescriptionSchema(BaseModel):
+    id: int = Field(..., description="콘텐츠 ID")
+    description: Optional[str] = Field(None, description="콘텐츠 설명")
+# --- ▲ [신규] ▲ ---
+
+
+# --- ▼ [신규] 지도 클러스터 (bbox + zoom) ▼ ---
+class MapMarkerSchema(BaseModel):
+    """지도 마커 1개 (설명 등 큰 필드는 제외 - 상세는 /content/{id} 로 조회)"""
+    id: int = Field(..., description="콘텐츠 ID")
+    title: str = Field(..., description="콘텐츠 제목")
+    location: Optional[str] = Field(None, description="지역 코드")
+    latitude: float = Field(..., description="위도 (lat)")
+    longitude: float = Field(..., description="경도 (lng)")
+    main_image_url: Optional[str] = Field(None, description="메인 이미지 URL")
+    price: Optional[int] = Field(None, description="콘텐츠 가격")
+    rating: Optional[float] = Field(None, description="콘텐츠 평점")
+
+
+class MapClusterSchema(BaseModel):
+    latitude: float = Field(..., description="클러스터 중심 위도 (칸 안 콘텐츠 좌표의 평균)")
+    longitude: float = Field(..., description="클러스터 중심 경도")
+    count: int = Field(..., description="클러스터에 포함된 콘텐츠 수")
+    top: MapMarkerSchema = Field(..., description="대표 콘텐츠 (예약 수/평점 기준)")
+
+
+class MapClustersResponse(BaseModel):
+    zoom: int = Field(..., description="요청한 줌 레벨")
+    total_count: int = Field(..., description="화면(bbox) 안의 콘텐츠 수")
+    clusters: List[MapClusterSchema] = Field(..., description="클러스터 목록 (낮은 줌)")
+    markers: List[MapMarkerSchema] = Field(..., description="개별 마커 목록 (높은 줌, 또는 콘텐츠가 1개인 칸)")
+    truncated: bool = Field(False, description="마커가 최대 개수를 넘어 인기순으로 잘렸는지 여부")
+# --- ▲ [신규] ▲ ---
+
+
+# --- ▼ [신규] 주변 콘텐츠 (k 최근접) ▼ ---
+class NearbyContentSchema(MapMarkerSchema):
+    distance_km: float = Field(..., description="기준 위치로부터의 거리 (km, 하버사인)")
+# --- ▲ [신규] ▲ ---
+
+
+# --- ▼ [신규] 지역(시도/시군구)별 콘텐츠 수 ▼ ---
+class RegionCountSchema(BaseModel):
+    name: str = Field(..., description="지역 이름 (시도, 또는 '부산광역시 해운대구' 처럼 시도+시군구) - map-data 의 area 로 사용")
+    sido: str = Field(..., description="시도 이름")
+    sigungu: Optional[str] = Field(None, description="시군구 이름 (시도별 집계에서는 null)")
+    count: int = Field(..., description="지역 안의 Active 콘텐츠 수")
+
+
+class RegionCountsResponse(BaseModel):
+    level: str = Field(..., description="집계 단위: 'sido' 또는 'sigungu'")
+    regions: List[RegionCountSchema] = Field(..., description="지역별 콘텐츠 수 (많은 순)")
+# --- ▲ [신규] ▲ ---
+
+
 # ==================================================
 # 2. Auth & User 관련 스키마
 # ==================================================
@@ -194,6 +327,18 @@ class BookingCreateResponse(BaseModel):
     message: str = Field("예약 요청이 성공적으로 접수되었습니다.", description="결과 메시지")
     model_config = ConfigDict(from_attributes=True)
 
+# --- ▼ [신규] 예약 슬롯 (일정별 정원) ▼ ---
+class ContentSlotSchema(BaseModel):
+    start_at: datetime = Field(..., description="예약 일시")
+    capacity: int = Field(..., description="최대 인원")
+    booked: int = Field(..., description="예약된 인원 (취소/거절 제외)")
+    remaining: int = Field(..., description="남은 자리")
+
+class SlotCapacityRequest(BaseModel):
+    start_at: datetime = Field(..., description="정원을 설정할 예약 일시")
+    capacity: int = Field(..., gt=0, description="최대 인원 (1 이상, 이미 예약된 인원 이상)")
+# --- ▲ [신규] ▲ ---
+
 class MyBookingSchema(BaseModel):
     booking_id: int = Field(..., description="예약 고유 ID")
     content_id: int = Field(..., description="콘텐츠 ID (상세보기 링크용)")
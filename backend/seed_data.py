@@ -29,6 +29,12 @@ from seed_ai_definitions import (
     SEED_REALISTIC_TRAVELER_REVIEWS   # 현실적인 여행자 리뷰
 )
 
+# --- 콘텐츠 지역 배정 (시군구 경계 GeoJSON) ---
+from services.region_service import RegionDataNotFoundError, assign_regions
+from services.content_stats_service import reconcile_all as reconcile_content_stats
+from services.guide_summary_service import reconcile_all as reconcile_guide_summaries
+from services.booking_slot_service import reconcile_all as reconcile_booking_slots, slot_start
+
 
 # --- AI 규칙서 생성 헬퍼 함수 ---
 def _create_ai_rules(db: Session):
@@ -210,7 +216,7 @@ def create_seed_data(db: Session):
                 new_booking = Booking(
                     traveler_id=reviewer.id,
                     content_id=new_content.id,
-                    booking_date=datetime.now() - timedelta(days=random.randint(1, 10)),
+                    booking_date=slot_start(datetime.now() - timedelta(days=random.randint(1, 10))),
                     personnel=random.randint(1, 4),
                     status="Completed"
                 )
@@ -221,6 +227,7 @@ def create_seed_data(db: Session):
                 # (2) Review (상품 리뷰) 생성
                 db.add(Review(
                     booking_id=new_booking.id,
+                    content_id=new_content.id,
                     reviewer_id=reviewer.id,
                     rating=review_rating,
                     text=review_text, # seed_definitions.py의 원본 상품 리뷰
@@ -271,6 +278,15 @@ def create_seed_data(db: Session):
     print(f"     ✅ {total_guide_reviews} GuideReviews (for AI processing) created.")
     print(f"     ✅ {total_traveler_reviews} TravelerReviews (for AI processing) created.")
 
+    # --- ▼ [신규] 콘텐츠 지역(시도/시군구) 배정 ▼ ---
+    try:
+        region_result = assign_regions(db)
+        print(f"     ✅ {region_result['assigned']} contents assigned to regions "
+              f"({region_result['unassigned']} outside / without coordinates).")
+    except RegionDataNotFoundError as e:
+        print(f"     ⚠️ Skipping region assignment: {e}")
+    # --- ▲ [신규] ▲ ---
+
     # --- 4. 가이드/여행자 평균 평점/매너점수 업데이트 ---
     print("  6. Updating Guide/Traveler Ratings...")
     try:
@@ -297,6 +313,16 @@ def create_seed_data(db: Session):
         traceback.print_exc() 
         db.rollback()
 
+    # --- ▼ [신규] 콘텐츠 통계(평점/리뷰 수) / 가이드 요약(프로필 페이지용) / 예약 슬롯 채우기 ▼ ---
+    # 시드는 리뷰/예약을 직접 넣어 증분 갱신을 거치지 않으므로, 원본에서 한 번 집계해 둡니다.
+    stats_result = reconcile_content_stats(db)
+    print(f"     ✅ {stats_result['inserted']} content stats created.")
+    summary_result = reconcile_guide_summaries(db)
+    print(f"     ✅ {summary_result['inserted']} guide summaries created.")
+    slot_result = reconcile_booking_slots(db)
+    print(f"     ✅ {slot_result['inserted']} booking slots created.")
+    # --- ▲ [신규] ▲ ---
+
 
 if __name__ == "__main__":
     from database import SessionLocal
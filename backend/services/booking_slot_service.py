@@ -0,0 +1,179 @@
+import os
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from models import Booking, Content, ContentSlot
+from services.content_stats_service import EXCLUDED_BOOKING_STATUSES, is_counted_booking
+
+
+# 슬롯이 없는 일시에 첫 예약이 들어오면 이 정원으로 슬롯을 만듭니다. (가이드가 PUT /bookings/slots 로 변경)
+DEFAULT_SLOT_CAPACITY = int(os.getenv("DEFAULT_SLOT_CAPACITY", "10"))
+
+
+class SlotCapacityError(Exception):
+    """슬롯의 남은 자리가 부족해 예약(또는 정원 축소)을 할 수 없음"""
+
+    def __init__(self, capacity: int, booked: int):
+        super().__init__(f"slot capacity exceeded (capacity={capacity}, booked={booked})")
+        self.capacity = capacity
+        self.booked = booked
+
+    @property
+    def remaining(self) -> int:
+        return max(self.capacity - self.booked, 0)
+
+
+def slot_start(booking_date: datetime) -> datetime:
+    """예약 일시 -> 슬롯 시작 시각 (분 단위). Booking.booking_date 도 이 값으로 저장합니다."""
+    return booking_date.replace(second=0, microsecond=0)
+
+
+def _slot_filter(content_id: int, start_at: datetime):
+    return (ContentSlot.content_id == content_id, ContentSlot.start_at == slot_start(start_at))
+
+
+def _capacity_error(db: Session, content_id: int, start_at: datetime) -> SlotCapacityError:
+    row = db.query(ContentSlot.capacity, ContentSlot.booked).filter(*_slot_filter(content_id, start_at)).first()
+    return SlotCapacityError(row.capacity, row.booked) if row else SlotCapacityError(0, 0)
+
+
+# ==================================================
+# 1. 슬롯 생성 / 자리 잡기 / 반납 (호출한 쪽의 트랜잭션 안에서 실행, commit 하지 않음)
+# ==================================================
+
+def _ensure_slot(db: Session, content_id: int, start_at: datetime, capacity: int = DEFAULT_SLOT_CAPACITY):
+    """
+    슬롯이 없으면 만듭니다. 동시에 같은 슬롯을 만들려는 요청이 있으면 UNIQUE 키에서 한쪽만 성공하고,
+    나머지는 SAVEPOINT 만 되돌린 뒤 먼저 만들어진 슬롯을 그대로 씁니다.
+    """
+    start_at = slot_start(start_at)
+    if db.query(ContentSlot.id).filter(*_slot_filter(content_id, start_at)).first():
+        return
+    try:
+        with db.begin_nested():
+            db.add(ContentSlot(content_id=content_id, start_at=start_at, capacity=capacity,
+                               booked=0, updated_at=datetime.now()))
+    except IntegrityError:
+        pass
+
+
+def reserve_slot(db: Session, content_id: int, booking_date: datetime, personnel: int):
+    """
+    booked + personnel <= capacity 인 경우에만 booked 를 늘리는 조건부 UPDATE 한 번으로 자리를 잡습니다.
+    검사와 증가가 한 문장이라 동시 요청끼리 정원을 넘길 수 없고, 잠금은 해당 슬롯 행에만 commit 까지 걸립니다.
+    자리가 부족하면 SlotCapacityError (호출한 쪽에서 rollback)
+    """
+    _ensure_slot(db, content_id, booking_date)
+    updated = db.query(ContentSlot).filter(*_slot_filter(content_id, booking_date),
+                                           ContentSlot.booked + personnel <= ContentSlot.capacity)\
+                .update({ContentSlot.booked: ContentSlot.booked + personnel,
+                         ContentSlot.updated_at: datetime.now()},
+                        synchronize_session=False)
+    if updated != 1:
+        raise _capacity_error(db, content_id, booking_date)
+
+
+def release_slot(db: Session, content_id: int, booking_date: datetime, personnel: int):
+    """취소/거절된 예약의 인원을 슬롯에 돌려놓습니다. (슬롯이 없거나 이미 어긋났으면 reconcile 이 바로잡음)"""
+    db.query(ContentSlot).filter(*_slot_filter(content_id, booking_date), ContentSlot.booked >= personnel)\
+      .update({ContentSlot.booked: ContentSlot.booked - personnel,
+               ContentSlot.updated_at: datetime.now()},
+              synchronize_session=False)
+
+
+def record_slot_status(db: Session, content_id: int, booking_date: datetime, personnel: int,
+                       old_status: Optional[str], new_status: Optional[str]):
+    """
+    예약 상태 변경을 슬롯 인원에 반영합니다. (content_stats_service.record_booking_status 와 같은 기준)
+    취소/거절로 바뀌면 인원을 반납하고, 집계 대상 여부가 같으면 변화 없음
+    """
+    delta = int(is_counted_booking(new_status)) - int(is_counted_booking(old_status))
+    if delta > 0:
+        reserve_slot(db, content_id, booking_date, personnel)
+    elif delta < 0:
+        release_slot(db, content_id, booking_date, personnel)
+
+
+# ==================================================
+# 2. 조회 / 정원 변경 (가이드)
+# ==================================================
+
+def list_slots(db: Session, content_id: int, date_from: datetime, date_to: datetime) -> List[ContentSlot]:
+    return db.query(ContentSlot)\
+             .filter(ContentSlot.content_id == content_id,
+                     ContentSlot.start_at >= date_from, ContentSlot.start_at < date_to)\
+             .order_by(ContentSlot.start_at)\
+             .all()
+
+
+def set_slot_capacity(db: Session, content_id: int, start_at: datetime, capacity: int) -> ContentSlot:
+    """
+    슬롯 정원을 바꿉니다. (없으면 생성) 이미 예약된 인원보다 작게 줄이려 하면 SlotCapacityError.
+    예약과 같은 행에 대한 조건부 UPDATE 라 동시에 들어온 예약과 엇갈려도 booked <= capacity 가 유지됩니다.
+    """
+    _ensure_slot(db, content_id, start_at, capacity)
+    updated = db.query(ContentSlot).filter(*_slot_filter(content_id, start_at), ContentSlot.booked <= capacity)\
+                .update({ContentSlot.capacity: capacity, ContentSlot.updated_at: datetime.now()},
+                        synchronize_session=False)
+    if updated != 1:
+        raise _capacity_error(db, content_id, start_at)
+    return db.query(ContentSlot).filter(*_slot_filter(content_id, start_at)).one()
+
+
+# ==================================================
+# 3. 일괄 재계산 (run_reconcile_booking_slots.py)
+# ==================================================
+
+def _booked_by_slot(db: Session, content_ids: List[int]) -> Dict[Tuple[int, datetime], int]:
+    """(콘텐츠, 슬롯 시작 시각) -> 예약 인원. 분 단위로 잘리지 않은 예전 예약도 같은 슬롯으로 합칩니다."""
+    rows = db.query(Booking.content_id, Booking.booking_date, func.sum(Booking.personnel))\
+             .filter(Booking.content_id.in_(content_ids), Booking.status.notin_(EXCLUDED_BOOKING_STATUSES))\
+             .group_by(Booking.content_id, Booking.booking_date)
+    booked: Dict[Tuple[int, datetime], int] = {}
+    for content_id, booking_date, total in rows:
+        key = (content_id, slot_start(booking_date))
+        booked[key] = booked.get(key, 0) + int(total or 0)
+    return booked
+
+
+def reconcile_all(db: Session, batch_size: int = 500, dry_run: bool = False) -> dict:
+    """
+    예약 원본에서 슬롯별 인원을 다시 집계해 어긋난 booked 를 고치고, 슬롯이 없는 예약 일시는 슬롯을 만듭니다.
+    batch_size 개 콘텐츠 단위로, 해당 슬롯 행을 먼저 잠근(FOR UPDATE) 뒤 집계하므로
+    진행 중인 예약과 엇갈려 오래된 합계로 덮어쓰지 않습니다. (정원을 넘긴 슬롯은 over_capacity 로 보고)
+    """
+    result = {"checked": 0, "inserted": 0, "updated": 0, "over_capacity": 0}
+    all_ids = [cid for (cid,) in db.query(Content.id).order_by(Content.id)]
+    db.rollback()
+    for start in range(0, len(all_ids), batch_size):
+        ids = all_ids[start:start + batch_size]
+        slots = db.query(ContentSlot).filter(ContentSlot.content_id.in_(ids))\
+                  .order_by(ContentSlot.id).with_for_update().all()
+        expected = _booked_by_slot(db, ids)
+        now = datetime.now()
+        inserts, updates = [], []
+        for slot in slots:
+            booked = expected.pop((slot.content_id, slot.start_at), 0)
+            if slot.booked != booked:
+                updates.append({"id": slot.id, "booked": booked, "updated_at": now})
+            if booked > slot.capacity:
+                result["over_capacity"] += 1
+        for (content_id, start_at), booked in expected.items():
+            inserts.append({"content_id": content_id, "start_at": start_at, "booked": booked,
+                            "capacity": max(DEFAULT_SLOT_CAPACITY, booked), "updated_at": now})
+        result["checked"] += len(slots)
+        result["inserted"] += len(inserts)
+        result["updated"] += len(updates)
+        if dry_run:
+            db.rollback()
+            continue
+        if inserts:
+            db.bulk_insert_mappings(ContentSlot, inserts)
+        if updates:
+            db.bulk_update_mappings(ContentSlot, updates)
+        db.commit()
+    return result
@@ -0,0 +1,158 @@
+import asyncio
+import os
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from database import SessionLocal
+from models import SearchOutbox
+
+
+# search_outbox 를 '변경 로그'로 읽어 API 프로세스의 메모리 구조(인덱스/캐시)를 갱신하는 폴링 간격(초)
+CHANGE_FEED_POLL_SECONDS = float(os.getenv("CHANGE_FEED_POLL_SECONDS", "2"))
+# 한 번의 폴링에서 읽을 최대 이벤트 수
+CHANGE_FEED_BATCH_SIZE = 1000
+# AUTO_INCREMENT ID 는 INSERT 시점에 정해지지만 commit 시점에 보이므로, 기준점보다 작은데 아직 보이지 않은 ID(빈 구멍)는
+# 늦게 commit 될 수 있습니다. 이 시간(초) 동안 매 폴링마다 다시 확인하고, 그 뒤에는 롤백된 ID 로 보고 버립니다.
+CHANGE_FEED_GAP_GRACE_SECONDS = float(os.getenv("CHANGE_FEED_GAP_GRACE_SECONDS", "60"))
+# 추적할 빈 ID 의 최대 개수 (대량 롤백 등으로 ID 가 크게 건너뛰어도 메모리/IN 목록이 커지지 않도록)
+CHANGE_FEED_MAX_TRACKED_GAPS = 10000
+
+# listener(db, content_ids) 형태의 콜백 목록
+_listeners: List[Callable[[Session, Set[int]], None]] = []
+_last_seen_id = 0
+# 빈 ID -> 다시 확인을 멈출 시각 (time.monotonic 기준)
+_pending_gaps: Dict[int, float] = {}
+_poll_task: Optional[asyncio.Task] = None
+
+
+def register_listener(listener: Callable[[Session, Set[int]], None]):
+    """
+    콘텐츠 변경 알림을 받을 콜백을 등록합니다.
+    outbox 는 리뷰/태그/콘텐츠 쓰기 트랜잭션과 함께 기록되므로,
+    배치 스크립트 등 '다른 프로세스'에서 일어난 변경도 이 콜백으로 전달됩니다.
+    """
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def notify_local(db: Session, content_ids: Set[int]):
+    """같은 프로세스의 쓰기 경로에서 폴링을 기다리지 않고 바로 알릴 때 사용합니다."""
+    _dispatch(db, set(content_ids))
+
+
+def _dispatch(db: Session, content_ids: Set[int]):
+    if not content_ids:
+        return
+    for listener in list(_listeners):
+        try:
+            listener(db, content_ids)
+        except Exception as e:
+            print(f"Change feed listener {getattr(listener, '__name__', listener)} failed: {e}")
+
+
+def _track_gaps(previous_id: int, seen_ids: Iterable[int]):
+    """previous_id 다음부터 seen_ids(오름차순) 사이에 비어 있는 ID 를 늦은 commit 후보로 기록합니다."""
+    deadline = time.monotonic() + CHANGE_FEED_GAP_GRACE_SECONDS
+    expected = previous_id + 1
+    for row_id in seen_ids:
+        room = CHANGE_FEED_MAX_TRACKED_GAPS - len(_pending_gaps)
+        for gap_id in range(expected, min(row_id, expected + max(room, 0))):
+            _pending_gaps[gap_id] = deadline
+        expected = max(expected, row_id + 1)
+
+
+def mark_current_position(db: Session):
+    """
+    현재 outbox 의 마지막 ID 를 기준점으로 삼습니다. (전체 빌드 직전에 호출)
+    그 직전 구간의 빈 ID 는 아직 commit 되지 않은 쓰기일 수 있으므로 함께 추적합니다.
+    """
+    global _last_seen_id
+    _pending_gaps.clear()
+    _last_seen_id = db.query(func.max(SearchOutbox.id)).scalar() or 0
+    window_start = max(_last_seen_id - CHANGE_FEED_BATCH_SIZE, 0)
+    recent_ids = [row_id for (row_id,) in db.query(SearchOutbox.id)
+                  .filter(SearchOutbox.id > window_start).order_by(SearchOutbox.id)]
+    _track_gaps(window_start, recent_ids)
+
+
+def _recheck_gaps(db: Session) -> Set[int]:
+    """추적 중인 빈 ID 중 그 사이 commit 된 이벤트의 content_id (유예 시간이 지난 ID 는 버림)"""
+    now = time.monotonic()
+    for gap_id in [gap_id for gap_id, deadline in _pending_gaps.items() if deadline < now]:
+        del _pending_gaps[gap_id]
+    if not _pending_gaps:
+        return set()
+    rows = db.query(SearchOutbox.id, SearchOutbox.content_id)\
+             .filter(SearchOutbox.id.in_(list(_pending_gaps)))\
+             .all()
+    for row in rows:
+        _pending_gaps.pop(row.id, None)
+    return {row.content_id for row in rows}
+
+
+def poll_once() -> int:
+    """
+    기준점 이후 새로 기록된 이벤트와, 기준점 아래에서 늦게 commit 된 이벤트를 읽어 listener 에 전달합니다.
+    반환값: 기준점 이후 읽은 이벤트 수
+    """
+    global _last_seen_id
+    db = SessionLocal()
+    try:
+        content_ids = _recheck_gaps(db)
+        rows = db.query(SearchOutbox.id, SearchOutbox.content_id)\
+                 .filter(SearchOutbox.id > _last_seen_id)\
+                 .order_by(SearchOutbox.id)\
+                 .limit(CHANGE_FEED_BATCH_SIZE)\
+                 .all()
+        if rows:
+            _track_gaps(_last_seen_id, [row.id for row in rows])
+            _last_seen_id = rows[-1].id
+            content_ids |= {row.content_id for row in rows}
+        _dispatch(db, content_ids)
+        return len(rows)
+    finally:
+        db.close()
+
+
+async def _poll_loop():
+    while True:
+        try:
+            while await asyncio.to_thread(poll_once) >= CHANGE_FEED_BATCH_SIZE:
+                pass
+        except Exception as e:
+            print(f"Change feed polling failed: {e}")
+        await asyncio.sleep(CHANGE_FEED_POLL_SECONDS)
+
+
+async def start():
+    """앱 lifespan 시작 시 호출: 현재 위치부터 outbox 폴링을 시작합니다."""
+    global _poll_task
+    if _poll_task is None:
+        try:
+            await asyncio.to_thread(_mark_current_position_in_new_session)
+        except Exception as e:
+            # DB 가 아직 준비되지 않았어도 기동은 계속 (처음부터 읽음)
+            print(f"Change feed start position unavailable: {e}")
+        _poll_task = asyncio.create_task(_poll_loop())
+
+
+def _mark_current_position_in_new_session():
+    db = SessionLocal()
+    try:
+        mark_current_position(db)
+    finally:
+        db.close()
+
+
+async def stop():
+    global _poll_task
+    if _poll_task is not None:
+        _poll_task.cancel()
+        try:
+            await _poll_task
+        except asyncio.CancelledError:
+            pass
+        _poll_task = None
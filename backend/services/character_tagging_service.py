@@ -7,6 +7,7 @@ from models import (
     Tag, GuideReviewTag, TravelerReviewTag
 )
 # --- ▲ [신규] ▲ ---
+from services.guide_summary_service import record_guide_review_tagging
 
 
 def fetch_reviews_without_character(db: Session) -> List[Union[GuideReview, TravelerReview]]:
@@ -128,5 +129,14 @@ def save_tags_and_character(
 
     # 3. '리뷰' 테이블 자체에 '최종 분류된 캐릭터 ID' 업데이트
     # -----------------------------------------------------------------
+    previous_character_id = review.ai_character_id
     review.ai_character_id = character_id
-    db.add(review) # (SQLAlchemy가 UPDATE로 처리)
\ No newline at end of file
+    db.add(review) # (SQLAlchemy가 UPDATE로 처리)
+
+    # 4. 가이드 리뷰면 가이드 요약(캐릭터 분포/상위 태그)에 같은 트랜잭션에서 반영
+    # -----------------------------------------------------------------
+    if isinstance(review, GuideReview):
+        record_guide_review_tagging(
+            db, review.guide_id, character_id, [link.tag_id for link in new_links],
+            previous_character_id=previous_character_id
+        )
\ No newline at end of file
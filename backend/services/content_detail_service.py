@@ -0,0 +1,158 @@
+import os
+from typing import Iterable, Optional, Set
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from cache import MISSING, get_cache
+from models import Content, ContentStats, ContentTag, GuideProfile, Tag, User
+from services.content_stats_service import get_content_stats, main_image_column
+from services.related_service import load_related, to_related_item
+
+
+# 조립된 상세(리뷰 제외)의 유효 시간(초). 가이드 평점처럼 변경 알림이 오지 않는 값은 이 시간 안에 반영됩니다.
+DETAIL_CACHE_TTL_SECONDS = int(os.getenv("DETAIL_CACHE_TTL_SECONDS", "300"))
+DETAIL_CACHE_MAX_ENTRIES = int(os.getenv("DETAIL_CACHE_MAX_ENTRIES", "4096"))
+# 미리 계산된 이웃이 없는 콘텐츠용 '최신 Active 콘텐츠' 목록의 앞부분을 이만큼 캐시
+RELATED_HEAD_SIZE = 24
+
+# content_id -> 상세 dict / "related" -> (최신 콘텐츠 목록, Active 콘텐츠 수)
+# CACHE_BACKEND=redis 이면 모든 워커가 같은 항목과 무효화를 공유합니다.
+_details = get_cache("content_detail", max_entries=DETAIL_CACHE_MAX_ENTRIES, default_ttl=DETAIL_CACHE_TTL_SECONDS)
+_RELATED_KEY = "related"
+
+
+# ==================================================
+# 1. 상세 (리뷰를 제외한 안정적인 부분)
+# ==================================================
+
+def load_content_detail(db: Session, content_id: int) -> Optional[dict]:
+    """
+    콘텐츠 + 가이드 + 통계(평점/리뷰 수) + 메인 이미지를 한 번의 SELECT 로 읽고,
+    태그와 미리 계산된 관련 콘텐츠(content_related)를 한 번씩 더 읽어 조립합니다.
+    Active 가 아니거나 없는 콘텐츠면 None.
+    """
+    row = db.query(
+        Content.id,
+        Content.title,
+        Content.description,
+        Content.price,
+        Content.location,
+        Content.created_at,
+        Content.status,
+        Content.guide_id,
+        User.nickname.label("guide_nickname"),
+        GuideProfile.avg_rating.label("guide_avg_rating"),
+        ContentStats.content_id.label("stats_content_id"),
+        ContentStats.review_count,
+        ContentStats.avg_rating,
+        main_image_column().label("main_image_url"),
+    ).outerjoin(GuideProfile, GuideProfile.users_id == Content.guide_id)\
+     .outerjoin(User, User.id == GuideProfile.users_id)\
+     .outerjoin(ContentStats, ContentStats.content_id == Content.id)\
+     .filter(Content.id == content_id, Content.status == "Active")\
+     .first()
+    if row is None:
+        return None
+
+    review_count, avg_rating = row.review_count, row.avg_rating
+    if row.stats_content_id is None:
+        # 통계 행이 아직 없음 (reconcile 전) -> 원본 집계
+        stats = get_content_stats(db, content_id)
+        review_count, avg_rating = stats["review_count"], stats["avg_rating"]
+
+    tags = db.query(Tag.id, Tag.name).join(ContentTag, Tag.id == ContentTag.tag_id)\
+             .filter(ContentTag.contents_id == content_id).all()
+
+    return {
+        "id": row.id,
+        "title": row.title,
+        "description": row.description,
+        "price": row.price,
+        "location": row.location,
+        "created_at": row.created_at,
+        "status": row.status,
+        "guide_id": row.guide_id,
+        "guide_name": row.guide_nickname if row.guide_nickname is not None else "공식 가이드",
+        "guide_nickname": row.guide_nickname if row.guide_nickname is not None else "정보 없음",
+        "guide_avg_rating": row.guide_avg_rating if row.guide_nickname is not None else None,
+        "main_image_url": row.main_image_url,
+        "review_count": review_count,
+        "rating": round(float(avg_rating), 1) if avg_rating else 0.0,
+        "tags": [{"id": tag.id, "name": tag.name} for tag in tags],
+        "related": load_related(db, content_id),
+    }
+
+
+def get_content_detail(db: Session, content_id: int) -> Optional[dict]:
+    """캐시된 상세를 반환하고, 없으면 load_content_detail 로 채웁니다. (없는 콘텐츠는 캐시하지 않음)"""
+    key = str(content_id)
+    detail = _details.get(key)
+    if detail is not MISSING:
+        return detail
+    detail = load_content_detail(db, content_id)
+    if detail is not None:
+        _details.set(key, detail)
+    return detail
+
+
+# ==================================================
+# 2. 관련 콘텐츠 (미리 계산된 이웃, 없으면 최신 Active 콘텐츠)
+# ==================================================
+
+def _related_query(db: Session, exclude_id: Optional[int] = None):
+    query = db.query(Content.id, Content.title, Content.price, main_image_column().label("imageUrl"),
+                     ContentStats.avg_rating.label("rating"))\
+        .outerjoin(ContentStats, ContentStats.content_id == Content.id)\
+        .filter(Content.status == "Active")
+    if exclude_id is not None:
+        query = query.filter(Content.id != exclude_id)
+    return query.order_by(Content.created_at.desc())
+
+
+def _related_head(db: Session):
+    head = _details.get(_RELATED_KEY)
+    if head is MISSING:
+        # 자기 자신을 빼도 RELATED_HEAD_SIZE 개가 남도록 한 개 더 읽음
+        items = [to_related_item(row) for row in _related_query(db).limit(RELATED_HEAD_SIZE + 1)]
+        active_count = db.query(func.count(Content.id)).filter(Content.status == "Active").scalar() or 0
+        head = (items, active_count)
+        _details.set(_RELATED_KEY, head)
+    return head
+
+
+def get_related_page(db: Session, detail: dict, page: int, per_page: int):
+    """
+    상세(get_content_detail 결과)의 (관련 콘텐츠 한 페이지, 전체 관련 콘텐츠 수)
+    - 미리 계산된 이웃이 있으면 캐시된 상세 안에서 자름 (쿼리 없음)
+    - 없으면 (새 콘텐츠 등) 최신 Active 콘텐츠: 캐시된 앞부분 안의 페이지는 쿼리 없이, 그 뒤는 DB 에서 읽음
+    """
+    start, end = (page - 1) * per_page, page * per_page
+    if detail["related"]:
+        return detail["related"][start:end], len(detail["related"])
+
+    content_id = detail["id"]
+    items, active_count = _related_head(db)
+    # 캐시된 목록에서 자기 자신만 빼도 전체 관련 목록의 앞부분(prefix)이 그대로 유지됨
+    others = [item for item in items if item["id"] != content_id]
+    total = max(active_count - 1, 0)
+    if end <= len(others) or len(items) >= active_count:
+        return others[start:end], total
+    rows = _related_query(db, exclude_id=content_id).offset(start).limit(per_page).all()
+    return [to_related_item(row) for row in rows], total
+
+
+# ==================================================
+# 3. 무효화
+# ==================================================
+
+def invalidate(content_ids: Iterable[int]):
+    """리뷰/태그/콘텐츠 쓰기 이후 해당 콘텐츠의 상세와 (평점이 실린) 관련 콘텐츠 목록을 지웁니다."""
+    for content_id in set(content_ids):
+        _details.delete(str(content_id))
+    _details.delete(_RELATED_KEY)
+
+
+def on_content_change(db: Session, content_ids: Set[int]):
+    """change feed listener: 다른 프로세스(배치 스크립트 등)의 리뷰/태그/콘텐츠 변경도 반영"""
+    invalidate(content_ids)
@@ -0,0 +1,216 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from models import Booking, Content, ContentImage, ContentStats, Review
+
+
+# 예약 수 집계에서 제외하는 예약 상태 (suggest_service 의 인기도 기준과 동일)
+EXCLUDED_BOOKING_STATUSES = ("Canceled", "Rejected")
+RATING_VALUES = (1, 2, 3, 4, 5)
+_RATING_COLUMNS = {value: getattr(ContentStats, f"rating_{value}") for value in RATING_VALUES}
+
+
+def is_counted_booking(booking_status: Optional[str]) -> bool:
+    return booking_status is not None and booking_status not in EXCLUDED_BOOKING_STATUSES
+
+
+def main_image_subquery():
+    """콘텐츠당 메인 이미지 1장 (스칼라 서브쿼리라 JOIN 과 달리 행이 늘지 않음)"""
+    return select(ContentImage.image_url)\
+        .where(ContentImage.contents_id == Content.id, ContentImage.is_main == True)\
+        .order_by(ContentImage.id)\
+        .limit(1)\
+        .correlate(Content)\
+        .scalar_subquery()
+
+
+def main_image_column():
+    """통계 행의 메인 이미지 (행이 아직 없으면 이미지 테이블에서 조회) - ContentStats 를 outer join 한 쿼리용"""
+    return func.coalesce(ContentStats.main_image_url, main_image_subquery())
+
+
+# ==================================================
+# 1. 원본 테이블 집계 (재계산 / 통계 행이 없을 때의 대체 경로)
+# ==================================================
+
+def _empty_stats(content_id: int) -> dict:
+    stats = {
+        "content_id": content_id, "review_count": 0, "rating_sum": 0, "avg_rating": None,
+        "booking_count": 0, "main_image_url": None,
+    }
+    stats.update({f"rating_{value}": 0 for value in RATING_VALUES})
+    return stats
+
+
+def aggregate_content_stats(db: Session, content_ids: Optional[List[int]] = None) -> Dict[int, dict]:
+    """
+    리뷰/예약/이미지 테이블에서 콘텐츠별 통계를 GROUP BY 로 한 번에 집계합니다.
+    content_ids 가 None 이면 전체 콘텐츠 (reconcile 용)
+    """
+    content_query = db.query(Content.id, main_image_subquery().label("main_image_url"))
+    if content_ids is not None:
+        content_query = content_query.filter(Content.id.in_(content_ids))
+    results: Dict[int, dict] = {}
+    for row in content_query:
+        stats = _empty_stats(row.id)
+        stats["main_image_url"] = row.main_image_url
+        results[row.id] = stats
+
+    review_query = db.query(Booking.content_id, Review.rating, func.count(Review.id))\
+        .join(Review, Review.booking_id == Booking.id)
+    if content_ids is not None:
+        review_query = review_query.filter(Booking.content_id.in_(content_ids))
+    for content_id, rating, count in review_query.group_by(Booking.content_id, Review.rating):
+        stats = results.get(content_id)
+        if stats is None:
+            continue
+        stats["review_count"] += count
+        stats["rating_sum"] += rating * count
+        if rating in _RATING_COLUMNS:
+            stats[f"rating_{rating}"] += count
+
+    booking_query = db.query(Booking.content_id, func.count(Booking.id))\
+        .filter(Booking.status.notin_(EXCLUDED_BOOKING_STATUSES))
+    if content_ids is not None:
+        booking_query = booking_query.filter(Booking.content_id.in_(content_ids))
+    for content_id, count in booking_query.group_by(Booking.content_id):
+        if content_id in results:
+            results[content_id]["booking_count"] = count
+
+    for stats in results.values():
+        if stats["review_count"]:
+            stats["avg_rating"] = stats["rating_sum"] / stats["review_count"]
+    return results
+
+
+def _insert_stats(db: Session, stats: dict, now: datetime) -> bool:
+    """
+    통계 행을 새로 넣습니다. 동시에 다른 트랜잭션이 같은 행을 먼저 넣었으면 (PK 충돌)
+    SAVEPOINT 만 되돌리고 False - 호출한 쪽의 리뷰/예약 쓰기는 그대로 유지됩니다.
+    """
+    try:
+        with db.begin_nested():
+            db.add(ContentStats(**stats, updated_at=now))
+        return True
+    except IntegrityError:
+        return False
+
+
+def refresh_content_stats(db: Session, content_ids: Iterable[int]):
+    """주어진 콘텐츠의 통계 행을 원본에서 다시 계산해 저장합니다. (commit 하지 않음)"""
+    ids = sorted({cid for cid in content_ids if cid is not None})
+    if not ids:
+        return
+    db.flush() # 같은 트랜잭션에서 방금 추가한 리뷰/예약도 집계에 포함
+    now = datetime.now()
+    for stats in aggregate_content_stats(db, ids).values():
+        query = db.query(ContentStats).filter(ContentStats.content_id == stats["content_id"])
+        values = {key: value for key, value in stats.items() if key != "content_id"}
+        values["updated_at"] = now
+        # UPDATE -> (행이 없으면) INSERT -> (동시에 먼저 생성됐으면) 다시 UPDATE
+        if not query.update(values, synchronize_session=False) and not _insert_stats(db, stats, now):
+            query.update(values, synchronize_session=False)
+
+
+def get_content_stats(db: Session, content_id: int) -> dict:
+    """상세 조회용: 통계 행이 있으면 그 행을, 없으면 (reconcile 이전) 원본 집계를 반환합니다."""
+    row = db.get(ContentStats, content_id)
+    if row is not None:
+        return {column.name: getattr(row, column.name) for column in ContentStats.__table__.columns}
+    return aggregate_content_stats(db, [content_id]).get(content_id) or _empty_stats(content_id)
+
+
+# ==================================================
+# 2. 증분 갱신 (쓰기 측) - 호출자의 트랜잭션 안에서 실행, commit 하지 않음
+# ==================================================
+
+def _update_or_create(db: Session, content_id: int, values: dict) -> bool:
+    """
+    통계 행에 values 를 원자적으로 적용합니다. (UPDATE col = col + n)
+    행이 없으면 원본에서 집계해 새로 만들고 False (방금 flush 한 리뷰/예약이 이미 포함됨).
+    동시에 다른 트랜잭션이 먼저 행을 만들었으면 그 행에 다시 UPDATE 해 이 쓰기만 더합니다.
+    """
+    query = db.query(ContentStats).filter(ContentStats.content_id == content_id)
+    if query.update(values, synchronize_session=False):
+        return True
+    db.flush()
+    stats = aggregate_content_stats(db, [content_id]).get(content_id)
+    if stats is None or _insert_stats(db, stats, datetime.now()):
+        return False
+    return bool(query.update(values, synchronize_session=False))
+
+
+def record_review(db: Session, content_id: int, rating: int):
+    """
+    새 상품 리뷰를 통계에 더합니다.
+    UPDATE col = col + n 형태라 동시에 리뷰가 작성되어도 값을 잃지 않습니다. (행 잠금)
+    """
+    values = {
+        ContentStats.review_count: ContentStats.review_count + 1,
+        ContentStats.rating_sum: ContentStats.rating_sum + rating,
+        ContentStats.updated_at: datetime.now(),
+    }
+    if rating in _RATING_COLUMNS:
+        values[_RATING_COLUMNS[rating]] = _RATING_COLUMNS[rating] + 1
+    if not _update_or_create(db, content_id, values):
+        return
+    # 평균은 갱신된 합계/개수로 다시 계산 (SET 절의 평가 순서가 DB 마다 달라 별도 문장으로 실행)
+    db.query(ContentStats).filter(ContentStats.content_id == content_id)\
+      .update({ContentStats.avg_rating: ContentStats.rating_sum * 1.0 / ContentStats.review_count},
+              synchronize_session=False)
+
+
+def record_booking_status(db: Session, content_id: int, old_status: Optional[str], new_status: Optional[str]):
+    """
+    예약 생성(old_status=None) 또는 상태 변경을 예약 수에 반영합니다.
+    취소/거절로 바뀌면 -1, 새 예약이면 +1, 집계 대상 여부가 같으면 변화 없음
+    """
+    delta = int(is_counted_booking(new_status)) - int(is_counted_booking(old_status))
+    if not delta:
+        return
+    _update_or_create(db, content_id, {ContentStats.booking_count: ContentStats.booking_count + delta,
+                                       ContentStats.updated_at: datetime.now()})
+
+
+# ==================================================
+# 3. 일괄 재계산 (run_reconcile_stats.py)
+# ==================================================
+
+_COMPARED_FIELDS = ("review_count", "rating_sum", "booking_count", "main_image_url") + \
+    tuple(f"rating_{value}" for value in RATING_VALUES)
+
+
+def reconcile_all(db: Session, batch_size: int = 1000, dry_run: bool = False) -> dict:
+    """
+    전체 콘텐츠의 통계를 원본에서 다시 집계해 어긋난 행만 고칩니다. (없는 행은 추가)
+    batch_size 개 콘텐츠 단위로 집계/commit 하여 긴 트랜잭션과 큰 IN 목록을 피합니다.
+    """
+    result = {"checked": 0, "inserted": 0, "updated": 0}
+    all_ids = [cid for (cid,) in db.query(Content.id).order_by(Content.id)]
+    for start in range(0, len(all_ids), batch_size):
+        ids = all_ids[start:start + batch_size]
+        expected = aggregate_content_stats(db, ids)
+        existing = {row.content_id: row for row in db.query(ContentStats).filter(ContentStats.content_id.in_(ids))}
+        now = datetime.now()
+        inserts, updates = [], []
+        for content_id, stats in expected.items():
+            row = existing.get(content_id)
+            if row is None:
+                inserts.append(dict(stats, updated_at=now))
+            elif any(getattr(row, field) != stats[field] for field in _COMPARED_FIELDS):
+                updates.append(dict(stats, updated_at=now))
+        result["checked"] += len(expected)
+        result["inserted"] += len(inserts)
+        result["updated"] += len(updates)
+        if dry_run:
+            continue
+        if inserts:
+            db.bulk_insert_mappings(ContentStats, inserts)
+        if updates:
+            db.bulk_update_mappings(ContentStats, updates)
+        db.commit()
+    return result
@@ -0,0 +1,81 @@
+import os
+from typing import List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Query
+
+from cache import MISSING, get_cache
+
+
+# --- 설정 ---
+# 캐시된 total_count 의 유효 시간(초). 다른 프로세스(배치 스크립트 등)의 쓰기는
+# 이 TTL 이 지나면 반영됩니다.
+COUNT_CACHE_TTL_SECONDS = int(os.getenv("COUNT_CACHE_TTL_SECONDS", "60"))
+# 메모리 보호를 위한 최대 캐시 항목 수 (초과 시 가장 오래 사용하지 않은 항목부터 제거)
+COUNT_CACHE_MAX_ENTRIES = int(os.getenv("COUNT_CACHE_MAX_ENTRIES", "1024"))
+# 결과가 이 개수를 넘으면 끝까지 세지 않고 "N개 이상"(추정치)으로 응답 (0이면 항상 정확히 셈)
+COUNT_ESTIMATE_THRESHOLD = int(os.getenv("COUNT_ESTIMATE_THRESHOLD", "10000"))
+
+# repr(signature) -> (count, is_estimate)
+# CACHE_BACKEND=redis 이면 모든 워커가 같은 count 와 무효화를 공유합니다.
+_cache = get_cache("list_count", max_entries=COUNT_CACHE_MAX_ENTRIES, default_ttl=COUNT_CACHE_TTL_SECONDS)
+
+
+def filter_signature(
+    search_terms: Optional[List[str]],
+    location: Optional[str],
+    tag_signature: tuple,
+    style: Optional[str],
+) -> tuple:
+    """
+    목록 필터 조합을 정규화하여 캐시 키로 사용할 튜플을 만듭니다.
+    (검색어/태그의 순서, 공백, 중복이 달라도 같은 필터면 같은 키가 됩니다)
+    tag_signature 는 TagFilter.signature() (이미 정규화된 태그 조건)
+    """
+    terms = tuple(sorted({t.strip() for t in (search_terms or []) if t and t.strip()}))
+    return (
+        terms,
+        (location or "").strip(),
+        tag_signature,
+        (style or "").strip(),
+    )
+
+
+def get_cached_count(signature: tuple) -> Optional[Tuple[int, bool]]:
+    """캐시된 (count, is_estimate) 를 반환합니다. 없거나 만료되었으면 None."""
+    entry = _cache.get(repr(signature))
+    if entry is MISSING:
+        return None
+    count, is_estimate = entry
+    return count, is_estimate
+
+
+def set_cached_count(signature: tuple, count: int, is_estimate: bool = False):
+    """count 결과를 TTL 과 함께 저장합니다."""
+    _cache.set(repr(signature), (count, is_estimate))
+
+
+def invalidate_count_cache():
+    """콘텐츠/태그 쓰기 이후 호출하여 모든 캐시된 count 를 무효화합니다."""
+    _cache.clear()
+
+
+def on_content_change(db, content_ids):
+    """change feed listener: 콘텐츠/태그가 바뀌면 (다른 프로세스의 변경 포함) count 캐시를 비웁니다."""
+    invalidate_count_cache()
+
+
+def count_query(query: Query) -> Tuple[int, bool]:
+    """
+    목록 쿼리의 전체 개수를 셉니다.
+    COUNT_ESTIMATE_THRESHOLD 를 넘는 결과는 threshold+1 행까지만 읽고 멈춘 뒤
+    (threshold, True) 를 반환하여 "N개 이상"으로 표시할 수 있게 합니다.
+    """
+    if COUNT_ESTIMATE_THRESHOLD <= 0:
+        return query.count(), False
+
+    capped = query.limit(COUNT_ESTIMATE_THRESHOLD + 1).subquery()
+    count = query.session.query(func.count()).select_from(capped).scalar() or 0
+    if count > COUNT_ESTIMATE_THRESHOLD:
+        return COUNT_ESTIMATE_THRESHOLD, True
+    return count, False
@@ -0,0 +1,158 @@
+import asyncio
+import os
+import threading
+import time
+from typing import Optional
+
+from services.search_index_service import ES_URL
+
+
+# --- 설정 ---
+# 요청 경로에서 ES 호출 한 번에 허용하는 시간(초). 넘으면 DB 검색으로 전환합니다.
+ES_REQUEST_TIMEOUT_SECONDS = float(os.getenv("ES_REQUEST_TIMEOUT_SECONDS", "0.8"))
+# 연속 실패가 이 횟수에 도달하면 회로를 열고(open) ES 호출을 중단합니다.
+ES_FAILURE_THRESHOLD = int(os.getenv("ES_FAILURE_THRESHOLD", "3"))
+# 회로가 열린 동안 백그라운드에서 ES 상태를 확인하는 간격(초)
+ES_PROBE_INTERVAL_SECONDS = float(os.getenv("ES_PROBE_INTERVAL_SECONDS", "5"))
+
+
+class CircuitBreaker:
+    """
+    ES 장애 시 요청마다 타임아웃을 기다리지 않도록 하는 서킷 브레이커.
+    - closed: 정상. 요청 경로에서 ES 를 호출합니다.
+    - open: 연속 실패 누적. 요청 경로는 즉시 DB 검색으로 전환하고, 복구 여부는 백그라운드 probe 가 확인합니다.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+
+    def __init__(self, failure_threshold: int):
+        self.failure_threshold = failure_threshold
+        self._lock = threading.Lock()
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.total_failures = 0
+        self.total_short_circuited = 0
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            self.total_short_circuited += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self.opened_at = None
+
+    def record_failure(self, error: Exception):
+        with self._lock:
+            self.consecutive_failures += 1
+            self.total_failures += 1
+            self.last_error = str(error)[:200]
+            if self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                print(f"Elasticsearch 회로 열림 (연속 {self.consecutive_failures}회 실패): {self.last_error}")
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "open_for_seconds": round(time.monotonic() - self.opened_at, 1) if self.opened_at else None,
+                "last_error": self.last_error,
+                "total_failures": self.total_failures,
+                "total_short_circuited": self.total_short_circuited,
+            }
+
+
+breaker = CircuitBreaker(ES_FAILURE_THRESHOLD)
+
+_client = None
+_client_lock = threading.Lock()
+_probe_task: Optional[asyncio.Task] = None
+
+
+def _get_client():
+    """ES 클라이언트를 처음 필요할 때 생성합니다. (생성자는 네트워크 연결을 하지 않음)"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from elasticsearch import Elasticsearch
+                _client = Elasticsearch(
+                    ES_URL,
+                    request_timeout=ES_REQUEST_TIMEOUT_SECONDS,
+                    max_retries=0,
+                    retry_on_timeout=False,
+                )
+    return _client
+
+
+def get_search_client():
+    """
+    요청 경로에서 사용할 ES 클라이언트를 반환합니다.
+    회로가 열려 있거나 클라이언트를 만들 수 없으면 None (호출자는 DB 검색으로 전환).
+    """
+    if not breaker.allow_request():
+        return None
+    try:
+        return _get_client()
+    except Exception as e:
+        breaker.record_failure(e)
+        return None
+
+
+def probe() -> bool:
+    """ES 에 ping 을 보내 회로 상태를 갱신합니다. (블로킹 호출이므로 스레드에서 실행)"""
+    try:
+        ok = bool(_get_client().ping())
+    except Exception as e:
+        breaker.record_failure(e)
+        return False
+    if ok:
+        if breaker.state != CircuitBreaker.CLOSED:
+            print("Elasticsearch 복구 확인 - 회로 닫힘")
+        breaker.record_success()
+    else:
+        breaker.record_failure(RuntimeError("ping failed"))
+    return ok
+
+
+async def _probe_loop():
+    # 시작 직후 한 번 확인 (서버 기동은 기다리지 않음)
+    await asyncio.to_thread(probe)
+    while True:
+        await asyncio.sleep(ES_PROBE_INTERVAL_SECONDS)
+        if breaker.state != CircuitBreaker.CLOSED:
+            await asyncio.to_thread(probe)
+
+
+async def start():
+    """앱 lifespan 시작 시 호출: 백그라운드 probe 작업을 시작합니다."""
+    global _probe_task
+    if _probe_task is None:
+        _probe_task = asyncio.create_task(_probe_loop())
+
+
+async def stop():
+    """앱 lifespan 종료 시 호출: probe 작업을 멈추고 클라이언트를 닫습니다."""
+    global _probe_task, _client
+    if _probe_task is not None:
+        _probe_task.cancel()
+        try:
+            await _probe_task
+        except asyncio.CancelledError:
+            pass
+        _probe_task = None
+    if _client is not None:
+        _client.close()
+        _client = None
+
+
+def health() -> dict:
+    return {"url": ES_URL, **breaker.snapshot()}
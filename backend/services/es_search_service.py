@@ -0,0 +1,104 @@
+from typing import List, Optional
+
+from services.count_cache_service import COUNT_ESTIMATE_THRESHOLD
+from services.pagination_service import decode_cursor, encode_cursor, InvalidCursorError, SearchPage
+from services.search_index_service import CONTENTS_ALIAS
+from services.tag_index_service import TagFilter
+
+
+# ES 는 from + size 가 이 값을 넘는 요청을 거부합니다. (index.max_result_window 기본값)
+MAX_RESULT_WINDOW = 10000
+# ES 경로 커서의 종류 표시 (DB 경로의 created_at 커서와 섞이지 않도록 구분)
+ES_CURSOR_KIND = "es"
+
+
+def build_search_query(
+    search_terms: List[str],
+    location: Optional[str] = None,
+    tag_filter: Optional[TagFilter] = None,
+    style: Optional[str] = None,
+) -> dict:
+    """
+    관련도 점수는 should 절(제목 > 태그 > 리뷰 > 설명 순 가중치)로 계산하고,
+    지역/태그/스타일 조건은 점수에 영향이 없는 filter 절로 처리합니다.
+    (태그: any_of 는 terms 하나, all_of 는 태그마다 term, none_of 는 must_not)
+    """
+    query_string = " ".join(search_terms)
+    filters = [{"term": {"status": "Active"}}]
+    must_not = []
+    if location:
+        filters.append({"term": {"location": location}})
+    if tag_filter and tag_filter.any_of:
+        filters.append({"terms": {"all_tags": tag_filter.any_of}})
+    if tag_filter:
+        filters.extend({"term": {"all_tags": name}} for name in tag_filter.all_of)
+        if tag_filter.none_of:
+            must_not.append({"terms": {"all_tags": tag_filter.none_of}})
+    if style:
+        filters.append({"term": {"style": style}})
+
+    return {
+        "bool": {
+            "should": [
+                {"match": {"title": {"query": query_string, "boost": 3}}},
+                {"terms": {"all_tags": search_terms, "boost": 2}},
+                {"match": {"all_reviews_text": {"query": query_string, "boost": 1.5}}},
+                {"match": {"description": {"query": query_string, "boost": 1}}},
+            ],
+            "minimum_should_match": 1,
+            "filter": filters,
+            "must_not": must_not,
+        }
+    }
+
+
+def search_content_page(
+    es,
+    search_terms: List[str],
+    per_page: int,
+    page: int = 1,
+    cursor: Optional[str] = None,
+    location: Optional[str] = None,
+    tag_filter: Optional[TagFilter] = None,
+    style: Optional[str] = None,
+    request_timeout: Optional[float] = None,
+) -> SearchPage:
+    """
+    ES 에서 점수순 한 페이지의 콘텐츠 ID 를 가져옵니다.
+    - cursor 가 있으면 search_after (점수, id) 로 이어서 조회 (깊이와 무관하게 일정 비용)
+    - 없으면 page 기준 from/size 로 조회 (MAX_RESULT_WINDOW 이내)
+    """
+    body = {
+        "query": build_search_query(search_terms, location, tag_filter, style),
+        "sort": [{"_score": "desc"}, {"id": "desc"}],
+        "size": per_page + 1, # 다음 페이지 존재 여부 확인용 1개 추가
+        "_source": False,
+        "track_total_hits": COUNT_ESTIMATE_THRESHOLD if COUNT_ESTIMATE_THRESHOLD > 0 else True,
+    }
+    if cursor:
+        search_after = decode_cursor(cursor, ES_CURSOR_KIND)
+        if len(search_after) != 2:
+            raise InvalidCursorError("malformed search cursor")
+        body["search_after"] = search_after
+    else:
+        offset = (page - 1) * per_page
+        if offset + per_page + 1 > MAX_RESULT_WINDOW:
+            raise InvalidCursorError("page is too deep for relevance search; use cursor")
+        body["from"] = offset
+
+    client = es.options(request_timeout=request_timeout) if request_timeout else es
+    response = client.search(index=CONTENTS_ALIAS, body=body)
+    hits = response["hits"]["hits"]
+
+    next_cursor = None
+    if len(hits) > per_page:
+        next_cursor = encode_cursor(ES_CURSOR_KIND, hits[per_page - 1]["sort"])
+        hits = hits[:per_page]
+
+    total = response["hits"]["total"]
+    return SearchPage(
+        ids=[int(hit["_id"]) for hit in hits],
+        total_count=total["value"],
+        is_estimated_count=total.get("relation") == "gte",
+        next_cursor=next_cursor,
+    )
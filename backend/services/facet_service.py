@@ -0,0 +1,118 @@
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from models import Content, GuideProfile, AiCharacter, ContentTag, Tag
+from services.es_search_service import build_search_query
+from services.search_index_service import CONTENTS_ALIAS
+from services.tag_index_service import TagFilter, content_id_condition
+from services import text_index_service
+
+
+# 패싯 이름 -> ES 문서 필드
+FACET_FIELDS = {"location": "location", "tag": "all_tags", "style": "style"}
+
+
+def _filter_query(search_terms, location, tag_filter, style) -> dict:
+    """검색어가 있으면 목록 검색과 같은 쿼리를, 없으면 필터만 있는 쿼리를 만듭니다."""
+    query = build_search_query(search_terms or [], location, tag_filter, style)
+    if not search_terms:
+        query["bool"].pop("should")
+        query["bool"].pop("minimum_should_match")
+    return query
+
+
+def facet_counts_es(
+    es,
+    search_terms: Optional[List[str]],
+    location: Optional[str],
+    tag_filter: TagFilter,
+    style: Optional[str],
+    size: int,
+    request_timeout: Optional[float] = None,
+) -> Tuple[int, Dict[str, Counter]]:
+    """ES terms 집계 한 번으로 지역/태그/스타일별 개수를 구합니다. (문서는 가져오지 않음)"""
+    body = {
+        "query": _filter_query(search_terms, location, tag_filter, style),
+        "size": 0,
+        "track_total_hits": True,
+        "aggs": {
+            name: {"terms": {"field": field, "size": size}}
+            for name, field in FACET_FIELDS.items()
+        },
+    }
+    client = es.options(request_timeout=request_timeout) if request_timeout else es
+    response = client.search(index=CONTENTS_ALIAS, body=body)
+    counts = {
+        name: Counter({b["key"]: b["doc_count"] for b in response["aggregations"][name]["buckets"]})
+        for name in FACET_FIELDS
+    }
+    return response["hits"]["total"]["value"], counts
+
+
+def facet_counts_memory(
+    search_terms: Optional[List[str]],
+    location: Optional[str],
+    tag_filter: TagFilter,
+    style: Optional[str],
+) -> Optional[Tuple[int, Dict[str, Counter]]]:
+    """메모리 텍스트 인덱스의 후보 집합을 한 번 훑어 개수를 셉니다. 인덱스가 준비되지 않았으면 None."""
+    index = text_index_service.text_index.index
+    if index is None:
+        return None
+    return index.facet_counts(search_terms, location, tag_filter, style)
+
+
+def facet_counts_db(
+    db: Session,
+    search_terms: Optional[List[str]],
+    location: Optional[str],
+    tag_filter: TagFilter,
+    style: Optional[str],
+) -> Tuple[int, Dict[str, Counter]]:
+    """
+    (최후 수단) DB GROUP BY 로 개수를 셉니다.
+    후보 콘텐츠 ID 서브쿼리를 한 번 만들고 패싯마다 GROUP BY 합니다. (쿼리 4회)
+    """
+    candidates = db.query(Content.id)\
+                   .outerjoin(GuideProfile, Content.guide_id == GuideProfile.users_id)\
+                   .outerjoin(AiCharacter, GuideProfile.ai_character_id_as_guide == AiCharacter.id)\
+                   .filter(Content.status == "Active")
+    for term in search_terms or []:
+        pattern = f"%{term}%"
+        candidates = candidates.filter(Content.title.ilike(pattern) | Content.description.ilike(pattern))
+    if location:
+        candidates = candidates.filter(Content.location == location)
+    if style:
+        candidates = candidates.filter(AiCharacter.name == style)
+    tag_condition = content_id_condition(tag_filter)
+    if tag_condition is not None:
+        candidates = candidates.filter(tag_condition)
+    candidate_ids = candidates.subquery()
+
+    total = db.query(func.count()).select_from(candidate_ids).scalar() or 0
+    location_rows = db.query(Content.location, func.count(Content.id))\
+                      .filter(Content.id.in_(candidate_ids.select()), Content.location.isnot(None))\
+                      .group_by(Content.location).all()
+    tag_rows = db.query(Tag.name, func.count(ContentTag.contents_id))\
+                 .join(ContentTag, Tag.id == ContentTag.tag_id)\
+                 .filter(ContentTag.contents_id.in_(candidate_ids.select()))\
+                 .group_by(Tag.name).all()
+    style_rows = db.query(AiCharacter.name, func.count(Content.id))\
+                   .join(GuideProfile, GuideProfile.ai_character_id_as_guide == AiCharacter.id)\
+                   .join(Content, Content.guide_id == GuideProfile.users_id)\
+                   .filter(Content.id.in_(candidate_ids.select()))\
+                   .group_by(AiCharacter.name).all()
+    return total, {
+        "location": Counter(dict(location_rows)),
+        "tag": Counter(dict(tag_rows)),
+        "style": Counter(dict(style_rows)),
+    }
+
+
+def top_values(counter: Counter, size: int) -> List[dict]:
+    """개수 내림차순(동점은 값 오름차순) 상위 size 개"""
+    ranked = sorted(counter.items(), key=lambda item: (-item[1], item[0]))
+    return [{"value": value, "count": count} for value, count in ranked[:size]]
@@ -0,0 +1,105 @@
+import os
+import re
+from typing import List, Optional
+
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Session
+
+from models import Content, GuideProfile, AiCharacter
+from services.count_cache_service import count_query, filter_signature, get_cached_count, set_cached_count
+from services.pagination_service import SearchPage, decode_cursor, encode_cursor, keyset_seek, InvalidCursorError
+from services.tag_index_service import TagFilter, content_id_condition
+
+
+# 검색 백엔드 선택: 'elasticsearch' (기본) 또는 'fulltext' (ES 없는 배포용 MySQL FULLTEXT ngram)
+# 어느 쪽이든 실패하면 메모리 바이그램 인덱스 -> ILIKE 순으로 전환합니다.
+SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "elasticsearch").lower()
+# FULLTEXT 경로 커서의 종류 표시
+FULLTEXT_CURSOR_KIND = "ft"
+
+# BOOLEAN MODE 연산자로 해석되는 문자는 검색어에서 제거
+_BOOLEAN_OPERATORS = re.compile(r'[+\-<>()~*"@]')
+
+
+def to_boolean_query(search_terms: List[str]) -> str:
+    """
+    각 검색어를 '+"검색어"' 형태로 묶어 모든 검색어를 포함하도록(AND) 만듭니다.
+    ngram 파서에서 구(phrase) 검색은 연속된 바이그램 일치로 처리되어 ILIKE '%검색어%' 와 유사하게 동작합니다.
+    """
+    phrases = []
+    for term in search_terms:
+        cleaned = _BOOLEAN_OPERATORS.sub(" ", term).strip()
+        if cleaned:
+            phrases.append(f'+"{cleaned}"')
+    return " ".join(phrases)
+
+
+def search_page(
+    db: Session,
+    search_terms: List[str],
+    per_page: int,
+    page: int = 1,
+    cursor: Optional[str] = None,
+    location: Optional[str] = None,
+    tag_filter: Optional[TagFilter] = None,
+    style: Optional[str] = None,
+) -> Optional[SearchPage]:
+    """
+    MATCH ... AGAINST 로 관련도순 한 페이지의 콘텐츠 ID 를 조회합니다.
+    검색어가 모두 연산자 문자뿐이라 질의를 만들 수 없으면 None.
+    * 커서는 마지막 행의 (관련도 점수, id) 입니다. 일치하는 행은 매번 모두 점수를 매기지만,
+      정렬은 OFFSET 만큼의 앞쪽 행 없이 한 페이지 크기(LIMIT)만 유지하면 되어 깊은 페이지도 비용이 같습니다.
+    * 전체 개수는 ILIKE 경로와 같은 count 캐시를 씁니다. (키에 'ft' 를 붙여 경로별로 구분)
+    * ngram_token_size=2 라 한 글자 검색어는 일치하는 토큰이 없어 결과가 0건입니다. (migrations/001 참고)
+    """
+    boolean_query = to_boolean_query(search_terms)
+    if not boolean_query:
+        return None
+
+    relevance = match(Content.title, Content.description, against=boolean_query).in_boolean_mode()
+    query = db.query(Content.id, relevance.label("score")).filter(relevance, Content.status == "Active")
+
+    if location:
+        query = query.filter(Content.location == location)
+    if style:
+        query = query.join(GuideProfile, Content.guide_id == GuideProfile.users_id)\
+                     .join(AiCharacter, GuideProfile.ai_character_id_as_guide == AiCharacter.id)\
+                     .filter(AiCharacter.name == style)
+    tag_condition = content_id_condition(tag_filter) if tag_filter else None
+    if tag_condition is not None:
+        # JOIN 대신 ID 조건으로 처리하여 행이 늘어나지 않게 함 (DISTINCT 불필요)
+        query = query.filter(tag_condition)
+
+    count_signature = (FULLTEXT_CURSOR_KIND, filter_signature(
+        search_terms, location, (tag_filter or TagFilter()).signature(), style
+    ))
+    cached = get_cached_count(count_signature)
+    if cached is None:
+        total_count, is_estimated_count = count_query(query.with_entities(Content.id))
+        set_cached_count(count_signature, total_count, is_estimated_count)
+    else:
+        total_count, is_estimated_count = cached
+
+    page_query = query.order_by(relevance.desc(), Content.id.desc())
+    if cursor:
+        values = decode_cursor(cursor, FULLTEXT_CURSOR_KIND)
+        try:
+            last_score, last_id = float(values[0]), int(values[1])
+        except (IndexError, TypeError, ValueError) as e:
+            raise InvalidCursorError(f"malformed cursor values: {e}")
+        page_query = page_query.filter(keyset_seek([relevance, Content.id], [last_score, last_id]))
+    else:
+        page_query = page_query.offset((page - 1) * per_page)
+    rows = page_query.limit(per_page + 1).all()
+
+    next_cursor = None
+    if len(rows) > per_page:
+        rows = rows[:per_page]
+        next_cursor = encode_cursor(FULLTEXT_CURSOR_KIND, [float(rows[-1].score), rows[-1].id])
+
+    return SearchPage(
+        ids=[row.id for row in rows],
+        total_count=total_count,
+        is_estimated_count=is_estimated_count,
+        next_cursor=next_cursor,
+    )
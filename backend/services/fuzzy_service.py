@@ -0,0 +1,290 @@
+import bisect
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from models import Content
+from services.memory_index_service import MemoryIndexHolder
+from services.search_index_service import content_rows_query, load_content_tags, load_reviews_text
+
+
+# 오타 교정 사용 여부 (0 이면 검색어를 그대로 사용)
+FUZZY_REWRITE_ENABLED = os.getenv("FUZZY_REWRITE_ENABLED", "1") == "1"
+# 자모 단위 최대 편집 거리 ("헤운대" -> "해운대" 는 ㅔ/ㅐ 치환 1회)
+FUZZY_MAX_DISTANCE = 2
+# 이 길이(자모 수) 이하이거나 2음절 이하인 짧은 단어는 편집 거리 1 까지만 허용
+# (2음절 단어는 거리 2 면 "한옥" -> "한국" 처럼 전혀 다른 단어가 됨)
+FUZZY_SHORT_WORD_LENGTH = 4
+FUZZY_SHORT_WORD_SYLLABLES = 2
+# 삭제 변형은 단어 앞부분(자모 기준)만으로 만듭니다 (SymSpell prefix length: 사전 크기를 제한)
+FUZZY_PREFIX_LENGTH = 9
+# 사전에 넣을 최소 음절(글자) 수
+FUZZY_MIN_WORD_LENGTH = 2
+
+_WORD_SPLIT = re.compile(r"[^\w]+")
+
+# 호환용 자모 (사용자가 입력 중인 'ㅎ' 같은 낱자와 같은 문자로 맞추기 위해 사용)
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+              "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+
+
+def to_jamo(text: str) -> str:
+    """한글 음절을 초성/중성/종성 자모로 풉니다. (예: '해운' -> 'ㅎㅐㅇㅜㄴ', 한글이 아닌 문자는 소문자로 유지)"""
+    parts = []
+    for char in text.lower():
+        code = ord(char)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            offset = code - _HANGUL_BASE
+            parts.append(_CHOSEONG[offset // 588])
+            parts.append(_JUNGSEONG[(offset % 588) // 28])
+            parts.append(_JONGSEONG[offset % 28])
+        else:
+            parts.append(char)
+    return "".join(parts)
+
+
+def split_words(text: Optional[str]) -> List[str]:
+    return [w for w in _WORD_SPLIT.split((text or "").lower()) if len(w) >= FUZZY_MIN_WORD_LENGTH]
+
+
+def _deletes(word: str, max_distance: int) -> Set[str]:
+    """word 에서 최대 max_distance 개의 문자를 지운 모든 변형 (word 자신 포함)"""
+    results = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        next_frontier = set()
+        for item in frontier:
+            if len(item) <= 1:
+                continue
+            for i in range(len(item)):
+                next_frontier.add(item[:i] + item[i + 1:])
+        results |= next_frontier
+        frontier = next_frontier
+    return results
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """인접 문자 교환을 포함한 편집 거리 (max_distance 를 넘으면 max_distance + 1 을 반환)"""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    # 공통 앞/뒷부분은 거리에 영향이 없으므로 잘라내고 계산
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
+    if not a or not b:
+        return len(a) + len(b) if len(a) + len(b) <= max_distance else max_distance + 1
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = current[0]
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous_previous is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+            row_min = min(row_min, current[j])
+        if row_min > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return previous[-1]
+
+
+class SymSpellDictionary:
+    """
+    자모 문자열에 대한 Symmetric Delete(SymSpell) 사전
+    - 사전 단어마다 '최대 N개 문자를 지운 변형'을 미리 색인해 두고
+    - 조회 시 검색어의 삭제 변형만 만들어 교집합을 찾으므로, 사전 크기와 무관하게 후보 수가 작습니다.
+    """
+
+    def __init__(self, max_distance: int = FUZZY_MAX_DISTANCE, prefix_length: int = FUZZY_PREFIX_LENGTH):
+        self._lock = threading.RLock()
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        # 자모 문자열 -> {원래 단어: 출현 횟수}
+        self.words: Dict[str, Dict[str, int]] = {}
+        # 삭제 변형 -> 해당 변형을 만드는 자모 문자열들
+        self.deletes: Dict[str, Set[str]] = {}
+        # 접두어 검사용 정렬 배열 (입력 중인 단어는 교정하지 않기 위함)
+        self._sorted: List[str] = []
+        # 콘텐츠별로 사전에 더한 단어 (부분 갱신 시 빼기 위해 보관)
+        self.words_of: Dict[int, Tuple[str, ...]] = {}
+
+    def __len__(self):
+        return len(self.words)
+
+    def _add_word(self, word: str, delta: int):
+        jamo = to_jamo(word)
+        originals = self.words.get(jamo)
+        if originals is None:
+            if delta <= 0:
+                return
+            originals = self.words[jamo] = {}
+            for variant in _deletes(jamo[:self.prefix_length], self.max_distance):
+                self.deletes.setdefault(variant, set()).add(jamo)
+            bisect.insort(self._sorted, jamo)
+        count = originals.get(word, 0) + delta
+        if count > 0:
+            originals[word] = count
+        else:
+            originals.pop(word, None)
+        if not originals:
+            # 삭제 변형 목록은 남겨 두고 조회 시 words 에 없는 항목을 무시합니다 (제거 비용 절약)
+            del self.words[jamo]
+            position = bisect.bisect_left(self._sorted, jamo)
+            if position < len(self._sorted) and self._sorted[position] == jamo:
+                del self._sorted[position]
+
+    def set_content(self, content_id: int, texts: Iterable[str]):
+        """콘텐츠의 검색 대상 텍스트(제목/설명/태그/지역/리뷰)에서 뽑은 단어를 (교체) 등록합니다."""
+        words = tuple(word for text in texts for word in split_words(text))
+        with self._lock:
+            self._remove(content_id)
+            for word in words:
+                self._add_word(word, +1)
+            self.words_of[content_id] = words
+
+    def remove(self, content_id: int):
+        with self._lock:
+            self._remove(content_id)
+
+    def _remove(self, content_id: int):
+        for word in self.words_of.pop(content_id, ()):
+            self._add_word(word, -1)
+
+    def has_prefix(self, jamo: str) -> bool:
+        """사전에 jamo 로 시작하는 단어가 있는지 (정확히 일치하는 경우 포함)"""
+        position = bisect.bisect_left(self._sorted, jamo)
+        return position < len(self._sorted) and self._sorted[position].startswith(jamo)
+
+    def lookup(self, word: str) -> Optional[Tuple[str, int]]:
+        """
+        가장 가까운 사전 단어와 편집 거리를 반환합니다. (거리 최소 -> 출현 횟수 최대 순)
+        사전에 같은 단어가 있거나 그 단어로 시작하는 단어가 있으면 (입력 중으로 보고) None.
+        """
+        jamo = to_jamo(word)
+        is_short = len(jamo) <= FUZZY_SHORT_WORD_LENGTH or len(word) <= FUZZY_SHORT_WORD_SYLLABLES
+        max_distance = 1 if is_short else self.max_distance
+        with self._lock:
+            if self.has_prefix(jamo):
+                return None
+
+            best: Optional[Tuple[int, int, str]] = None # (거리, -출현 횟수, 원래 단어)
+            best_distance = max_distance
+            seen = set()
+            # 검색어에서 지운 글자 수(level)가 적은 변형부터 확인합니다.
+            # 거리 d 인 단어는 level <= d 에서 반드시 만나므로, level 이 현재 최선의 거리보다 커지면 중단
+            frontier = {jamo[:self.prefix_length]}
+            for level in range(max_distance + 1):
+                if level > best_distance:
+                    break
+                for variant in frontier:
+                    for candidate in self.deletes.get(variant, ()):
+                        if candidate in seen:
+                            continue
+                        seen.add(candidate)
+                        originals = self.words.get(candidate)
+                        if not originals or abs(len(candidate) - len(jamo)) > best_distance:
+                            continue
+                        distance = edit_distance(jamo, candidate, best_distance)
+                        if distance > best_distance:
+                            continue
+                        original, count = max(originals.items(), key=lambda item: item[1])
+                        key = (distance, -count, original)
+                        if best is None or key < best:
+                            best = key
+                            best_distance = distance
+                frontier = {
+                    item[:i] + item[i + 1:]
+                    for item in frontier if len(item) > 1
+                    for i in range(len(item))
+                }
+        if best is None:
+            return None
+        return best[2], best[0]
+
+
+# ==================================================
+# 빌드 / 부분 갱신 (change feed)
+# ==================================================
+
+# 한 번에 태그/리뷰를 조회할 콘텐츠 수 (전체 빌드)
+_BUILD_BATCH_SIZE = 1000
+
+
+def _set_rows(db: Session, dictionary: SymSpellDictionary, rows: list):
+    """
+    검색 백엔드(ES / FULLTEXT / 메모리 인덱스)가 매칭하는 필드와 같은 텍스트로 사전을 채웁니다.
+    사전에 없는 단어만 교정 후보가 되므로, 설명이나 리뷰에만 나오는 단어도 올바른 단어로 인식됩니다.
+    """
+    if not rows:
+        return
+    ids = [row.id for row in rows]
+    tags = load_content_tags(db, ids)
+    reviews_text = load_reviews_text(db, ids)
+    for row in rows:
+        texts = [row.title or "", row.description or "", row.location or "", reviews_text.get(row.id, "")]
+        dictionary.set_content(row.id, texts + tags.get(row.id, []))
+
+
+def build_fuzzy_dictionary(db: Session) -> SymSpellDictionary:
+    """전체 Active 콘텐츠의 제목/설명/태그/지역/리뷰 단어로 새 사전을 만듭니다."""
+    dictionary = SymSpellDictionary()
+    # 스트리밍 중인 연결에서는 태그/리뷰를 조회할 수 없으므로 ID 기준으로 끊어 읽음
+    last_id = 0
+    while True:
+        rows = content_rows_query(db).filter(Content.id > last_id)\
+                                     .order_by(Content.id).limit(_BUILD_BATCH_SIZE).all()
+        if not rows:
+            return dictionary
+        _set_rows(db, dictionary, rows)
+        last_id = rows[-1].id
+
+
+def refresh_fuzzy_dictionary(db: Session, dictionary: SymSpellDictionary, content_ids: Set[int]):
+    """변경된 콘텐츠의 단어만 다시 등록합니다. (비활성/삭제된 콘텐츠는 제거)"""
+    rows = content_rows_query(db).filter(Content.id.in_(list(content_ids))).all()
+    _set_rows(db, dictionary, rows)
+    for missing_id in content_ids - {row.id for row in rows}:
+        dictionary.remove(missing_id)
+
+
+fuzzy_dictionary = MemoryIndexHolder("fuzzy_symspell", build_fuzzy_dictionary, refresh_fuzzy_dictionary)
+
+
+def rewrite_terms(search_terms: List[str]) -> Optional[List[str]]:
+    """
+    검색어의 각 단어를 사전에서 가장 가까운 단어로 바꿉니다.
+    바뀐 단어가 없거나 사전이 준비되지 않았으면 None (원래 검색어를 그대로 사용).
+    원래 검색어를 대신하지 않습니다 - 호출하는 쪽은 원래 검색어의 결과가 0건일 때만 교정된 검색어로 다시 검색합니다.
+    """
+    dictionary = fuzzy_dictionary.index
+    if not FUZZY_REWRITE_ENABLED or dictionary is None or not search_terms:
+        return None
+
+    changed = False
+    rewritten = []
+    for term in search_terms:
+        words = []
+        for word in term.split():
+            match = dictionary.lookup(word) if len(word) >= FUZZY_MIN_WORD_LENGTH else None
+            if match is not None:
+                words.append(match[0])
+                changed = True
+            else:
+                words.append(word)
+        rewritten.append(" ".join(words))
+    return rewritten if changed else None
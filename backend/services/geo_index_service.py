@@ -0,0 +1,246 @@
+import math
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from models import Content, ContentStats
+from services.content_stats_service import main_image_column
+from services.memory_index_service import MemoryIndexHolder
+
+
+# 예약 수(대표 마커 선정 기준)는 change feed 로 전달되지 않으므로 이 주기(초)마다 전체 재빌드
+GEO_REBUILD_SECONDS = float(os.getenv("GEO_REBUILD_SECONDS", "600"))
+# 이 줌 이상에서는 클러스터 대신 개별 마커를 반환 (웹 메르카토르 줌 기준, 카카오맵 level ≈ 20 - zoom)
+GEO_MARKER_ZOOM = 15
+# 격자를 미리 만들어 두는 가장 세밀한 줌 (마커 조회도 이 격자로 후보를 찾음)
+GEO_MAX_GRID_ZOOM = GEO_MARKER_ZOOM - 1
+# 클러스터 한 칸의 크기: 256px 타일을 4x4 로 나눈 크기 (화면상 약 64px)
+GEO_CELLS_PER_TILE = 4
+# 마커 모드에서 한 번에 반환하는 최대 마커 수 (인기순)
+GEO_MAX_MARKERS = 500
+
+
+def cell_size(zoom: int) -> float:
+    """줌 레벨의 격자 한 칸 크기(도). 줌이 1 오를 때마다 절반이 됩니다."""
+    return 360.0 / (2 ** zoom) / GEO_CELLS_PER_TILE
+
+
+def _cell_of(lat: float, lng: float, size: float) -> Tuple[int, int]:
+    return math.floor(lat / size), math.floor(lng / size)
+
+
+@dataclass
+class GeoPoint:
+    content_id: int
+    latitude: float
+    longitude: float
+    title: str
+    location: Optional[str]
+    price: Optional[int]
+    rating: Optional[float]
+    main_image_url: Optional[str]
+    booking_count: int
+
+    @property
+    def rank(self) -> tuple:
+        """대표 마커 선정 기준 (예약 수 -> 평점 -> 최신 ID 순으로 큼)"""
+        return (self.booking_count, self.rating or 0.0, self.content_id)
+
+
+class GridCell:
+    """격자 한 칸의 집계 (개수, 좌표 합 -> 중심점, 대표 항목)"""
+
+    __slots__ = ("members", "sum_lat", "sum_lng", "top")
+
+    def __init__(self):
+        self.members: Set[int] = set()
+        self.sum_lat = 0.0
+        self.sum_lng = 0.0
+        self.top: Optional[int] = None # None 이면 다음 조회 때 다시 계산
+
+
+@dataclass
+class Cluster:
+    latitude: float
+    longitude: float
+    count: int
+    top: GeoPoint
+
+
+@dataclass
+class GeoQueryResult:
+    zoom: int
+    total_count: int
+    clusters: List[Cluster]
+    markers: List[GeoPoint]
+    truncated: bool
+
+
+class GeoGridIndex:
+    """
+    줌 레벨별 위/경도 격자 (0 ~ GEO_MAX_GRID_ZOOM)
+    - 칸마다 개수/좌표 합/대표 항목을 유지하므로, 클러스터 조회 비용은 화면 안의 칸 수에만 비례합니다.
+    - 콘텐츠 추가/제거 시 각 줌에서 해당 칸 하나씩만 갱신합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.points: Dict[int, GeoPoint] = {}
+        self.sizes = [cell_size(zoom) for zoom in range(GEO_MAX_GRID_ZOOM + 1)]
+        self.grids: List[Dict[Tuple[int, int], GridCell]] = [{} for _ in self.sizes]
+
+    def __len__(self):
+        return len(self.points)
+
+    def set_content(self, point: GeoPoint):
+        with self._lock:
+            self._remove(point.content_id)
+            self.points[point.content_id] = point
+            for size, grid in zip(self.sizes, self.grids):
+                cell = grid.get(_cell_of(point.latitude, point.longitude, size))
+                if cell is None:
+                    cell = grid[_cell_of(point.latitude, point.longitude, size)] = GridCell()
+                    cell.top = point.content_id
+                elif cell.top is not None and point.rank > self.points[cell.top].rank:
+                    cell.top = point.content_id
+                cell.members.add(point.content_id)
+                cell.sum_lat += point.latitude
+                cell.sum_lng += point.longitude
+
+    def remove(self, content_id: int):
+        with self._lock:
+            self._remove(content_id)
+
+    def _remove(self, content_id: int):
+        point = self.points.pop(content_id, None)
+        if point is None:
+            return
+        for size, grid in zip(self.sizes, self.grids):
+            key = _cell_of(point.latitude, point.longitude, size)
+            cell = grid[key]
+            cell.members.discard(content_id)
+            if not cell.members:
+                del grid[key]
+                continue
+            cell.sum_lat -= point.latitude
+            cell.sum_lng -= point.longitude
+            if cell.top == content_id:
+                cell.top = None
+
+    def _top(self, cell: GridCell) -> GeoPoint:
+        if cell.top is None:
+            cell.top = max(cell.members, key=lambda cid: self.points[cid].rank)
+        return self.points[cell.top]
+
+    def _cells_in_bbox(self, zoom: int, min_lat: float, min_lng: float, max_lat: float, max_lng: float):
+        """bbox 와 겹치는 칸들. 범위가 넓으면 (칸 수 > 실제 칸 수) 존재하는 칸만 훑습니다."""
+        size, grid = self.sizes[zoom], self.grids[zoom]
+        min_row, min_col = _cell_of(min_lat, min_lng, size)
+        max_row, max_col = _cell_of(max_lat, max_lng, size)
+        if (max_row - min_row + 1) * (max_col - min_col + 1) <= len(grid):
+            for row in range(min_row, max_row + 1):
+                for col in range(min_col, max_col + 1):
+                    cell = grid.get((row, col))
+                    if cell is not None:
+                        yield cell
+        else:
+            for (row, col), cell in grid.items():
+                if min_row <= row <= max_row and min_col <= col <= max_col:
+                    yield cell
+
+    def query(self, min_lat: float, min_lng: float, max_lat: float, max_lng: float, zoom: int,
+              max_markers: int = GEO_MAX_MARKERS) -> GeoQueryResult:
+        """
+        bbox 안의 콘텐츠를 zoom 에 맞게 반환합니다.
+        - zoom < GEO_MARKER_ZOOM: 칸별 클러스터 (콘텐츠가 1개인 칸은 마커)
+        - zoom >= GEO_MARKER_ZOOM: 개별 마커 (인기순 최대 max_markers 개)
+        클러스터는 칸 단위이므로 bbox 경계 근처 칸의 개수에는 화면 밖 콘텐츠가 포함될 수 있습니다.
+        """
+        with self._lock:
+            if zoom < GEO_MARKER_ZOOM:
+                clusters, markers, total = [], [], 0
+                for cell in self._cells_in_bbox(zoom, min_lat, min_lng, max_lat, max_lng):
+                    count = len(cell.members)
+                    total += count
+                    if count == 1:
+                        markers.append(self._top(cell))
+                    else:
+                        clusters.append(Cluster(cell.sum_lat / count, cell.sum_lng / count, count, self._top(cell)))
+                clusters.sort(key=lambda cluster: -cluster.count)
+                return GeoQueryResult(zoom, total, clusters, markers, truncated=False)
+
+            inside = [
+                self.points[cid]
+                for cell in self._cells_in_bbox(GEO_MAX_GRID_ZOOM, min_lat, min_lng, max_lat, max_lng)
+                for cid in cell.members
+                if min_lat <= self.points[cid].latitude <= max_lat and min_lng <= self.points[cid].longitude <= max_lng
+            ]
+            inside.sort(key=lambda point: point.rank, reverse=True)
+            return GeoQueryResult(zoom, len(inside), [], inside[:max_markers], truncated=len(inside) > max_markers)
+
+
+# ==================================================
+# 빌드 / 부분 갱신 (change feed)
+# ==================================================
+
+def geo_point_query(db: Session):
+    """좌표가 있는 Active 콘텐츠 + 지도에 표시할 통계 (nearby_service 도 사용)"""
+    return db.query(
+        Content.id,
+        Content.latitude,
+        Content.longitude,
+        Content.title,
+        Content.location,
+        Content.price,
+        ContentStats.avg_rating,
+        ContentStats.booking_count,
+        main_image_column().label("main_image_url"),
+    ).outerjoin(ContentStats, ContentStats.content_id == Content.id)\
+     .filter(Content.status == "Active", Content.latitude.isnot(None), Content.longitude.isnot(None))
+
+
+def to_geo_point(row) -> GeoPoint:
+    return GeoPoint(
+        content_id=row.id,
+        latitude=float(row.latitude),
+        longitude=float(row.longitude),
+        title=row.title,
+        location=row.location,
+        price=row.price,
+        rating=float(row.avg_rating) if row.avg_rating is not None else None,
+        main_image_url=row.main_image_url,
+        booking_count=row.booking_count or 0,
+    )
+
+
+def build_geo_index(db: Session) -> GeoGridIndex:
+    """좌표가 있는 전체 Active 콘텐츠로 새 격자 인덱스를 만듭니다."""
+    index = GeoGridIndex()
+    for row in geo_point_query(db).yield_per(1000):
+        index.set_content(to_geo_point(row))
+    return index
+
+
+def refresh_geo_index(db: Session, index: GeoGridIndex, content_ids: Set[int]):
+    """변경된 콘텐츠만 다시 읽어 갱신합니다. (비활성/삭제/좌표 없음은 제거)"""
+    rows = geo_point_query(db).filter(Content.id.in_(list(content_ids))).all()
+    for row in rows:
+        index.set_content(to_geo_point(row))
+    for missing_id in content_ids - {row.id for row in rows}:
+        index.remove(missing_id)
+
+
+geo_index = MemoryIndexHolder(
+    "geo_grid", build_geo_index, refresh_geo_index, rebuild_interval=GEO_REBUILD_SECONDS
+)
+
+
+def query_map(min_lat: float, min_lng: float, max_lat: float, max_lng: float, zoom: int) -> Optional[GeoQueryResult]:
+    """지도 화면(bbox + zoom) 조회. 인덱스가 아직 준비되지 않았으면 None."""
+    index = geo_index.index
+    if index is None:
+        return None
+    return index.query(min_lat, min_lng, max_lat, max_lng, zoom)
@@ -0,0 +1,367 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from models import (
+    AiCharacter, Content, ContentStats, GuideProfile, GuideReview, GuideReviewTag, GuideSummary,
+    GuideSummaryCharacter, GuideSummaryTag, Tag, User,
+)
+from services.content_stats_service import main_image_column
+
+
+# 프로필에 보여줄 상위 태그 수
+TOP_TAG_COUNT = 8
+
+_SUMMARY_FIELDS = ("review_count", "rating_sum", "content_count")
+
+
+# ==================================================
+# 1. 원본 테이블 집계 (재계산 / 요약 행이 없을 때의 대체 경로)
+# ==================================================
+
+def _empty_summary(guide_id: int) -> dict:
+    return {
+        "summary": {"guide_id": guide_id, "review_count": 0, "rating_sum": 0, "avg_rating": None, "content_count": 0},
+        "characters": {}, # ai_character_id -> 리뷰 수
+        "tags": {}, # tag_id -> 횟수
+    }
+
+
+def aggregate_guide_summaries(db: Session, guide_ids: Optional[List[int]] = None) -> Dict[int, dict]:
+    """
+    가이드 리뷰/콘텐츠/태그 테이블에서 가이드별 요약을 GROUP BY 로 한 번에 집계합니다.
+    guide_ids 가 None 이면 전체 가이드 (reconcile 용)
+    """
+    def scoped(query, column):
+        return query if guide_ids is None else query.filter(column.in_(guide_ids))
+
+    results = {guide_id: _empty_summary(guide_id)
+               for (guide_id,) in scoped(db.query(GuideProfile.users_id), GuideProfile.users_id)}
+
+    review_query = db.query(GuideReview.guide_id, func.count(GuideReview.id), func.sum(GuideReview.rating))
+    for guide_id, count, rating_sum in scoped(review_query, GuideReview.guide_id).group_by(GuideReview.guide_id):
+        if guide_id in results:
+            summary = results[guide_id]["summary"]
+            summary["review_count"], summary["rating_sum"] = count, int(rating_sum or 0)
+            summary["avg_rating"] = summary["rating_sum"] / count if count else None
+
+    content_query = db.query(Content.guide_id, func.count(Content.id)).filter(Content.status == "Active")
+    for guide_id, count in scoped(content_query, Content.guide_id).group_by(Content.guide_id):
+        if guide_id in results:
+            results[guide_id]["summary"]["content_count"] = count
+
+    character_query = db.query(GuideReview.guide_id, GuideReview.ai_character_id, func.count(GuideReview.id))\
+                        .filter(GuideReview.ai_character_id.isnot(None))
+    for guide_id, character_id, count in scoped(character_query, GuideReview.guide_id)\
+            .group_by(GuideReview.guide_id, GuideReview.ai_character_id):
+        if guide_id in results:
+            results[guide_id]["characters"][character_id] = count
+
+    tag_query = db.query(GuideReview.guide_id, GuideReviewTag.tag_id, func.count(GuideReviewTag.id))\
+                  .join(GuideReview, GuideReview.id == GuideReviewTag.guide_review_id)
+    for guide_id, tag_id, count in scoped(tag_query, GuideReview.guide_id)\
+            .group_by(GuideReview.guide_id, GuideReviewTag.tag_id):
+        if guide_id in results:
+            results[guide_id]["tags"][tag_id] = count
+    return results
+
+
+def _keyed(db: Session, model, keys: dict):
+    query = db.query(model)
+    for name, value in keys.items():
+        query = query.filter(getattr(model, name) == value)
+    return query
+
+
+def _insert_row(db: Session, model, values: dict) -> bool:
+    """
+    행을 새로 넣습니다. 동시에 다른 트랜잭션이 같은 키의 행을 먼저 넣었으면 (PK 충돌)
+    SAVEPOINT 만 되돌리고 False - 호출한 쪽의 리뷰/태그 쓰기는 그대로 유지됩니다.
+    """
+    try:
+        with db.begin_nested():
+            db.add(model(**values))
+        return True
+    except IntegrityError:
+        return False
+
+
+def _upsert(db: Session, model, keys: dict, values: dict):
+    """keys 행을 values 로 덮어씁니다. (UPDATE -> 없으면 INSERT -> 동시에 먼저 생성됐으면 다시 UPDATE)"""
+    query = _keyed(db, model, keys)
+    if not query.update(values, synchronize_session=False) and not _insert_row(db, model, {**keys, **values}):
+        query.update(values, synchronize_session=False)
+
+
+def _store_details(db: Session, aggregate: dict):
+    """캐릭터/태그 행을 집계 결과로 맞춥니다. (집계에 없는 행은 삭제)"""
+    guide_id = aggregate["summary"]["guide_id"]
+    characters, tags = aggregate["characters"], aggregate["tags"]
+    db.query(GuideSummaryCharacter)\
+      .filter(GuideSummaryCharacter.guide_id == guide_id, GuideSummaryCharacter.ai_character_id.notin_(list(characters)))\
+      .delete(synchronize_session=False)
+    db.query(GuideSummaryTag)\
+      .filter(GuideSummaryTag.guide_id == guide_id, GuideSummaryTag.tag_id.notin_(list(tags)))\
+      .delete(synchronize_session=False)
+    for character_id, count in characters.items():
+        _upsert(db, GuideSummaryCharacter, {"guide_id": guide_id, "ai_character_id": character_id},
+                {"review_count": count})
+    for tag_id, count in tags.items():
+        _upsert(db, GuideSummaryTag, {"guide_id": guide_id, "tag_id": tag_id}, {"tag_count": count})
+
+
+def _store(db: Session, aggregate: dict, now: datetime):
+    """요약 행과 캐릭터/태그 행을 집계 결과로 교체합니다."""
+    summary = dict(aggregate["summary"])
+    guide_id = summary.pop("guide_id")
+    _upsert(db, GuideSummary, {"guide_id": guide_id}, dict(summary, updated_at=now))
+    _store_details(db, aggregate)
+
+
+def refresh_guide_summaries(db: Session, guide_ids: Iterable[int]):
+    """주어진 가이드의 요약을 원본에서 다시 계산해 저장합니다. (commit 하지 않음)"""
+    ids = sorted({gid for gid in guide_ids if gid is not None})
+    if not ids:
+        return
+    db.flush() # 같은 트랜잭션에서 방금 추가한 리뷰/태그도 집계에 포함
+    now = datetime.now()
+    for aggregate in aggregate_guide_summaries(db, ids).values():
+        _store(db, aggregate, now)
+
+
+# ==================================================
+# 2. 증분 갱신 (쓰기 측) - 호출자의 트랜잭션 안에서 실행, commit 하지 않음
+# ==================================================
+
+def record_guide_review(db: Session, guide_id: int, rating: int):
+    """
+    새 가이드 리뷰를 요약에 더합니다.
+    UPDATE col = col + n 형태라 동시에 리뷰가 작성되어도 값을 잃지 않습니다. (행 잠금)
+    """
+    query = db.query(GuideSummary).filter(GuideSummary.guide_id == guide_id)
+    values = {GuideSummary.review_count: GuideSummary.review_count + 1,
+              GuideSummary.rating_sum: GuideSummary.rating_sum + rating,
+              GuideSummary.updated_at: datetime.now()}
+    if not query.update(values, synchronize_session=False):
+        # 요약 행이 없으면 원본에서 집계해 만듦 (방금 flush 한 리뷰 포함)
+        db.flush()
+        aggregate = aggregate_guide_summaries(db, [guide_id]).get(guide_id)
+        if aggregate is None:
+            return
+        if _insert_row(db, GuideSummary, dict(aggregate["summary"], updated_at=datetime.now())):
+            _store_details(db, aggregate)
+            return
+        # 동시에 다른 리뷰가 먼저 행을 만들었으면 그 행에 이 리뷰만 더함
+        query.update(values, synchronize_session=False)
+    # 평균은 갱신된 합계/개수로 다시 계산 (SET 절의 평가 순서가 DB 마다 달라 별도 문장으로 실행)
+    db.query(GuideSummary).filter(GuideSummary.guide_id == guide_id)\
+      .update({GuideSummary.avg_rating: GuideSummary.rating_sum * 1.0 / GuideSummary.review_count},
+              synchronize_session=False)
+
+
+def _increment(db: Session, model, keys: dict, column, delta: int):
+    """
+    (가이드, 캐릭터/태그) 행의 횟수를 delta 만큼 바꾸고, 행이 없으면 추가합니다.
+    동시에 다른 트랜잭션이 같은 행을 먼저 추가했으면 그 행에 다시 더합니다.
+    """
+    query = _keyed(db, model, keys)
+    if query.update({column: column + delta}, synchronize_session=False) or delta <= 0:
+        return
+    if not _insert_row(db, model, {**keys, column.key: delta}):
+        query.update({column: column + delta}, synchronize_session=False)
+
+
+def record_guide_review_tagging(db: Session, guide_id: int, character_id: Optional[int], tag_ids: Iterable[int],
+                                previous_character_id: Optional[int] = None):
+    """
+    AI 캐릭터 분류 결과(리뷰의 캐릭터 + 새로 연결된 태그)를 요약에 더합니다.
+    다시 분류되어 캐릭터가 바뀐 리뷰면 이전 캐릭터의 수를 뺍니다.
+    """
+    if db.query(GuideSummary.guide_id).filter(GuideSummary.guide_id == guide_id).first() is None:
+        refresh_guide_summaries(db, [guide_id])
+        return
+    if character_id != previous_character_id:
+        if previous_character_id is not None:
+            _increment(db, GuideSummaryCharacter, {"guide_id": guide_id, "ai_character_id": previous_character_id},
+                       GuideSummaryCharacter.review_count, -1)
+        if character_id is not None:
+            _increment(db, GuideSummaryCharacter, {"guide_id": guide_id, "ai_character_id": character_id},
+                       GuideSummaryCharacter.review_count, 1)
+    for tag_id in set(tag_ids):
+        _increment(db, GuideSummaryTag, {"guide_id": guide_id, "tag_id": tag_id}, GuideSummaryTag.tag_count, 1)
+    db.query(GuideSummary).filter(GuideSummary.guide_id == guide_id)\
+      .update({GuideSummary.updated_at: datetime.now()}, synchronize_session=False)
+
+
+def on_content_change(db: Session, content_ids: Set[int]):
+    """change feed listener: 콘텐츠가 등록/비활성화된 가이드의 Active 콘텐츠 수를 다시 셉니다."""
+    try:
+        guide_ids = {gid for (gid,) in db.query(Content.guide_id).filter(Content.id.in_(content_ids)).distinct()}
+        if not guide_ids:
+            return
+        counts = dict(db.query(Content.guide_id, func.count(Content.id))
+                        .filter(Content.guide_id.in_(guide_ids), Content.status == "Active")
+                        .group_by(Content.guide_id).all())
+        for guide_id in guide_ids:
+            # 요약 행이 아직 없는 가이드는 건너뜀 (첫 리뷰/태깅이나 reconcile 때 원본에서 채워짐)
+            db.query(GuideSummary)\
+              .filter(GuideSummary.guide_id == guide_id, GuideSummary.content_count != counts.get(guide_id, 0))\
+              .update({GuideSummary.content_count: counts.get(guide_id, 0), GuideSummary.updated_at: datetime.now()},
+                      synchronize_session=False)
+        db.commit()
+    except Exception:
+        # 같은 세션을 쓰는 다음 listener 가 실패한 트랜잭션을 이어받지 않도록
+        db.rollback()
+        raise
+
+
+# ==================================================
+# 3. 일괄 재계산 (run_reconcile_guide_summary.py)
+# ==================================================
+
+def reconcile_all(db: Session, batch_size: int = 500, dry_run: bool = False) -> dict:
+    """
+    전체 가이드의 요약을 원본에서 다시 집계해 어긋난 가이드만 고칩니다. (없는 행은 추가)
+    batch_size 명 단위로 집계/commit 하여 긴 트랜잭션과 큰 IN 목록을 피합니다.
+    """
+    result = {"checked": 0, "inserted": 0, "updated": 0}
+    all_ids = [gid for (gid,) in db.query(GuideProfile.users_id).order_by(GuideProfile.users_id)]
+    for start in range(0, len(all_ids), batch_size):
+        ids = all_ids[start:start + batch_size]
+        expected = aggregate_guide_summaries(db, ids)
+        existing = {row.guide_id: row for row in db.query(GuideSummary).filter(GuideSummary.guide_id.in_(ids))}
+        characters = {gid: {} for gid in ids}
+        for row in db.query(GuideSummaryCharacter).filter(GuideSummaryCharacter.guide_id.in_(ids)):
+            if row.review_count:
+                characters[row.guide_id][row.ai_character_id] = row.review_count
+        tags = {gid: {} for gid in ids}
+        for row in db.query(GuideSummaryTag).filter(GuideSummaryTag.guide_id.in_(ids)):
+            if row.tag_count:
+                tags[row.guide_id][row.tag_id] = row.tag_count
+
+        now = datetime.now()
+        changed = []
+        for guide_id, aggregate in expected.items():
+            row = existing.get(guide_id)
+            if row is None:
+                result["inserted"] += 1
+            elif any(getattr(row, field) != aggregate["summary"][field] for field in _SUMMARY_FIELDS) \
+                    or characters[guide_id] != aggregate["characters"] or tags[guide_id] != aggregate["tags"]:
+                result["updated"] += 1
+            else:
+                continue
+            changed.append(aggregate)
+        result["checked"] += len(expected)
+        if dry_run:
+            continue
+        for aggregate in changed:
+            _store(db, aggregate, now)
+        db.commit()
+    return result
+
+
+# ==================================================
+# 4. 조회 (GET /guides/{id})
+# ==================================================
+
+def _ranked(items: List[tuple]) -> List[tuple]:
+    # (id, 이름, 횟수) 를 횟수 내림차순, 같으면 id 오름차순
+    return sorted((item for item in items if item[2] > 0), key=lambda item: (-item[2], item[0]))
+
+
+def get_guide_profile(db: Session, guide_id: int) -> Optional[dict]:
+    """
+    가이드 프로필 + 요약(평점/리뷰 수/콘텐츠 수) + 캐릭터 분포 + 상위 태그.
+    요약 행이 있으면 PK 조회 세 번, 없으면 (reconcile 이전) 원본에서 집계합니다. 없는 가이드면 None.
+    """
+    row = db.query(
+        GuideProfile.users_id,
+        GuideProfile.bio,
+        GuideProfile.license_status,
+        GuideProfile.manner_score,
+        User.nickname,
+        User.profile_image_url,
+        AiCharacter.name.label("character_name"),
+        GuideSummary.guide_id.label("summary_guide_id"),
+        GuideSummary.review_count,
+        GuideSummary.avg_rating,
+        GuideSummary.content_count,
+    ).join(User, User.id == GuideProfile.users_id)\
+     .outerjoin(AiCharacter, AiCharacter.id == GuideProfile.ai_character_id_as_guide)\
+     .outerjoin(GuideSummary, GuideSummary.guide_id == GuideProfile.users_id)\
+     .filter(GuideProfile.users_id == guide_id)\
+     .first()
+    if row is None:
+        return None
+
+    if row.summary_guide_id is not None:
+        summary = {"review_count": row.review_count, "avg_rating": row.avg_rating, "content_count": row.content_count}
+        characters = db.query(AiCharacter.id, AiCharacter.name, GuideSummaryCharacter.review_count)\
+                       .join(GuideSummaryCharacter, GuideSummaryCharacter.ai_character_id == AiCharacter.id)\
+                       .filter(GuideSummaryCharacter.guide_id == guide_id).all()
+        tags = db.query(Tag.id, Tag.name, GuideSummaryTag.tag_count)\
+                 .join(GuideSummaryTag, GuideSummaryTag.tag_id == Tag.id)\
+                 .filter(GuideSummaryTag.guide_id == guide_id, GuideSummaryTag.tag_count > 0)\
+                 .order_by(GuideSummaryTag.tag_count.desc(), Tag.id)\
+                 .limit(TOP_TAG_COUNT).all()
+    else:
+        aggregate = aggregate_guide_summaries(db, [guide_id])[guide_id]
+        summary = aggregate["summary"]
+        names = dict(db.query(AiCharacter.id, AiCharacter.name).filter(AiCharacter.id.in_(aggregate["characters"])))
+        characters = [(cid, names.get(cid), count) for cid, count in aggregate["characters"].items()]
+        top_tag_ids = [tid for tid, _, _ in _ranked([(tid, None, n) for tid, n in aggregate["tags"].items()])][:TOP_TAG_COUNT]
+        tag_names = dict(db.query(Tag.id, Tag.name).filter(Tag.id.in_(top_tag_ids))) if top_tag_ids else {}
+        tags = [(tid, tag_names.get(tid), aggregate["tags"][tid]) for tid in top_tag_ids]
+
+    characters = _ranked([tuple(item) for item in characters])
+    tagged_reviews = sum(count for _, _, count in characters)
+    return {
+        "id": row.users_id,
+        "name": row.nickname,
+        "avatar_url": row.profile_image_url,
+        "bio": row.bio,
+        "license_status": row.license_status,
+        "verified": row.license_status == "Licensed",
+        "manner_score": row.manner_score,
+        "character_name": row.character_name,
+        "avg_rating": round(float(summary["avg_rating"]), 1) if summary["avg_rating"] else 0.0,
+        "review_count": summary["review_count"],
+        "content_count": summary["content_count"],
+        "character_distribution": [
+            {"id": cid, "name": name, "review_count": count, "ratio": round(count / tagged_reviews, 3)}
+            for cid, name, count in characters
+        ],
+        "top_tags": [{"id": tid, "name": name, "count": count} for tid, name, count in _ranked([tuple(t) for t in tags])],
+    }
+
+
+
+def guide_contents_page(db: Session, guide_id: int, page: int = 1, per_page: int = 9,
+                        total: Optional[int] = None) -> Optional[tuple]:
+    """
+    가이드의 Active 콘텐츠 한 페이지 (최신순)와 전체 개수. 가이드당 콘텐츠가 적어 OFFSET 으로 충분합니다.
+    total 을 넘기면 (프로필에서 이미 읽은 경우) 가이드/개수 조회를 건너뜁니다. 없는 가이드면 None.
+    """
+    if total is None:
+        row = db.query(GuideProfile.users_id, GuideSummary.content_count)\
+                .outerjoin(GuideSummary, GuideSummary.guide_id == GuideProfile.users_id)\
+                .filter(GuideProfile.users_id == guide_id)\
+                .first()
+        if row is None:
+            return None
+        total = row.content_count
+        if total is None:
+            total = db.query(func.count(Content.id))\
+                      .filter(Content.guide_id == guide_id, Content.status == "Active").scalar() or 0
+    rows = db.query(Content.id, Content.title, Content.description, Content.price, Content.location,
+                    Content.guide_id, User.nickname.label("guide_nickname"),
+                    main_image_column().label("main_image_url"))\
+             .outerjoin(ContentStats, ContentStats.content_id == Content.id)\
+             .outerjoin(User, User.id == Content.guide_id)\
+             .filter(Content.guide_id == guide_id, Content.status == "Active")\
+             .order_by(Content.created_at.desc(), Content.id.desc())\
+             .offset((page - 1) * per_page).limit(per_page).all()
+    return rows, total
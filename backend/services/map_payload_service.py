@@ -0,0 +1,134 @@
+import struct
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# 지도 마커 목록의 열(column) 단위 바이너리 형식 (Accept 헤더로 요청, 기본 응답은 기존 JSON)
+MAP_COLUMNS_MEDIA_TYPE = "application/vnd.travia.map-columns"
+MAP_COLUMNS_MAGIC = b"TVMC"
+MAP_COLUMNS_VERSION = 1
+# 좌표는 1e-6 도(약 0.1m) 단위 정수로 보냅니다.
+COORDINATE_SCALE = 1_000_000
+NULL_PRICE = -1
+NULL_INDEX = 0xFFFFFFFF
+
+FORMAT_JSON = "json"
+FORMAT_COLUMNS = "columns"
+
+_HEADER = struct.Struct("<4sBBHI") # magic, version, 예약(0), 예약(0), 마커 수
+_STRING_COLUMNS = ("title", "location", "main_image_url")
+
+
+def negotiate_format(accept: Optional[str]) -> str:
+    """Accept 헤더에 바이너리 형식이 (q > 0 으로) 있으면 FORMAT_COLUMNS, 아니면 FORMAT_JSON"""
+    if not accept:
+        return FORMAT_JSON
+    for item in accept.split(","):
+        media_type, *params = [part.strip() for part in item.split(";")]
+        if media_type.lower() != MAP_COLUMNS_MEDIA_TYPE:
+            continue
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    return FORMAT_COLUMNS if float(value) > 0 else FORMAT_JSON
+                except ValueError:
+                    return FORMAT_JSON
+        return FORMAT_COLUMNS
+    return FORMAT_JSON
+
+
+def _pad4(data: bytes) -> bytes:
+    return data + b"\0" * (-len(data) % 4)
+
+
+def _encode_strings(values: Sequence[Optional[str]]) -> bytes:
+    """
+    사전(dictionary) 인코딩한 문자열 열:
+    uint32 사전 크기 d | uint32 offsets[d + 1] | UTF-8 바이트 (4바이트 정렬) | uint32 index[n] (NULL 은 0xFFFFFFFF)
+    지역 코드처럼 반복되는 값은 한 번만 실립니다.
+    """
+    dictionary: Dict[str, int] = {}
+    indexes = np.empty(len(values), dtype="<u4")
+    for i, value in enumerate(values):
+        if value is None:
+            indexes[i] = NULL_INDEX
+        else:
+            indexes[i] = dictionary.setdefault(value, len(dictionary))
+    encoded = [value.encode("utf-8") for value in dictionary]
+    offsets = np.zeros(len(encoded) + 1, dtype="<u4")
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    return (
+        struct.pack("<I", len(encoded)) + offsets.tobytes()
+        + _pad4(b"".join(encoded)) + indexes.tobytes()
+    )
+
+
+def encode_map_columns(rows: Sequence) -> bytes:
+    """
+    지도 마커 목록(id/latitude/longitude/price/rating/title/location/main_image_url 속성을 가진 행)을
+    열 단위 바이너리로 만듭니다. 모든 열은 4바이트 정렬이라 브라우저에서 TypedArray 로 바로 읽을 수 있습니다.
+
+    헤더 12바이트: 'TVMC' | uint8 버전 | uint8 0 | uint16 0 | uint32 마커 수 n
+    int32 ids[n] | int32 lat_e6[n] | int32 lng_e6[n] | int32 price[n] (NULL 은 -1) | float32 rating[n] (NULL 은 NaN)
+    문자열 열: title, location, main_image_url (_encode_strings 형식)
+    설명(description)은 싣지 않습니다. -> GET /content/{id}/description 으로 마커별로 조회
+    """
+    count = len(rows)
+    ids = np.fromiter((row.id for row in rows), dtype="<i4", count=count)
+    lat = np.fromiter((float(row.latitude) for row in rows), dtype=np.float64, count=count)
+    lng = np.fromiter((float(row.longitude) for row in rows), dtype=np.float64, count=count)
+    price = np.fromiter(
+        (NULL_PRICE if row.price is None else row.price for row in rows), dtype="<i4", count=count
+    )
+    rating = np.fromiter(
+        (np.nan if row.rating is None else float(row.rating) for row in rows), dtype="<f4", count=count
+    )
+    parts = [
+        _HEADER.pack(MAP_COLUMNS_MAGIC, MAP_COLUMNS_VERSION, 0, 0, count),
+        ids.tobytes(),
+        np.round(lat * COORDINATE_SCALE).astype("<i4").tobytes(),
+        np.round(lng * COORDINATE_SCALE).astype("<i4").tobytes(),
+        price.tobytes(),
+        rating.tobytes(),
+    ]
+    for column in _STRING_COLUMNS:
+        parts.append(_encode_strings([getattr(row, column) for row in rows]))
+    return b"".join(parts)
+
+
+def _decode_strings(payload: bytes, position: int, count: int) -> Tuple[List[Optional[str]], int]:
+    (size,) = struct.unpack_from("<I", payload, position)
+    position += 4
+    offsets = np.frombuffer(payload, dtype="<u4", count=size + 1, offset=position)
+    position += 4 * (size + 1)
+    blob = payload[position:position + int(offsets[-1])]
+    position += int(offsets[-1]) + (-int(offsets[-1]) % 4)
+    dictionary = [blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(size)]
+    indexes = np.frombuffer(payload, dtype="<u4", count=count, offset=position)
+    position += 4 * count
+    return [None if index == NULL_INDEX else dictionary[index] for index in indexes], position
+
+
+def decode_map_columns(payload: bytes) -> Dict[str, list]:
+    """encode_map_columns 의 역변환 (열 이름 -> 값 목록). 벤치마크/클라이언트 구현 검증용"""
+    magic, version, _, _, count = _HEADER.unpack_from(payload, 0)
+    if magic != MAP_COLUMNS_MAGIC or version != MAP_COLUMNS_VERSION:
+        raise ValueError(f"Unsupported map payload (magic={magic!r}, version={version})")
+    position = _HEADER.size
+    columns: Dict[str, list] = {}
+    for name, dtype in (("id", "<i4"), ("latitude", "<i4"), ("longitude", "<i4"), ("price", "<i4"), ("rating", "<f4")):
+        values = np.frombuffer(payload, dtype=dtype, count=count, offset=position)
+        position += 4 * count
+        if name in ("latitude", "longitude"):
+            columns[name] = (values / COORDINATE_SCALE).tolist()
+        elif name == "price":
+            columns[name] = [None if value == NULL_PRICE else int(value) for value in values]
+        elif name == "rating":
+            columns[name] = [None if np.isnan(value) else float(value) for value in values]
+        else:
+            columns[name] = values.tolist()
+    for name in _STRING_COLUMNS:
+        columns[name], position = _decode_strings(payload, position, count)
+    return columns
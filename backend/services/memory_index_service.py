@@ -0,0 +1,111 @@
+import asyncio
+import threading
+import time
+from typing import Callable, Generic, List, Optional, Set, TypeVar
+
+from sqlalchemy.orm import Session
+
+from database import SessionLocal
+from services import change_feed_service
+
+
+T = TypeVar("T")
+
+# start() 된 holder 목록 (앱 종료 시 stop_all 로 백그라운드 빌드를 모두 정리)
+_started_holders: List["MemoryIndexHolder"] = []
+
+
+class MemoryIndexHolder(Generic[T]):
+    """
+    API 프로세스 메모리에 두는 읽기 전용 인덱스의 수명주기를 관리합니다.
+    - start(): 기동 시 백그라운드 스레드에서 전체 빌드 (서버 기동을 막지 않음)
+    - change feed 로 전달된 콘텐츠 변경은 refresh_fn 으로 부분 갱신
+    - 전체 빌드 도중 들어온 변경은 모아 두었다가 새 인덱스로 교체한 직후 반영
+    - rebuild_interval(초)을 주면 change feed 로 전달되지 않는 값(예: 예약 수)을 위해 주기적으로 전체 재빌드
+    """
+
+    def __init__(
+        self,
+        name: str,
+        build_fn: Callable[[Session], T],
+        refresh_fn: Callable[[Session, T, Set[int]], None],
+        rebuild_interval: float = 0,
+    ):
+        self.name = name
+        self._build_fn = build_fn
+        self._refresh_fn = refresh_fn
+        self.rebuild_interval = rebuild_interval
+        self._lock = threading.Lock()
+        self._building = False
+        self._pending: Set[int] = set()
+        self.index: Optional[T] = None
+        self.built_at: Optional[float] = None
+        self._build_task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.index is not None
+
+    def rebuild(self):
+        """전체 빌드 후 인덱스를 원자적으로 교체합니다. (블로킹)"""
+        with self._lock:
+            self._building = True
+        db = SessionLocal()
+        try:
+            started = time.monotonic()
+            new_index = self._build_fn(db)
+            with self._lock:
+                pending, self._pending = self._pending, set()
+                self._building = False
+            if pending:
+                self._refresh_fn(db, new_index, pending)
+            self.index = new_index
+            self.built_at = time.time()
+            print(f"In-memory index '{self.name}' built in {time.monotonic() - started:.2f}s")
+        except Exception as e:
+            with self._lock:
+                self._building = False
+            print(f"In-memory index '{self.name}' build failed: {e}")
+        finally:
+            db.close()
+
+    def on_change(self, db: Session, content_ids: Set[int]):
+        with self._lock:
+            if self._building:
+                self._pending |= content_ids
+                return
+        if self.index is not None:
+            self._refresh_fn(db, self.index, content_ids)
+
+    async def _build_loop(self):
+        while True:
+            await asyncio.to_thread(self.rebuild)
+            if self.rebuild_interval <= 0:
+                return
+            await asyncio.sleep(self.rebuild_interval)
+
+    async def start(self):
+        """앱 lifespan 시작 시 호출: 변경 알림을 구독하고 전체 빌드를 백그라운드로 시작합니다."""
+        change_feed_service.register_listener(self.on_change)
+        self._build_task = asyncio.create_task(self._build_loop())
+        if self not in _started_holders:
+            _started_holders.append(self)
+
+    async def stop(self):
+        if self._build_task is not None:
+            self._build_task.cancel()
+            try:
+                await self._build_task
+            except asyncio.CancelledError:
+                pass
+            self._build_task = None
+
+    def status(self) -> dict:
+        return {"ready": self.ready, "built_at": self.built_at}
+
+
+async def stop_all():
+    """앱 lifespan 종료 시 호출: start() 된 모든 holder 의 백그라운드 빌드를 멈춥니다."""
+    for holder in reversed(_started_holders):
+        await holder.stop()
+    _started_holders.clear()
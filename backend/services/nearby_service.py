@@ -0,0 +1,238 @@
+import math
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from models import Content
+from services import tag_index_service
+from services.geo_index_service import GeoPoint, geo_point_query, to_geo_point
+from services.memory_index_service import MemoryIndexHolder
+from services.tag_index_service import TagFilter
+
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = math.pi * EARTH_RADIUS_KM / 180
+# 첫 탐색 반경(km). 이 안에서 k 개를 못 채우면 반경을 넓혀 다시 탐색합니다.
+NEARBY_INITIAL_RADIUS_KM = 5.0
+# 위도 띠(row) 높이(도). 띠 안에서는 경도순으로 정렬되어 있어 경도 범위도 searchsorted 로 자름
+NEARBY_ROW_DEGREES = 0.05
+NEARBY_DEFAULT_LIMIT = 10
+
+
+class TagIndexNotReadyError(Exception):
+    """태그 조건이 있는데 태그 비트맵 인덱스가 아직 빌드되지 않음"""
+    pass
+
+
+@dataclass
+class NearbyResult:
+    point: GeoPoint
+    distance_km: float
+
+
+def _row_of(latitude: float) -> int:
+    return math.floor(latitude / NEARBY_ROW_DEGREES)
+
+
+class _Snapshot:
+    """(위도 띠, 경도)순으로 정렬한 좌표/가격 배열 (조회 전용, 변경 시 새로 만듦)"""
+
+    def __init__(self, points: Dict[int, GeoPoint]):
+        ordered = sorted(points.values(), key=lambda point: (_row_of(point.latitude), point.longitude))
+        self.points = ordered
+        self.ids = np.array([point.content_id for point in ordered], dtype=np.int64)
+        self.lat = np.array([point.latitude for point in ordered], dtype=np.float64)
+        self.lng = np.array([point.longitude for point in ordered], dtype=np.float64)
+        self.lat_rad = np.radians(self.lat)
+        self.lng_rad = np.radians(self.lng)
+        self.cos_lat = np.cos(self.lat_rad)
+        # 가격이 없는 콘텐츠는 NaN -> 가격 조건이 있으면 항상 제외
+        self.price = np.array([np.nan if point.price is None else point.price for point in ordered], dtype=np.float64)
+        # 정렬 키 (띠 번호 * 1000 + 경도) -> 띠별 경도 범위를 한 번의 searchsorted 로 찾음
+        rows = np.floor(self.lat / NEARBY_ROW_DEGREES).astype(np.int64)
+        self.keys = rows * 1000 + (self.lng + 180.0)
+        self.rows = np.unique(rows)
+
+    def window(self, min_lat: float, max_lat: float, min_lng: float, max_lng: float) -> np.ndarray:
+        """위/경도 사각형 안(위도는 띠 단위로 근사)에 있을 수 있는 배열 위치들"""
+        rows = self.rows[np.searchsorted(self.rows, _row_of(min_lat)):np.searchsorted(self.rows, _row_of(max_lat), side="right")]
+        starts = np.searchsorted(self.keys, rows * 1000 + (max(min_lng, -180.0) + 180.0), side="left")
+        ends = np.searchsorted(self.keys, rows * 1000 + (min(max_lng, 180.0) + 180.0), side="right")
+        lengths = ends - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.int64)
+        # [start, end) 구간들을 이어 붙인 위치 배열 (파이썬 루프 없이)
+        offsets = np.repeat(starts - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths)
+        return np.arange(total) + offsets
+
+
+def _bitmap_mask(bitmap: int, size: int) -> np.ndarray:
+    """태그 비트맵(파이썬 int)을 콘텐츠 ID 로 인덱싱할 수 있는 bool 배열로 풉니다."""
+    data = np.frombuffer(bitmap.to_bytes((bitmap.bit_length() + 7) // 8 or 1, "little"), dtype=np.uint8)
+    bits = np.unpackbits(data, bitorder="little").astype(bool)
+    if bits.size < size:
+        bits = np.concatenate([bits, np.zeros(size - bits.size, dtype=bool)])
+    return bits
+
+
+class NearbyIndex:
+    """
+    (위도 띠, 경도)순으로 정렬한 NumPy 배열 위에서 하버사인 거리로 k 최근접 콘텐츠를 찾습니다.
+    - 반경 r 을 감싸는 위/경도 사각형을 띠별 searchsorted 로 잘라 그 안의 점만 계산
+    - 원 안에서 k 개를 못 채우면 사각형 후보의 k 번째 거리(후보가 모자라면 두 배)로 넓혀 다시 탐색
+      (도심에서는 첫 반경에서 끝남)
+    콘텐츠 변경은 점 목록만 고쳐 두고, 다음 조회 때 배열을 한 번 다시 만듭니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.points: Dict[int, GeoPoint] = {}
+        self._snapshot: Optional[_Snapshot] = None
+
+    def __len__(self):
+        return len(self.points)
+
+    def set_content(self, point: GeoPoint):
+        with self._lock:
+            self.points[point.content_id] = point
+            self._snapshot = None
+
+    def remove(self, content_id: int):
+        with self._lock:
+            if self.points.pop(content_id, None) is not None:
+                self._snapshot = None
+
+    def snapshot(self) -> _Snapshot:
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = _Snapshot(self.points)
+            return self._snapshot
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = NEARBY_DEFAULT_LIMIT,
+        max_km: Optional[float] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        tag_bitmap: Optional[int] = None,
+        exclude_id: Optional[int] = None,
+    ) -> List[NearbyResult]:
+        """(latitude, longitude) 에서 가까운 순으로 최대 k 개 (tag_bitmap 이 있으면 해당 콘텐츠만)"""
+        snap = self.snapshot()
+        if not snap.points or k <= 0:
+            return []
+        limit_km = max_km if max_km is not None else math.pi * EARTH_RADIUS_KM
+        tag_mask = _bitmap_mask(tag_bitmap, int(snap.ids.max()) + 1) if tag_bitmap is not None else None
+        q_lat, q_lng = math.radians(latitude), math.radians(longitude)
+
+        radius_km = min(NEARBY_INITIAL_RADIUS_KM, limit_km)
+        while True:
+            dlat = radius_km / KM_PER_DEGREE_LAT
+            # 반경 원이 닿는 가장 높은 위도에서의 경도 폭 (극 근처에서는 경도 조건 생략)
+            edge_cos = math.cos(math.radians(min(abs(latitude) + dlat, 90.0)))
+            dlng = dlat / edge_cos if edge_cos > 1e-6 else 360.0
+            rows = snap.window(latitude - dlat, latitude + dlat, longitude - dlng, longitude + dlng)
+
+            mask = np.ones(rows.size, dtype=bool)
+            if min_price is not None:
+                mask &= snap.price[rows] >= min_price
+            if max_price is not None:
+                mask &= snap.price[rows] <= max_price
+            if tag_mask is not None:
+                mask &= tag_mask[snap.ids[rows]]
+            if exclude_id is not None:
+                mask &= snap.ids[rows] != exclude_id
+            candidates = rows[mask]
+
+            distances = self._haversine_km(snap, candidates, q_lat, q_lng)
+            within = distances <= radius_km
+            exhausted = radius_km >= limit_km
+            if within.sum() >= k or exhausted:
+                candidates, distances = candidates[within], distances[within]
+                if candidates.size > k:
+                    top = np.argpartition(distances, k - 1)[:k]
+                    candidates, distances = candidates[top], distances[top]
+                order = np.argsort(distances, kind="stable")
+                return [NearbyResult(snap.points[candidates[i]], float(distances[i])) for i in order]
+            if candidates.size >= k:
+                # 사각형 안 후보의 k 번째 거리 안에 정답이 모두 있으므로 그 반경으로 한 번만 더 탐색
+                radius_km = min(float(np.partition(distances, k - 1)[k - 1]), limit_km)
+            else:
+                radius_km = min(radius_km * 2, limit_km)
+
+    @staticmethod
+    def _haversine_km(snap: _Snapshot, rows: np.ndarray, q_lat: float, q_lng: float) -> np.ndarray:
+        half_dlat = (snap.lat_rad[rows] - q_lat) / 2
+        half_dlng = (snap.lng_rad[rows] - q_lng) / 2
+        a = np.sin(half_dlat) ** 2 + math.cos(q_lat) * snap.cos_lat[rows] * np.sin(half_dlng) ** 2
+        return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+# ==================================================
+# 빌드 / 부분 갱신 (change feed)
+# ==================================================
+
+def build_nearby_index(db: Session) -> NearbyIndex:
+    """좌표가 있는 전체 Active 콘텐츠로 새 인덱스를 만듭니다."""
+    index = NearbyIndex()
+    for row in geo_point_query(db).yield_per(1000):
+        index.set_content(to_geo_point(row))
+    index.snapshot()
+    return index
+
+
+def refresh_nearby_index(db: Session, index: NearbyIndex, content_ids: Set[int]):
+    """변경된 콘텐츠만 다시 읽어 갱신합니다. (비활성/삭제/좌표 없음은 제거)"""
+    rows = geo_point_query(db).filter(Content.id.in_(list(content_ids))).all()
+    for row in rows:
+        index.set_content(to_geo_point(row))
+    for missing_id in content_ids - {row.id for row in rows}:
+        index.remove(missing_id)
+    # 배열 재생성 비용을 요청이 아닌 갱신 스레드에서 부담
+    index.snapshot()
+
+
+nearby_index = MemoryIndexHolder("nearby_knn", build_nearby_index, refresh_nearby_index)
+
+
+def find_nearby(
+    latitude: float,
+    longitude: float,
+    k: int = NEARBY_DEFAULT_LIMIT,
+    max_km: Optional[float] = None,
+    min_price: Optional[int] = None,
+    max_price: Optional[int] = None,
+    tag_filter: Optional[TagFilter] = None,
+    exclude_id: Optional[int] = None,
+) -> Optional[List[NearbyResult]]:
+    """
+    가까운 콘텐츠를 반환합니다. 인덱스가 아직 준비되지 않았으면 None.
+    태그 조건은 태그 비트맵 인덱스로 계산하며, 그 인덱스가 준비되지 않았으면 TagIndexNotReadyError.
+    """
+    index = nearby_index.index
+    if index is None:
+        return None
+    tag_bitmap = None
+    if tag_filter is not None and not tag_filter.is_empty:
+        tag_index = tag_index_service.tag_index.index
+        if tag_index is None:
+            raise TagIndexNotReadyError()
+        tag_bitmap = tag_index.resolve(tag_filter)
+    return index.nearest(latitude, longitude, k, max_km, min_price, max_price, tag_bitmap, exclude_id)
+
+
+def find_nearby_content(content_id: int, **kwargs) -> Optional[List[NearbyResult]]:
+    """콘텐츠 기준 최근접 (자기 자신 제외). 인덱스 미준비면 None, 좌표가 없는 콘텐츠면 KeyError."""
+    index = nearby_index.index
+    if index is None:
+        return None
+    point = index.points.get(content_id)
+    if point is None:
+        raise KeyError(content_id)
+    return find_nearby(point.latitude, point.longitude, exclude_id=content_id, **kwargs)
@@ -0,0 +1,142 @@
+import base64
+import json
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, List, Optional
+
+from sqlalchemy import and_, or_
+
+
+# --- 커서(Cursor) 토큰 인코딩/디코딩 ---
+# 커서는 "마지막으로 본 행의 정렬 키"를 담은 불투명(opaque) 토큰입니다.
+# 클라이언트는 내용을 해석하지 않고 next_cursor 값을 그대로 다시 보내기만 하면 됩니다.
+
+class InvalidCursorError(ValueError):
+    """커서 토큰이 손상되었거나 현재 정렬 방식과 맞지 않을 때 발생합니다."""
+
+
+@dataclass
+class SearchPage:
+    """검색 엔진이 정한 '한 페이지' 결과 (ids 순서가 곧 관련도 순위)"""
+    ids: List[int]
+    total_count: int
+    is_estimated_count: bool
+    next_cursor: Optional[str]
+
+
+def encode_cursor(kind: str, values: List[Any]) -> str:
+    """정렬 키 목록을 URL-safe 문자열 토큰으로 변환합니다."""
+    payload = {
+        "k": kind,
+        "v": [v.isoformat() if isinstance(v, datetime) else v for v in values],
+    }
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, kind: str) -> List[Any]:
+    """
+    encode_cursor로 만든 토큰을 원래의 정렬 키 목록으로 되돌립니다.
+    (kind가 다르면 다른 정렬 방식의 커서이므로 거부합니다)
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if payload.get("k") != kind or not isinstance(payload.get("v"), list):
+            raise InvalidCursorError("cursor kind mismatch")
+        return payload["v"]
+    except InvalidCursorError:
+        raise
+    except Exception as e:
+        raise InvalidCursorError(f"malformed cursor: {e}")
+
+
+def cursor_kind(token: str) -> Optional[str]:
+    """커서 토큰의 종류(kind)만 읽습니다. 해석할 수 없는 토큰이면 None."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        kind = json.loads(base64.urlsafe_b64decode(padded.encode("ascii"))).get("k")
+    except Exception:
+        return None
+    return kind if isinstance(kind, str) else None
+
+
+def decode_created_at_cursor(token: str, kind: str = "created_at") -> tuple:
+    """(created_at, id) 커서를 디코딩하여 (datetime, int) 튜플로 반환합니다."""
+    values = decode_cursor(token, kind)
+    try:
+        created_at_str, last_id = values
+        return datetime.fromisoformat(created_at_str), int(last_id)
+    except Exception as e:
+        raise InvalidCursorError(f"malformed cursor values: {e}")
+
+
+def keyset_before(created_at_col, id_col, created_at: datetime, last_id: int):
+    """
+    `(created_at, id) < (:created_at, :id)` 조건을 만듭니다. (내림차순 정렬 기준 '다음 페이지')
+    MySQL은 행 생성자(row constructor) 비교를 인덱스 범위 스캔으로 잘 풀지 못하므로
+    동일한 의미의 OR 형태로 풀어서 작성합니다.
+    """
+    return or_(
+        created_at_col < created_at,
+        and_(created_at_col == created_at, id_col < last_id),
+    )
+
+
+def keyset_seek(columns: list, values: list, descending: bool = True):
+    """
+    여러 열로 정렬된 목록의 '다음 페이지' 조건 (keyset_before 를 열 N 개로 일반화)
+    (a, b, c) < (x, y, z) -> a < x OR (a = x AND b < y) OR (a = x AND b = y AND c < z)
+    모든 열이 같은 방향(descending)으로 정렬되어 있어야 하나의 인덱스 범위로 읽힙니다.
+    """
+    clauses = []
+    for i, (column, value) in enumerate(zip(columns, values)):
+        equals = [columns[j] == values[j] for j in range(i)]
+        clauses.append(and_(*equals, column < value if descending else column > value))
+    return or_(*clauses)
+
+
+def next_cursor_from_rows(rows: list, per_page: int, kind: str = "created_at") -> Optional[str]:
+    """
+    per_page + 1 개를 조회한 결과에서 다음 페이지 존재 여부를 판단하고 커서를 만듭니다.
+    (rows는 호출 측에서 per_page 개로 잘라 사용해야 합니다)
+    """
+    if len(rows) <= per_page:
+        return None
+    last = rows[per_page - 1]
+    return encode_cursor(kind, [last.created_at, last.id])
+
+
+def paginate_ranked(
+    ranked: List[tuple],
+    per_page: int,
+    kind: str,
+    page: int = 1,
+    cursor: Optional[str] = None,
+) -> SearchPage:
+    """
+    메모리에서 계산한 (score, id) 순위 목록을 한 페이지로 자릅니다.
+    ranked 는 score 내림차순, 같은 점수는 id 내림차순으로 정렬되어 있어야 합니다.
+    """
+    if cursor:
+        values = decode_cursor(cursor, kind)
+        try:
+            last_score, last_id = float(values[0]), int(values[1])
+        except Exception as e:
+            raise InvalidCursorError(f"malformed cursor values: {e}")
+        start = bisect_right(ranked, (-last_score, -last_id), key=lambda r: (-r[0], -r[1]))
+    else:
+        start = (page - 1) * per_page
+
+    window = ranked[start:start + per_page]
+    next_cursor = None
+    if start + per_page < len(ranked) and window:
+        next_cursor = encode_cursor(kind, [window[-1][0], window[-1][1]])
+
+    return SearchPage(
+        ids=[content_id for _, content_id in window],
+        total_count=len(ranked),
+        is_estimated_count=False,
+        next_cursor=next_cursor,
+    )
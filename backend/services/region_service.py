@@ -0,0 +1,275 @@
+import json
+import math
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from models import Content, ContentRegion
+
+
+# 시도/시군구 경계 GeoJSON (프론트엔드 지도와 같은 파일, properties: sidonm / sggnm / sidonm_sggnm)
+REGION_GEOJSON_PATH = os.getenv(
+    "REGION_GEOJSON_PATH",
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "frontend", "public", "korea_ver3.geojson")),
+)
+# 후보 폴리곤을 거르는 격자 한 칸의 크기(도). 시군구 하나가 대략 2~4칸에 걸칩니다.
+REGION_GRID_DEGREES = 0.1
+
+Ring = List[Tuple[float, float]] # [(경도, 위도), ...] - GeoJSON 좌표 순서
+
+
+class RegionDataNotFoundError(Exception):
+    """경계 GeoJSON 파일이 없거나 읽을 수 없음"""
+    pass
+
+
+def _cell_of(lat: float, lng: float) -> Tuple[int, int]:
+    return math.floor(lat / REGION_GRID_DEGREES), math.floor(lng / REGION_GRID_DEGREES)
+
+
+def _point_in_ring(lng: float, lat: float, ring: Ring) -> bool:
+    """반직선(ray casting) 교차 횟수로 링 안쪽인지 판정합니다."""
+    inside = False
+    x1, y1 = ring[-1]
+    for x2, y2 in ring:
+        if (y1 > lat) != (y2 > lat) and lng < (x2 - x1) * (lat - y1) / (y2 - y1) + x1:
+            inside = not inside
+        x1, y1 = x2, y2
+    return inside
+
+
+@dataclass
+class RegionPolygon:
+    """외곽 링 1개 + 구멍 링 0개 이상 (MultiPolygon 은 여러 개로 나눠 보관)"""
+    outer: Ring
+    holes: List[Ring]
+    bbox: Tuple[float, float, float, float] # (min_lat, min_lng, max_lat, max_lng)
+
+    def contains(self, lat: float, lng: float) -> bool:
+        min_lat, min_lng, max_lat, max_lng = self.bbox
+        if not (min_lat <= lat <= max_lat and min_lng <= lng <= max_lng):
+            return False
+        if not _point_in_ring(lng, lat, self.outer):
+            return False
+        return not any(_point_in_ring(lng, lat, hole) for hole in self.holes)
+
+
+@dataclass
+class Region:
+    name: str # '부산광역시 해운대구' (프론트엔드 폴리곤 클릭 시 전달하는 areaName 과 동일)
+    sido: str
+    sigungu: Optional[str]
+    polygons: List[RegionPolygon]
+
+
+def _to_polygon(rings) -> Optional[RegionPolygon]:
+    parsed = [[(float(point[0]), float(point[1])) for point in ring] for ring in rings if len(ring) >= 3]
+    if not parsed:
+        return None
+    outer = parsed[0]
+    lats = [lat for _, lat in outer]
+    lngs = [lng for lng, _ in outer]
+    return RegionPolygon(outer, parsed[1:], (min(lats), min(lngs), max(lats), max(lngs)))
+
+
+def _to_region(feature: dict) -> Optional[Region]:
+    properties = feature.get("properties") or {}
+    geometry = feature.get("geometry") or {}
+    name = (properties.get("sidonm_sggnm") or "").strip()
+    sido = (properties.get("sidonm") or "").strip()
+    sigungu = (properties.get("sggnm") or "").strip()
+    # 일부 파일은 합친 이름만 가지고 있음 -> 첫 공백 기준으로 시도/시군구 분리
+    if name and not sido:
+        sido, _, sigungu = name.partition(" ")
+    if not name:
+        name = f"{sido} {sigungu}".strip()
+    if not name:
+        return None
+
+    if geometry.get("type") == "Polygon":
+        polygon_rings = [geometry.get("coordinates") or []]
+    elif geometry.get("type") == "MultiPolygon":
+        polygon_rings = geometry.get("coordinates") or []
+    else:
+        return None
+    polygons = [polygon for polygon in (_to_polygon(rings) for rings in polygon_rings) if polygon is not None]
+    if not polygons:
+        return None
+    return Region(name=name, sido=sido, sigungu=sigungu or None, polygons=polygons)
+
+
+def load_regions(path: str = REGION_GEOJSON_PATH) -> List[Region]:
+    """GeoJSON FeatureCollection 에서 시군구 경계를 읽습니다."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        raise RegionDataNotFoundError(
+            f"Region boundaries unavailable ({path}): {e} - run `python run_fetch_region_geojson.py --source <URL or path>`"
+        )
+    return [region for region in (_to_region(feature) for feature in data.get("features", [])) if region is not None]
+
+
+class RegionLocator:
+    """
+    좌표 -> 시군구 판정기
+    - 폴리곤 bbox 가 걸치는 격자 칸마다 후보 (지역, 폴리곤) 목록을 미리 만들어 두고 (bbox 사전 필터)
+    - 조회 시 좌표가 속한 칸의 후보들만 bbox -> point-in-polygon 순으로 검사합니다.
+    """
+
+    def __init__(self, regions: List[Region]):
+        self.regions = regions
+        self.grid: Dict[Tuple[int, int], List[Tuple[Region, RegionPolygon]]] = {}
+        for region in regions:
+            for polygon in region.polygons:
+                min_lat, min_lng, max_lat, max_lng = polygon.bbox
+                min_row, min_col = _cell_of(min_lat, min_lng)
+                max_row, max_col = _cell_of(max_lat, max_lng)
+                for row in range(min_row, max_row + 1):
+                    for col in range(min_col, max_col + 1):
+                        self.grid.setdefault((row, col), []).append((region, polygon))
+
+    def __len__(self):
+        return len(self.regions)
+
+    def locate(self, lat: Optional[float], lng: Optional[float]) -> Optional[Region]:
+        """좌표가 속한 지역 (어느 경계에도 속하지 않으면 None - 바다/해외 등)"""
+        if lat is None or lng is None:
+            return None
+        for region, polygon in self.grid.get(_cell_of(lat, lng), ()):
+            if polygon.contains(lat, lng):
+                return region
+        return None
+
+
+_locator: Optional[RegionLocator] = None
+_locator_lock = threading.Lock()
+
+
+def get_locator() -> RegionLocator:
+    """경계 파일을 처음 필요할 때 한 번만 읽습니다. (없으면 RegionDataNotFoundError)"""
+    global _locator
+    if _locator is None:
+        with _locator_lock:
+            if _locator is None:
+                _locator = RegionLocator(load_regions())
+                print(f"Region boundaries loaded: {len(_locator)} regions")
+    return _locator
+
+
+# ==================================================
+# 콘텐츠 -> 지역 배정 (content_regions)
+# ==================================================
+
+def assign_regions(
+    db: Session,
+    content_ids: Optional[Iterable[int]] = None,
+    batch_size: int = 1000,
+    locator: Optional[RegionLocator] = None,
+    dry_run: bool = False,
+) -> dict:
+    """
+    콘텐츠 좌표로 지역을 판정해 content_regions 를 맞춥니다. (바뀐 행만 쓰기)
+    content_ids 가 None 이면 전체 콘텐츠. 경계 밖이거나 좌표가 없는 콘텐츠의 행은 지웁니다.
+    batch_size 개 단위로 commit 하므로 여러 번 실행해도 안전합니다.
+    """
+    locator = locator or get_locator()
+    result = {"checked": 0, "assigned": 0, "unassigned": 0, "changed": 0}
+    if content_ids is None:
+        all_ids = [cid for (cid,) in db.query(Content.id).order_by(Content.id)]
+    else:
+        all_ids = sorted(set(content_ids))
+
+    for start in range(0, len(all_ids), batch_size):
+        ids = all_ids[start:start + batch_size]
+        rows = db.query(Content.id, Content.latitude, Content.longitude).filter(Content.id.in_(ids)).all()
+        existing = {row.content_id: row for row in db.query(ContentRegion).filter(ContentRegion.content_id.in_(ids))}
+        now = datetime.now()
+        inserts, updates, deletes = [], [], []
+        for row in rows:
+            lat = float(row.latitude) if row.latitude is not None else None
+            lng = float(row.longitude) if row.longitude is not None else None
+            region = locator.locate(lat, lng)
+            current = existing.get(row.id)
+            if region is None:
+                result["unassigned"] += 1
+                if current is not None:
+                    deletes.append(row.id)
+                continue
+            result["assigned"] += 1
+            values = {
+                "content_id": row.id, "region_name": region.name, "sido_name": region.sido,
+                "sigungu_name": region.sigungu, "updated_at": now,
+            }
+            if current is None:
+                inserts.append(values)
+            elif current.region_name != region.name:
+                updates.append(values)
+        # 삭제된 콘텐츠 (FK CASCADE 가 없는 환경 대비)
+        deletes.extend(set(existing) - {row.id for row in rows})
+        result["checked"] += len(rows)
+        result["changed"] += len(inserts) + len(updates) + len(deletes)
+        if dry_run:
+            continue
+        if inserts:
+            db.bulk_insert_mappings(ContentRegion, inserts)
+        if updates:
+            db.bulk_update_mappings(ContentRegion, updates)
+        if deletes:
+            db.query(ContentRegion).filter(ContentRegion.content_id.in_(deletes)).delete(synchronize_session=False)
+        db.commit()
+    return result
+
+
+_missing_data_reported = False
+
+
+def on_content_change(db: Session, content_ids: Set[int]):
+    """change feed listener: 새로 등록되었거나 좌표가 바뀐 콘텐츠만 다시 배정합니다."""
+    global _missing_data_reported
+    try:
+        locator = get_locator()
+    except RegionDataNotFoundError as e:
+        if not _missing_data_reported:
+            print(f"Region assignment skipped: {e}")
+            _missing_data_reported = True
+        return
+    try:
+        assign_regions(db, content_ids, locator=locator)
+    except Exception:
+        # 같은 세션을 쓰는 다음 listener 가 실패한 트랜잭션을 이어받지 않도록
+        db.rollback()
+        raise
+
+
+# ==================================================
+# 지역별 집계
+# ==================================================
+
+def region_counts(db: Session, sido: Optional[str] = None) -> List[dict]:
+    """
+    지역별 Active 콘텐츠 수 (content_regions GROUP BY)
+    - sido 가 없으면 시도별, 있으면 그 시도의 시군구별
+    """
+    count = func.count(ContentRegion.content_id).label("count")
+    query = db.query(ContentRegion.sido_name, count)\
+              .join(Content, Content.id == ContentRegion.content_id)\
+              .filter(Content.status == "Active")
+    if sido is None:
+        rows = query.group_by(ContentRegion.sido_name).order_by(count.desc()).all()
+        return [{"name": row.sido_name, "sido": row.sido_name, "sigungu": None, "count": row.count} for row in rows]
+
+    rows = query.add_columns(ContentRegion.sigungu_name, ContentRegion.region_name)\
+                .filter(ContentRegion.sido_name == sido)\
+                .group_by(ContentRegion.sido_name, ContentRegion.sigungu_name, ContentRegion.region_name)\
+                .order_by(count.desc())\
+                .all()
+    return [
+        {"name": row.region_name, "sido": row.sido_name, "sigungu": row.sigungu_name, "count": row.count}
+        for row in rows
+    ]
@@ -0,0 +1,268 @@
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from models import Booking, Content, ContentRelated, ContentStats, ContentTag, GuideProfile, Review, ReviewTag
+from services.content_stats_service import main_image_column
+
+
+# 콘텐츠당 저장하는 이웃 수
+RELATED_TOP_K = 20
+# 특성 묶음별 가중치 (묶음마다 L2 정규화한 뒤 곱해서 이어 붙임)
+# 상품 태그가 가장 직접적인 신호이고, 리뷰 태그/지역/가이드 캐릭터는 보조 신호입니다.
+FEATURE_WEIGHTS = {
+    "tag": 1.0,
+    "review_tag": 0.6,
+    "location": 0.5,
+    "style": 0.3,
+}
+
+
+@dataclass
+class SparseRows:
+    """
+    scipy 없이 쓰는 CSR 형식 행렬 (행 = 콘텐츠, 열 = 특성)
+    indptr[i]:indptr[i+1] 구간의 indices/data 가 i 번째 행의 0 이 아닌 값
+    """
+    indptr: np.ndarray
+    indices: np.ndarray
+    data: np.ndarray
+    n_cols: int
+
+    def transpose(self) -> "SparseRows":
+        """열 기준(역색인)으로 바꾼 행렬: 특성 -> 그 특성을 가진 콘텐츠들"""
+        n_rows = len(self.indptr) - 1
+        rows = np.repeat(np.arange(n_rows), np.diff(self.indptr))
+        order = np.argsort(self.indices, kind="stable")
+        indptr = np.zeros(self.n_cols + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.indices, minlength=self.n_cols), out=indptr[1:])
+        return SparseRows(indptr, rows[order], self.data[order], n_rows)
+
+
+def _tfidf_block(counts: List[Dict[int, float]], n_cols: int) -> SparseRows:
+    """
+    콘텐츠별 {특성: 횟수} 목록 -> 행마다 L2 정규화한 TF-IDF (tf = 1 + log(횟수), 스무딩한 idf)
+    """
+    n_rows = len(counts)
+    df = np.zeros(n_cols, dtype=np.float64)
+    for row in counts:
+        for col in row:
+            df[col] += 1
+    idf = np.log((1 + n_rows) / (1 + df)) + 1
+
+    indptr = np.zeros(n_rows + 1, dtype=np.int64)
+    indices, data = [], []
+    for i, row in enumerate(counts):
+        cols = np.fromiter(row.keys(), dtype=np.int64, count=len(row))
+        values = np.fromiter(row.values(), dtype=np.float64, count=len(row))
+        weights = (1 + np.log(values)) * idf[cols] if len(row) else values
+        norm = math.sqrt(float(np.dot(weights, weights))) if len(row) else 0.0
+        indices.append(cols)
+        data.append(weights / norm if norm else weights)
+        indptr[i + 1] = indptr[i] + len(row)
+    return SparseRows(
+        indptr,
+        np.concatenate(indices) if indices else np.empty(0, dtype=np.int64),
+        np.concatenate(data) if data else np.empty(0, dtype=np.float64),
+        n_cols,
+    )
+
+
+def _hstack(blocks: List[Tuple[SparseRows, float]]) -> SparseRows:
+    """가중치를 곱한 블록들을 옆으로 이어 붙입니다. (모든 블록의 행 수는 같음)"""
+    n_rows = len(blocks[0][0].indptr) - 1
+    indptr = np.zeros(n_rows + 1, dtype=np.int64)
+    indices, data = [], []
+    for i in range(n_rows):
+        offset, count = 0, 0
+        for block, weight in blocks:
+            start, end = block.indptr[i], block.indptr[i + 1]
+            indices.append(block.indices[start:end] + offset)
+            data.append(block.data[start:end] * weight)
+            offset += block.n_cols
+            count += end - start
+        indptr[i + 1] = indptr[i] + count
+    n_cols = sum(block.n_cols for block, _ in blocks)
+    if not indices:
+        return SparseRows(indptr, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64), n_cols)
+    return SparseRows(indptr, np.concatenate(indices), np.concatenate(data), n_cols)
+
+
+def _normalize_rows(matrix: SparseRows) -> SparseRows:
+    n_rows = len(matrix.indptr) - 1
+    rows = np.repeat(np.arange(n_rows), np.diff(matrix.indptr))
+    norms = np.sqrt(np.bincount(rows, weights=matrix.data ** 2, minlength=n_rows))
+    scale = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+    return SparseRows(matrix.indptr, matrix.indices, matrix.data * scale[rows], matrix.n_cols)
+
+
+# ==================================================
+# 1. 특성 행렬 (상품 태그 / 리뷰 태그 / 지역 / 가이드 캐릭터)
+# ==================================================
+
+@dataclass
+class RelatedFeatures:
+    content_ids: np.ndarray # 행 번호 -> 콘텐츠 ID
+    popularity: np.ndarray # 동점일 때의 순서 (예약 수)
+    matrix: SparseRows # 행마다 L2 정규화 -> 행끼리의 내적 = 코사인 유사도
+
+
+def _index_of(vocabulary: Dict, key) -> int:
+    return vocabulary.setdefault(key, len(vocabulary))
+
+
+def _empty_counts(rows) -> List[Dict[int, float]]:
+    return [{} for _ in rows]
+
+
+def load_features(db: Session) -> RelatedFeatures:
+    """Active 콘텐츠 전체의 특성을 GROUP BY 몇 번으로 읽어 TF-IDF 행렬을 만듭니다."""
+    rows = db.query(Content.id, Content.location, GuideProfile.ai_character_id_as_guide, ContentStats.booking_count)\
+             .outerjoin(GuideProfile, GuideProfile.users_id == Content.guide_id)\
+             .outerjoin(ContentStats, ContentStats.content_id == Content.id)\
+             .filter(Content.status == "Active")\
+             .order_by(Content.id)\
+             .all()
+    position = {row.id: i for i, row in enumerate(rows)}
+
+    tag_counts, tag_vocabulary = _empty_counts(rows), {}
+    for content_id, tag_id in db.query(ContentTag.contents_id, ContentTag.tag_id):
+        if content_id in position:
+            tag_counts[position[content_id]][_index_of(tag_vocabulary, tag_id)] = 1.0
+
+    review_tag_counts, review_tag_vocabulary = _empty_counts(rows), {}
+    review_tag_rows = db.query(Booking.content_id, ReviewTag.tag_id, func.count(ReviewTag.id))\
+                        .join(Review, Review.id == ReviewTag.review_id)\
+                        .join(Booking, Booking.id == Review.booking_id)\
+                        .group_by(Booking.content_id, ReviewTag.tag_id)
+    for content_id, tag_id, count in review_tag_rows:
+        if content_id in position:
+            review_tag_counts[position[content_id]][_index_of(review_tag_vocabulary, tag_id)] = float(count)
+
+    location_counts, location_vocabulary = _empty_counts(rows), {}
+    style_counts, style_vocabulary = _empty_counts(rows), {}
+    for i, row in enumerate(rows):
+        if row.location:
+            location_counts[i][_index_of(location_vocabulary, row.location)] = 1.0
+        if row.ai_character_id_as_guide is not None:
+            style_counts[i][_index_of(style_vocabulary, row.ai_character_id_as_guide)] = 1.0
+
+    blocks = [
+        (_tfidf_block(tag_counts, len(tag_vocabulary)), FEATURE_WEIGHTS["tag"]),
+        (_tfidf_block(review_tag_counts, len(review_tag_vocabulary)), FEATURE_WEIGHTS["review_tag"]),
+        (_tfidf_block(location_counts, len(location_vocabulary)), FEATURE_WEIGHTS["location"]),
+        (_tfidf_block(style_counts, len(style_vocabulary)), FEATURE_WEIGHTS["style"]),
+    ]
+    return RelatedFeatures(
+        content_ids=np.array([row.id for row in rows], dtype=np.int64),
+        popularity=np.array([row.booking_count or 0 for row in rows], dtype=np.int64),
+        matrix=_normalize_rows(_hstack(blocks)),
+    )
+
+
+# ==================================================
+# 2. top-K 이웃 계산 (역색인으로 겹치는 특성이 있는 콘텐츠만 점수 계산)
+# ==================================================
+
+def compute_neighbours(features: RelatedFeatures, k: int = RELATED_TOP_K) -> Dict[int, List[Tuple[int, float]]]:
+    """
+    콘텐츠 ID -> [(이웃 콘텐츠 ID, 코사인 유사도), ...] (유사도 > 0, 높은 순 최대 k 개)
+    동점이면 예약 수가 많은 순, 그다음 최신(ID 큰) 순입니다.
+    """
+    matrix = features.matrix
+    inverted = matrix.transpose()
+    n_rows = len(features.content_ids)
+    neighbours: Dict[int, List[Tuple[int, float]]] = {}
+    for i in range(n_rows):
+        start, end = matrix.indptr[i], matrix.indptr[i + 1]
+        if start == end:
+            neighbours[int(features.content_ids[i])] = []
+            continue
+        # i 행의 특성마다 그 특성을 가진 콘텐츠 목록(posting)을 모아 bincount 로 내적을 한 번에 누적
+        cols = matrix.indices[start:end]
+        starts, ends = inverted.indptr[cols], inverted.indptr[cols + 1]
+        lengths = ends - starts
+        positions = np.repeat(starts - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths) + np.arange(lengths.sum())
+        weights = np.repeat(matrix.data[start:end], lengths) * inverted.data[positions]
+        scores = np.bincount(inverted.indices[positions], weights=weights, minlength=n_rows)
+        scores[i] = 0.0
+
+        candidates = np.flatnonzero(scores > 1e-9)
+        if candidates.size > k:
+            # k 번째 점수와 같은 동점 후보까지 남긴 뒤 정렬
+            threshold = np.partition(scores[candidates], candidates.size - k)[candidates.size - k]
+            candidates = candidates[scores[candidates] >= threshold]
+        order = np.lexsort((-features.content_ids[candidates], -features.popularity[candidates], -scores[candidates]))
+        neighbours[int(features.content_ids[i])] = [
+            (int(features.content_ids[c]), float(scores[c])) for c in candidates[order][:k]
+        ]
+    return neighbours
+
+
+# ==================================================
+# 3. 저장 / 조회 (content_related)
+# ==================================================
+
+def store_neighbours(db: Session, neighbours: Dict[int, List[Tuple[int, float]]], batch_size: int = 500) -> int:
+    """콘텐츠별 이웃 행을 통째로 교체합니다. (batch_size 개 콘텐츠 단위 commit) 반환값: 저장한 행 수"""
+    content_ids = sorted(neighbours)
+    written = 0
+    now = datetime.now()
+    for start in range(0, len(content_ids), batch_size):
+        ids = content_ids[start:start + batch_size]
+        db.query(ContentRelated).filter(ContentRelated.content_id.in_(ids)).delete(synchronize_session=False)
+        mappings = [
+            {"content_id": cid, "sort_order": order, "related_content_id": related_id, "score": score, "updated_at": now}
+            for cid in ids
+            for order, (related_id, score) in enumerate(neighbours[cid], start=1)
+        ]
+        if mappings:
+            db.bulk_insert_mappings(ContentRelated, mappings)
+        db.commit()
+        written += len(mappings)
+    # 더 이상 Active 가 아닌 콘텐츠의 이웃 목록 정리
+    db.query(ContentRelated).filter(ContentRelated.content_id.notin_(content_ids)).delete(synchronize_session=False)
+    db.commit()
+    return written
+
+
+def load_related(db: Session, content_id: int) -> List[dict]:
+    """
+    미리 계산된 이웃을 sort_order 순으로 (PK 인덱스 한 번의 조회, 평점/메인 이미지는 content_stats 에서)
+    비활성화된 이웃은 건너뜁니다. 아직 계산되지 않은 콘텐츠면 빈 목록.
+    """
+    rows = db.query(Content.id, Content.title, Content.price, main_image_column().label("imageUrl"),
+                    ContentStats.avg_rating.label("rating"))\
+        .select_from(ContentRelated)\
+        .join(Content, Content.id == ContentRelated.related_content_id)\
+        .outerjoin(ContentStats, ContentStats.content_id == Content.id)\
+        .filter(ContentRelated.content_id == content_id, Content.status == "Active")\
+        .order_by(ContentRelated.sort_order)\
+        .all()
+    return [to_related_item(row) for row in rows]
+
+
+def to_related_item(row) -> dict:
+    """RelatedContentSchema 에 맞춘 dict (소요 시간은 저장된 값이 없어 None -> 화면에서 생략)"""
+    return {
+        "id": row.id, "title": row.title, "price": f"{row.price:,}" if row.price else "문의",
+        "rating": round(float(row.rating), 1) if row.rating else 0.0, "time": None, "imageUrl": row.imageUrl,
+    }
+
+
+def rebuild_related(db: Session, k: int = RELATED_TOP_K, batch_size: int = 500, dry_run: bool = False) -> dict:
+    """전체 이웃 재계산 (run_build_related.py)"""
+    features = load_features(db)
+    neighbours = compute_neighbours(features, k)
+    written = 0 if dry_run else store_neighbours(db, neighbours, batch_size)
+    return {
+        "contents": len(neighbours),
+        "features": features.matrix.n_cols,
+        "without_neighbours": sum(1 for items in neighbours.values() if not items),
+        "rows": written,
+    }
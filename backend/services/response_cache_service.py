@@ -0,0 +1,351 @@
+import asyncio
+import hashlib
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+from cache import MISSING, get_cache, register_cache_type
+from services.map_payload_service import negotiate_format
+
+
+# 전체 응답 캐시 사용 여부 (0 이면 미들웨어가 요청을 그대로 통과시킴)
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "1") == "1"
+# 메모리 보호를 위한 최대 캐시 항목 수 / 항목 하나의 기본 최대 본문 크기 (규칙별로 max_body_bytes 로 변경)
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "2048"))
+RESPONSE_CACHE_MAX_BODY_BYTES = 1024 * 1024
+# /content/map-data 는 전체 콘텐츠를 담아 수 MB 가 되므로 별도 한도 (가장 비싼 응답이라 캐시 효과도 가장 큼)
+RESPONSE_CACHE_MAP_MAX_BODY_BYTES = int(os.getenv("RESPONSE_CACHE_MAP_MAX_BODY_BYTES", str(32 * 1024 * 1024)))
+
+# 데이터 영역(domain): 쓰기 경로가 올리는 버전 카운터의 이름
+DOMAIN_CONTENTS = "contents"
+DOMAIN_REVIEWS = "reviews"
+DOMAIN_TAGS = "tags"
+DOMAIN_BOOKINGS = "bookings"
+DOMAIN_CHARACTERS = "characters"
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    pattern: "re.Pattern"
+    ttl_seconds: int
+    domains: FrozenSet[str]
+    # TTL 이 지난 뒤에도 이 시간(초) 동안은 이전 응답을 바로 반환하고, 갱신은 백그라운드 1회로 처리
+    # (데이터 버전이 바뀐 경우에는 적용하지 않음 -> 쓰기 직후에는 항상 새 응답)
+    stale_seconds: int = 0
+    # 같은 URL 이 요청 헤더에 따라 다른 본문을 반환할 때 (예: Accept 협상) 그 '변형' 이름을 돌려주는 함수
+    # -> 캐시 키/ETag 에 포함. 원본 헤더 대신 협상 결과를 쓰므로 브라우저마다 다른 Accept 로 키가 흩어지지 않음
+    variant: Optional[Callable[[Dict[bytes, bytes]], str]] = None
+    # 이보다 큰 응답은 저장하지 않음 (동시에 기다리던 같은 요청에는 크기와 무관하게 전달)
+    max_body_bytes: int = RESPONSE_CACHE_MAX_BODY_BYTES
+
+
+def _map_payload_variant(headers: Dict[bytes, bytes]) -> str:
+    accept = headers.get(b"accept")
+    return negotiate_format(accept.decode("latin-1") if accept else None)
+
+
+# 캐시 대상 GET 경로: (경로 정규식, TTL 초, 응답이 의존하는 데이터 영역, stale 허용 초)
+# TTL 은 버전 카운터로 알 수 없는 변경(직접 SQL 수정 등)이 반영되기까지의 최대 시간입니다.
+CACHE_RULES: List[CacheRule] = [
+    CacheRule(re.compile(r"^/content/locations$"), 300, frozenset({DOMAIN_CONTENTS})),
+    CacheRule(re.compile(r"^/content/tags$"), 300, frozenset({DOMAIN_CONTENTS, DOMAIN_TAGS})),
+    CacheRule(re.compile(r"^/content/list$"), 30,
+              frozenset({DOMAIN_CONTENTS, DOMAIN_TAGS, DOMAIN_CHARACTERS}), stale_seconds=60),
+    CacheRule(re.compile(r"^/content/map-data$"), 60, frozenset({DOMAIN_CONTENTS, DOMAIN_REVIEWS}),
+              stale_seconds=120, variant=_map_payload_variant,
+              max_body_bytes=RESPONSE_CACHE_MAP_MAX_BODY_BYTES),
+    CacheRule(re.compile(r"^/content/region-counts$"), 60, frozenset({DOMAIN_CONTENTS}), stale_seconds=120),
+    CacheRule(re.compile(r"^/content/\d+/description$"), 300, frozenset({DOMAIN_CONTENTS})),
+    CacheRule(re.compile(r"^/content/\d+/reviews$"), 30, frozenset({DOMAIN_REVIEWS})),
+    CacheRule(re.compile(r"^/guides/\d+/reviews$"), 30, frozenset({DOMAIN_REVIEWS})),
+    CacheRule(re.compile(r"^/guides/\d+/contents$"), 60, frozenset({DOMAIN_CONTENTS})),
+    CacheRule(re.compile(r"^/guides/\d+$"), 60, frozenset({DOMAIN_CONTENTS, DOMAIN_REVIEWS, DOMAIN_TAGS})),
+    CacheRule(re.compile(r"^/content/\d+$"), 60,
+              frozenset({DOMAIN_CONTENTS, DOMAIN_REVIEWS, DOMAIN_TAGS, DOMAIN_BOOKINGS})),
+    CacheRule(re.compile(r"^/characters$"), 3600, frozenset({DOMAIN_CHARACTERS, DOMAIN_TAGS})),
+]
+
+
+# ==================================================
+# 1. 데이터 버전 (쓰기 경로에서 invalidate 로 증가)
+# ==================================================
+
+# CACHE_BACKEND=redis 이면 한 워커의 invalidate 가 모든 워커의 ETag 를 바꿉니다.
+_versions = get_cache("response_versions")
+
+
+def invalidate(*domains: str):
+    """
+    쓰기 경로(예약/리뷰/태그 등)에서 commit 직후 호출합니다.
+    해당 영역에 의존하는 모든 캐시 응답의 ETag 가 바뀌어 다음 요청부터 새로 계산됩니다.
+    """
+    for domain in domains:
+        _versions.incr(domain)
+
+
+def on_content_change(db, content_ids):
+    """change feed listener: 다른 프로세스(배치 스크립트 등)의 콘텐츠/리뷰/태그 변경도 반영"""
+    invalidate(DOMAIN_CONTENTS, DOMAIN_REVIEWS, DOMAIN_TAGS)
+
+
+def current_versions(domains: Iterable[str]) -> Tuple[Tuple[str, int], ...]:
+    ordered = sorted(domains)
+    return tuple(zip(ordered, _versions.get_counters(ordered)))
+
+
+# ==================================================
+# 2. 응답 저장소
+# ==================================================
+
+Versions = Tuple[Tuple[str, int], ...]
+
+
+@register_cache_type
+@dataclass
+class CachedResponse:
+    etag: str
+    status: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+    versions: Versions = ()
+    stored_at: float = 0.0
+
+
+# 요청 키 -> CachedResponse (적중/미스/축출 수는 캐시 백엔드가 집계)
+_responses = get_cache("responses", max_entries=RESPONSE_CACHE_MAX_ENTRIES)
+stats = {"not_modified": 0, "stale_served": 0, "coalesced": 0, "background_refreshes": 0}
+
+
+def _get_response(key: str) -> Optional[CachedResponse]:
+    cached = _responses.get(key)
+    return None if cached is MISSING else cached
+
+
+def _store_response(key: str, response: CachedResponse, rule: CacheRule):
+    if len(response.body) > rule.max_body_bytes:
+        return
+    # ETag 가 TTL 구간마다 바뀌므로, stale 허용 시간까지 지나면 어차피 재사용되지 않음
+    _responses.set(key, response, ttl=rule.ttl_seconds + rule.stale_seconds)
+
+
+def _is_revalidatable(cached: CachedResponse, rule: CacheRule, versions: Versions) -> bool:
+    """TTL 만 지났고 (데이터 버전은 그대로) stale 허용 시간 안이면 이전 응답을 반환해도 됨"""
+    if rule.stale_seconds <= 0 or cached.versions != versions:
+        return False
+    return time.time() - cached.stored_at <= rule.ttl_seconds + rule.stale_seconds
+
+
+def clear():
+    _responses.clear()
+
+
+def match_rule(path: str) -> Optional[CacheRule]:
+    for rule in CACHE_RULES:
+        if rule.pattern.match(path):
+            return rule
+    return None
+
+
+def cache_key(path: str, query_string: bytes, variant: Optional[str] = None) -> str:
+    """쿼리 파라미터 순서가 달라도 같은 요청이면 같은 키가 되도록 정렬합니다."""
+    params = sorted(parse_qsl(query_string.decode("latin-1"), keep_blank_values=True))
+    key = f"{path}?{urlencode(params)}"
+    return f"{key}#{variant}" if variant else key
+
+
+def compute_etag(key: str, rule: CacheRule, versions: Optional[Versions] = None) -> str:
+    """
+    요청 키 + 의존 데이터 버전 + TTL 구간으로 ETag 를 만듭니다.
+    응답 본문을 계산하지 않고도 '변경 없음(304)'을 판단할 수 있습니다.
+    """
+    if versions is None:
+        versions = current_versions(rule.domains)
+    epoch = int(time.time() // rule.ttl_seconds)
+    raw = f"{key}|{versions}|{epoch}"
+    return '"' + hashlib.sha1(raw.encode("utf-8")).hexdigest()[:20] + '"'
+
+
+# ==================================================
+# 3. ASGI 미들웨어
+# ==================================================
+
+def _etag_matches(if_none_match: Optional[bytes], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.decode("latin-1").split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def _cache_headers(etag: str) -> List[Tuple[bytes, bytes]]:
+    return [(b"etag", etag.encode("latin-1")), (b"cache-control", b"no-cache")]
+
+
+# 요청 키|ETag -> 계산 중인 응답 (같은 요청이 동시에 미스 나면 한 번만 계산하고 결과를 공유)
+_inflight: Dict[str, "asyncio.Future"] = {}
+# 실행 중인 백그라운드 갱신 작업 (GC 로 취소되지 않도록 참조 유지)
+_background_tasks: Set["asyncio.Task"] = set()
+
+
+class _ResponseCapture:
+    """
+    라우터가 보내는 200 응답에 ETag 헤더를 붙이고 본문을 모읍니다.
+    저장 한도(max_body_bytes)를 넘는 본문도 끝까지 모아, 같은 요청을 기다리던 쪽에 그대로 넘겨줍니다.
+    """
+
+    def __init__(self, etag: str, versions: Versions):
+        self.etag = etag
+        self.versions = versions
+        self.status = None
+        self.headers: List[Tuple[bytes, bytes]] = []
+        self.chunks: List[bytes] = []
+        self.response: Optional[CachedResponse] = None
+
+    def process(self, message: dict) -> dict:
+        if message["type"] == "http.response.start":
+            self.status = message["status"]
+            if self.status == 200:
+                headers = [
+                    (name, value) for name, value in message.get("headers", [])
+                    if name.lower() not in (b"etag", b"cache-control")
+                ] + _cache_headers(self.etag)
+                message = dict(message, headers=headers)
+            self.headers = message.get("headers", [])
+        elif message["type"] == "http.response.body" and self.status == 200:
+            self.chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                self.response = CachedResponse(
+                    self.etag, 200, self.headers, b"".join(self.chunks), self.versions, time.time()
+                )
+                self.chunks = []
+        return message
+
+
+async def _send_cached(send, response: CachedResponse):
+    await send({"type": "http.response.start", "status": response.status, "headers": response.headers})
+    await send({"type": "http.response.body", "body": response.body})
+
+
+class ResponseCacheMiddleware:
+    """
+    CACHE_RULES 에 해당하는 GET 요청의 응답을 캐시하고 ETag / If-None-Match(304)를 처리합니다.
+    - If-None-Match 가 현재 ETag 와 같으면 라우터/DB 를 거치지 않고 304
+    - 같은 ETag 의 저장된 응답이 있으면 그대로 반환
+    - TTL 만 지난 응답은 (stale 허용 시) 그대로 반환하고 백그라운드에서 한 번만 다시 계산
+    - 그 외에는 라우터를 실행하고 200 응답을 저장 (동시에 들어온 같은 요청은 그 결과를 기다려 공유)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if not RESPONSE_CACHE_ENABLED or scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+        rule = match_rule(scope["path"])
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        variant = rule.variant(headers) if rule.variant is not None else None
+        key = cache_key(scope["path"], scope.get("query_string", b""), variant)
+        # 버전은 계산 '전에' 읽습니다. 계산 도중 쓰기가 일어나면 저장된 응답은 이전 ETag 로 남아 재사용되지 않음
+        versions = current_versions(rule.domains)
+        etag = compute_etag(key, rule, versions)
+        if_none_match = headers.get(b"if-none-match")
+
+        if _etag_matches(if_none_match, etag):
+            await self._send_not_modified(send, etag)
+            return
+
+        cached = _get_response(key)
+        if cached is not None:
+            if cached.etag == etag:
+                await _send_cached(send, cached)
+                return
+            if _is_revalidatable(cached, rule, versions):
+                stats["stale_served"] += 1
+                self._refresh_in_background(scope, key, etag, versions, rule)
+                if _etag_matches(if_none_match, cached.etag):
+                    await self._send_not_modified(send, cached.etag)
+                else:
+                    await _send_cached(send, cached)
+                return
+
+        flight_key = f"{key}|{etag}"
+        pending = _inflight.get(flight_key)
+        if pending is not None:
+            stats["coalesced"] += 1
+            response = await asyncio.shield(pending)
+            if response is not None:
+                await _send_cached(send, response)
+            else:
+                # 선행 요청이 200 응답을 끝내지 못함 (오류, 연결 끊김 등) -> 직접 실행
+                await self.app(scope, receive, send)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        _inflight[flight_key] = future
+        capture = _ResponseCapture(etag, versions)
+        try:
+            async def send_wrapper(message):
+                await send(capture.process(message))
+
+            await self.app(scope, receive, send_wrapper)
+            if capture.response is not None:
+                _store_response(key, capture.response, rule)
+        finally:
+            _inflight.pop(flight_key, None)
+            future.set_result(capture.response)
+
+    async def _send_not_modified(self, send, etag: str):
+        stats["not_modified"] += 1
+        await send({"type": "http.response.start", "status": 304, "headers": _cache_headers(etag)})
+        await send({"type": "http.response.body", "body": b""})
+
+    def _refresh_in_background(self, scope, key: str, etag: str, versions: Versions, rule: CacheRule):
+        """클라이언트 연결과 무관하게 라우터를 한 번 실행해 새 응답을 저장합니다. (이미 갱신 중이면 생략)"""
+        flight_key = f"{key}|{etag}"
+        if flight_key in _inflight:
+            return
+        future = asyncio.get_running_loop().create_future()
+        _inflight[flight_key] = future
+        stats["background_refreshes"] += 1
+        # 조건부 요청 헤더가 남아 있으면 라우터가 아닌 이 미들웨어 기준으로만 의미가 있으므로 제거
+        refresh_scope = dict(scope, headers=[
+            (name, value) for name, value in scope.get("headers") or [] if name != b"if-none-match"
+        ])
+        capture = _ResponseCapture(etag, versions)
+        request_sent = False
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            capture.process(message)
+
+        async def refresh():
+            try:
+                await self.app(refresh_scope, receive, send)
+                if capture.response is not None:
+                    _store_response(key, capture.response, rule)
+            except Exception as e:
+                print(f"Response cache background refresh failed ({key}): {e}")
+            finally:
+                _inflight.pop(flight_key, None)
+                future.set_result(capture.response)
+
+        task = asyncio.get_running_loop().create_task(refresh())
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+
+def status() -> dict:
+    return {"enabled": RESPONSE_CACHE_ENABLED, **_responses.status(), **stats, "in_flight": len(_inflight)}
@@ -0,0 +1,147 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from models import Content, ContentStats, GuideProfile, GuideReview, GuideSummary, Review, User
+from services.pagination_service import InvalidCursorError, decode_cursor, encode_cursor, keyset_seek
+
+
+SORT_LATEST = "latest"
+SORT_RATING_DESC = "rating_desc"
+SORT_RATING_ASC = "rating_asc"
+REVIEW_SORTS = (SORT_LATEST, SORT_RATING_DESC, SORT_RATING_ASC)
+
+UNKNOWN_REVIEWER = "알 수 없음"
+
+
+@dataclass
+class ReviewPage:
+    """리뷰 피드 한 페이지 (items 는 ReviewSchema 에 맞춘 dict)"""
+    items: List[dict]
+    total: int
+    next_cursor: Optional[str]
+
+
+# ==================================================
+# 1. 정렬 / 커서
+# ==================================================
+
+def _sort_columns(model, sort: str):
+    """
+    (정렬 열 목록, 내림차순 여부). 모든 열이 같은 방향이라 (소유자 ID, ...) 인덱스 하나로 seek 합니다.
+    rating_asc 는 rating_desc 인덱스를 거꾸로 읽으므로 같은 평점 안에서는 오래된 순입니다.
+    """
+    if sort == SORT_LATEST:
+        return [model.created_at, model.id], True
+    if sort == SORT_RATING_DESC:
+        return [model.rating, model.created_at, model.id], True
+    return [model.rating, model.created_at, model.id], False
+
+
+def _cursor_kind(model, sort: str) -> str:
+    # 다른 피드/정렬의 커서를 넘기면 decode_cursor 가 거부하도록 테이블 이름과 정렬을 함께 담음
+    return f"{model.__tablename__}:{sort}"
+
+
+def _decode_values(cursor: str, kind: str, size: int) -> list:
+    values = decode_cursor(cursor, kind)
+    try:
+        if len(values) != size:
+            raise ValueError(f"expected {size} values")
+        *ratings, created_at, last_id = values
+        return [int(rating) for rating in ratings] + [datetime.fromisoformat(created_at), int(last_id)]
+    except Exception as e:
+        raise InvalidCursorError(f"malformed cursor values: {e}")
+
+
+# ==================================================
+# 2. 공통 페이지 조회
+# ==================================================
+
+def _review_page(db: Session, model, owner_condition, sort: str, per_page: int,
+                 page: int, cursor: Optional[str], total: int) -> ReviewPage:
+    """
+    cursor 가 있으면 마지막으로 본 리뷰의 정렬 키 다음부터 seek (깊이와 무관하게 일정 비용),
+    없으면 page 기준 OFFSET. 작성자 닉네임은 페이지의 리뷰를 읽은 뒤 한 번에 조회합니다.
+    """
+    columns, descending = _sort_columns(model, sort)
+    kind = _cursor_kind(model, sort)
+    query = db.query(model.id, model.reviewer_id, model.rating, model.text, model.created_at)\
+              .filter(owner_condition)\
+              .order_by(*[column.desc() if descending else column.asc() for column in columns])
+    if cursor:
+        query = query.filter(keyset_seek(columns, _decode_values(cursor, kind, len(columns)), descending))
+    else:
+        query = query.offset((page - 1) * per_page)
+
+    # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+    rows = query.limit(per_page + 1).all()
+    next_cursor = None
+    if len(rows) > per_page:
+        last = rows[per_page - 1]
+        values = [last.created_at, last.id] if sort == SORT_LATEST else [last.rating, last.created_at, last.id]
+        next_cursor = encode_cursor(kind, values)
+    rows = rows[:per_page]
+
+    reviewer_ids = {row.reviewer_id for row in rows}
+    nicknames = dict(db.query(User.id, User.nickname).filter(User.id.in_(reviewer_ids)).all()) if reviewer_ids else {}
+    items = [
+        {
+            "id": row.id,
+            "user": nicknames.get(row.reviewer_id) or UNKNOWN_REVIEWER,
+            "rating": float(row.rating),
+            "text": row.text,
+            "created_at": row.created_at,
+        }
+        for row in rows
+    ]
+    return ReviewPage(items=items, total=total, next_cursor=next_cursor)
+
+
+# ==================================================
+# 3. 피드별 진입점 (대상이 없으면 None)
+# ==================================================
+
+def content_review_page(db: Session, content_id: int, sort: str = SORT_LATEST, per_page: int = 10,
+                        page: int = 1, cursor: Optional[str] = None,
+                        total: Optional[int] = None) -> Optional[ReviewPage]:
+    """
+    Active 콘텐츠의 상품 리뷰. 전체 개수는 content_stats 에서 읽습니다. (행이 없으면 원본 COUNT)
+    total 을 넘기면 (캐시된 상세처럼 이미 확인한 콘텐츠) 콘텐츠/개수 조회를 건너뜁니다.
+    """
+    if total is not None:
+        return _review_page(db, Review, Review.content_id == content_id, sort, per_page, page, cursor, total)
+    row = db.query(Content.id, ContentStats.review_count)\
+            .outerjoin(ContentStats, ContentStats.content_id == Content.id)\
+            .filter(Content.id == content_id, Content.status == "Active")\
+            .first()
+    if row is None:
+        return None
+    total = row.review_count
+    if total is None:
+        total = db.query(func.count(Review.id)).filter(Review.content_id == content_id).scalar() or 0
+    return _review_page(db, Review, Review.content_id == content_id, sort, per_page, page, cursor, total)
+
+
+def guide_review_page(db: Session, guide_id: int, sort: str = SORT_LATEST, per_page: int = 10,
+                      page: int = 1, cursor: Optional[str] = None,
+                      total: Optional[int] = None) -> Optional[ReviewPage]:
+    """
+    가이드가 받은 리뷰 (GuideReview). 전체 개수는 guide_summary 에서 읽습니다. (행이 없으면 원본 COUNT)
+    total 을 넘기면 (프로필에서 이미 읽은 경우) 가이드/개수 조회를 건너뜁니다.
+    """
+    if total is not None:
+        return _review_page(db, GuideReview, GuideReview.guide_id == guide_id, sort, per_page, page, cursor, total)
+    row = db.query(GuideProfile.users_id, GuideSummary.review_count)\
+            .outerjoin(GuideSummary, GuideSummary.guide_id == GuideProfile.users_id)\
+            .filter(GuideProfile.users_id == guide_id)\
+            .first()
+    if row is None:
+        return None
+    total = row.review_count
+    if total is None:
+        total = db.query(func.count(GuideReview.id)).filter(GuideReview.guide_id == guide_id).scalar() or 0
+    return _review_page(db, GuideReview, GuideReview.guide_id == guide_id, sort, per_page, page, cursor, total)
@@ -0,0 +1,282 @@
+import os
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy.orm import Session
+
+from models import (
+    Content, GuideProfile, AiCharacter, ContentTag, Tag, Review, GuideReview, Booking
+)
+
+
+# --- Elasticsearch 설정 ---
+ES_URL = os.getenv("ELASTICSEARCH_URL", "http://localhost:9200")
+# 검색 API(get_content_list)가 조회하는 이름. 실제 인덱스가 아니라 버전 인덱스를 가리키는 alias 입니다.
+CONTENTS_ALIAS = "contents"
+# 리뷰 본문이 아주 긴 콘텐츠가 문서 크기를 키우지 않도록 잘라서 색인
+MAX_REVIEWS_TEXT_LENGTH = 20000
+# 전체 재색인에서 적재에 실패해도 alias 를 교체할 수 있는 최대 문서 수 (기본 0: 하나라도 실패하면 교체하지 않음)
+ES_REINDEX_MAX_FAILED = int(os.getenv("ES_REINDEX_MAX_FAILED", "0"))
+
+
+class ReindexAbortedError(Exception):
+    """적재 실패 문서가 허용치를 넘어 새 인덱스를 버리고 alias 를 그대로 둠"""
+
+    def __init__(self, index_name: str, indexed: int, failed: int, max_failed: int):
+        super().__init__(f"{failed} documents failed to index into '{index_name}' "
+                         f"({indexed} indexed, at most {max_failed} allowed)")
+        self.index_name = index_name
+        self.indexed = indexed
+        self.failed = failed
+
+# 한국어 형태소 분석 플러그인(nori) 없이도 동작하도록 내장 'cjk' 분석기(바이그램)를 사용합니다.
+CONTENTS_INDEX_BODY = {
+    "settings": {
+        "number_of_shards": 1,
+    },
+    "mappings": {
+        "dynamic": "strict",
+        "properties": {
+            "id": {"type": "integer"},
+            "title": {"type": "text", "analyzer": "cjk"},
+            "description": {"type": "text", "analyzer": "cjk"},
+            "all_tags": {"type": "keyword"},
+            "all_reviews_text": {"type": "text", "analyzer": "cjk"},
+            "location": {"type": "keyword"},
+            "style": {"type": "keyword"},
+            "price": {"type": "integer"},
+            "status": {"type": "keyword"},
+            "guide_id": {"type": "integer"},
+            "created_at": {"type": "date"},
+        },
+    },
+}
+
+
+def new_index_name() -> str:
+    """버전(타임스탬프)이 붙은 새 물리 인덱스 이름을 만듭니다. (예: contents_v20250101120000)"""
+    return f"{CONTENTS_ALIAS}_v{datetime.now().strftime('%Y%m%d%H%M%S')}"
+
+
+# ==================================================
+# 1. 문서(Document) 생성
+# ==================================================
+
+def content_rows_query(db: Session):
+    """색인 대상(Active) 콘텐츠와 가이드 대표 캐릭터(style)를 함께 조회하는 쿼리"""
+    return db.query(
+        Content.id,
+        Content.title,
+        Content.description,
+        Content.location,
+        Content.price,
+        Content.status,
+        Content.guide_id,
+        Content.created_at,
+        AiCharacter.name.label("style"),
+    ).outerjoin(
+        GuideProfile, Content.guide_id == GuideProfile.users_id
+    ).outerjoin(
+        AiCharacter, GuideProfile.ai_character_id_as_guide == AiCharacter.id
+    ).filter(
+        Content.status == "Active"
+    )
+
+
+def load_content_tags(db: Session, content_ids: List[int]) -> Dict[int, List[str]]:
+    """콘텐츠 ID 목록의 태그 이름을 한 번의 쿼리로 조회합니다. (content_id -> [tag name])"""
+    rows = db.query(ContentTag.contents_id, Tag.name)\
+             .join(Tag, ContentTag.tag_id == Tag.id)\
+             .filter(ContentTag.contents_id.in_(content_ids))\
+             .all()
+    tags = defaultdict(list)
+    for content_id, name in rows:
+        tags[content_id].append(name)
+    return tags
+
+
+def load_all_active_content_tags(db: Session) -> Dict[int, List[str]]:
+    """전체 Active 콘텐츠의 태그를 스트리밍으로 조회합니다. (메모리 인덱스 전체 빌드용)"""
+    tags = defaultdict(list)
+    rows = db.query(ContentTag.contents_id, Tag.name)\
+             .join(Tag, ContentTag.tag_id == Tag.id)\
+             .join(Content, ContentTag.contents_id == Content.id)\
+             .filter(Content.status == "Active")\
+             .yield_per(5000)
+    for content_id, name in rows:
+        tags[content_id].append(name)
+    return tags
+
+
+def load_reviews_text(db: Session, content_ids: List[int]) -> Dict[int, str]:
+    """상품 리뷰(Review)와 가이드 리뷰(GuideReview) 본문을 콘텐츠별로 이어 붙입니다."""
+    texts = defaultdict(list)
+    for ReviewModel in (Review, GuideReview):
+        rows = db.query(Booking.content_id, ReviewModel.text)\
+                 .join(Booking, ReviewModel.booking_id == Booking.id)\
+                 .filter(Booking.content_id.in_(content_ids))\
+                 .all()
+        for content_id, text in rows:
+            if text:
+                texts[content_id].append(text)
+    return {cid: "\n".join(parts)[:MAX_REVIEWS_TEXT_LENGTH] for cid, parts in texts.items()}
+
+
+def _to_document(row, tags: List[str], reviews_text: str) -> dict:
+    return {
+        "id": row.id,
+        "title": row.title,
+        "description": row.description or "",
+        "all_tags": tags,
+        "all_reviews_text": reviews_text,
+        "location": row.location,
+        "style": row.style,
+        "price": row.price,
+        "status": row.status,
+        "guide_id": row.guide_id,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+    }
+
+
+def build_documents(db: Session, rows: list) -> List[dict]:
+    """콘텐츠 행 묶음(batch)에 태그/리뷰를 일괄 조회(2~3회 쿼리)하여 ES 문서 목록을 만듭니다."""
+    if not rows:
+        return []
+    content_ids = [row.id for row in rows]
+    tags = load_content_tags(db, content_ids)
+    reviews_text = load_reviews_text(db, content_ids)
+    return [
+        _to_document(row, tags.get(row.id, []), reviews_text.get(row.id, ""))
+        for row in rows
+    ]
+
+
+def build_documents_for_ids(db: Session, content_ids: List[int]) -> List[dict]:
+    """지정한 콘텐츠들의 최신 문서를 만듭니다. (Active 가 아닌 콘텐츠는 결과에서 빠짐)"""
+    if not content_ids:
+        return []
+    rows = content_rows_query(db).filter(Content.id.in_(content_ids)).all()
+    return build_documents(db, rows)
+
+
+def iter_all_documents(stream_db: Session, lookup_db: Session, batch_size: int = 1000) -> Iterator[dict]:
+    """
+    전체 Active 콘텐츠를 서버 사이드 커서로 스트리밍하며 ES 문서를 생성합니다.
+    MySQL 은 스트리밍 중인 연결에서 다른 쿼리를 실행할 수 없으므로
+    태그/리뷰 조회는 별도 세션(lookup_db)을 사용합니다.
+    """
+    batch = []
+    query = content_rows_query(stream_db).order_by(Content.id).yield_per(batch_size)
+    for row in query:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield from build_documents(lookup_db, batch)
+            batch = []
+    if batch:
+        yield from build_documents(lookup_db, batch)
+
+
+# ==================================================
+# 2. 인덱스 생성 / alias 교체
+# ==================================================
+
+def _bulk_actions(index_name: str, documents: Iterator[dict]) -> Iterator[dict]:
+    for doc in documents:
+        yield {"_op_type": "index", "_index": index_name, "_id": doc["id"], "_source": doc}
+
+
+def create_versioned_index(es, index_name: str):
+    """대량 적재에 맞춰 refresh/replica 를 끈 상태로 새 인덱스를 생성합니다."""
+    settings = dict(CONTENTS_INDEX_BODY["settings"])
+    settings.update({"refresh_interval": "-1", "number_of_replicas": 0})
+    es.indices.create(index=index_name, settings=settings, mappings=CONTENTS_INDEX_BODY["mappings"])
+
+
+def finalize_index(es, index_name: str, replicas: int = 1):
+    """적재가 끝난 인덱스의 refresh/replica 설정을 원래대로 되돌리고 검색 가능하게 만듭니다."""
+    es.indices.put_settings(
+        index=index_name,
+        settings={"refresh_interval": "1s", "number_of_replicas": replicas},
+    )
+    es.indices.refresh(index=index_name)
+
+
+def current_alias_targets(es) -> List[str]:
+    """현재 alias 가 가리키는 물리 인덱스 이름 목록 (없으면 빈 목록)"""
+    if not es.indices.exists_alias(name=CONTENTS_ALIAS):
+        return []
+    return list(es.indices.get_alias(name=CONTENTS_ALIAS).keys())
+
+
+def swap_alias(es, new_index: str) -> List[str]:
+    """
+    alias 를 새 인덱스로 원자적으로 교체하고, 이전에 가리키던 인덱스 목록을 반환합니다.
+    alias 이름과 같은 '실제 인덱스'(예전 수동 생성분)가 있으면 같은 요청 안에서 제거합니다.
+    """
+    old_indices = current_alias_targets(es)
+    actions = [{"remove": {"index": idx, "alias": CONTENTS_ALIAS}} for idx in old_indices]
+    if not old_indices and es.indices.exists(index=CONTENTS_ALIAS):
+        actions.append({"remove_index": {"index": CONTENTS_ALIAS}})
+    actions.append({"add": {"index": new_index, "alias": CONTENTS_ALIAS}})
+    es.indices.update_aliases(actions=actions)
+    return old_indices
+
+
+def reindex_all(
+    es,
+    stream_db: Session,
+    lookup_db: Session,
+    batch_size: int = 1000,
+    replicas: int = 1,
+    keep_old: bool = False,
+    index_name: Optional[str] = None,
+    max_failed: Optional[int] = None,
+    documents: Optional[Iterable[dict]] = None,
+) -> dict:
+    """
+    전체 재색인: 새 버전 인덱스 생성 -> bulk 적재 -> alias 교체 -> (옵션) 이전 인덱스 삭제.
+    검색은 교체 직전까지 기존 인덱스를 사용하므로 중단 시간이 없습니다.
+    적재 실패 문서가 max_failed(기본 ES_REINDEX_MAX_FAILED)를 넘으면 불완전한 새 인덱스를 삭제하고
+    ReindexAbortedError 를 발생시킵니다. (alias 와 이전 인덱스는 그대로)
+    documents 를 주면 DB 대신 그 문서들을 적재합니다. (benchmarks/bench_es_reindex.py 의 가짜 ES 검증용)
+    """
+    from elasticsearch.helpers import streaming_bulk
+
+    index_name = index_name or new_index_name()
+    create_versioned_index(es, index_name)
+
+    indexed, failed = 0, 0
+    try:
+        if documents is None:
+            documents = iter_all_documents(stream_db, lookup_db, batch_size=batch_size)
+        for ok, item in streaming_bulk(
+            es,
+            _bulk_actions(index_name, documents),
+            chunk_size=batch_size,
+            raise_on_error=False,
+            max_retries=3,
+        ):
+            if ok:
+                indexed += 1
+            else:
+                failed += 1
+                print(f"   ⚠️ Failed to index document: {item}")
+    except Exception:
+        # 적재 도중 실패하면 반쯤 채워진 인덱스를 남기지 않음 (alias 는 그대로 유지)
+        es.indices.delete(index=index_name, ignore_unavailable=True)
+        raise
+
+    max_failed = ES_REINDEX_MAX_FAILED if max_failed is None else max_failed
+    if failed > max_failed:
+        es.indices.delete(index=index_name, ignore_unavailable=True)
+        raise ReindexAbortedError(index_name, indexed, failed, max_failed)
+
+    finalize_index(es, index_name, replicas=replicas)
+    old_indices = swap_alias(es, index_name)
+
+    if not keep_old:
+        for old in old_indices:
+            es.indices.delete(index=old, ignore_unavailable=True)
+
+    return {"index": index_name, "indexed": indexed, "failed": failed, "previous": old_indices}
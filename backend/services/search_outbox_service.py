@@ -0,0 +1,141 @@
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Set
+
+from sqlalchemy.orm import Session
+
+from models import SearchOutbox, Content
+from services.search_index_service import CONTENTS_ALIAS, build_documents_for_ids
+
+
+# 이벤트 사유(reason)별로 ES 문서에서 다시 써야 하는 필드 목록
+# (None 이면 문서 전체를 갱신)
+REASON_FIELDS = {
+    "content": None,
+    "review": ["all_reviews_text"],
+    "tags": ["all_tags"],
+    "guide": ["style"],
+}
+
+
+# ==================================================
+# 1. 쓰기 측 (Writer) - 호출자의 트랜잭션 안에서 실행, commit 하지 않음
+# ==================================================
+
+def enqueue_content_sync(db: Session, content_ids: Iterable[int], reason: str):
+    """
+    콘텐츠 변경 이벤트를 outbox 에 추가합니다.
+    호출자가 본 변경과 같은 트랜잭션에서 commit 해야 '변경은 됐는데 이벤트는 없는' 상태가 생기지 않습니다.
+    """
+    if reason not in REASON_FIELDS:
+        raise ValueError(f"Unknown outbox reason: {reason}")
+    unique_ids = sorted({cid for cid in content_ids if cid is not None})
+    if unique_ids:
+        db.add_all([SearchOutbox(content_id=cid, reason=reason) for cid in unique_ids])
+
+
+def enqueue_guide_contents_sync(db: Session, guide_ids: Iterable[int], reason: str = "guide"):
+    """가이드 정보(대표 캐릭터 등)가 바뀌었을 때, 해당 가이드의 모든 콘텐츠 이벤트를 추가합니다."""
+    guide_ids = list({gid for gid in guide_ids if gid is not None})
+    if not guide_ids:
+        return
+    content_ids = [row[0] for row in db.query(Content.id).filter(Content.guide_id.in_(guide_ids)).all()]
+    enqueue_content_sync(db, content_ids, reason)
+
+
+# ==================================================
+# 2. 읽기 측 (Worker)
+# ==================================================
+
+def fetch_pending_events(db: Session, limit: int) -> List[SearchOutbox]:
+    """
+    미처리 이벤트를 id 순으로 가져옵니다.
+    SKIP LOCKED 로 다른 워커가 처리 중인 행은 건너뛰므로 워커를 여러 개 띄워도 안전합니다.
+    """
+    return db.query(SearchOutbox)\
+             .filter(SearchOutbox.processed_at.is_(None))\
+             .order_by(SearchOutbox.id)\
+             .limit(limit)\
+             .with_for_update(skip_locked=True)\
+             .all()
+
+
+def _fields_by_content(events: List[SearchOutbox]) -> Dict[int, Set[str]]:
+    """이벤트 목록을 콘텐츠별 '갱신할 필드 집합'으로 합칩니다. (빈 집합 = 전체 갱신)"""
+    merged: Dict[int, Set[str]] = {}
+    full_update = set()
+    for event in events:
+        fields = REASON_FIELDS.get(event.reason)
+        if fields is None:
+            full_update.add(event.content_id)
+        merged.setdefault(event.content_id, set()).update(fields or [])
+    for cid in full_update:
+        merged[cid] = set()
+    return merged
+
+
+def build_sync_actions(db: Session, events: List[SearchOutbox]) -> List[dict]:
+    """
+    이벤트를 ES bulk 액션으로 변환합니다.
+    - Active 콘텐츠: 바뀐 필드만 담은 partial update (문서가 없으면 전체 문서로 upsert)
+    - 비활성/삭제된 콘텐츠: delete
+    """
+    fields_by_content = _fields_by_content(events)
+    documents = {doc["id"]: doc for doc in build_documents_for_ids(db, list(fields_by_content))}
+
+    actions = []
+    for content_id, fields in fields_by_content.items():
+        doc = documents.get(content_id)
+        if doc is None:
+            actions.append({"_op_type": "delete", "_index": CONTENTS_ALIAS, "_id": content_id})
+            continue
+        partial = {f: doc[f] for f in fields} if fields else doc
+        actions.append({
+            "_op_type": "update",
+            "_index": CONTENTS_ALIAS,
+            "_id": content_id,
+            "doc": partial,
+            "upsert": doc,
+        })
+    return actions
+
+
+def mark_processed(db: Session, events: List[SearchOutbox]):
+    now = datetime.now()
+    for event in events:
+        event.processed_at = now
+
+
+def purge_processed_events(db: Session, retention: timedelta) -> int:
+    """처리 완료 후 retention 이 지난 이벤트를 삭제합니다. (호출자가 commit)"""
+    cutoff = datetime.now() - retention
+    return db.query(SearchOutbox)\
+             .filter(SearchOutbox.processed_at.isnot(None), SearchOutbox.processed_at < cutoff)\
+             .delete(synchronize_session=False)
+
+
+def sync_pending_batch(es, db: Session, batch_size: int = 500) -> int:
+    """
+    미처리 이벤트 한 묶음을 ES 에 반영하고 처리 완료로 표시합니다.
+    ES 반영에 실패하면 예외를 그대로 올리며, 호출자가 rollback 하면 이벤트는 다시 미처리 상태가 됩니다.
+    반환값: 처리한 이벤트 수
+    """
+    from elasticsearch.helpers import bulk
+
+    events = fetch_pending_events(db, batch_size)
+    if not events:
+        return 0
+
+    actions = build_sync_actions(db, events)
+    _, errors = bulk(es, actions, raise_on_error=False)
+
+    # 이미 없는 문서를 delete 한 경우(404)는 정상으로 간주
+    real_errors = [
+        e for e in errors
+        if not ("delete" in e and e["delete"].get("status") == 404)
+    ]
+    if real_errors:
+        raise RuntimeError(f"{len(real_errors)} bulk actions failed, first: {real_errors[0]}")
+
+    mark_processed(db, events)
+    db.commit()
+    return len(events)
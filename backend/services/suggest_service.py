@@ -0,0 +1,257 @@
+import bisect
+import heapq
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from models import Booking, Content
+from services.memory_index_service import MemoryIndexHolder
+from services.search_index_service import content_rows_query, load_content_tags, load_all_active_content_tags
+
+
+# 예약 수는 change feed 로 전달되지 않으므로 이 주기(초)마다 전체 재빌드하여 인기도를 반영
+SUGGEST_REBUILD_SECONDS = float(os.getenv("SUGGEST_REBUILD_SECONDS", "600"))
+# 접두어별 결과 캐시 크기 (한 글자 접두어는 후보가 많으므로 빌드 시 미리 계산해 둠)
+SUGGEST_CACHE_MAX_ENTRIES = 8192
+SUGGEST_DEFAULT_LIMIT = 10
+# 접두어 범위의 끝을 찾기 위한 최대 코드 포인트
+_MAX_CHAR = "\U0010ffff"
+# 인기도 집계에서 제외하는 예약 상태
+EXCLUDED_BOOKING_STATUSES = ("Canceled", "Rejected")
+
+# 자동완성 항목 종류
+KIND_CONTENT = "content"
+KIND_TAG = "tag"
+KIND_LOCATION = "location"
+KIND_STYLE = "style"
+SUGGEST_KINDS = (KIND_CONTENT, KIND_TAG, KIND_LOCATION, KIND_STYLE)
+
+
+def normalize(text: Optional[str]) -> str:
+    return " ".join((text or "").lower().split())
+
+
+def _search_keys(text: str) -> Set[str]:
+    """전체 문자열 + 각 단어로 시작하는 뒷부분 (예: '부산 광안리 요트' -> '광안리 요트' 로도 찾음)"""
+    words = normalize(text).split(" ")
+    return {" ".join(words[i:]) for i in range(len(words)) if words[i]}
+
+
+@dataclass
+class ContentEntry:
+    title: str
+    location: Optional[str]
+    style: Optional[str]
+    tags: FrozenSet[str]
+    weight: int # 예약 수 + 1 (예약이 없어도 후보에 오르도록)
+
+
+@dataclass
+class Suggestion:
+    text: str
+    kind: str
+    weight: int
+    content_id: Optional[int] = None
+
+
+class SuggestIndex:
+    """
+    정렬된 (검색 키, 종류, 식별자) 배열 + bisect 로 접두어 범위를 찾고, 인기도 상위 k 개를 고릅니다.
+    - 콘텐츠 제목: 식별자 = 콘텐츠 ID, 가중치 = 해당 콘텐츠 예약 수
+    - 태그/지역/스타일: 식별자 = 이름, 가중치 = 해당 값을 가진 콘텐츠들의 가중치 합
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.contents: Dict[int, ContentEntry] = {}
+        self.weights: Dict[Tuple[str, object], int] = {}
+        self._keys: List[Tuple[str, str, object]] = []
+        self._cache: Dict[tuple, List[Suggestion]] = {}
+        self._stale_chars: Set[str] = set()
+
+    def __len__(self):
+        return len(self.weights)
+
+    # --- 항목 추가/제거 (호출 측에서 lock 보유) ---
+
+    def _add_weight(self, kind: str, ident, text: str, delta: int):
+        entry = (kind, ident)
+        keys = _search_keys(text)
+        weight = self.weights.get(entry, 0) + delta
+        if weight > 0:
+            if entry not in self.weights:
+                for key in keys:
+                    bisect.insort(self._keys, (key, kind, ident))
+            self.weights[entry] = weight
+        elif entry in self.weights:
+            del self.weights[entry]
+            for key in keys:
+                position = bisect.bisect_left(self._keys, (key, kind, ident))
+                if position < len(self._keys) and self._keys[position] == (key, kind, ident):
+                    del self._keys[position]
+        self._invalidate(keys)
+
+    def _invalidate(self, keys: Set[str]):
+        """바뀐 키의 접두어에 해당하는 캐시 항목만 지웁니다. (다른 접두어의 캐시는 유지)"""
+        for cache_key in [ck for ck in self._cache if any(key.startswith(ck[0]) for key in keys)]:
+            del self._cache[cache_key]
+        self._stale_chars.update(key[0] for key in keys)
+
+    def rewarm(self):
+        """변경으로 지워진 한 글자 접두어 결과를 (요청 대신) 갱신 스레드에서 다시 계산합니다."""
+        with self._lock:
+            stale, self._stale_chars = self._stale_chars, set()
+            for first_char in stale:
+                self.suggest(first_char)
+
+    def _apply(self, content_id: int, entry: ContentEntry, sign: int):
+        delta = sign * entry.weight
+        self._add_weight(KIND_CONTENT, content_id, entry.title, delta)
+        if entry.location:
+            self._add_weight(KIND_LOCATION, entry.location, entry.location, delta)
+        if entry.style:
+            self._add_weight(KIND_STYLE, entry.style, entry.style, delta)
+        for name in entry.tags:
+            self._add_weight(KIND_TAG, name, name, delta)
+
+    def set_content(self, content_id: int, title: str, location: Optional[str], style: Optional[str],
+                    tags: Iterable[str], bookings: int = 0, rewarm: bool = True):
+        entry = ContentEntry(title or "", location, style, frozenset(tags or []), bookings + 1)
+        with self._lock:
+            self._remove(content_id)
+            self.contents[content_id] = entry
+            self._apply(content_id, entry, +1)
+            if rewarm:
+                self.rewarm()
+
+    def remove(self, content_id: int, rewarm: bool = True):
+        with self._lock:
+            self._remove(content_id)
+            if rewarm:
+                self.rewarm()
+
+    def _remove(self, content_id: int):
+        entry = self.contents.pop(content_id, None)
+        if entry is not None:
+            self._apply(content_id, entry, -1)
+
+    def load(self, entries: Iterable[Tuple[int, ContentEntry]]):
+        """전체 빌드용: 가중치를 모두 합산한 뒤 키 배열을 한 번에 정렬합니다. (insort 반복보다 빠름)"""
+        with self._lock:
+            for content_id, entry in entries:
+                self.contents[content_id] = entry
+                targets = [(KIND_CONTENT, content_id)]
+                if entry.location:
+                    targets.append((KIND_LOCATION, entry.location))
+                if entry.style:
+                    targets.append((KIND_STYLE, entry.style))
+                targets.extend((KIND_TAG, name) for name in entry.tags)
+                for target in targets:
+                    self.weights[target] = self.weights.get(target, 0) + entry.weight
+            self._keys = sorted(
+                (key, kind, ident)
+                for (kind, ident) in self.weights
+                for key in _search_keys(self._display((kind, ident)))
+            )
+            self._cache.clear()
+            self._stale_chars.clear()
+            # 한 글자 접두어는 범위가 넓으므로 미리 계산 (첫 키 입력도 캐시에서 응답)
+            for first_char in sorted({key[0] for key, _, _ in self._keys}):
+                self.suggest(first_char)
+
+    # --- 조회 ---
+
+    def suggest(self, prefix: str, limit: int = SUGGEST_DEFAULT_LIMIT, kinds: Optional[Iterable[str]] = None) -> List[Suggestion]:
+        """접두어로 시작하는 항목 중 가중치 상위 limit 개 (동점은 짧은 문자열 우선)"""
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        kinds = frozenset(kinds) if kinds else frozenset(SUGGEST_KINDS)
+        cache_key = (prefix, limit, kinds)
+        with self._lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            start = bisect.bisect_left(self._keys, (prefix,))
+            end = bisect.bisect_left(self._keys, (prefix + _MAX_CHAR,), start)
+            matched = {(kind, ident) for _, kind, ident in self._keys[start:end] if kind in kinds}
+
+            top = heapq.nsmallest(
+                limit, matched,
+                key=lambda entry: (-self.weights[entry], len(self._display(entry)), self._display(entry)),
+            )
+            results = [
+                Suggestion(
+                    text=self._display(entry),
+                    kind=entry[0],
+                    weight=self.weights[entry],
+                    content_id=entry[1] if entry[0] == KIND_CONTENT else None,
+                )
+                for entry in top
+            ]
+            if len(self._cache) >= SUGGEST_CACHE_MAX_ENTRIES:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[cache_key] = results
+            return results
+
+    def _display(self, entry: Tuple[str, object]) -> str:
+        kind, ident = entry
+        return self.contents[ident].title if kind == KIND_CONTENT else ident
+
+
+# ==================================================
+# 빌드 / 부분 갱신 (change feed)
+# ==================================================
+
+def _booking_counts(db: Session, content_ids: Optional[List[int]] = None) -> Dict[int, int]:
+    query = db.query(Booking.content_id, func.count(Booking.id))\
+              .filter(Booking.status.notin_(EXCLUDED_BOOKING_STATUSES))
+    if content_ids is not None:
+        query = query.filter(Booking.content_id.in_(content_ids))
+    return dict(query.group_by(Booking.content_id).all())
+
+
+def build_suggest_index(db: Session) -> SuggestIndex:
+    """전체 Active 콘텐츠의 제목/태그/지역/스타일과 예약 수로 새 인덱스를 만듭니다."""
+    index = SuggestIndex()
+    rows = content_rows_query(db).all()
+    tags = load_all_active_content_tags(db)
+    bookings = _booking_counts(db)
+    index.load(
+        (row.id, ContentEntry(row.title or "", row.location, row.style,
+                              frozenset(tags.get(row.id, [])), bookings.get(row.id, 0) + 1))
+        for row in rows
+    )
+    return index
+
+
+def refresh_suggest_index(db: Session, index: SuggestIndex, content_ids: Set[int]):
+    """변경된 콘텐츠만 다시 읽어 갱신합니다. (비활성/삭제된 콘텐츠는 제거)"""
+    ids = list(content_ids)
+    rows = content_rows_query(db).filter(Content.id.in_(ids)).all()
+    tags = load_content_tags(db, ids)
+    bookings = _booking_counts(db, ids)
+    for row in rows:
+        index.set_content(row.id, row.title, row.location, row.style, tags.get(row.id, []),
+                          bookings.get(row.id, 0), rewarm=False)
+    for missing_id in content_ids - {row.id for row in rows}:
+        index.remove(missing_id, rewarm=False)
+    index.rewarm()
+
+
+suggest_index = MemoryIndexHolder(
+    "suggest_prefix", build_suggest_index, refresh_suggest_index, rebuild_interval=SUGGEST_REBUILD_SECONDS
+)
+
+
+def suggest(prefix: str, limit: int = SUGGEST_DEFAULT_LIMIT, kinds: Optional[Iterable[str]] = None) -> Optional[List[Suggestion]]:
+    """자동완성 후보를 반환합니다. 인덱스가 아직 준비되지 않았으면 None."""
+    index = suggest_index.index
+    if index is None:
+        return None
+    return index.suggest(prefix, limit, kinds)
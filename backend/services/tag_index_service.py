@@ -0,0 +1,206 @@
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+from sqlalchemy import and_, false, select
+from sqlalchemy.orm import Session
+
+from models import Content, ContentTag, Tag
+from services.memory_index_service import MemoryIndexHolder
+from services.search_index_service import load_content_tags, load_all_active_content_tags
+
+
+# 태그 조합 결과가 이 개수 이하이면 ID 목록을 IN (...) 으로 직접 넘기고,
+# 더 많으면 (긴 IN 목록 대신) 서브쿼리 조건으로 DB 에 맡깁니다.
+TAG_INDEX_MAX_IN_IDS = int(os.getenv("TAG_INDEX_MAX_IN_IDS", "5000"))
+
+# 바이트 값 -> 켜진 비트 위치 (비트맵을 ID 목록으로 풀 때 사용)
+_BYTE_BITS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+
+
+def _split(value: Optional[str]) -> List[str]:
+    return sorted({t.strip() for t in (value or "").split(",") if t.strip()})
+
+
+@dataclass
+class TagFilter:
+    """
+    태그 조건 조합
+    - any_of: 하나라도 가진 콘텐츠 (OR, 기존 tags 파라미터)
+    - all_of: 모두 가진 콘텐츠 (AND)
+    - none_of: 하나도 갖지 않은 콘텐츠 (NOT)
+    """
+    any_of: List[str] = field(default_factory=list)
+    all_of: List[str] = field(default_factory=list)
+    none_of: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_params(cls, tags: Optional[str], tags_all: Optional[str] = None,
+                    tags_not: Optional[str] = None) -> "TagFilter":
+        """쉼표로 구분된 쿼리 파라미터 문자열로부터 만듭니다. (공백/중복/순서 정규화)"""
+        return cls(any_of=_split(tags), all_of=_split(tags_all), none_of=_split(tags_not))
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.any_of or self.all_of or self.none_of)
+
+    def signature(self) -> tuple:
+        """count 캐시 키 등에 쓰는 정규화된 튜플"""
+        return (tuple(self.any_of), tuple(self.all_of), tuple(self.none_of))
+
+    def matches(self, tags: FrozenSet[str]) -> bool:
+        """콘텐츠 한 건의 태그 집합이 조건을 만족하는지 검사합니다."""
+        if self.any_of and tags.isdisjoint(self.any_of):
+            return False
+        if self.all_of and not tags.issuperset(self.all_of):
+            return False
+        if self.none_of and not tags.isdisjoint(self.none_of):
+            return False
+        return True
+
+
+class TagBitmapIndex:
+    """
+    태그 이름 -> Active 콘텐츠 ID 비트맵 (파이썬 int 를 비트셋으로 사용)
+    콘텐츠 ID 는 AUTO_INCREMENT 로 촘촘하므로 콘텐츠 10만 건이어도 태그당 약 12KB 이며,
+    AND/OR/NOT 조합은 정수 비트 연산(&, |, & ~) 한 번으로 계산됩니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.bitmaps: Dict[str, int] = {}
+        self.active = 0 # 전체 Active 콘텐츠 (NOT 연산의 기준 집합)
+        self.tags_of: Dict[int, FrozenSet[str]] = {}
+
+    def __len__(self):
+        return len(self.tags_of)
+
+    def set_content(self, content_id: int, tags: Iterable[str]):
+        """콘텐츠의 태그 목록을 (교체) 등록합니다."""
+        tags = frozenset(tags or [])
+        bit = 1 << content_id
+        with self._lock:
+            self._remove(content_id)
+            for name in tags:
+                self.bitmaps[name] = self.bitmaps.get(name, 0) | bit
+            self.active |= bit
+            self.tags_of[content_id] = tags
+
+    def remove(self, content_id: int):
+        with self._lock:
+            self._remove(content_id)
+
+    def _remove(self, content_id: int):
+        tags = self.tags_of.pop(content_id, None)
+        if tags is None:
+            return
+        mask = ~(1 << content_id)
+        for name in tags:
+            remaining = self.bitmaps.get(name, 0) & mask
+            if remaining:
+                self.bitmaps[name] = remaining
+            else:
+                self.bitmaps.pop(name, None)
+        self.active &= mask
+
+    def resolve(self, tag_filter: TagFilter) -> int:
+        """태그 조건을 만족하는 콘텐츠 비트맵을 계산합니다."""
+        with self._lock:
+            result = self.active
+            if tag_filter.any_of:
+                union = 0
+                for name in tag_filter.any_of:
+                    union |= self.bitmaps.get(name, 0)
+                result &= union
+            for name in tag_filter.all_of:
+                result &= self.bitmaps.get(name, 0)
+                if not result:
+                    return 0
+            for name in tag_filter.none_of:
+                result &= ~self.bitmaps.get(name, 0)
+            return result
+
+    def count(self, name: str) -> int:
+        return self.bitmaps.get(name, 0).bit_count()
+
+
+def bitmap_to_ids(bitmap: int) -> List[int]:
+    """비트맵을 오름차순 ID 목록으로 풉니다. (바이트 단위로 훑어 O(최대ID/8 + 결과 수))"""
+    if bitmap <= 0:
+        return []
+    ids = []
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    for offset, value in enumerate(data):
+        if value:
+            base = offset * 8
+            ids.extend(base + bit for bit in _BYTE_BITS[value])
+    return ids
+
+
+# ==================================================
+# 빌드 / 부분 갱신 (change feed)
+# ==================================================
+
+def build_tag_index(db: Session) -> TagBitmapIndex:
+    """전체 Active 콘텐츠의 태그로 새 인덱스를 만듭니다. (태그 없는 콘텐츠도 NOT 연산을 위해 등록)"""
+    index = TagBitmapIndex()
+    tags = load_all_active_content_tags(db)
+    for (content_id,) in db.query(Content.id).filter(Content.status == "Active").yield_per(5000):
+        index.set_content(content_id, tags.get(content_id, []))
+    return index
+
+
+def refresh_tag_index(db: Session, index: TagBitmapIndex, content_ids: Set[int]):
+    """변경된 콘텐츠의 태그만 다시 읽어 갱신합니다. (비활성/삭제된 콘텐츠는 제거)"""
+    ids = list(content_ids)
+    active_ids = {row.id for row in db.query(Content.id).filter(Content.id.in_(ids), Content.status == "Active")}
+    tags = load_content_tags(db, list(active_ids)) if active_ids else {}
+    for content_id in active_ids:
+        index.set_content(content_id, tags.get(content_id, []))
+    for missing_id in content_ids - active_ids:
+        index.remove(missing_id)
+
+
+tag_index = MemoryIndexHolder("tag_bitmap", build_tag_index, refresh_tag_index)
+
+
+# ==================================================
+# 목록/검색 쿼리 조건
+# ==================================================
+
+def _tagged_with(names: List[str]):
+    """주어진 태그 중 하나라도 가진 콘텐츠 ID 서브쿼리"""
+    return select(ContentTag.contents_id)\
+        .join(Tag, ContentTag.tag_id == Tag.id)\
+        .where(Tag.name.in_(names))
+
+
+def sql_tag_conditions(tag_filter: TagFilter) -> list:
+    """인덱스 없이 DB 에서 평가하는 조건 (모두 IN/NOT IN 서브쿼리라 행이 늘지 않아 DISTINCT 불필요)"""
+    conditions = []
+    if tag_filter.any_of:
+        conditions.append(Content.id.in_(_tagged_with(tag_filter.any_of)))
+    for name in tag_filter.all_of:
+        conditions.append(Content.id.in_(_tagged_with([name])))
+    if tag_filter.none_of:
+        conditions.append(Content.id.notin_(_tagged_with(tag_filter.none_of)))
+    return conditions
+
+
+def content_id_condition(tag_filter: TagFilter):
+    """
+    목록/검색 쿼리에 붙일 태그 조건을 만듭니다. 조건이 없으면 None.
+    메모리 인덱스가 준비되어 있고 결과가 작으면 Content.id IN (ID 목록) 으로,
+    그렇지 않으면 서브쿼리 조건으로 처리합니다.
+    """
+    if tag_filter.is_empty:
+        return None
+    index = tag_index.index
+    if index is not None:
+        bitmap = index.resolve(tag_filter)
+        if not bitmap:
+            return false()
+        if bitmap.bit_count() <= TAG_INDEX_MAX_IN_IDS:
+            return Content.id.in_(bitmap_to_ids(bitmap))
+    return and_(*sql_tag_conditions(tag_filter))
@@ -0,0 +1,225 @@
+import math
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from models import Content
+from services.memory_index_service import MemoryIndexHolder
+from services.pagination_service import SearchPage, paginate_ranked
+from services.search_index_service import content_rows_query, load_content_tags, load_all_active_content_tags
+from services.tag_index_service import TagFilter
+
+
+# 한국어는 띄어쓰기/조사 때문에 단어 단위 매칭이 잘 안 되므로 '글자 바이그램' 단위로 색인합니다.
+# (예: "해운대투어" -> 해운, 운대, 대투, 투어) 한 글자 검색어용으로 문서에는 글자 유니그램도 함께 색인합니다.
+_TOKEN_SPLIT = re.compile(r"[^\w]+")
+# 필드별 가중치 (ES 검색의 boost 와 같은 순서: 제목 > 태그 > 설명)
+FIELD_WEIGHTS = {"title": 3, "tags": 2, "description": 1}
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+# 메모리 검색 경로 커서의 종류 표시
+MEMORY_CURSOR_KIND = "bm25"
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """텍스트를 소문자화하고 단어별 글자 바이그램 목록으로 만듭니다. (한 글자 단어는 그대로)"""
+    grams = []
+    for word in _TOKEN_SPLIT.split((text or "").lower()):
+        if not word:
+            continue
+        if len(word) == 1:
+            grams.append(word)
+        else:
+            grams.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return grams
+
+
+def unigrams(text: Optional[str]) -> List[str]:
+    """
+    두 글자 이상 단어의 글자 유니그램. 한 글자 검색어("섬", "산")가 "제주섬투어" 같은 긴 단어 안에서도
+    맞도록 문서 쪽에만 함께 색인합니다. (검색어 쪽은 tokenize 그대로 -> 두 글자 이상 검색어는 바이그램으로만 매칭)
+    """
+    return [char for word in _TOKEN_SPLIT.split((text or "").lower()) if len(word) > 1 for char in word]
+
+
+@dataclass
+class IndexedDoc:
+    location: Optional[str]
+    style: Optional[str]
+    tags: FrozenSet[str]
+    length: int
+    terms: Tuple[str, ...]
+
+
+class BigramIndex:
+    """콘텐츠 제목/설명/태그에 대한 바이그램 역색인 + BM25 점수 계산"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.docs: Dict[int, IndexedDoc] = {}
+        self.total_length = 0
+
+    def __len__(self):
+        return len(self.docs)
+
+    def add(self, content_id: int, title: str, description: str, tags: Iterable[str],
+            location: Optional[str] = None, style: Optional[str] = None):
+        tags = frozenset(tags or [])
+        tf = Counter()
+        length = 0
+        for field, text in (("title", title), ("description", description), ("tags", " ".join(tags))):
+            weight = FIELD_WEIGHTS[field]
+            for gram in tokenize(text):
+                tf[gram] += weight
+                length += weight
+            # 유니그램은 문서 길이에 넣지 않음 (바이그램 검색의 BM25 길이 정규화가 그대로 유지되도록)
+            for char in unigrams(text):
+                tf[char] += weight
+
+        with self._lock:
+            self._remove(content_id)
+            for gram, freq in tf.items():
+                self.postings.setdefault(gram, {})[content_id] = freq
+            self.docs[content_id] = IndexedDoc(location, style, tags, length, tuple(tf))
+            self.total_length += length
+
+    def remove(self, content_id: int):
+        with self._lock:
+            self._remove(content_id)
+
+    def _remove(self, content_id: int):
+        doc = self.docs.pop(content_id, None)
+        if doc is None:
+            return
+        for gram in doc.terms:
+            posting = self.postings.get(gram)
+            if posting is not None:
+                posting.pop(content_id, None)
+                if not posting:
+                    del self.postings[gram]
+        self.total_length -= doc.length
+
+    def _candidates(self, search_terms: Optional[List[str]], location: Optional[str],
+                    tag_filter: Optional[TagFilter], style: Optional[str]) -> Tuple[Set[int], Set[str]]:
+        """
+        조건을 만족하는 콘텐츠 ID 와 검색어 바이그램을 구합니다. (호출 측에서 lock 보유)
+        검색어가 없으면 전체 콘텐츠가 후보입니다.
+        """
+        candidates: Optional[Set[int]] = None
+        query_grams = set()
+        for term in search_terms or []:
+            for gram in set(tokenize(term)):
+                posting = self.postings.get(gram)
+                if not posting:
+                    return set(), query_grams
+                query_grams.add(gram)
+                candidates = set(posting) if candidates is None else candidates & posting.keys()
+                if not candidates:
+                    return set(), query_grams
+        if candidates is None:
+            candidates = set(self.docs)
+
+        check_tags = tag_filter is not None and not tag_filter.is_empty
+        if location or style or check_tags:
+            candidates = {
+                cid for cid in candidates
+                if (not location or self.docs[cid].location == location)
+                and (not style or self.docs[cid].style == style)
+                and (not check_tags or tag_filter.matches(self.docs[cid].tags))
+            }
+        return candidates, query_grams
+
+    def facet_counts(self, search_terms: Optional[List[str]], location: Optional[str] = None,
+                     tag_filter: Optional[TagFilter] = None, style: Optional[str] = None) -> Tuple[int, Dict[str, Counter]]:
+        """조건에 맞는 콘텐츠를 한 번 훑으며 지역/태그/스타일별 개수를 셉니다. 반환: (전체 개수, {facet: Counter})"""
+        counts = {"location": Counter(), "tag": Counter(), "style": Counter()}
+        with self._lock:
+            candidates, _ = self._candidates(search_terms, location, tag_filter, style)
+            for cid in candidates:
+                doc = self.docs[cid]
+                if doc.location:
+                    counts["location"][doc.location] += 1
+                if doc.style:
+                    counts["style"][doc.style] += 1
+                counts["tag"].update(doc.tags)
+        return len(candidates), counts
+
+    def search(self, search_terms: List[str], location: Optional[str] = None,
+               tag_filter: Optional[TagFilter] = None, style: Optional[str] = None) -> List[Tuple[float, int]]:
+        """
+        모든 검색어를 포함(각 검색어의 바이그램을 모두 가진)하는 콘텐츠를 BM25 점수순으로 반환합니다.
+        반환: [(score, content_id), ...] - 점수 내림차순, 동점은 id 내림차순
+        """
+        with self._lock:
+            n_docs = len(self.docs)
+            if n_docs == 0 or not search_terms:
+                return []
+
+            candidates, query_grams = self._candidates(search_terms, location, tag_filter, style)
+            if not candidates or not query_grams:
+                return []
+
+            avg_length = self.total_length / n_docs
+            scores = dict.fromkeys(candidates, 0.0)
+            for gram in query_grams:
+                posting = self.postings[gram]
+                idf = math.log(1 + (n_docs - len(posting) + 0.5) / (len(posting) + 0.5))
+                for cid in candidates:
+                    freq = posting.get(cid)
+                    if freq:
+                        norm = BM25_K1 * (1 - BM25_B + BM25_B * self.docs[cid].length / avg_length)
+                        scores[cid] += idf * freq * (BM25_K1 + 1) / (freq + norm)
+
+        return sorted(((score, cid) for cid, score in scores.items()), key=lambda r: (-r[0], -r[1]))
+
+
+# ==================================================
+# 빌드 / 부분 갱신 (change feed)
+# ==================================================
+
+def _add_rows(index: BigramIndex, rows, tags: Dict[int, List[str]]):
+    for row in rows:
+        index.add(row.id, row.title, row.description, tags.get(row.id, []), row.location, row.style)
+
+
+def build_text_index(db: Session) -> BigramIndex:
+    """전체 Active 콘텐츠로 새 인덱스를 만듭니다."""
+    index = BigramIndex()
+    tags = load_all_active_content_tags(db)
+    _add_rows(index, content_rows_query(db).yield_per(1000), tags)
+    return index
+
+
+def refresh_text_index(db: Session, index: BigramIndex, content_ids: Set[int]):
+    """변경된 콘텐츠만 다시 읽어 갱신합니다. (비활성/삭제된 콘텐츠는 제거)"""
+    ids = list(content_ids)
+    rows = content_rows_query(db).filter(Content.id.in_(ids)).all()
+    _add_rows(index, rows, load_content_tags(db, ids))
+    for missing_id in content_ids - {row.id for row in rows}:
+        index.remove(missing_id)
+
+
+text_index = MemoryIndexHolder("text_bigram_bm25", build_text_index, refresh_text_index)
+
+
+def search_page(
+    search_terms: List[str],
+    per_page: int,
+    page: int = 1,
+    cursor: Optional[str] = None,
+    location: Optional[str] = None,
+    tag_filter: Optional[TagFilter] = None,
+    style: Optional[str] = None,
+) -> Optional[SearchPage]:
+    """메모리 인덱스로 한 페이지를 검색합니다. 인덱스가 아직 준비되지 않았으면 None."""
+    index = text_index.index
+    if index is None:
+        return None
+    ranked = index.search(search_terms, location, tag_filter, style)
+    return paginate_ranked(ranked, per_page, MEMORY_CURSOR_KIND, page=page, cursor=cursor)
@@ -17,6 +17,8 @@ const ReviewsSection = ({ contentId, initialReviews, totalReviews }) => {
     // --- 리뷰 목록 및 무한 스크롤 상태 ---
     const [reviews, setReviews] = useState(initialReviews || []);
     const [currentPage, setCurrentPage] = useState(1);
+    // 리뷰 피드 API 의 다음 페이지 커서 (첫 '더 보기'는 page=2, 이후는 커서로 이어서 조회)
+    const [nextCursor, setNextCursor] = useState(null);
     const [loadingMore, setLoadingMore] = useState(false);
     // 초기 로드된 리뷰 개수와 전체 개수를 비교하여 초기 hasMoreReviews 상태 설정
     const [hasMoreReviews, setHasMoreReviews] = useState((initialReviews || []).length < totalReviews);
@@ -26,6 +28,7 @@ const ReviewsSection = ({ contentId, initialReviews, totalReviews }) => {
     useEffect(() => {
         setReviews(initialReviews || []);
         setCurrentPage(1);
+        setNextCursor(null);
         setHasMoreReviews((initialReviews || []).length < totalReviews);
     }, [contentId, initialReviews, totalReviews]);
 
@@ -39,10 +42,15 @@ const ReviewsSection = ({ contentId, initialReviews, totalReviews }) => {
         const nextPage = currentPage + 1;
 
         try {
-            const response = await fetch(`${API_BASE_URL}/content/${contentId}?reviews_page=${nextPage}&reviews_per_page=${REVIEWS_PER_PAGE}`);
+            // 상세 전체가 아닌 리뷰 피드만 조회
+            const query = nextCursor
+                ? `cursor=${encodeURIComponent(nextCursor)}&per_page=${REVIEWS_PER_PAGE}`
+                : `page=${nextPage}&per_page=${REVIEWS_PER_PAGE}`;
+            const response = await fetch(`${API_BASE_URL}/content/${contentId}/reviews?${query}`);
             if (!response.ok) throw new Error("Failed to fetch more reviews");
             const data = await response.json();
-            const newReviews = data.reviews || [];
+            const newReviews = data.items || [];
+            setNextCursor(data.next_cursor || null);
 
             if (newReviews.length > 0) {
                 setReviews(prevReviews => {
@@ -63,7 +71,7 @@ const ReviewsSection = ({ contentId, initialReviews, totalReviews }) => {
         } finally {
             setLoadingMore(false);
         }
-    }, [loadingMore, hasMoreReviews, currentPage, contentId, totalReviews]);
+    }, [loadingMore, hasMoreReviews, currentPage, nextCursor, contentId, totalReviews]);
 
 
     // --- Intersection Observer 설정 ---
@@ -185,7 +185,7 @@ function GuideActionBar({ guide, navigateTo }) {
 }
 
 /** 리뷰 섹션 (가이드 대상 전용, 간단 구현) */
-function GuideReviewsSection({ guideId, user }) {
+function GuideReviewsSection({ guideId, user, initialReviews }) {
     const [items, setItems] = useState([]);
     const [page, setPage] = useState(1);
     const [perPage] = useState(6);
@@ -220,9 +220,16 @@ function GuideReviewsSection({ guideId, user }) {
     };
 
     useEffect(() => {
+        // 프로필 응답(/guides/{id})에 실린 최신 리뷰 첫 페이지가 있으면 다시 요청하지 않음
+        if (sort === "latest" && initialReviews?.items) {
+            setItems(initialReviews.items);
+            setTotal(initialReviews.total ?? initialReviews.items.length);
+            setLoading(false);
+            return;
+        }
         load(1, sort);
         // eslint-disable-next-line react-hooks/exhaustive-deps
-    }, [guideId, sort]);
+    }, [guideId, sort, initialReviews]);
 
     const totalPages = useMemo(() => Math.max(1, Math.ceil(total / perPage)), [total, perPage]);
 
@@ -319,7 +326,7 @@ function GuideReviewsSection({ guideId, user }) {
                 <>
                     <ul className="divide-y">
                         {items.map((rv, idx) => {
-                            const nickname = rv.user_name || rv.nickname || rv.author || "익명";
+                            const nickname = rv.user_name || rv.user || rv.nickname || rv.author || "익명";
                             const rate = rv.rating || rv.score || 0;
                             const body = rv.content || rv.comment || rv.text || "";
                             const created = rv.created_at || rv.created || rv.date || "";
@@ -434,8 +441,10 @@ export default function GuideProfilePage({ guideId, navigateTo, user }) {
                 const guideData = g?.data || g;
                 if (mounted) setGuide(guideData);
 
-                // 다른 투어
-                const cont = await getGuideContents(guideId, { page: 1, perPage: 9 });
+                // 다른 투어 (프로필 응답에 첫 페이지가 실려 있으면 추가 요청 없음)
+                const cont = guideData?.contents?.items
+                    ? guideData.contents
+                    : await getGuideContents(guideId, { page: 1, perPage: 9 });
                 const list = cont.items || cont.data || cont.contents || [];
                 if (mounted) setContents(list);
             } catch (e) {
@@ -486,7 +495,7 @@ export default function GuideProfilePage({ guideId, navigateTo, user }) {
             <div className="grid md:grid-cols-3 gap-4">
                 <div className="md:col-span-2 space-y-4">
                     <GuideInfoCard guide={guide} />
-                    <GuideReviewsSection guideId={guideId} user={user} />
+                    <GuideReviewsSection guideId={guideId} user={user} initialReviews={guide.reviews} />
                 </div>
                 <div className="space-y-4">
                     <GuideStats guide={guide} />